@@ -1,174 +1,484 @@
-"""This module contains the main fucntion that calls the GUI and Database construction then creates
-listeners and links them to the handlers in their repective modules."""
+"""This module contains the app factory that calls the GUI and Database construction then
+creates listeners and links them to the handlers in their repective modules, and the
+main function that runs it. Importing it builds nothing."""
 
 
+import argparse
+import functools
+import logging
+import os
 import sys
 from PyQt6 import QtWidgets, QtCore
 from gui import UiGarageTrackerMainWindow
+from db_worker import DatabaseWorker, AsyncDatabase
 from data_interface import AppDatabase
+import query_stats
+import tracing
 import users
 import repairs
 import parts
 import vehicles
 import customers
+import lookup
 
 # disable linter message due to using C extention
 # pylint: disable=c-extension-no-member
 
+# Where the F12 key writes the action traces to
+TRACE_FILE = os.path.join(
+    os.path.dirname(os.path.realpath(__file__)), "data", "traces.jsonl"
+)
 
-def setup_button_handlers():
-    """Connects all the UI buttons and action buttons to proper
-    functions in other modules."""
+# GUI methods that display results, timed as render time of an action
+RENDER_METHODS = (
+    "stream_text",
+    "update_list_table",
+    "update_active_repair_list",
+    "update_lookup_results",
+    "update_user_update_displays",
+    "update_edit_repair_displays",
+    "update_old_repair_displays",
+    "update_edit_part_page",
+    "update_edit_customer_page",
+    "update_edit_vehicle_page",
+)
 
-    # submit, add, remove buttons
-    # user buttons
-    Gui.login_page_submit_button.clicked.connect(
-        lambda: users.login_submit(Database, Gui)
-    )
-    Gui.new_user_page_submit_button.clicked.connect(
-        lambda: users.new_user_submit(Database, Gui)
-    )
-    Gui.update_password_submit_button.clicked.connect(
-        lambda: users.update_password_submit(Database, Gui)
-    )
-    Gui.update_user_page_submit_button.clicked.connect(
-        lambda: users.update_user_submit(Database, Gui)
-    )
+# GUI methods that show a dialog, timed as dialog time of an action
+DIALOG_METHODS = (
+    "show_error",
+    "show_success",
+    "show_id_search_request",
+    "show_quantity_request",
+    "show_user_search",
+    "show_vehicle_repair_history",
+)
 
-    # repair buttons
-    Gui.new_repair_page_submit_button.clicked.connect(
-        lambda: repairs.new_repair_submit(Database, Gui)
+
+def parse_arguments(arguments=None):
+    """Returns the app's command line options, Qt's own options are left to Qt."""
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--database", help="path of the database file, data/data.db by default"
     )
-    Gui.edit_repair_page_submit_complete_button.clicked.connect(
-        lambda: repairs.finish_repair_submit(Database, Gui)
+    parser.add_argument(
+        "--query-stats",
+        action="store_true",
+        help="record statement timings and counts per handler, reported on exit",
     )
-    Gui.edit_repair_page_submit_update_button.clicked.connect(
-        lambda: repairs.edit_repair_submit(Database, Gui)
+    parser.add_argument(
+        "--slow-query-ms",
+        type=float,
+        default=query_stats.SLOW_QUERY_MS,
+        help="log statements slower than this with --query-stats",
     )
-    Gui.edit_repair_add_part_button.clicked.connect(
-        lambda: repairs.add_part_to_repair(Database, Gui)
+    parser.add_argument(
+        "--trace-file",
+        default=TRACE_FILE,
+        help="file the F12 key and exit write the latest action traces to",
     )
-    Gui.edit_repair_remove_part_button.clicked.connect(
-        lambda: repairs.remove_part_from_repair(Database, Gui)
+    parser.add_argument(
+        "--dump-traces-on-exit",
+        action="store_true",
+        help="write the action traces to the trace file on exit",
     )
 
-    # part buttons
-    Gui.new_part_submit_button.clicked.connect(
-        lambda: parts.create_part_submit(Database, Gui)
-    )
-    Gui.edit_part_submit_button.clicked.connect(
-        lambda: parts.edit_part_submit(Database, Gui)
-    )
+    return parser.parse_known_args(arguments)[0]
 
-    # customer buttons
-    Gui.new_customer_submit_button.clicked.connect(
-        lambda: customers.new_customer_submit(Database, Gui)
-    )
-    Gui.edit_customer_submit_button.clicked.connect(
-        lambda: customers.edit_customer_submit(Database, Gui)
-    )
-    Gui.edit_customer_add_vehicle_button.clicked.connect(
-        lambda: customers.add_vehicle_to_customer_button(Database, Gui)
-    )
-    Gui.edit_customer_remove_vehicle_button.clicked.connect(
-        lambda: customers.remove_vehicle_from_customer_button(Database, Gui)
-    )
 
-    # vehicle buttons
-    Gui.new_vehicle_submit_button.clicked.connect(
-        lambda: vehicles.new_vehicle_submit(Database, Gui)
-    )
-    Gui.edit_vehicle_submit_button.clicked.connect(
-        lambda: vehicles.edit_vehicle_submit(Database, Gui)
+def setup_query_stats(options):
+    """Returns the query statistics the database records if the options ask for them,
+    with the handler modules tracked, otherwise None."""
+
+    if not options.query_stats:
+        return None
+
+    logging.basicConfig(level=logging.INFO)
+
+    stats = query_stats.QueryStats(options.slow_query_ms)
+
+    for module in (users, repairs, parts, vehicles, customers, lookup):
+        stats.track_module(module)
+
+    return stats
+
+
+def setup_tracing(database, gui):
+    """Times the database waits, password hashes, result displays and dialogs of the
+    traced actions."""
+
+    gui.tracer.time_methods(database, tracing.DATABASE, ("wait",))
+    gui.tracer.time_methods(
+        database.auth.policy, tracing.HASHING, ("hash", "verify", "verify_and_update")
     )
+    gui.tracer.time_methods(gui, tracing.RENDER, RENDER_METHODS)
+    gui.tracer.time_methods(gui, tracing.DIALOG, DIALOG_METHODS)
+
+
+def setup_button_handlers(database, gui):
+    """Connects all the UI action buttons to proper functions in other modules, page
+    buttons are connected once their page is built."""
 
     # Go to functions for action menu (top menu bar)
     # user actions
-    Gui.action_login.triggered.connect(lambda: users.go_to_login_page(Gui))
-    Gui.action_logout.triggered.connect(lambda: users.logout_user(Database, Gui))
-    Gui.action_new_user.triggered.connect(lambda: users.go_to_new_user_page(Gui))
-    Gui.action_update_password.triggered.connect(
-        lambda: users.go_to_update_password_page(Database, Gui)
+    gui.connect_action(gui.action_login.triggered, users.go_to_login_page, gui)
+    gui.connect_action(gui.action_logout.triggered, users.logout_user, database, gui)
+    gui.connect_action(gui.action_new_user.triggered, users.go_to_new_user_page, gui)
+    gui.connect_action(
+        gui.action_update_password.triggered,
+        users.go_to_update_password_page,
+        database,
+        gui,
+    )
+    gui.connect_action(
+        gui.action_update_user.triggered, users.go_to_update_user_page, database, gui
     )
-    Gui.action_update_user.triggered.connect(
-        lambda: users.go_to_update_user_page(Database, Gui)
+    gui.connect_action(
+        gui.action_search_user.triggered, users.search_for_user, database, gui
     )
-    Gui.action_search_user.triggered.connect(
-        lambda: users.search_for_user(Database, Gui)
+    gui.connect_action(
+        gui.action_show_users.triggered, users.show_all_users, database, gui
     )
-    Gui.action_show_users.triggered.connect(lambda: users.show_all_users(Database, Gui))
-    Gui.action_remove_user.triggered.connect(
-        lambda: Database.remove_row(Gui, "employees")
+    gui.connect_action(
+        gui.action_remove_user.triggered,
+        database.remove_row,
+        gui,
+        "employees",
+        name="remove_row.employees",
     )
 
     # repair actions
-    Gui.action_new_repair.triggered.connect(
-        lambda: repairs.go_to_new_repair_page(Database, Gui)
-    )
-    Gui.action_edit_repair.triggered.connect(
-        lambda: repairs.go_to_edit_repair_page(Database, Gui)
-    )
-    Gui.action_active_repairs.triggered.connect(
-        lambda: repairs.go_to_active_repairs_page(Database, Gui)
-    )
-    Gui.action_display_old_repair.triggered.connect(
-        lambda: repairs.go_to_old_repair_page(Database, Gui)
-    )
-    Gui.action_remove_repair.triggered.connect(
-        lambda: Database.remove_row(Gui, "repairs")
+    gui.connect_action(
+        gui.action_new_repair.triggered, repairs.go_to_new_repair_page, database, gui
+    )
+    gui.connect_action(
+        gui.action_edit_repair.triggered, repairs.go_to_edit_repair_page, database, gui
+    )
+    gui.connect_action(
+        gui.action_active_repairs.triggered,
+        repairs.go_to_active_repairs_page,
+        database,
+        gui,
+    )
+    gui.connect_action(
+        gui.action_display_old_repair.triggered,
+        repairs.go_to_old_repair_page,
+        database,
+        gui,
+    )
+    gui.connect_action(
+        gui.action_search_repairs.triggered,
+        repairs.go_to_search_repairs_page,
+        database,
+        gui,
+    )
+    gui.connect_action(
+        gui.action_remove_repair.triggered,
+        database.remove_row,
+        gui,
+        "repairs",
+        name="remove_row.repairs",
     )
 
     # part actions
-    Gui.action_new_part.triggered.connect(
-        lambda: parts.go_to_new_part_page(Database, Gui)
+    gui.connect_action(
+        gui.action_new_part.triggered, parts.go_to_new_part_page, database, gui
+    )
+    gui.connect_action(
+        gui.action_edit_part.triggered, parts.go_to_edit_part_page, database, gui
     )
-    Gui.action_edit_part.triggered.connect(
-        lambda: parts.go_to_edit_part_page(Database, Gui)
+    gui.connect_action(
+        gui.action_list_of_parts.triggered,
+        parts.go_to_list_of_parts_page,
+        database,
+        gui,
     )
-    Gui.action_list_of_parts.triggered.connect(
-        lambda: parts.go_to_list_of_parts_page(Database, Gui)
+    gui.connect_action(
+        gui.action_remove_part.triggered,
+        database.remove_row,
+        gui,
+        "parts",
+        name="remove_row.parts",
     )
-    Gui.action_remove_part.triggered.connect(lambda: Database.remove_row(Gui, "parts"))
 
     # customer actions
-    Gui.action_new_customer.triggered.connect(
-        lambda: customers.go_to_new_customer_page(Database, Gui)
-    )
-    Gui.action_edit_customer.triggered.connect(
-        lambda: customers.go_to_edit_customer_page(Database, Gui)
-    )
-    Gui.action_list_of_customers.triggered.connect(
-        lambda: customers.go_to_list_of_customers_page(Database, Gui)
-    )
-    Gui.action_remove_customer.triggered.connect(
-        lambda: Database.remove_row(Gui, "customers")
+    gui.connect_action(
+        gui.action_new_customer.triggered,
+        customers.go_to_new_customer_page,
+        database,
+        gui,
+    )
+    gui.connect_action(
+        gui.action_edit_customer.triggered,
+        customers.go_to_edit_customer_page,
+        database,
+        gui,
+    )
+    gui.connect_action(
+        gui.action_list_of_customers.triggered,
+        customers.go_to_list_of_customers_page,
+        database,
+        gui,
+    )
+    gui.connect_action(
+        gui.action_remove_customer.triggered,
+        database.remove_row,
+        gui,
+        "customers",
+        name="remove_row.customers",
     )
 
     # vehicle actions
-    Gui.action_new_vehicle.triggered.connect(
-        lambda: vehicles.go_to_new_vehicle_page(Database, Gui)
-    )
-    Gui.action_edit_vehicle.triggered.connect(
-        lambda: vehicles.go_to_edit_vehicle_page(Database, Gui)
-    )
-    Gui.action_get_repair_history.triggered.connect(
-        lambda: vehicles.search_repair_history(Database, Gui)
-    )
-    Gui.action_list_of_vehicles.triggered.connect(
-        lambda: vehicles.go_to_list_of_vehicles_page(Database, Gui)
-    )
-    Gui.action_remove_vehicle.triggered.connect(
-        lambda: Database.remove_row(Gui, "vehicles")
-    )
+    gui.connect_action(
+        gui.action_new_vehicle.triggered, vehicles.go_to_new_vehicle_page, database, gui
+    )
+    gui.connect_action(
+        gui.action_edit_vehicle.triggered,
+        vehicles.go_to_edit_vehicle_page,
+        database,
+        gui,
+    )
+    gui.connect_action(
+        gui.action_get_repair_history.triggered,
+        vehicles.search_repair_history,
+        database,
+        gui,
+    )
+    gui.connect_action(
+        gui.action_list_of_vehicles.triggered,
+        vehicles.go_to_list_of_vehicles_page,
+        database,
+        gui,
+    )
+    gui.connect_action(
+        gui.action_remove_vehicle.triggered,
+        database.remove_row,
+        gui,
+        "vehicles",
+        name="remove_row.vehicles",
+    )
+
+    # lookup actions
+    gui.connect_action(
+        gui.action_lookup_customer.triggered,
+        lookup.go_to_lookup_page,
+        database,
+        gui,
+        lookup.CUSTOMER_LOOKUP,
+    )
+    gui.connect_action(
+        gui.action_lookup_vehicle.triggered,
+        lookup.go_to_lookup_page,
+        database,
+        gui,
+        lookup.VEHICLE_LOOKUP,
+    )
+    gui.connect_action(
+        gui.action_lookup_part.triggered,
+        lookup.go_to_lookup_page,
+        database,
+        gui,
+        lookup.PART_LOOKUP,
+    )
+
+
+def setup_page_handlers(database, gui, page):
+    """Connects the buttons and text boxes of the passed page to proper functions in
+    other modules, called when the gui builds the page."""
+
+    match page:
+        # user pages
+        case "login_page":
+            gui.connect_action(
+                gui.login_page_submit_button.clicked, users.login_submit, database, gui
+            )
+
+        case "new_user_page":
+            gui.connect_action(
+                gui.new_user_page_submit_button.clicked,
+                users.new_user_submit,
+                database,
+                gui,
+            )
+
+        case "update_password_page":
+            gui.connect_action(
+                gui.update_password_submit_button.clicked,
+                users.update_password_submit,
+                database,
+                gui,
+            )
+
+        case "update_user_page":
+            gui.connect_action(
+                gui.update_user_page_submit_button.clicked,
+                users.update_user_submit,
+                database,
+                gui,
+            )
+
+        # repair pages
+        case "new_repair_page":
+            gui.connect_action(
+                gui.new_repair_page_submit_button.clicked,
+                repairs.new_repair_submit,
+                database,
+                gui,
+            )
+
+        case "edit_repair_page":
+            gui.connect_action(
+                gui.edit_repair_page_submit_complete_button.clicked,
+                repairs.finish_repair_submit,
+                database,
+                gui,
+            )
+            gui.connect_action(
+                gui.edit_repair_page_submit_update_button.clicked,
+                repairs.edit_repair_submit,
+                database,
+                gui,
+            )
+            gui.connect_action(
+                gui.edit_repair_add_part_button.clicked,
+                repairs.add_part_to_repair,
+                database,
+                gui,
+            )
+            gui.connect_action(
+                gui.edit_repair_remove_part_button.clicked,
+                repairs.remove_part_from_repair,
+                database,
+                gui,
+            )
+
+            # if the text in the edit repair description text browsers change
+            # connect to gui and set proper class attribute to true
+            gui.edit_repair_problem_description_input_box.textChanged.connect(
+                lambda: gui.set_repair_problem_has_changed(True)
+            )
+            gui.edit_repair_repair_description_input_box.textChanged.connect(
+                lambda: gui.set_repair_repair_has_changed(True)
+            )
+
+        case "search_repairs_page":
+            gui.connect_action(
+                gui.search_repairs_submit_button.clicked,
+                repairs.search_repairs_submit,
+                database,
+                gui,
+            )
+
+        # part pages
+        case "new_part_page":
+            gui.connect_action(
+                gui.new_part_submit_button.clicked,
+                parts.create_part_submit,
+                database,
+                gui,
+            )
+
+        case "edit_part_page":
+            gui.connect_action(
+                gui.edit_part_submit_button.clicked,
+                parts.edit_part_submit,
+                database,
+                gui,
+            )
+
+        # customer pages
+        case "new_customer_page":
+            gui.connect_action(
+                gui.new_customer_submit_button.clicked,
+                customers.new_customer_submit,
+                database,
+                gui,
+            )
+
+        case "edit_customer_page":
+            gui.connect_action(
+                gui.edit_customer_submit_button.clicked,
+                customers.edit_customer_submit,
+                database,
+                gui,
+            )
+            gui.connect_action(
+                gui.edit_customer_add_vehicle_button.clicked,
+                customers.add_vehicle_to_customer_button,
+                database,
+                gui,
+            )
+            gui.connect_action(
+                gui.edit_customer_remove_vehicle_button.clicked,
+                customers.remove_vehicle_from_customer_button,
+                database,
+                gui,
+            )
+
+        # vehicle pages
+        case "new_vehicle_page":
+            gui.connect_action(
+                gui.new_vehicle_submit_button.clicked,
+                vehicles.new_vehicle_submit,
+                database,
+                gui,
+            )
+
+        case "edit_vehicle_page":
+            gui.connect_action(
+                gui.edit_vehicle_submit_button.clicked,
+                vehicles.edit_vehicle_submit,
+                database,
+                gui,
+            )
+
+        # lookup page searches as the user types, once typing pauses
+        case "lookup_page":
+            gui.lookup_input_box.textChanged.connect(
+                lambda: lookup.lookup_text_changed(gui)
+            )
+            gui.connect_action(
+                gui.lookup_kind_combo_box.currentIndexChanged,
+                lookup.run_lookup,
+                database,
+                gui,
+            )
+            gui.connect_action(
+                gui.lookup_timer.timeout, lookup.run_lookup, database, gui
+            )
+            gui.lookup_results_list_widget.itemActivated.connect(
+                lambda item: gui.tracer.run(
+                    lookup.open_lookup_result, database, gui, item
+                )
+            )
 
 
 class MainWindow(UiGarageTrackerMainWindow):
     """Creates a GUI from the UiGarageTracker template created by
     PyQt Designer and adds return and esc key press support."""
 
-    def __init__(self):
+    def __init__(self, options):
         super().__init__()
         self.setup_ui(self)
+        self.options = options
+        self.tracer = tracing.ActionTracer()
+        self.database = None  # set by create_app once the database worker runs
+        self.stats = None
+
+    def connect_action(self, signal, handler, *args, name=None):
+        """Connects the passed signal to call the handler with the passed arguments as
+        a traced action, the signal's own arguments are dropped."""
+
+        signal.connect(lambda *_: self.tracer.run(handler, *args, name=name))
+
+    def dump_traces(self):
+        """Writes the latest action traces to the trace file."""
+
+        written = self.tracer.dump(self.options.trace_file)
+
+        return self.show_success(
+            f"{written} action traces written to {self.options.trace_file}."
+        )
 
     # disable linter message for invalid name, this is a PyQt variable
     # pylint: disable=invalid-name
@@ -180,77 +490,108 @@ class MainWindow(UiGarageTrackerMainWindow):
         if event.key() == QtCore.Qt.Key.Key_Escape.value:
             self.close()
 
+        # if user hits F12 --> write the latest action traces to the trace file
+        if event.key() == QtCore.Qt.Key.Key_F12.value:
+            self.dump_traces()
+
         # if user hits enter
         if event.key() == QtCore.Qt.Key.Key_Return.value:
             # match index to current page's submit button
-            index = Gui.widget_stack.currentIndex()
+            index = self.widget_stack.currentIndex()
             match index:
                 case 0:
-                    users.login_submit(Database, Gui)
+                    self.tracer.run(users.login_submit, self.database, self)
 
                 case 1:
-                    users.new_user_submit(Database, Gui)
+                    self.tracer.run(users.new_user_submit, self.database, self)
 
                 case 2:
-                    users.update_password_submit(Database, Gui)
+                    self.tracer.run(users.update_password_submit, self.database, self)
 
                 case 3:
-                    users.update_user_submit(Database, Gui)
+                    self.tracer.run(users.update_user_submit, self.database, self)
 
                 case 4:
-                    repairs.new_repair_submit(Database, Gui)
+                    self.tracer.run(repairs.new_repair_submit, self.database, self)
 
                 case 5:
-                    repairs.edit_repair_submit(Database, Gui)
+                    self.tracer.run(repairs.edit_repair_submit, self.database, self)
 
                 case 8:
-                    parts.create_part_submit(Database, Gui)
+                    self.tracer.run(parts.create_part_submit, self.database, self)
 
                 case 9:
-                    parts.edit_part_submit(Database, Gui)
+                    self.tracer.run(parts.edit_part_submit, self.database, self)
 
                 case 11:
-                    customers.new_customer_submit(Database, Gui)
+                    self.tracer.run(customers.new_customer_submit, self.database, self)
 
                 case 12:
-                    customers.edit_customer_submit(Database, Gui)
+                    self.tracer.run(customers.edit_customer_submit, self.database, self)
 
                 case 14:
-                    vehicles.new_vehicle_submit(Database, Gui)
+                    self.tracer.run(vehicles.new_vehicle_submit, self.database, self)
 
                 case 15:
-                    vehicles.edit_vehicle_submit(Database, Gui)
+                    self.tracer.run(vehicles.edit_vehicle_submit, self.database, self)
 
+                case 17:
+                    self.tracer.run(repairs.search_repairs_submit, self.database, self)
 
-def setup_text_handlers():
-    """Sets up the handling for events on the edit repair QTextEdit objects
-    (repair description and problem description)"""
+                case 18:
+                    self.tracer.run(lookup.open_lookup_result, self.database, self)
 
-    # if the text in the edit repair description text browsers change
-    # connect to gui and set proper class attribute to true
-    Gui.edit_repair_problem_description_input_box.textChanged.connect(
-        lambda: Gui.set_repair_problem_has_changed(True)
-    )
-    Gui.edit_repair_repair_description_input_box.textChanged.connect(
-        lambda: Gui.set_repair_repair_has_changed(True)
+
+def create_app(arguments=None):
+    """Sets up the application ui and database and connects the handlers, returns the
+    QApplication and the main window. The database runs on its own worker thread and
+    the gui keeps painting while it waits on it."""
+
+    options = parse_arguments(arguments)
+    app = QtWidgets.QApplication(sys.argv)
+    gui = MainWindow(options)
+    stats = setup_query_stats(options)
+    worker = DatabaseWorker(
+        functools.partial(AppDatabase, options.database, query_stats=stats)
     )
+    worker.start()
+    database = AsyncDatabase(worker, gui.wait_for_future)
+    gui.database = database
+    gui.stats = stats
+
+    # Calibrate the password policy while the user types their login
+    database.auth.warm_up()
 
+    setup_tracing(database, gui)
+    setup_button_handlers(database, gui)
 
-# Set up application ui and database
-App = QtWidgets.QApplication(sys.argv)
-Gui = MainWindow()
-Database = AppDatabase()
+    # pages build their widgets when first used --> connect each page once it is built
+    gui.page_built.connect(functools.partial(setup_page_handlers, database, gui))
+
+    for page in gui.built_pages:
+        setup_page_handlers(database, gui, page)
+
+    return app, gui
 
 
 def main():
-    """Calls button and text box change handlers, shows gui, and setups up app exit."""
+    """Creates the app, shows gui, and setups up app exit."""
+
+    app, gui = create_app()
+    gui.show()
+    exit_code = app.exec()
+
+    # Let queued database calls finish, then close the database
+    gui.database.close()
+
+    if gui.stats is not None:
+        query_stats.logger.info("Query statistics\n%s", gui.stats.format_report())
+
+    if gui.options.dump_traces_on_exit:
+        gui.tracer.dump(gui.options.trace_file)
 
-    setup_button_handlers()
-    setup_text_handlers()
-    Gui.show()
-    sys.exit(App.exec())
+    sys.exit(exit_code)
 
 
 if __name__ == "__main__":
     main()
-    Database.connection.close()
@@ -0,0 +1,121 @@
+"""This module defines the authentication service used to hash and verify passwords on
+worker threads. The database calls it from its own worker thread, which blocks on the
+hash while the GUI keeps painting through the database's waiter (see db_worker)."""
+
+import hashlib
+import hmac
+import secrets
+import time
+from concurrent.futures import ThreadPoolExecutor
+from password_policy import PasswordPolicy
+
+# Seconds a confirmed password skips the full hash on repeated confirmations, 0 disables
+REAUTH_GRACE_SECONDS = 120
+
+
+class AuthService:
+    """This class defines a password hashing service backed by a worker thread pool."""
+
+    def __init__(self, max_workers=2, policy=None):
+        self.policy = policy if policy is not None else PasswordPolicy()
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="auth"
+        )
+
+    def submit_hash(self, password):
+        """Starts hashing the passed password on a worker thread, returns a future
+        of the hash."""
+
+        return self.executor.submit(self.policy.hash, password)
+
+    def submit_verify(self, password, stored_hash):
+        """Starts verifying the passed password against the stored hash on a worker
+        thread, returns a future of the result."""
+
+        return self.executor.submit(self.policy.verify, password, stored_hash)
+
+    def submit_verify_and_update(self, password, stored_hash):
+        """Starts verifying the passed password on a worker thread, returns a future of
+        the result and a new hash if the stored one is outside the policy."""
+
+        return self.executor.submit(
+            self.policy.verify_and_update, password, stored_hash
+        )
+
+    def hash(self, password):
+        """Returns the hash of the passed password, computed on a worker thread."""
+
+        return self.submit_hash(password).result()
+
+    def verify(self, password, stored_hash):
+        """Returns true if the passed password matches the stored hash, verified on a
+        worker thread."""
+
+        return self.submit_verify(password, stored_hash).result()
+
+    def verify_and_update(self, password, stored_hash):
+        """Returns a tuple of true if the passed password matches the stored hash and a
+        replacement hash if the stored one is outside the policy (otherwise None)."""
+
+        return self.submit_verify_and_update(password, stored_hash).result()
+
+    def warm_up(self):
+        """Starts calibrating the password policy on a worker thread so the first login
+        does not wait for it."""
+
+        self.executor.submit(self.policy.get_context)
+
+    def shutdown(self):
+        """Stops the worker threads once running hashes finish."""
+
+        self.executor.shutdown(wait=False)
+
+
+class ReauthGrace:
+    """This class defines a short lived step up authentication session. After a user's
+    password is confirmed by the full hash, repeated confirmations by that same user
+    within the grace window are checked against a keyed digest of the password instead.
+    """
+
+    def __init__(self, grace_seconds=REAUTH_GRACE_SECONDS):
+        self.grace_seconds = grace_seconds
+        self.key = secrets.token_bytes(32)  # per process, digests never leave memory
+        self.user_id = None
+        self.digest = None
+        self.expires_at = 0.0
+
+    def password_digest(self, password):
+        """Returns the keyed digest of the passed password."""
+
+        return hmac.new(self.key, password.encode(), hashlib.sha256).digest()
+
+    def remember(self, user_id, password):
+        """Starts a grace window for the passed user and their confirmed password."""
+
+        if self.grace_seconds <= 0:
+            return  # grace window disabled
+
+        self.user_id = user_id
+        self.digest = self.password_digest(password)
+        self.expires_at = time.monotonic() + self.grace_seconds
+
+    def is_confirmed(self, user_id, password):
+        """Returns true if the passed user confirmed this same password within the
+        grace window."""
+
+        if self.digest is None or user_id != self.user_id:
+            return False
+
+        if time.monotonic() >= self.expires_at:
+            self.clear()  # window over --> full hash again
+
+            return False
+
+        return hmac.compare_digest(self.digest, self.password_digest(password))
+
+    def clear(self):
+        """Ends the grace window."""
+
+        self.user_id = None
+        self.digest = None
+        self.expires_at = 0.0
@@ -0,0 +1,6 @@
+"""This package times the database methods and the handler flows of the application
+against a generated database, headless, and writes the timings to a JSON report.
+
+Run from the application directory --> python -m benchmarks --help
+Generate a database for load testing --> python -m benchmarks.generator --help
+Profile the startup imports --> python -m benchmarks.startup --help"""
@@ -0,0 +1,103 @@
+"""Command line entry point of the benchmarks --> python -m benchmarks --help"""
+
+import argparse
+import os
+import sys
+import tempfile
+from benchmarks import generator
+from benchmarks import report
+from benchmarks import suite
+import query_stats
+
+
+def parse_arguments(arguments=None):
+    """Returns the parsed command line arguments."""
+
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Times the database methods and handler flows against a "
+        "generated database and writes the timings to a JSON report.",
+    )
+    parser.add_argument(
+        "--repairs",
+        type=int,
+        default=10000,
+        help="number of repairs generated, the other tables scale with it",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    parser.add_argument(
+        "--repeat", type=int, default=20, help="number of runs of each benchmark"
+    )
+    parser.add_argument(
+        "--only", help="only run the benchmarks whose name contains this text"
+    )
+    parser.add_argument(
+        "--output", default="benchmark_report.json", help="path of the JSON report"
+    )
+    parser.add_argument("--baseline", help="path of a report to compare against")
+    parser.add_argument(
+        "--query-stats",
+        action="store_true",
+        help="add statement statistics per benchmark to the report, timings include "
+        "the instrumentation",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=report.DEFAULT_TOLERANCE,
+        help="slowdown over the baseline median counted as a regression",
+    )
+
+    return parser.parse_args(arguments)
+
+
+def main(arguments=None):
+    """Runs the benchmarks, writes the report and compares it to the baseline.
+    Returns the exit status --> 1 if any benchmark regressed."""
+
+    arguments = parse_arguments(arguments)
+
+    # generated database lives only as long as the run
+    with tempfile.TemporaryDirectory() as directory:
+        database_path = os.path.join(directory, "benchmark.db")
+
+        print(f"Generating database with {arguments.repairs} repairs...")
+        scale = generator.generate(database_path, arguments.repairs, arguments.seed)
+
+        print("Running benchmarks...")
+        results = suite.run_benchmarks(
+            database_path,
+            arguments.repeat,
+            arguments.seed,
+            arguments.only,
+            query_stats.QueryStats() if arguments.query_stats else None,
+        )
+
+    run_report = report.build_report(results, scale, arguments.repeat, arguments.seed)
+    report.write_report(run_report, arguments.output)
+
+    print(report.format_summary(run_report))
+    print(f"\nReport written to {arguments.output}")
+
+    if arguments.baseline is None:
+        return 0
+
+    regressions = report.find_regressions(
+        run_report, report.read_report(arguments.baseline), arguments.tolerance
+    )
+
+    if not regressions:
+        print(f"No regressions against {arguments.baseline}.")
+
+        return 0
+
+    print(f"\n--- regressions against {arguments.baseline} ---")
+
+    for section, name, baseline_median, median in regressions:
+        print(f"{section} {name} : {baseline_median:.3f} ms --> {median:.3f} ms")
+
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,669 @@
+"""This module generates a database of synthetic shop data for load testing: customers,
+vehicles, employees, parts, repairs and part listings, skewed the way a busy shop's
+data is. Fleet vehicles come back for many repairs, a few parts are used far more
+than the rest and about 5% of repairs are still open.
+
+The same seed and counts always generate the same data.
+
+Run from the application directory --> python -m benchmarks.generator --help"""
+
+import argparse
+import contextlib
+import datetime
+import itertools
+import os
+import random
+import sys
+import time
+from data_interface import AppDatabase
+
+# Password of every generated employee
+GENERATED_PASSWORD = "password"
+
+# Default rows of the other tables per repair
+VEHICLES_PER_REPAIR = 0.25
+CUSTOMERS_PER_VEHICLE = 0.7
+PARTS_PER_REPAIR = 0.02
+REPAIRS_PER_EMPLOYEE = 2500
+
+# Least parts and employees generated
+MIN_PARTS = 50
+MIN_EMPLOYEES = 4
+
+# Share of vehicles in fleets, their share of the repairs compared to other vehicles and
+# the share of customers that own the fleets
+FLEET_VEHICLE_SHARE = 0.03
+FLEET_REPAIR_WEIGHT = 25
+FLEET_CUSTOMER_SHARE = 0.002
+
+# Share of repairs with no completion date, only a vehicle's latest repair can be open.
+# While under the share a vehicle's latest repair is open with OPEN_VEHICLE_CHANCE.
+OPEN_REPAIR_SHARE = 0.05
+OPEN_VEHICLE_CHANCE = 0.5
+
+# Share of employees that are service writers, the rest are techs
+WRITER_SHARE = 0.3
+
+# Part listings per repair and the skew of part usage, part of rank r is used in
+# proportion to 1 / r ** ZIPF_EXPONENT
+MAX_LISTINGS_PER_REPAIR = 6
+MAX_LISTING_QUANTITY = 4
+ZIPF_EXPONENT = 1.1
+
+# Repair history covers the days up to the last day, fixed so a seed always gives the
+# same database
+HISTORY_DAYS = 3650
+HISTORY_END = datetime.date(2024, 12, 31)
+MAX_REPAIR_DAYS = 5  # days from drop off to completion
+
+# Repairs generated per transaction and page cache size while generating, negative
+# sizes are in KiB --> 512 MiB
+BATCH_REPAIRS = 100000
+LOAD_CACHE_KIB = -524288
+
+# Vehicle makes --> (world manufacturer identifier, models)
+MAKES = {
+    "Ford": ("1FT", ("F150", "Transit", "Escape", "Explorer")),
+    "Chevrolet": ("1GC", ("Silverado", "Express", "Malibu", "Tahoe")),
+    "Toyota": ("JTD", ("Camry", "Corolla", "Tacoma", "Sienna")),
+    "Honda": ("1HG", ("Civic", "Accord", "Odyssey", "Pilot")),
+    "Ram": ("3C6", ("1500", "2500", "ProMaster")),
+    "Nissan": ("1N4", ("Altima", "Sentra", "Rogue", "NV200")),
+    "Subaru": ("JF1", ("Outback", "Forester", "Impreza")),
+    "Volkswagen": ("3VW", ("Jetta", "Passat", "Tiguan")),
+}
+COLORS = ("White", "Black", "Silver", "Gray", "Red", "Blue", "Green", "Brown")
+ENGINES = ("I4", "I4 Turbo", "V6", "V8", "Diesel", "Hybrid", "Electric")
+
+# Characters a vin can have in its model and serial positions, vins never use I, O, Q
+VIN_CHARACTERS = "ABCDEFGHJKLMNPRSTUVWXYZ0123456789"
+
+# Vin check digit values of each character and weights of each position
+VIN_VALUES = {
+    **{str(digit): digit for digit in range(10)},
+    **dict(zip("ABCDEFGH", range(1, 9))),
+    **dict(zip("JKLMN", range(1, 6))),
+    "P": 7,
+    "R": 9,
+    **dict(zip("STUVWXYZ", range(2, 10))),
+}
+VIN_WEIGHTS = (8, 7, 6, 5, 4, 3, 2, 10, 0, 9, 8, 7, 6, 5, 4, 3, 2)
+
+# Vin model year characters, 1980 onwards repeating every 30 years
+VIN_YEAR_CHARACTERS = "ABCDEFGHJKLMNPRSTVWXY123456789"
+
+FIRST_NAMES = (
+    "James Mary Robert Patricia John Jennifer Michael Linda David Elizabeth William "
+    "Barbara Richard Susan Joseph Jessica Thomas Sarah Carlos Maria Wei Priya Ahmed "
+    "Fatima Kenji Olga"
+).split()
+LAST_NAMES = (
+    "Smith Johnson Williams Brown Jones Garcia Miller Davis Rodriguez Martinez "
+    "Hernandez Lopez Gonzalez Wilson Anderson Thomas Taylor Moore Jackson Martin Lee "
+    "Nguyen Patel Kim Chen"
+).split()
+STREETS = (
+    "Main St, Oak Ave, Maple Dr, Cedar Ln, Pine St, Elm St, Lake Rd, Hill St, "
+    "Park Ave, Washington Blvd"
+).split(", ")
+FLEET_NAMES = ("Transport", "Logistics", "Delivery", "Plumbing", "Electric", "Rentals")
+PART_KINDS = (
+    "Brake pad set",
+    "Brake rotor",
+    "Oil filter",
+    "Air filter",
+    "Cabin filter",
+    "Spark plug",
+    "Serpentine belt",
+    "Timing belt",
+    "Water pump",
+    "Alternator",
+    "Starter",
+    "Battery",
+    "Wiper blade",
+    "Headlight bulb",
+    "Wheel bearing",
+    "Control arm",
+    "Tie rod end",
+    "Shock absorber",
+    "Strut assembly",
+    "Radiator hose",
+    "Thermostat",
+    "Ignition coil",
+    "Oxygen sensor",
+    "Fuel pump",
+)
+PROBLEMS = (
+    "Customer states engine noise at idle",
+    "Customer states brakes squeal when stopping",
+    "Check engine light on",
+    "Vehicle pulls to the left",
+    "Customer requests oil change and inspection",
+    "No start, clicking noise",
+    "Overheating in traffic",
+    "Vibration at highway speed",
+    "Battery keeps dying overnight",
+    "AC blows warm air",
+    "Grinding noise when turning",
+    "Rough idle and poor fuel economy",
+)
+REPAIRS_DONE = (
+    "Replaced worn parts and road tested",
+    "Replaced brake pads and resurfaced rotors",
+    "Replaced faulty sensor, cleared codes",
+    "Performed alignment, adjusted tie rods",
+    "Changed oil and filters, inspected vehicle",
+    "Replaced starter, verified charging system",
+    "Replaced thermostat and flushed coolant",
+    "Balanced tires and replaced wheel bearing",
+    "Replaced battery and tested alternator",
+    "Recharged AC system, no leaks found",
+    "Replaced control arm and tie rod end",
+    "Replaced ignition coil and spark plugs",
+)
+
+
+def get_vin_check_digit(vin):
+    """Returns the check digit of the passed 17 character vin, ignoring its 9th
+    character."""
+
+    remainder = (
+        sum(
+            VIN_VALUES[character] * weight
+            for character, weight in zip(vin, VIN_WEIGHTS)
+        )
+        % 11
+    )
+
+    return "X" if remainder == 10 else str(remainder)
+
+
+def make_vin(rng, wmi, year, serial):
+    """Returns a valid vin: the passed world manufacturer identifier, random model
+    characters, check digit, model year character, plant character and serial number.
+    Each serial gives a different vin."""
+
+    plant, number = divmod(serial, 1000000)
+    vin = (
+        wmi
+        + "".join(rng.choices(VIN_CHARACTERS, k=5))
+        + "0"  # check digit placeholder, weight 0
+        + VIN_YEAR_CHARACTERS[(year - 1980) % 30]
+        + VIN_CHARACTERS[plant]
+        + f"{number:06}"
+    )
+
+    return vin[:8] + get_vin_check_digit(vin) + vin[9:]
+
+
+def format_date(date):
+    """Returns the passed date the way the app stores dates --> YYYY/MM/DD"""
+
+    return date.strftime("%Y/%m/%d")
+
+
+def get_default_counts(repairs):
+    """Returns the default number of rows of each table for the passed number of
+    repairs."""
+
+    vehicles = max(1, int(repairs * VEHICLES_PER_REPAIR))
+
+    return {
+        "repairs": repairs,
+        "vehicles": vehicles,
+        "customers": max(1, int(vehicles * CUSTOMERS_PER_VEHICLE)),
+        "parts": max(MIN_PARTS, int(repairs * PARTS_PER_REPAIR)),
+        "employees": max(MIN_EMPLOYEES, repairs // REPAIRS_PER_EMPLOYEE),
+    }
+
+
+class ShopDataGenerator:
+    """This class defines a generator of synthetic shop data. It writes each table with
+    executemany, BATCH_REPAIRS repairs per transaction, and keeps only the current
+    batch in memory."""
+
+    def __init__(self, database, counts, seed=0):
+        self.database = database
+        self.counts = counts
+        self.rng = random.Random(seed)
+        self.written = dict.fromkeys(
+            ("employees", "customers", "parts", "vehicles", "repairs", "part_listings"),
+            0,
+        )
+        self.tech_ids = []
+        self.writer_ids = []
+        self.part_ids = []
+        self.part_costs = {}
+        self.part_cum_weights = []
+        self.fleet_customer_count = max(
+            1, int(counts["customers"] * FLEET_CUSTOMER_SHARE)
+        )
+
+        # day of the history --> date as repair id suffix and as stored, made once
+        history_start = HISTORY_END - datetime.timedelta(days=HISTORY_DAYS - 1)
+        history = [
+            history_start + datetime.timedelta(days=day)
+            for day in range(HISTORY_DAYS + MAX_REPAIR_DAYS)
+        ]
+        self.day_ids = [date.strftime("%Y%m%d") for date in history]
+        self.dates = [format_date(date) for date in history]
+
+    def generate(self):
+        """Writes every table, returns the number of rows written to each."""
+
+        # every generated row is new --> skip waiting on the disk between batches, keep
+        # more of the indexes in memory while they grow
+        self.database.cursor.execute("""PRAGMA synchronous = OFF;""")
+        self.database.cursor.execute(f"""PRAGMA cache_size = {LOAD_CACHE_KIB};""")
+
+        # indexes and triggers are remade after the load, in one pass each instead of
+        # once per row
+        with self.suspend_schema(
+            ("customers", "parts", "vehicles", "repairs", "part_listings")
+        ):
+            with self.database.transaction():
+                self.write_employees()
+                self.write_customers()
+                self.write_parts()
+
+            self.write_vehicles_and_repairs()
+
+        self.database.rebuild_repair_search()
+
+        self.database.cursor.execute("""PRAGMA synchronous = FULL;""")
+        self.database.cursor.execute("""ANALYZE;""")
+
+        return self.written
+
+    @contextlib.contextmanager
+    def suspend_schema(self, tables):
+        """Context manager dropping the indexes and triggers of the passed tables for
+        the block, then creating them again from their stored SQL. Rows written in the
+        block are not seen by the triggers, the block must write them as the triggers
+        would."""
+
+        placeholders = ", ".join("?" * len(tables))
+        schema = self.database.cursor.execute(
+            f"""SELECT type, name, sql FROM sqlite_master
+            WHERE type IN ('index', 'trigger') AND sql IS NOT NULL
+            AND tbl_name IN ({placeholders});""",
+            tables,
+        ).fetchall()
+
+        with self.database.transaction():
+            for row in schema:
+                # names come from sqlite_master, not from input
+                self.database.cursor.execute(f"""DROP {row["type"]} {row["name"]};""")
+
+        yield
+
+        with self.database.transaction():
+            for row in schema:
+                self.database.cursor.execute(row["sql"])
+
+    def write_rows(self, table, statement, rows):
+        """Writes the passed rows to the passed table with one executemany."""
+
+        self.database.cursor.executemany(statement, rows)
+        self.written[table] += len(rows)
+
+    def write_employees(self):
+        """Writes the employees, all with the generated password."""
+
+        rng = self.rng
+        password_hash = self.database.hash_password(GENERATED_PASSWORD)
+        rows = []
+
+        for employee_id in range(1, self.counts["employees"] + 1):
+            # first employees are one of each role so both always exist
+            is_writer = employee_id == 1 or (
+                employee_id > 2 and rng.random() < WRITER_SHARE
+            )
+            (self.writer_ids if is_writer else self.tech_ids).append(employee_id)
+
+            rows.append(
+                (
+                    employee_id,
+                    f"employee{employee_id}",
+                    password_hash,
+                    f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+                    rng.choice("ABCD"),
+                    str(rng.randint(1, 20)),
+                    int(not is_writer),
+                    int(is_writer),
+                )
+            )
+
+        self.write_rows(
+            "employees",
+            """INSERT INTO employees (employee_id, username, password, name, team,
+            lane_or_section, is_tech, is_writer) VALUES (?, ?, ?, ?, ?, ?, ?, ?);""",
+            rows,
+        )
+
+    def write_customers(self):
+        """Writes the customers, the first of them own the fleets."""
+
+        rng = self.rng
+        rows = []
+
+        for customer_id in range(1, self.counts["customers"] + 1):
+            if customer_id <= self.fleet_customer_count:
+                name = (
+                    f"{rng.choice(LAST_NAMES)} {rng.choice(FLEET_NAMES)} {customer_id}"
+                )
+            else:
+                name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+
+            rows.append(
+                (
+                    customer_id,
+                    name,
+                    f"{rng.randint(1, 9999)} {rng.choice(STREETS)}",
+                    f"{rng.randint(200, 999)}-{rng.randint(200, 999)}-"
+                    f"{rng.randint(0, 9999):04}",
+                )
+            )
+
+        self.write_rows(
+            "customers",
+            """INSERT INTO customers (customer_id, name, address, phone_number)
+            VALUES (?, ?, ?, ?);""",
+            rows,
+        )
+
+    def write_parts(self):
+        """Writes the parts and ranks them by how often repairs use them."""
+
+        rng = self.rng
+        rows = []
+
+        for part in range(self.counts["parts"]):
+            kind = rng.choice(PART_KINDS)
+            part_id = f"{kind[:2].upper()}{part:07}"
+            cost = round(rng.lognormvariate(3.5, 1.0), 2)
+
+            self.part_ids.append(part_id)
+            self.part_costs[part_id] = cost
+            rows.append((part_id, cost, f"{kind} {rng.choice(tuple(MAKES))}"))
+
+        self.write_rows("parts", """INSERT INTO parts VALUES (?, ?, ?);""", rows)
+
+        # popularity rank is random, not the part id order
+        rng.shuffle(self.part_ids)
+        self.part_cum_weights = list(
+            itertools.accumulate(
+                1 / rank**ZIPF_EXPONENT for rank in range(1, len(self.part_ids) + 1)
+            )
+        )
+
+    def get_repair_counts(self):
+        """Generator yielding (is fleet vehicle, repairs of it) per vehicle. Repairs
+        are spread over the vehicles in proportion to their weight, fleet vehicles
+        weigh FLEET_REPAIR_WEIGHT times more than the others."""
+
+        rng = self.rng
+        vehicles = self.counts["vehicles"]
+        remaining_repairs = self.counts["repairs"]
+        mean_weight = 1 + FLEET_VEHICLE_SHARE * (FLEET_REPAIR_WEIGHT - 1)
+
+        for vehicle in range(vehicles):
+            is_fleet = rng.random() < FLEET_VEHICLE_SHARE
+            weight = FLEET_REPAIR_WEIGHT if is_fleet else 1
+            mean = remaining_repairs * weight / ((vehicles - vehicle) * mean_weight)
+
+            if vehicle == vehicles - 1:
+                repairs = remaining_repairs  # last vehicle --> the rest
+            elif mean > 0:
+                # spread around the mean so histories vary
+                repairs = int(rng.expovariate(1 / mean) + 0.5)
+            else:
+                repairs = 0
+
+            # a vehicle has at most a repair a day, never more than are left
+            repairs = min(repairs, remaining_repairs, HISTORY_DAYS)
+            remaining_repairs -= repairs
+
+            yield is_fleet, repairs
+
+    def make_listings(self, repair_id):
+        """Returns the part listings of a repair and their parts cost."""
+
+        rng_random = self.rng.random  # called per listing --> skip randint's overhead
+        part_ids = self.rng.choices(
+            self.part_ids,
+            cum_weights=self.part_cum_weights,
+            k=int(rng_random() * (MAX_LISTINGS_PER_REPAIR + 1)),
+        )
+        listings = {}
+
+        for part_id in part_ids:  # a repair lists each part once with a quantity
+            listings[part_id] = (
+                listings.get(part_id, 0) + 1 + int(rng_random() * MAX_LISTING_QUANTITY)
+            )
+
+        parts_cost = sum(
+            self.part_costs[part_id] * quantity
+            for part_id, quantity in listings.items()
+        )
+
+        return [
+            (repair_id, part_id, quantity) for part_id, quantity in listings.items()
+        ], parts_cost
+
+    def make_vehicle_repairs(self, vin, repairs, has_open_repair):
+        """Returns the repairs of a vehicle on distinct days, oldest first, their part
+        listings and the id of its open repair, the latest one, or None."""
+
+        rng_random = self.rng.random  # called per repair --> skip choice's overhead
+        day_ids, dates = self.day_ids, self.dates
+        tech_ids, writer_ids = self.tech_ids, self.writer_ids
+        repair_rows = []
+        listing_rows = []
+        open_repair_id = None
+
+        days = sorted(self.rng.sample(range(HISTORY_DAYS), repairs))
+
+        for index, day in enumerate(days):
+            repair_id = vin + day_ids[day]  # vin + YYYYMMDD, as the app makes them
+            is_open = has_open_repair and index == repairs - 1
+            listings, parts_cost = self.make_listings(repair_id)
+            labor = round(40 + rng_random() * 1460, 2)
+
+            if is_open:
+                open_repair_id = repair_id
+                completed = None
+                repair_description = None
+            else:
+                completed = dates[day + int(rng_random() * (MAX_REPAIR_DAYS + 1))]
+                repair_description = REPAIRS_DONE[int(rng_random() * len(REPAIRS_DONE))]
+
+            repair_rows.append(
+                (
+                    repair_id,
+                    labor + parts_cost,
+                    labor,
+                    parts_cost,
+                    dates[day],
+                    completed,
+                    PROBLEMS[int(rng_random() * len(PROBLEMS))],
+                    repair_description,
+                    tech_ids[int(rng_random() * len(tech_ids))],
+                    writer_ids[int(rng_random() * len(writer_ids))],
+                    vin,
+                )
+            )
+            listing_rows.extend(listings)
+
+        return repair_rows, listing_rows, open_repair_id
+
+    def write_vehicles_and_repairs(self):
+        """Writes the vehicles with their repair histories and part listings, a
+        transaction per BATCH_REPAIRS repairs."""
+
+        rng = self.rng
+        customers = self.counts["customers"]
+        fleet_customers = self.fleet_customer_count
+
+        repairs_so_far = 0
+        open_repairs = 0
+
+        vehicle_rows = []
+        repair_rows = []
+        listing_rows = []
+
+        for serial, (is_fleet, repairs) in enumerate(self.get_repair_counts()):
+            make = rng.choice(tuple(MAKES))
+            wmi, models = MAKES[make]
+            year = rng.randint(HISTORY_END.year - 25, HISTORY_END.year)
+            vin = make_vin(rng, wmi, year, serial)
+
+            # latest repair left open at random while under OPEN_REPAIR_SHARE of the
+            # repairs so far
+            repairs_so_far += repairs
+            has_open_repair = (
+                repairs > 0
+                and open_repairs < OPEN_REPAIR_SHARE * repairs_so_far
+                and rng.random() < OPEN_VEHICLE_CHANCE
+            )
+            open_repairs += has_open_repair
+
+            (
+                vehicle_repairs,
+                vehicle_listings,
+                open_repair_id,
+            ) = self.make_vehicle_repairs(vin, repairs, has_open_repair)
+
+            vehicle_rows.append(
+                (
+                    vin,
+                    rng.choice(models),
+                    make,
+                    str(year),
+                    rng.choice(COLORS),
+                    rng.choice(ENGINES),
+                    open_repair_id,
+                    rng.randint(1, fleet_customers)
+                    if is_fleet
+                    else rng.randint(min(fleet_customers + 1, customers), customers),
+                )
+            )
+            repair_rows.extend(vehicle_repairs)
+            listing_rows.extend(vehicle_listings)
+
+            if len(repair_rows) >= BATCH_REPAIRS:
+                self.write_batch(vehicle_rows, repair_rows, listing_rows)
+
+                vehicle_rows, repair_rows, listing_rows = [], [], []
+
+        self.write_batch(vehicle_rows, repair_rows, listing_rows)
+
+    def write_batch(self, vehicle_rows, repair_rows, listing_rows):
+        """Writes a batch of vehicles, repairs and part listings as one transaction.
+        The repairs are written with their costs already added up, as the cost
+        triggers would. Rows are written in key order to keep index writes local."""
+
+        repair_rows.sort()
+        listing_rows.sort()
+
+        with self.database.transaction():
+            self.write_rows(
+                "vehicles",
+                """INSERT INTO vehicles VALUES (?, ?, ?, ?, ?, ?, ?, ?);""",
+                vehicle_rows,
+            )
+            self.write_rows(
+                "part_listings",
+                """INSERT INTO part_listings (repair_id, part_id, quantity)
+                VALUES (?, ?, ?);""",
+                listing_rows,
+            )
+            self.write_rows(
+                "repairs",
+                """INSERT INTO repairs (repair_id, total_cost, labor, parts_cost,
+                drop_off_date, repair_completed_date, problem_description,
+                repair_description, technician, service_writer, vehicle)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?);""",
+                repair_rows,
+            )
+
+
+def generate(database_path, repairs=10000, seed=0, **counts):
+    """Generates a new database at the passed path with about the passed number of
+    repairs and, by default, the other tables scaled to match. Counts passed by table
+    name replace the defaults. Returns the number of rows written to each table."""
+
+    counts = {**get_default_counts(repairs), **counts}
+    database = AppDatabase(database_path)
+
+    try:
+        return ShopDataGenerator(database, counts, seed).generate()
+    finally:
+        database.close()
+
+
+def parse_arguments(arguments=None):
+    """Returns the parsed command line arguments."""
+
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.generator",
+        description="Generates a database of synthetic shop data for load testing.",
+    )
+    parser.add_argument("output", help="path of the database file to create")
+    parser.add_argument(
+        "--repairs", type=int, default=10000, help="about how many repairs to generate"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+
+    for table in ("vehicles", "customers", "parts", "employees"):
+        parser.add_argument(
+            f"--{table}", type=int, help=f"number of {table}, scales with repairs"
+        )
+
+    parser.add_argument(
+        "--replace", action="store_true", help="replace the output file if it exists"
+    )
+
+    return parser.parse_args(arguments)
+
+
+def main(arguments=None):
+    """Generates the database the command line asks for. Returns the exit status."""
+
+    arguments = parse_arguments(arguments)
+
+    if os.path.exists(arguments.output):
+        if not arguments.replace:
+            print(f"{arguments.output} exists, pass --replace to replace it.")
+
+            return 1
+
+        os.remove(arguments.output)
+
+    counts = {
+        table: getattr(arguments, table)
+        for table in ("vehicles", "customers", "parts", "employees")
+        if getattr(arguments, table) is not None
+    }
+
+    start = time.perf_counter()
+
+    try:
+        written = generate(
+            arguments.output, arguments.repairs, arguments.seed, **counts
+        )
+    except BaseException:
+        # a partly generated database is missing rows, indexes and triggers
+        os.remove(arguments.output)
+        raise
+
+    for table, rows in written.items():
+        print(f"{table:<15}{rows:>12,}")
+
+    print(f"Generated in {time.perf_counter() - start:.1f} s")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+"""This module writes the benchmark results to a JSON report and compares them to the
+report of an earlier run."""
+
+import datetime
+import json
+import platform
+import sqlite3
+
+# Default slowdown of a benchmark's median over the baseline's that counts as a
+# regression, 1.5 --> 50% slower
+DEFAULT_TOLERANCE = 1.5
+
+# Medians below this are too short to compare reliably, in milliseconds
+MIN_COMPARED_MS = 0.05
+
+
+def build_report(results, scale, repeat, seed):
+    """Returns the report of the passed benchmark results and the run they came from."""
+
+    return {
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "sqlite": sqlite3.sqlite_version,
+        "platform": platform.platform(),
+        "scale": scale,
+        "repeat": repeat,
+        "seed": seed,
+        **results,
+    }
+
+
+def write_report(report, path):
+    """Writes the passed report to the JSON file at the passed path."""
+
+    with open(path, "w", encoding="utf-8") as report_file:
+        json.dump(report, report_file, indent=2)
+
+
+def read_report(path):
+    """Returns the report in the JSON file at the passed path."""
+
+    with open(path, encoding="utf-8") as report_file:
+        return json.load(report_file)
+
+
+def find_regressions(report, baseline, tolerance=DEFAULT_TOLERANCE):
+    """Returns a list of (section, benchmark, baseline median, median) of every
+    benchmark in both reports whose median grew past the baseline's by more than the
+    tolerance."""
+
+    regressions = []
+
+    for section in ("database_methods", "handler_flows"):
+        baseline_section = baseline.get(section, {})
+
+        for name, timings in report.get(section, {}).items():
+            if name not in baseline_section:
+                continue  # new benchmark --> nothing to compare to
+
+            baseline_median = baseline_section[name]["median_ms"]
+            median = timings["median_ms"]
+
+            if max(median, baseline_median) < MIN_COMPARED_MS:
+                continue  # too fast to tell apart from timer noise
+
+            if median > baseline_median * tolerance:
+                regressions.append((section, name, baseline_median, median))
+
+    return regressions
+
+
+def format_summary(report):
+    """Returns the report's timings as a text table, slowest medians first."""
+
+    lines = [f"{'benchmark':<45}{'median ms':>12}{'p95 ms':>12}{'max ms':>12}"]
+
+    for section in ("database_methods", "handler_flows"):
+        lines.append(f"\n--- {section} ---")
+
+        timings = sorted(
+            report[section].items(), key=lambda item: item[1]["median_ms"], reverse=True
+        )
+
+        for name, timing in timings:
+            lines.append(
+                f"{name:<45}{timing['median_ms']:>12.3f}{timing['p95_ms']:>12.3f}"
+                f"{timing['max_ms']:>12.3f}"
+            )
+
+            if timing["errors"]:
+                lines.append(f"    errors shown : {' '.join(timing['errors'])!r}")
+
+    if report["not_benchmarked"]:
+        lines.append("\n--- not benchmarked ---")
+
+        for name, reason in report["not_benchmarked"].items():
+            lines.append(f"{name} : {reason}")
+
+    return "\n".join(lines)
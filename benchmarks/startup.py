@@ -0,0 +1,193 @@
+"""This module profiles the startup of the application: what importing each module
+costs, measured by Python's -X importtime in a fresh interpreter, and optionally how
+long the app factory takes to put an interactive login page on screen.
+
+Run from the application directory --> python -m benchmarks.startup --help"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+# Modules profiled by default, the handler modules first and the app last
+DEFAULT_MODULES = (
+    "users",
+    "repairs",
+    "parts",
+    "customers",
+    "vehicles",
+    "lookup",
+    "data_interface",
+    "db_worker",
+    "gui",
+    "app",
+)
+
+# Packages reported on when a module imports them, the costly ones to import
+HEAVY_PACKAGES = ("passlib", "PyQt6")
+
+# Directory of the application modules
+APP_DIRECTORY = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+
+# Run in a fresh interpreter to time the app factory, prints the timings as JSON
+WINDOW_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import app
+imported = time.perf_counter()
+qt_app, gui = app.create_app(["--database", sys.argv[1]])
+gui.show()
+qt_app.processEvents()
+shown = time.perf_counter()
+gui.database.close()
+print(json.dumps({"import_ms": (imported - start) * 1000,
+                  "create_app_ms": (shown - imported) * 1000}))
+"""
+
+
+def run_python(arguments, env=None):
+    """Runs a fresh interpreter with the passed arguments in the application
+    directory, returns the completed process."""
+
+    return subprocess.run(
+        [sys.executable, *arguments],
+        cwd=APP_DIRECTORY,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def parse_importtime(output):
+    """Returns a list of (self us, cumulative us, depth, module) of every import
+    -X importtime wrote to the passed output."""
+
+    imports = []
+
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue  # other output or the header
+
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+
+        imports.append((int(self_us), int(cumulative_us), depth, name.strip()))
+
+    return imports
+
+
+def profile_import(module):
+    """Returns a dictionary of the time importing the passed module takes in a fresh
+    interpreter, the heavy packages it pulls in and every import it adds, slowest
+    cumulative first. Imports the interpreter makes on its own are left out."""
+
+    baseline = {
+        name
+        for _, _, _, name in parse_importtime(
+            run_python(["-X", "importtime", "-c", "pass"]).stderr
+        )
+    }
+    imports = [
+        entry
+        for entry in parse_importtime(
+            run_python(["-X", "importtime", "-c", f"import {module}"]).stderr
+        )
+        if entry[3] not in baseline
+    ]
+    names = {name for _, _, _, name in imports}
+
+    return {
+        "module": module,
+        "total_ms": sum(self_us for self_us, _, _, _ in imports) / 1000,
+        "heavy": [
+            package
+            for package in HEAVY_PACKAGES
+            if any(name.split(".")[0] == package for name in names)
+        ],
+        "imports": sorted(imports, key=lambda entry: entry[1], reverse=True),
+    }
+
+
+def profile_window():
+    """Returns a dictionary of the time importing app and the app factory take in a
+    fresh interpreter, against an empty database in a temporary directory."""
+
+    env = dict(
+        os.environ, QT_QPA_PLATFORM=os.environ.get("QT_QPA_PLATFORM", "offscreen")
+    )
+
+    with tempfile.TemporaryDirectory() as directory:
+        database_path = os.path.join(directory, "startup.db")
+        result = run_python(["-c", WINDOW_SCRIPT, database_path], env)
+
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+def format_profile(profile, top):
+    """Returns the passed import profile as text, its slowest imports first."""
+
+    heavy = ", ".join(profile["heavy"]) or "none"
+    lines = [
+        f"\n--- {profile['module']} : {profile['total_ms']:.1f} ms, "
+        f"heavy packages : {heavy} ---",
+        f"{'self ms':>10}{'cumulative ms':>15}  module",
+    ]
+
+    for self_us, cumulative_us, depth, name in profile["imports"][:top]:
+        lines.append(
+            f"{self_us / 1000:>10.1f}{cumulative_us / 1000:>15.1f}  {'  ' * depth}{name}"
+        )
+
+    return "\n".join(lines)
+
+
+def parse_arguments(arguments=None):
+    """Returns the parsed command line arguments."""
+
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.startup",
+        description="Profiles the import time of the application modules and "
+        "optionally the time to an interactive login page.",
+    )
+    parser.add_argument(
+        "modules",
+        nargs="*",
+        default=DEFAULT_MODULES,
+        help="modules to profile, the handler modules, database, gui and app by default",
+    )
+    parser.add_argument(
+        "--top", type=int, default=10, help="slowest imports listed per module"
+    )
+    parser.add_argument(
+        "--window",
+        action="store_true",
+        help="also time the app factory showing the login page, offscreen by default",
+    )
+
+    return parser.parse_args(arguments)
+
+
+def main(arguments=None):
+    """Profiles the modules the command line asks for. Returns the exit status."""
+
+    arguments = parse_arguments(arguments)
+
+    for module in arguments.modules:
+        print(format_profile(profile_import(module), arguments.top))
+
+    if arguments.window:
+        timings = profile_window()
+
+        print(
+            f"\nimport app : {timings['import_ms']:.1f} ms, create_app to login page : "
+            f"{timings['create_app_ms']:.1f} ms"
+        )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
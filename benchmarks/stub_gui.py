@@ -0,0 +1,130 @@
+"""This module defines a headless stand in for the GUI that the handler modules can be
+run against, so handler flows can be timed without a display."""
+
+import collections
+from data_interface import PAGE_SIZE
+
+
+class StubWidget:
+    """This class defines a stand in for any GUI widget. It holds a text value and a
+    checked state, and every other method call does nothing."""
+
+    def __init__(self, value=""):
+        self.value = value
+        self.checked = False
+
+    def text(self):
+        """Returns the widget's text."""
+
+        return self.value
+
+    def toPlainText(self):  # pylint: disable=invalid-name
+        """Returns the widget's text."""
+
+        return self.value
+
+    def setText(self, value):  # pylint: disable=invalid-name
+        """Sets the widget's text."""
+
+        self.value = value
+
+    def clear(self):
+        """Clears the widget's text."""
+
+        self.value = ""
+
+    def isChecked(self):  # pylint: disable=invalid-name
+        """Returns the widget's checked state."""
+
+        return self.checked
+
+    def __call__(self, *args, **kwargs):
+        return None
+
+    def __getattr__(self, name):
+        return self  # any other method --> callable that does nothing
+
+
+class StubGui:
+    """This class defines a stand in for the GUI. Widgets are created on first use, the
+    dialogs return queued answers and the displays consume what they are passed the way
+    the GUI would, so rendering is part of the timed work."""
+
+    def __init__(self):
+        self.widgets = {}
+        self.id_answers = collections.deque()  # answers to show_id_search_request
+        self.quantity = 1  # answer to show_quantity_request
+        self.errors = []
+        self.messages = []
+
+    def __getattr__(self, name):
+        # widgets, displays and page resets --> stub widget that records text
+        if name not in self.widgets:
+            self.widgets[name] = StubWidget()
+
+        return self.widgets[name]
+
+    def set_input(self, name, value):
+        """Sets the text of the named input widget."""
+
+        getattr(self, name).setText(value)
+
+    def show_error(self, error):
+        """Records the error message."""
+
+        self.errors.append(error)
+
+    def show_success(self, message):
+        """Records the success message."""
+
+        self.messages.append(message)
+
+    def show_user_search(self, information_to_display):
+        """Records the displayed user information."""
+
+        self.messages.append(information_to_display)
+
+    def show_vehicle_repair_history(self, repair_info):
+        """Records the displayed repair history."""
+
+        self.messages.append(repair_info)
+
+    def show_id_search_request(self, _title, _msg):
+        """Returns the next queued answer, False (cancel) once they run out."""
+
+        if not self.id_answers:
+            return False
+
+        return self.id_answers.popleft()
+
+    def show_quantity_request(self, _title, _msg):
+        """Returns the set quantity."""
+
+        return self.quantity
+
+    def stream_text(self, text_browser, chunks):
+        """Renders every chunk into the text browser at once."""
+
+        text_browser.setText("".join(chunks))
+
+    def update_list_table(self, _table_view, fetch_page, _table, columns):
+        """Fetches and formats the first page of the table, which is what the table
+        view shows when a list page opens."""
+
+        for row in fetch_page(None, PAGE_SIZE, None, False):
+            for column, _header, format_string in columns:
+                value = row[column]
+
+                if value is not None and format_string is not None:
+                    format_string.format(value)
+
+    def update_active_repair_list(self, fetch_page, columns):
+        """Fetches and formats the first page of active repairs."""
+
+        self.update_list_table(None, fetch_page, "repairs", columns)
+
+    def clear_errors(self):
+        """Drops the recorded messages."""
+
+        self.errors.clear()
+        self.messages.clear()
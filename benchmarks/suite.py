@@ -0,0 +1,745 @@
+"""This module defines the benchmarks of the database methods and the handler flows and
+the functions that run them.
+
+Each benchmark is a function taking the benchmark context and returning the call to
+time. Setting up the call (picking keys, inserting the rows it removes, queueing dialog
+answers) happens before the clock starts."""
+
+import collections
+import contextlib
+import functools
+import inspect
+import random
+import statistics
+import time
+from data_interface import AppDatabase
+from benchmarks.generator import GENERATED_PASSWORD
+from benchmarks.stub_gui import StubGui
+import customers
+import parts
+import repairs
+import users
+import vehicles
+
+# Most keys of each kind sampled from the database for the benchmarks to pick from
+SAMPLE_SIZE = 1000
+
+# Most runs of a benchmark that hashes a password, hashing is slow by design
+HASHING_REPEAT = 3
+
+# Drop off date of the repairs the benchmarks create --> YYYY/MM/DD
+BENCHMARK_DATE = "2030/01/01"
+
+
+class BenchmarkContext:
+    """This class defines the state the benchmarks share: the database, the stub GUI,
+    the keys sampled from the database and a counter for creating new unique keys."""
+
+    def __init__(self, database, seed=0):
+        self.database = database
+        self.gui = StubGui()
+        self.rng = random.Random(seed)
+        self.serial = 0
+        self.password_hash = database.hash_password(GENERATED_PASSWORD)
+
+        def sample(query):
+            return [row[0] for row in database.cursor.execute(query).fetchall()]
+
+        self.samples = {
+            "repair_ids": sample(
+                f"""SELECT repair_id FROM repairs ORDER BY random()
+                LIMIT {SAMPLE_SIZE};"""
+            ),
+            "completed_repair_ids": sample(
+                f"""SELECT repair_id FROM repairs WHERE repair_completed_date
+                IS NOT NULL ORDER BY random() LIMIT {SAMPLE_SIZE};"""
+            ),
+            "open_repair_ids": sample(
+                f"""SELECT repair_id FROM repairs WHERE repair_completed_date IS NULL
+                ORDER BY random() LIMIT {SAMPLE_SIZE};"""
+            ),
+            "part_ids": sample(
+                f"""SELECT part_id FROM parts ORDER BY random() LIMIT {SAMPLE_SIZE};"""
+            ),
+            "customer_ids": sample(
+                f"""SELECT customer_id FROM customers ORDER BY random()
+                LIMIT {SAMPLE_SIZE};"""
+            ),
+            "vins": sample(
+                f"""SELECT vin FROM vehicles ORDER BY random() LIMIT {SAMPLE_SIZE};"""
+            ),
+            "tech_ids": sample("""SELECT employee_id FROM employees WHERE is_tech;"""),
+            "writer_ids": sample(
+                """SELECT employee_id FROM employees WHERE is_writer;"""
+            ),
+        }
+
+        # benchmarks run logged in as a service writer
+        self.user_id = self.samples["writer_ids"][0]
+        self.username = database.search_for_user(self.user_id)["username"]
+
+        database.set_current_user(self.user_id)
+        database.set_login_status(True)
+        database.load_employee_directory()
+
+    def pick(self, kind):
+        """Returns a random sampled key of the passed kind."""
+
+        return self.rng.choice(self.samples[kind])
+
+    def new_key(self, prefix, length):
+        """Returns a new unique key starting with prefix, padded to length."""
+
+        self.serial += 1
+
+        return f"{prefix}{self.serial:0{length - len(prefix)}}"
+
+    def confirm_password(self):
+        """Confirms the current user's password so the password checks that follow
+        run within the re-authentication grace window, the way they do in the app."""
+
+        self.database.is_current_users_password(GENERATED_PASSWORD)
+
+    def new_vehicle(self, owner=None):
+        """Inserts a new vehicle, returns its vin."""
+
+        return self.database.insert_vehicle(
+            {
+                "vin": self.new_key("BENCH", 17),
+                "model": "Model",
+                "make": "Make",
+                "year": "2030",
+                "color": "Blue",
+                "engine": "I4",
+                "repair_request": None,
+                "owner": owner,
+            }
+        )
+
+    def new_repair(self):
+        """Inserts a new open repair of a new owned vehicle, returns its repair id."""
+
+        vin = self.new_vehicle(self.pick("customer_ids"))
+        repair_id = self.database.insert_repair(
+            {
+                "repair_id": vin + BENCHMARK_DATE.replace("/", ""),
+                "total_cost": 0.0,
+                "labor": 0.0,
+                "parts_cost": 0.0,
+                "drop_off_date": BENCHMARK_DATE,
+                "problem_description": "Customer states brakes squeal",
+                "tech_id": self.pick("tech_ids"),
+                "writer_id": self.pick("writer_ids"),
+                "vin": vin,
+            }
+        )
+
+        self.database.update_vehicle_active_repair(vin, repair_id)
+
+        return repair_id
+
+    def new_part(self):
+        """Inserts a new part, returns its part id."""
+
+        return self.database.insert_part(
+            {
+                "part_id": self.new_key("BENCH", 12),
+                "part_cost": 10.0,
+                "part_description": "Benchmark part",
+            }
+        )
+
+    def new_customer(self):
+        """Inserts a new customer, returns its customer id."""
+
+        return self.database.insert_customer(
+            {"name": "Benchmark Customer", "address": "1 Main St", "phone": "555-0100"}
+        )
+
+    def new_user_data(self):
+        """Returns the data of a new user with the benchmark password."""
+
+        return {
+            "username": self.new_key("bench_user", 20),
+            "hash_pwrd": self.password_hash,
+            "name": "Benchmark User",
+            "team": "B",
+            "lane_or_section": "1",
+            "is_tech": 1,
+            "is_writer": 0,
+        }
+
+    def new_user(self):
+        """Inserts a new user, returns its employee id."""
+
+        return self.database.insert_user(self.new_user_data())
+
+
+def consume(rows):
+    """Exhausts the passed iterator of rows, used to time the iter_* methods."""
+
+    collections.deque(rows, maxlen=0)
+
+
+def run_empty_transaction(database):
+    """Opens and commits a transaction with nothing in it."""
+
+    with database.transaction():
+        pass
+
+
+def bench_insert_repair(context):
+    """Times inserting a repair of a new vehicle."""
+
+    vin = context.new_vehicle()
+
+    return functools.partial(
+        context.database.insert_repair,
+        {
+            "repair_id": vin + BENCHMARK_DATE.replace("/", ""),
+            "total_cost": 0.0,
+            "labor": 0.0,
+            "parts_cost": 0.0,
+            "drop_off_date": BENCHMARK_DATE,
+            "problem_description": "Customer states brakes squeal",
+            "tech_id": context.pick("tech_ids"),
+            "writer_id": context.pick("writer_ids"),
+            "vin": vin,
+        },
+    )
+
+
+def bench_is_current_users_password(context):
+    """Times a full password check, outside the grace window."""
+
+    context.database.reauth_grace.clear()
+
+    return functools.partial(
+        context.database.is_current_users_password, GENERATED_PASSWORD
+    )
+
+
+def bench_remove_repair(context):
+    """Times removing a new repair."""
+
+    repair_id = context.new_repair()
+    context.confirm_password()
+
+    return functools.partial(
+        context.database.remove_repair, repair_id, GENERATED_PASSWORD
+    )
+
+
+def bench_remove_part(context):
+    """Times removing a new part."""
+
+    part_id = context.new_part()
+    context.confirm_password()
+
+    return functools.partial(context.database.remove_part, part_id, GENERATED_PASSWORD)
+
+
+def bench_remove_customer(context):
+    """Times removing a new customer."""
+
+    customer_id = context.new_customer()
+    context.confirm_password()
+
+    return functools.partial(
+        context.database.remove_customer, customer_id, GENERATED_PASSWORD
+    )
+
+
+def bench_remove_vehicle(context):
+    """Times removing a new vehicle."""
+
+    vin = context.new_vehicle()
+    context.confirm_password()
+
+    return functools.partial(context.database.remove_vehicle, vin, GENERATED_PASSWORD)
+
+
+def bench_drop_part_listing(context):
+    """Times dropping a part listing from an open repair."""
+
+    repair_id = context.pick("open_repair_ids")
+    part_id = context.pick("part_ids")
+
+    context.database.insert_part_listing(repair_id, part_id)
+
+    return functools.partial(context.database.drop_part_listing, repair_id, part_id)
+
+
+def bench_remove_vehicle_owner(context):
+    """Times removing the owner of a new owned vehicle."""
+
+    customer_id = context.pick("customer_ids")
+    vin = context.new_vehicle(customer_id)
+
+    return functools.partial(context.database.remove_vehicle_owner, vin, customer_id)
+
+
+# Database method --> benchmark, see the module docstring
+DATABASE_BENCHMARKS = {
+    # tables and maintenance
+    "create_tables": lambda c: c.database.create_tables,
+    "migrate_database": lambda c: c.database.migrate_database,
+    "commit": lambda c: c.database.commit,
+    "transaction": lambda c: functools.partial(run_empty_transaction, c.database),
+    "rebuild_repair_costs": lambda c: c.database.rebuild_repair_costs,
+    "rebuild_repair_search": lambda c: c.database.rebuild_repair_search,
+    "update_fields": lambda c: functools.partial(
+        c.database.update_fields,
+        "repairs",
+        c.pick("repair_ids"),
+        {"labor": 150.0, "problem_description": "Customer states engine noise"},
+    ),
+    "create_remove_row_dispatcher": lambda c: c.database.create_remove_row_dispatcher,
+    # paging and streaming
+    "get_table_page": lambda c: functools.partial(
+        c.database.get_table_page,
+        "repairs",
+        None,
+        100,
+        "total_cost",
+        True,
+        "repair_completed_date IS NULL",
+    ),
+    "iter_table": lambda c: lambda: consume(c.database.iter_table("parts")),
+    "get_parts_page": lambda c: c.database.get_parts_page,
+    "get_customers_page": lambda c: c.database.get_customers_page,
+    "get_vehicles_page": lambda c: c.database.get_vehicles_page,
+    "get_users_page": lambda c: c.database.get_users_page,
+    "get_active_repairs_page": lambda c: c.database.get_active_repairs_page,
+    "iter_parts": lambda c: lambda: consume(c.database.iter_parts()),
+    "iter_customers": lambda c: lambda: consume(c.database.iter_customers()),
+    "iter_vehicles": lambda c: lambda: consume(c.database.iter_vehicles()),
+    "iter_users": lambda c: lambda: consume(c.database.iter_users()),
+    "iter_active_repairs": lambda c: lambda: consume(c.database.iter_active_repairs()),
+    "get_all_parts_in_database": lambda c: c.database.get_all_parts_in_database,
+    "get_all_customers": lambda c: c.database.get_all_customers,
+    "get_all_vehicles": lambda c: c.database.get_all_vehicles,
+    "get_all_users": lambda c: c.database.get_all_users,
+    "get_all_active_repairs": lambda c: c.database.get_all_active_repairs,
+    # search and lookups
+    "search_repairs_text": lambda c: functools.partial(
+        c.database.search_repairs_text, "engine noise"
+    ),
+    "get_prefix_matches": lambda c: functools.partial(
+        c.database.get_prefix_matches, "part_id", c.pick("part_ids")[:7]
+    ),
+    "get_merged_prefix_matches": lambda c: functools.partial(
+        c.database.get_merged_prefix_matches,
+        ("vehicle_vin", "vehicle_vin_last_six"),
+        "vin",
+        c.pick("vins")[:3],
+        25,
+    ),
+    "find_customers": lambda c: functools.partial(
+        c.database.find_customers, name_prefix="customer 1"
+    ),
+    "lookup_customers": lambda c: functools.partial(
+        c.database.lookup_customers, "Customer 12"
+    ),
+    "lookup_vehicles": lambda c: functools.partial(
+        c.database.lookup_vehicles, c.pick("vins")[:4]
+    ),
+    "lookup_parts": lambda c: functools.partial(
+        c.database.lookup_parts, c.pick("part_ids")[:8]
+    ),
+    # users
+    "is_valid_login_query": lambda c: functools.partial(
+        c.database.is_valid_login_query, c.username, GENERATED_PASSWORD
+    ),
+    "remove_user": lambda c: functools.partial(
+        c.database.remove_user, c.new_user(), GENERATED_PASSWORD
+    ),
+    "is_current_users_password": bench_is_current_users_password,
+    "hash_password": lambda c: functools.partial(
+        c.database.hash_password, GENERATED_PASSWORD
+    ),
+    "is_current_users_username": lambda c: functools.partial(
+        c.database.is_current_users_username, c.username
+    ),
+    "set_current_user": lambda c: functools.partial(
+        c.database.set_current_user, c.user_id
+    ),
+    "insert_user": lambda c: functools.partial(
+        c.database.insert_user, c.new_user_data()
+    ),
+    "set_login_status": lambda c: functools.partial(c.database.set_login_status, True),
+    "get_login_status": lambda c: c.database.get_login_status,
+    "update_pass": lambda c: functools.partial(c.database.update_pass, c.password_hash),
+    "update_user_name": lambda c: functools.partial(
+        c.database.update_user_name, c.pick("tech_ids"), "Benchmark Name"
+    ),
+    "update_user_team": lambda c: functools.partial(
+        c.database.update_user_team, c.pick("tech_ids"), "B"
+    ),
+    "update_user_lane_or_section": lambda c: functools.partial(
+        c.database.update_user_lane_or_section, c.pick("tech_ids"), "7"
+    ),
+    "search_for_user": lambda c: functools.partial(
+        c.database.search_for_user, c.pick("tech_ids")
+    ),
+    "is_username_in_use": lambda c: functools.partial(
+        c.database.is_username_in_use, c.username
+    ),
+    "get_user_id_for_username": lambda c: functools.partial(
+        c.database.get_user_id_for_username, c.username
+    ),
+    "load_employee_directory": lambda c: c.database.load_employee_directory,
+    "get_employee": lambda c: functools.partial(
+        c.database.get_employee, c.pick("tech_ids")
+    ),
+    "is_tech_or_writer": lambda c: functools.partial(
+        c.database.is_tech_or_writer, c.pick("tech_ids"), "tech"
+    ),
+    # repairs
+    "insert_repair": bench_insert_repair,
+    "remove_repair": bench_remove_repair,
+    "search_for_repair": lambda c: functools.partial(
+        c.database.search_for_repair, c.pick("repair_ids")
+    ),
+    "get_repairs_assigned": lambda c: functools.partial(
+        c.database.get_repairs_assigned, c.pick("tech_ids")
+    ),
+    "update_repair_service_writer": lambda c: functools.partial(
+        c.database.update_repair_service_writer,
+        c.pick("repair_ids"),
+        c.pick("writer_ids"),
+    ),
+    "update_repair_tech": lambda c: functools.partial(
+        c.database.update_repair_tech, c.pick("repair_ids"), c.pick("tech_ids")
+    ),
+    "update_labor_cost": lambda c: functools.partial(
+        c.database.update_labor_cost, c.pick("repair_ids"), 150.0
+    ),
+    "update_repair_complete_date": lambda c: functools.partial(
+        c.database.update_repair_complete_date,
+        c.pick("completed_repair_ids"),
+        "2020/01/02",
+    ),
+    "update_repair_problem": lambda c: functools.partial(
+        c.database.update_repair_problem,
+        c.pick("repair_ids"),
+        "Customer states engine noise at idle",
+    ),
+    "update_repair_description": lambda c: functools.partial(
+        c.database.update_repair_description,
+        c.pick("completed_repair_ids"),
+        "Replaced worn parts",
+    ),
+    "insert_part_listing": lambda c: functools.partial(
+        c.database.insert_part_listing, c.pick("open_repair_ids"), c.pick("part_ids")
+    ),
+    "drop_part_listing": bench_drop_part_listing,
+    "get_repair_part_listings": lambda c: functools.partial(
+        c.database.get_repair_part_listings, c.pick("repair_ids")
+    ),
+    "get_repair_parts": lambda c: functools.partial(
+        c.database.get_repair_parts, c.pick("repair_ids")
+    ),
+    "get_repair_parts_cost": lambda c: functools.partial(
+        c.database.get_repair_parts_cost, c.pick("repair_ids")
+    ),
+    # parts
+    "insert_part": lambda c: functools.partial(
+        c.database.insert_part,
+        {
+            "part_id": c.new_key("BENCH", 12),
+            "part_cost": 10.0,
+            "part_description": "Benchmark part",
+        },
+    ),
+    "remove_part": bench_remove_part,
+    "get_part_data": lambda c: functools.partial(
+        c.database.get_part_data, c.pick("part_ids")
+    ),
+    "get_part_cache_stats": lambda c: c.database.get_part_cache_stats,
+    "update_part_cost": lambda c: functools.partial(
+        c.database.update_part_cost, c.pick("part_ids"), 12.5
+    ),
+    "update_part_description": lambda c: functools.partial(
+        c.database.update_part_description, c.pick("part_ids"), "Benchmark part"
+    ),
+    # customers
+    "insert_customer": lambda c: functools.partial(
+        c.database.insert_customer,
+        {"name": "Benchmark Customer", "address": "1 Main St", "phone": "555-0100"},
+    ),
+    "remove_customer": bench_remove_customer,
+    "get_customer_data": lambda c: functools.partial(
+        c.database.get_customer_data, c.pick("customer_ids")
+    ),
+    "update_customer_name": lambda c: functools.partial(
+        c.database.update_customer_name, c.pick("customer_ids"), "Benchmark Customer"
+    ),
+    "update_customer_address": lambda c: functools.partial(
+        c.database.update_customer_address, c.pick("customer_ids"), "1 Main St"
+    ),
+    "update_customer_phone": lambda c: functools.partial(
+        c.database.update_customer_phone, c.pick("customer_ids"), "555-0100"
+    ),
+    # vehicles
+    "insert_vehicle": lambda c: functools.partial(
+        c.database.insert_vehicle,
+        {
+            "vin": c.new_key("BENCH", 17),
+            "model": "Model",
+            "make": "Make",
+            "year": "2030",
+            "color": "Blue",
+            "engine": "I4",
+            "repair_request": None,
+            "owner": None,
+        },
+    ),
+    "remove_vehicle": bench_remove_vehicle,
+    "get_vehicle_data": lambda c: functools.partial(
+        c.database.get_vehicle_data, c.pick("vins")
+    ),
+    "vehicle_is_owned": lambda c: functools.partial(
+        c.database.vehicle_is_owned, c.pick("vins")
+    ),
+    "get_owned_vehicles": lambda c: functools.partial(
+        c.database.get_owned_vehicles, c.pick("customer_ids")
+    ),
+    "add_vehicle_owner": lambda c: functools.partial(
+        c.database.add_vehicle_owner, c.new_vehicle(), c.pick("customer_ids")
+    ),
+    "remove_vehicle_owner": bench_remove_vehicle_owner,
+    "update_vehicle_make": lambda c: functools.partial(
+        c.database.update_vehicle_make, c.pick("vins"), "Make"
+    ),
+    "update_vehicle_model": lambda c: functools.partial(
+        c.database.update_vehicle_model, c.pick("vins"), "Model"
+    ),
+    "update_vehicle_year": lambda c: functools.partial(
+        c.database.update_vehicle_year, c.pick("vins"), "2030"
+    ),
+    "update_vehicle_color": lambda c: functools.partial(
+        c.database.update_vehicle_color, c.pick("vins"), "Blue"
+    ),
+    "update_vehicle_engine": lambda c: functools.partial(
+        c.database.update_vehicle_engine, c.pick("vins"), "I4"
+    ),
+    "update_vehicle_active_repair": lambda c: functools.partial(
+        c.database.update_vehicle_active_repair, c.new_vehicle(), None
+    ),
+    "has_active_repair": lambda c: functools.partial(
+        c.database.has_active_repair, c.pick("vins")
+    ),
+    "get_vehicle_repair_history": lambda c: functools.partial(
+        c.database.get_vehicle_repair_history, c.pick("vins")
+    ),
+}
+
+# Database methods that hash a password, run at most HASHING_REPEAT times
+HASHING_BENCHMARKS = {
+    "is_valid_login_query",
+    "remove_user",
+    "is_current_users_password",
+    "hash_password",
+}
+
+# Public database methods without a benchmark --> reason
+SKIPPED_METHODS = {
+    "close": "closes the connection the other benchmarks run on",
+    "begin_transaction": "timed with end_transaction by the transaction benchmark",
+    "end_transaction": "timed with begin_transaction by the transaction benchmark",
+    "remove_row": "dialog loop around the remove_* methods, which are timed",
+    "get_remove_id_loop": "dialog loop around the remove_* methods, which are timed",
+}
+
+
+def bench_new_repair_submit(context):
+    """Times submitting the new repair page for a new owned vehicle."""
+
+    gui = context.gui
+
+    gui.set_input("new_repair_service_id_input_box", str(context.pick("writer_ids")))
+    gui.set_input("new_repair_tech_id_input_box", str(context.pick("tech_ids")))
+    gui.set_input(
+        "new_repair_vin_input_box", context.new_vehicle(context.pick("customer_ids"))
+    )
+    gui.set_input("new_repair_current_date_display", BENCHMARK_DATE)
+    gui.set_input("new_repair_description_input_box", "Customer states brakes squeal")
+
+    return functools.partial(repairs.new_repair_submit, context.database, gui)
+
+
+def bench_add_part_to_repair(context):
+    """Times adding a part to an open repair shown on the edit repair page."""
+
+    context.gui.set_input(
+        "edit_repair_repair_id_display_label", context.pick("open_repair_ids")
+    )
+    context.gui.id_answers.append(context.pick("part_ids"))
+
+    return functools.partial(repairs.add_part_to_repair, context.database, context.gui)
+
+
+def bench_remove_part_from_repair(context):
+    """Times removing a listed part from an open repair shown on the edit repair
+    page."""
+
+    repair_id = context.pick("open_repair_ids")
+    part_id = context.pick("part_ids")
+
+    context.database.insert_part_listing(repair_id, part_id)
+
+    context.gui.set_input("edit_repair_repair_id_display_label", repair_id)
+    context.gui.id_answers.append(part_id)
+
+    return functools.partial(
+        repairs.remove_part_from_repair, context.database, context.gui
+    )
+
+
+def bench_search_repairs_submit(context):
+    """Times submitting a search of the repair descriptions."""
+
+    context.gui.set_input("search_repairs_input_box", "engine noise")
+
+    return functools.partial(
+        repairs.search_repairs_submit, context.database, context.gui
+    )
+
+
+def handler_call(handler, kind=None, answer=None):
+    """Returns a benchmark calling the passed handler with the database and the GUI,
+    followed by a sampled key of kind if passed, after queueing a sampled key of
+    answer as the answer to its id dialog if passed."""
+
+    def benchmark(context):
+        if answer is not None:
+            context.gui.id_answers.append(context.pick(answer))
+
+        if kind is None:
+            return functools.partial(handler, context.database, context.gui)
+
+        return functools.partial(
+            handler, context.database, context.gui, context.pick(kind)
+        )
+
+    return benchmark
+
+
+# Handler flow --> benchmark, see the module docstring
+HANDLER_BENCHMARKS = {
+    "new_repair_submit": bench_new_repair_submit,
+    "add_part_to_repair": bench_add_part_to_repair,
+    "remove_part_from_repair": bench_remove_part_from_repair,
+    "go_to_edit_repair_page": handler_call(
+        repairs.go_to_edit_repair_page, kind="repair_ids"
+    ),
+    "go_to_old_repair_page": handler_call(
+        repairs.go_to_old_repair_page, answer="completed_repair_ids"
+    ),
+    "go_to_active_repairs_page": handler_call(repairs.go_to_active_repairs_page),
+    "search_repairs_submit": bench_search_repairs_submit,
+    "go_to_edit_part_page": handler_call(parts.go_to_edit_part_page, kind="part_ids"),
+    "go_to_list_of_parts_page": handler_call(parts.go_to_list_of_parts_page),
+    "go_to_edit_customer_page": handler_call(
+        customers.go_to_edit_customer_page, kind="customer_ids"
+    ),
+    "go_to_list_of_customers_page": handler_call(
+        customers.go_to_list_of_customers_page
+    ),
+    "go_to_edit_vehicle_page": handler_call(
+        vehicles.go_to_edit_vehicle_page, kind="vins"
+    ),
+    "search_repair_history": handler_call(
+        vehicles.search_repair_history, answer="vins"
+    ),
+    "go_to_list_of_vehicles_page": handler_call(vehicles.go_to_list_of_vehicles_page),
+    "show_all_users": handler_call(users.show_all_users),
+}
+
+
+def time_benchmark(context, name, benchmark, repeat):
+    """Runs the passed benchmark repeat times, returns the timing statistics in
+    milliseconds and the errors the GUI was shown. With query statistics each timed
+    call is recorded as a call of a handler named after the benchmark."""
+
+    stats = context.database.query_stats
+    timings = []
+    errors = []
+
+    for _ in range(repeat):
+        context.gui.clear_errors()
+        context.gui.id_answers.clear()
+
+        call = benchmark(context)
+        handler = contextlib.nullcontext() if stats is None else stats.handler(name)
+
+        with handler:
+            start = time.perf_counter()
+            call()
+            timings.append((time.perf_counter() - start) * 1000)
+
+        errors.extend(context.gui.errors)
+
+    timings.sort()
+
+    return {
+        "runs": repeat,
+        "mean_ms": statistics.fmean(timings),
+        "median_ms": statistics.median(timings),
+        "min_ms": timings[0],
+        "p95_ms": timings[min(repeat - 1, int(repeat * 0.95))],
+        "max_ms": timings[-1],
+        "errors": sorted(set(errors)),
+    }
+
+
+def get_uncovered_methods():
+    """Returns the public database methods without a benchmark --> reason."""
+
+    return {
+        name: SKIPPED_METHODS.get(name, "no benchmark")
+        for name, _member in inspect.getmembers(AppDatabase, inspect.isfunction)
+        if not name.startswith("_") and name not in DATABASE_BENCHMARKS
+    }
+
+
+def run_benchmarks(database_path, repeat=20, seed=0, only=None, query_stats=None):
+    """Runs every benchmark whose name contains only (all if None) against the
+    database at the passed path, returns the timings of the database methods and of
+    the handler flows and the uncovered database methods, and the query statistics
+    report if query statistics are passed."""
+
+    database = AppDatabase(database_path, query_stats)
+    context = BenchmarkContext(database, seed)
+    results = {"database_methods": {}, "handler_flows": {}}
+
+    try:
+        for section, benchmarks in (
+            ("database_methods", DATABASE_BENCHMARKS),
+            ("handler_flows", HANDLER_BENCHMARKS),
+        ):
+            for name, benchmark in benchmarks.items():
+                if only is not None and only not in name:
+                    continue
+
+                runs = (
+                    min(repeat, HASHING_REPEAT)
+                    if name in HASHING_BENCHMARKS
+                    else repeat
+                )
+
+                results[section][name] = time_benchmark(context, name, benchmark, runs)
+
+                # benchmarks may log in as another user --> log back in
+                database.set_current_user(context.user_id)
+                database.set_login_status(True)
+    finally:
+        database.close()
+
+    results["not_benchmarked"] = get_uncovered_methods()
+
+    if query_stats is not None:
+        results["query_stats"] = query_stats.get_report()
+
+    return results
@@ -0,0 +1,120 @@
+"""This module defines the in memory caches the database class keeps in front of its
+tables to skip repeated queries for rarely changing data."""
+
+from collections import OrderedDict
+
+
+class PartCatalogCache:
+    """This class defines a least recently used read-through cache of part rows keyed by
+    part id, counting hits and misses so its size can be tuned to the catalog."""
+
+    def __init__(self, max_size=50000):
+        self.max_size = max_size
+        self.parts = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, part_id):
+        """Returns the cached part row for the passed part id or None if it is not
+        cached, marking it as the most recently used part."""
+
+        part_data = self.parts.get(part_id)
+
+        if part_data is None:
+            self.misses += 1
+
+            return None
+
+        self.hits += 1
+        self.parts.move_to_end(part_id)
+
+        return part_data
+
+    def put(self, part_id, part_data):
+        """Caches the passed part row, dropping the least recently used part if the
+        cache is full."""
+
+        self.parts[part_id] = part_data
+        self.parts.move_to_end(part_id)
+
+        while len(self.parts) > self.max_size:
+            self.parts.popitem(last=False)
+
+    def invalidate(self, part_id):
+        """Drops the passed part id from the cache, used when that part is changed."""
+
+        self.parts.pop(part_id, None)
+
+    def clear(self):
+        """Drops every part from the cache."""
+
+        self.parts.clear()
+
+    def get_stats(self):
+        """Returns a dictionary of the cache's hit/miss counters and size."""
+
+        lookups = self.hits + self.misses
+
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "size": len(self.parts),
+            "max_size": self.max_size,
+        }
+
+
+class EmployeeDirectory:
+    """This class defines an in memory directory of employees keyed by employee id,
+    holding their username, name, team, lane/section and role flags (never passwords).
+    """
+
+    def __init__(self):
+        self.employees = {}
+        self.is_loaded = False
+
+    def load(self, employee_rows):
+        """Replaces the directory contents with the passed employee rows."""
+
+        self.employees = {row["employee_id"]: dict(row) for row in employee_rows}
+        self.is_loaded = True
+
+    def get(self, employee_id):
+        """Returns the passed employee id's directory entry or None if there is no
+        such employee."""
+
+        # ids typed into the gui are strings --> match the integer keys
+        try:
+            employee_id = int(employee_id)
+
+        except (TypeError, ValueError):
+            return None
+
+        return self.employees.get(employee_id)
+
+    def put(self, employee):
+        """Adds or replaces the passed employee's directory entry."""
+
+        self.employees[employee["employee_id"]] = employee
+
+    def update(self, employee_id, changes):
+        """Applies the passed {column: value} changes to an employee's entry."""
+
+        employee = self.get(employee_id)
+
+        if employee is not None:
+            employee.update(changes)
+
+    def remove(self, employee_id):
+        """Drops the passed employee id from the directory."""
+
+        employee = self.get(employee_id)
+
+        if employee is not None:
+            del self.employees[employee["employee_id"]]
+
+    def clear(self):
+        """Empties the directory, it will be loaded again on next use."""
+
+        self.employees = {}
+        self.is_loaded = False
@@ -1,9 +1,18 @@
 """This module contains all the handling for customer events in the application."""
 
 import validate
+import render
 
 NO_LOGIN_MSG = "You must be logged in to access this page."
 
+# Columns of the list of customers page --> (column name, header, format string)
+CUSTOMERS_LIST_COLUMNS = (
+    ("customer_id", "Customer ID", None),
+    ("name", "Name", None),
+    ("phone_number", "Phone Number", None),
+    ("address", "Address", None),
+)
+
 
 def new_customer_submit(database, gui):
     """Gets new customer data and passes it to the database for storage."""
@@ -73,15 +82,19 @@ def edit_customer_submit(database, gui):
     if errors != "":
         return gui.show_error(errors)
 
-    # Update items based on checkboxes
+    # Collect changes based on checkboxes, update all of them in one statement
+    changes = {}
+
     if gui.edit_customer_change_name_check_box.isChecked():
-        database.update_customer_name(customer_id, name)
+        changes["name"] = name
 
     if gui.edit_customer_change_address_check_box.isChecked():
-        database.update_customer_address(customer_id, address)
+        changes["address"] = address
 
     if gui.edit_customer_change_phone_check_box.isChecked():
-        database.update_customer_phone(customer_id, phone)
+        changes["phone_number"] = phone
+
+    database.update_fields("customers", customer_id, changes)
 
     # Show success, get updated data, update/reset page
     gui.show_success("Customer update successful.")
@@ -133,9 +146,9 @@ def add_vehicle_to_customer_button(database, gui):
 
     vehicle_data = database.get_owned_vehicles(customer_id)
 
-    list_of_vehicles = construct_vehicles_list(vehicle_data)
+    list_of_vehicles = render.iter_chunks(vehicle_data, render.VEHICLE_ROW)
 
-    gui.edit_customer_vechile_list_text_browser.setText(list_of_vehicles)
+    gui.stream_text(gui.edit_customer_vechile_list_text_browser, list_of_vehicles)
 
     return gui.show_success("Vehicle added.")
 
@@ -176,9 +189,9 @@ def remove_vehicle_from_customer_button(database, gui):
     # Get new vehicle data for customer, make list, display and show success
     vehicle_data = database.get_owned_vehicles(customer_id)
 
-    list_of_vehicles = construct_vehicles_list(vehicle_data)
+    list_of_vehicles = render.iter_chunks(vehicle_data, render.VEHICLE_ROW)
 
-    gui.edit_customer_vechile_list_text_browser.setText(list_of_vehicles)
+    gui.stream_text(gui.edit_customer_vechile_list_text_browser, list_of_vehicles)
 
     return gui.show_success("Vehicle removed.")
 
@@ -231,7 +244,7 @@ def go_to_edit_customer_page(database, gui, customer_id=None):
     # Get vehicle data, make list, update page with customer data and vehicle list, go to page
     vehicle_data = database.get_owned_vehicles(customer_id)
 
-    list_of_vehicles = construct_vehicles_list(vehicle_data)
+    list_of_vehicles = render.iter_chunks(vehicle_data, render.VEHICLE_ROW)
 
     gui.update_edit_customer_page(customer_data, list_of_vehicles)
 
@@ -241,47 +254,17 @@ def go_to_edit_customer_page(database, gui, customer_id=None):
 
 
 def go_to_list_of_customers_page(database, gui):
-    """Takes the user to the list of customers page, gets information from database on
-    all customers and passes it to the GUI to populate data on the page."""
+    """Takes the user to the list of customers page, the GUI pulls customer data from
+    the database a page at a time as the user scrolls through the list."""
 
     if not database.get_login_status():
         return gui.show_error(NO_LOGIN_MSG)
 
-    customer_data = database.get_all_customers()
-
-    customer_list = construct_list_of_customers(customer_data)
-
-    gui.list_of_customers_text_browser.setText(customer_list)
+    gui.update_list_table(
+        gui.list_of_customers_table_view,
+        database.get_customers_page,
+        "customers",
+        CUSTOMERS_LIST_COLUMNS,
+    )
 
     return gui.widget_stack.setCurrentIndex(13)
-
-
-def construct_list_of_customers(customer_data):
-    """Constructs a string to display in the ui containing all passed customers from the
-    database."""
-
-    customer_list = ""
-
-    for customer in customer_data:
-        customer_list = customer_list + (
-            f"Customer ID : {customer['customer_id']}, Name : {customer['name']}, "
-            f"Phone Number : {customer['phone_number']}, Address : {customer['address']}\n\n"
-        )
-
-    return customer_list
-
-
-def construct_vehicles_list(vehicle_data):
-    """Constructs a formated string of passed vehicle data for display."""
-
-    vehicle_list = ""
-
-    for vehicle in vehicle_data:
-        vehicle_list = vehicle_list + (
-            f"VIN : {vehicle['vin']}, Model : {vehicle['model']}, "
-            f"Make : {vehicle['make']}, Year : {vehicle['year']}, "
-            f"Color : {vehicle['color']}, Engine : {vehicle['engine']}, "
-            f"Current Active Repair ID : {vehicle['repair_request']}\n\n"
-        )
-
-    return vehicle_list
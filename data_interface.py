@@ -1,26 +1,155 @@
 """This module defines the the database class and functions used to query/execute to it."""
 
 
+import contextlib
 import os
 import sqlite3
-from passlib.hash import sha512_crypt
 import validate
+import migrations
+from caches import PartCatalogCache, EmployeeDirectory
+from auth_service import AuthService, ReauthGrace
+from query_stats import InstrumentedCursor
+
+# Columns update_fields is allowed to change, keyed by table --> (key column, columns)
+# repairs parts_cost and total_cost are kept by database triggers, see migrations
+UPDATABLE_COLUMNS = {
+    "customers": ("customer_id", ("name", "address", "phone_number")),
+    "employees": ("employee_id", ("name", "team", "lane_or_section")),
+    "repairs": (
+        "repair_id",
+        (
+            "labor",
+            "repair_completed_date",
+            "problem_description",
+            "repair_description",
+            "technician",
+            "service_writer",
+        ),
+    ),
+    "vehicles": (
+        "vin",
+        ("model", "make", "year", "color", "engine", "repair_request", "owner"),
+    ),
+}
+
+# Default number of rows per page for the paged list queries
+PAGE_SIZE = 100
+
+# Columns the paged list queries can sort by, keyed by table --> (key column, columns).
+# Rows are paged on (sort column, key column) so pages stay stable when sort values tie.
+# Each column has a (column, key column) index, see migrations 1 and 7, the repairs ones
+# only hold the active repairs as the active repairs list is the only one sorted.
+PAGE_SORT_COLUMNS = {
+    "customers": ("customer_id", ("customer_id", "name", "phone_number")),
+    "employees": ("employee_id", ("employee_id", "name", "lane_or_section")),
+    "parts": ("part_id", ("part_id", "part_cost", "part_description")),
+    "repairs": (
+        "repair_id",
+        (
+            "repair_id",
+            "total_cost",
+            "labor",
+            "parts_cost",
+            "drop_off_date",
+            "technician",
+            "service_writer",
+        ),
+    ),
+    "vehicles": ("vin", ("vin", "model", "make", "year")),
+}
+
+# Values the sortable columns that may be NULL sort as. Keyset comparisons skip NULL, so
+# these are sorted and paged on COALESCE(column, value), the expression of their index.
+PAGE_SORT_NULL_VALUES = {"total_cost": 0.0, "labor": 0.0, "parts_cost": 0.0}
+
+# Columns the paged/streamed list queries return for tables that should not return
+# every column, other tables return all their columns
+PAGE_SELECT_COLUMNS = {"employees": "employee_id, name, lane_or_section"}
+
+# Default number of rows the streaming iter_* queries fetch at a time
+STREAM_BATCH_SIZE = 500
+
+# Default number of results returned by the repair text search
+SEARCH_LIMIT = 50
+
+# Default number of results returned by each search as you type lookup
+LOOKUP_LIMIT = 25
+
+# Expressions the lookups match prefixes of, keyed by lookup --> (table, expression).
+# Each has an index on the same expression, see migration 5. Customers are looked up
+# by find_customers.
+LOOKUP_EXPRESSIONS = {
+    "vehicle_vin": ("vehicles", "vin COLLATE NOCASE"),
+    "vehicle_vin_last_six": ("vehicles", "substr(vin, -6) COLLATE NOCASE"),
+    "part_id": ("parts", "part_id COLLATE NOCASE"),
+    "part_description": ("parts", "part_description COLLATE NOCASE"),
+}
+
+# Sorts after every character, a prefix + this is the upper bound of its matches
+MAX_CHARACTER = "\U0010ffff"
+
+
+def build_search_query(text):
+    """Returns the passed search text as a full text search query matching repairs that
+    contain every word of it, or None if it has no words. Each word is quoted so the
+    search syntax's operators and punctuation in the text are matched as plain text."""
+
+    words = text.split()
+
+    if not words:
+        return None
+
+    return " ".join('"' + word.replace('"', '""') + '"' for word in words)
 
 
 class AppDatabase:
     """This class defines database objects for the application."""
 
-    def __init__(self):
+    def __init__(self, database_path=None, query_stats=None):
         self.is_logged_in = False
         self.current_user = None
+        self.transaction_depth = 0  # > 0 while inside a transaction block
+        self.part_cache = PartCatalogCache()
+        self.employee_directory = EmployeeDirectory()
+        self.auth = AuthService()  # hashes/verifies passwords off the calling thread
+        self.reauth_grace = ReauthGrace()  # skips repeat hashes for confirmations
+        self.query_stats = query_stats  # QueryStats to record statements in or None
         # set directory to data folder in app path
         self.data_directory = os.path.dirname(os.path.realpath(__file__)) + "\\data\\"
-        self.connection = sqlite3.connect(self.data_directory + "data.db")
+
+        # no database file passed --> use the app's database
+        if database_path is None:
+            database_path = self.data_directory + "data.db"
+
+        self.connection = sqlite3.connect(database_path)
         self.connection.row_factory = sqlite3.Row
-        self.cursor = self.connection.cursor()
+        self.cursor = self.create_cursor()
         self.create_tables()
+        self.migrate_database()
         self.remove_row_distpatcher = self.create_remove_row_dispatcher()
 
+    def create_cursor(self):
+        """Returns a new cursor of the connection, instrumented if the database records
+        query statistics."""
+
+        cursor = self.connection.cursor()
+
+        if self.query_stats is None:
+            return cursor
+
+        return InstrumentedCursor(cursor, self.query_stats)
+
+    def get_query_report(self):
+        """Returns the query statistics report, or None if the database does not
+        record query statistics."""
+
+        if self.query_stats is None:
+            return None
+
+        self.cursor.finish()  # last statement is recorded once it is finished
+
+        return self.query_stats.get_report()
+
     def create_tables(self):
         """Creates the tables in the database if they do not already exist."""
 
@@ -32,7 +161,7 @@ class AppDatabase:
                 phone_number TEXT NOT NULL);"""
         )
 
-        self.connection.commit()
+        self.commit()
 
         self.cursor.execute(
             """CREATE TABLE IF NOT EXISTS employees 
@@ -46,7 +175,7 @@ class AppDatabase:
                 is_writer INTEGER NOT NULL);"""
         )
 
-        self.connection.commit()
+        self.commit()
 
         self.cursor.execute(
             """CREATE TABLE IF NOT EXISTS parts
@@ -55,7 +184,7 @@ class AppDatabase:
                 part_description TEXT NOT NULL);"""
         )
 
-        self.connection.commit()
+        self.commit()
 
         self.cursor.execute(
             """CREATE TABLE IF NOT EXISTS part_listings 
@@ -66,7 +195,7 @@ class AppDatabase:
                 FOREIGN KEY (repair_id) REFERENCES repairs (repair_id));"""
         )
 
-        self.connection.commit()
+        self.commit()
 
         self.cursor.execute(
             """CREATE TABLE IF NOT EXISTS repairs
@@ -86,7 +215,7 @@ class AppDatabase:
                 FOREIGN KEY (vehicle) REFERENCES vehicles (vin));"""
         )
 
-        self.connection.commit()
+        self.commit()
 
         self.cursor.execute(
             """CREATE TABLE IF NOT EXISTS vehicles
@@ -102,7 +231,330 @@ class AppDatabase:
                 FOREIGN KEY (owner) REFERENCES customers (customer_id));"""
         )
 
-        self.connection.commit()
+        self.commit()
+
+    def close(self):
+        """Stops the password hashing workers and closes the database connection."""
+
+        self.auth.shutdown()
+        self.cursor.close()  # records the last statement if instrumented
+        self.connection.close()
+
+    def commit(self):
+        """Commits pending changes to the database unless they are part of an open
+        transaction block, which commits them all at once when it closes."""
+
+        if self.transaction_depth == 0:
+            self.connection.commit()
+
+    def begin_transaction(self):
+        """Opens a transaction block, nested blocks join the outermost one."""
+
+        self.transaction_depth += 1
+
+    def end_transaction(self, success=True):
+        """Closes a transaction block, the outermost block commits all changes made
+        inside it or rolls them all back if the block failed."""
+
+        self.transaction_depth -= 1
+
+        if self.transaction_depth > 0:
+            return  # nested block --> outermost block decides
+
+        if success:
+            self.connection.commit()
+        else:
+            self.connection.rollback()
+
+            # cached rows may have been read from rolled back changes
+            self.part_cache.clear()
+            self.employee_directory.clear()
+
+    @contextlib.contextmanager
+    def transaction(self):
+        """Context manager that groups every change made inside it into one atomic
+        commit, any exception rolls all of them back."""
+
+        self.begin_transaction()
+
+        try:
+            yield self
+
+        except BaseException:
+            self.end_transaction(False)
+
+            raise
+
+        self.end_transaction(True)
+
+    def migrate_database(self):
+        """Upgrades the database schema in place to the newest migration, returns the
+        resulting schema version."""
+
+        return migrations.migrate(self.connection)
+
+    def rebuild_repair_costs(self):
+        """Recalculates the parts cost and total cost of every repair from its part
+        listings and labor, used to repair costs in databases edited outside the app."""
+
+        with self.transaction():
+            for statement in migrations.REBUILD_REPAIR_COSTS:
+                self.cursor.execute(statement)
+
+    def get_table_page(
+        self,
+        table,
+        after_key=None,
+        limit=PAGE_SIZE,
+        sort_column=None,
+        descending=False,
+        condition=None,
+    ):
+        """Returns up to limit rows of the passed table ordered by sort column (the key
+        column if None) and then key column, starting after the passed page key.
+
+        The page key is None for the first page, otherwise the (sort value, key value)
+        of the last row of the previous page. Only a whitelisted
+        table/sort column is accepted as they can not be passed as parameters, raises
+        ValueError otherwise. The condition is an optional SQL filter written in code.
+        """
+
+        if table not in PAGE_SORT_COLUMNS:
+            raise ValueError(f"Table {table} can not be paged.")
+
+        key_column, sort_columns = PAGE_SORT_COLUMNS[table]
+
+        if sort_column is None:
+            sort_column = key_column
+
+        if sort_column not in sort_columns:
+            raise ValueError(f"Column {sort_column} of {table} can not be sorted.")
+
+        direction = "DESC" if descending else "ASC"
+        comparison = "<" if descending else ">"
+        conditions = [] if condition is None else [condition]
+        parameters = []
+
+        # sorted by key --> page on the key alone, otherwise on (sort value, key)
+        if sort_column == key_column:
+            order = f"{key_column} {direction}"
+
+            if after_key is not None:
+                conditions.append(f"{key_column} {comparison} (?)")
+                parameters.append(after_key[1])
+
+        else:
+            sort_expression = sort_column
+
+            if sort_column in PAGE_SORT_NULL_VALUES:
+                null_value = PAGE_SORT_NULL_VALUES[sort_column]
+                sort_expression = f"COALESCE({sort_column}, {null_value!r})"
+
+                # last row's sort value is the column's --> page on the expression's
+                if after_key is not None and after_key[0] is None:
+                    after_key = (null_value, after_key[1])
+
+            order = f"{sort_expression} {direction}, {key_column} {direction}"
+
+            if after_key is not None:
+                # the sort value alone lets an expression index seek to the page
+                conditions.append(f"{sort_expression} {comparison}= (?)")
+                conditions.append(
+                    f"({sort_expression}, {key_column}) {comparison} ((?), (?))"
+                )
+                parameters.extend((after_key[0], *after_key))
+
+        select = PAGE_SELECT_COLUMNS.get(table, "*")
+        where = f"WHERE {' AND '.join(conditions)} " if conditions else ""
+
+        return self.cursor.execute(
+            f"""SELECT {select} FROM {table} {where}ORDER BY {order} LIMIT (?);""",
+            (*parameters, limit),
+        ).fetchall()
+
+    def iter_table(self, table, batch_size=STREAM_BATCH_SIZE, condition=None):
+        """Generator yielding every row of the passed table in key column order, the
+        rows are fetched batch size rows at a time so only one batch is held in memory.
+
+        Runs on its own cursor so other queries can run while it is part way through.
+        Only a whitelisted table is accepted, raises ValueError otherwise. The condition
+        is an optional SQL filter written in code."""
+
+        if table not in PAGE_SORT_COLUMNS:
+            raise ValueError(f"Table {table} can not be streamed.")
+
+        key_column = PAGE_SORT_COLUMNS[table][0]
+        select = PAGE_SELECT_COLUMNS.get(table, "*")
+        where = "" if condition is None else f"WHERE {condition} "
+        cursor = self.create_cursor()
+
+        try:
+            cursor.execute(
+                f"""SELECT {select} FROM {table} {where}ORDER BY {key_column};"""
+            )
+
+            while True:
+                rows = cursor.fetchmany(batch_size)
+
+                if not rows:
+                    return  # all rows read
+
+                yield from rows
+
+        finally:
+            # generator finished or dropped part way through --> free the statement
+            cursor.close()
+
+    def get_prefix_matches(self, lookup, prefix, limit=LOOKUP_LIMIT):
+        """Returns up to limit rows whose lookup expression starts with the passed
+        prefix, in expression order. Matches are found as a range of the expression's
+        index, so the lookup takes as long for a million rows as for a thousand."""
+
+        table, expression = LOOKUP_EXPRESSIONS[lookup]
+
+        return self.cursor.execute(
+            f"""SELECT * FROM {table}
+            WHERE {expression} >= (?) AND {expression} < (?)
+            ORDER BY {expression}
+            LIMIT (?);""",
+            (prefix, prefix + MAX_CHARACTER, limit),
+        ).fetchall()
+
+    def get_merged_prefix_matches(self, lookups, key_column, prefix, limit):
+        """Returns up to limit rows matching the passed prefix on any of the passed
+        lookups, matches of earlier lookups first and each row once."""
+
+        matches = {}
+
+        for lookup in lookups:
+            for row in self.get_prefix_matches(lookup, prefix, limit):
+                matches.setdefault(row[key_column], row)
+
+            if len(matches) >= limit:
+                break
+
+        return list(matches.values())[:limit]
+
+    def find_customers(self, phone=None, name_prefix=None, limit=LOOKUP_LIMIT):
+        """Returns up to limit customers whose phone number starts with the passed
+        phone and/or whose name starts with the passed name prefix. Only the digits of
+        phone numbers are compared and names are compared ignoring case, both through
+        the indexed generated columns added in migration 6."""
+
+        conditions = []
+        parameters = []
+        order = "name_folded"
+
+        if phone is not None:
+            digits = "".join(character for character in phone if character.isdigit())
+
+            if not digits:
+                return []
+
+            conditions.append("phone_digits >= (?) AND phone_digits < (?)")
+            parameters.extend((digits, digits + MAX_CHARACTER))
+            order = "phone_digits"
+
+        if name_prefix:
+            # fold with sqlite's lower() so the prefix matches name_folded exactly
+            conditions.append(
+                "name_folded >= lower(?) AND name_folded < lower(?) || (?)"
+            )
+            parameters.extend((name_prefix, name_prefix, MAX_CHARACTER))
+
+        if not conditions:
+            return []
+
+        return self.cursor.execute(
+            f"""SELECT customer_id, name, address, phone_number FROM customers
+            WHERE {' AND '.join(conditions)}
+            ORDER BY {order}
+            LIMIT (?);""",
+            (*parameters, limit),
+        ).fetchall()
+
+    def lookup_customers(self, text, limit=LOOKUP_LIMIT):
+        """Returns up to limit customers whose phone number (if the text is a phone
+        number or the start of one) or name starts with the passed text."""
+
+        text = text.strip()
+
+        if not text:
+            return []
+
+        # only digits and phone punctuation --> search phone numbers
+        if any(character.isdigit() for character in text) and all(
+            character.isdigit() or character in "-() ." for character in text
+        ):
+            return self.find_customers(phone=text, limit=limit)
+
+        return self.find_customers(name_prefix=text, limit=limit)
+
+    def lookup_vehicles(self, text, limit=LOOKUP_LIMIT):
+        """Returns up to limit vehicles whose vin or last 6 vin characters start with
+        the passed text."""
+
+        text = text.strip()
+
+        if not text:
+            return []
+
+        return self.get_merged_prefix_matches(
+            ("vehicle_vin", "vehicle_vin_last_six"), "vin", text, limit
+        )
+
+    def lookup_parts(self, text, limit=LOOKUP_LIMIT):
+        """Returns up to limit parts whose part id or description start with the
+        passed text."""
+
+        text = text.strip()
+
+        if not text:
+            return []
+
+        return self.get_merged_prefix_matches(
+            ("part_id", "part_description"), "part_id", text, limit
+        )
+
+    def rebuild_repair_search(self):
+        """Rebuilds the repair text search index from the repairs table, for use if the
+        index was ever out of step with it (such as after writing repairs with its
+        triggers dropped)."""
+
+        with self.transaction():
+            for statement in migrations.REBUILD_REPAIR_SEARCH:
+                self.cursor.execute(statement)
+
+    def update_fields(self, table, key, changes):
+        """Updates every column in the passed changes dictionary ({column: value}) of the
+        row matching the passed key with one UPDATE statement. Table and columns must be
+        listed in UPDATABLE_COLUMNS."""
+
+        if table not in UPDATABLE_COLUMNS:
+            raise ValueError(f"Table {table} can not be updated.")
+
+        key_column, allowed_columns = UPDATABLE_COLUMNS[table]
+
+        for column in changes:
+            if column not in allowed_columns:
+                raise ValueError(f"Column {column} of {table} can not be updated.")
+
+        if not changes:
+            return  # nothing to update
+
+        # only whitelisted names are formatted in, all values are parameters
+        assignments = ", ".join(f"{column} = (?)" for column in changes)
+
+        self.cursor.execute(
+            f"""UPDATE {table} SET {assignments} WHERE {key_column} = (?);""",
+            (*changes.values(), key),
+        )
+
+        self.commit()
+
+        # keep the employee directory coherent with the table
+        if table == "employees":
+            self.employee_directory.update(key, changes)
 
     def create_remove_row_dispatcher(self):
         """Creates a dictionary of dictionaries used when removing a row from
@@ -158,10 +610,19 @@ class AppDatabase:
         if user_data is None:
             return False  # no user was found --> return false
 
-        if sha512_crypt.verify(input_pass, user_data["password"]):
-            # password matches --> set current user and login status, return true
+        is_valid, new_hash = self.auth.verify_and_update(
+            input_pass, user_data["password"]
+        )
+
+        if is_valid:
+            # password matches --> set current user and login status, load directory
             self.set_current_user(user_data["employee_id"])
             self.set_login_status(True)
+            self.load_employee_directory()
+
+            # stored hash is outside the password policy --> store the rehashed one
+            if new_hash is not None:
+                self.update_pass(new_hash)
 
             return True
 
@@ -181,12 +642,14 @@ class AppDatabase:
         if target_pass is None:
             return False  # no password found for that id (invalid id) --> return false
 
-        if sha512_crypt.verify(password, target_pass["password"]):
+        if self.auth.verify(password, target_pass["password"]):
             # password matches --> remove user from database, return true
             self.cursor.execute(
                 """DELETE FROM employees WHERE employee_id = (?);""", (employee_id,)
             )
-            self.connection.commit()
+            self.commit()
+
+            self.employee_directory.remove(employee_id)
 
             return True
 
@@ -195,7 +658,11 @@ class AppDatabase:
 
     def is_current_users_password(self, input_pass):
         """Checks if an input password matches the current users
-        password in the database."""
+        password in the database, skips the full hash if the current user
+        confirmed this password within the re-authentication grace window."""
+
+        if self.reauth_grace.is_confirmed(self.current_user, input_pass):
+            return True  # confirmed moments ago --> no hash needed
 
         # search for current user's password
         user_pass = self.cursor.execute(
@@ -206,11 +673,19 @@ class AppDatabase:
         if user_pass is None:
             return False  # no user was found for passed id (no current user)--> return false
 
-        if sha512_crypt.verify(input_pass, user_pass["password"]):
-            return True  # is current users password --> return true
+        if self.auth.verify(input_pass, user_pass["password"]):
+            # is current users password --> start grace window, return true
+            self.reauth_grace.remember(self.current_user, input_pass)
+
+            return True
 
         return False  # password did not match --> return false
 
+    def hash_password(self, password):
+        """Returns a hash of the passed password under the password policy."""
+
+        return self.auth.hash(password)
+
     def is_current_users_username(self, username):
         """Checks if the passed username is the username of the current logged in database user."""
 
@@ -227,13 +702,14 @@ class AppDatabase:
 
     def set_current_user(self, user_id):
         """Database's current user as the passed user_id, or switches to
-        None if the user logged out."""
+        None if the user logged out. Ends any re-authentication grace window."""
 
         self.current_user = user_id
+        self.reauth_grace.clear()
 
     def insert_user(self, user_data):
         """Takes a set of inputs for a new user and inputs it into
-        the database."""
+        the database, returns the new user's employee id."""
 
         self.cursor.execute(
             """INSERT INTO employees 
@@ -256,7 +732,25 @@ class AppDatabase:
             ),
         )
 
-        self.connection.commit()
+        self.commit()
+
+        employee_id = self.cursor.lastrowid
+
+        # add new user to the directory, an unloaded directory reads it on first use
+        if self.employee_directory.is_loaded:
+            self.employee_directory.put(
+                {
+                    "employee_id": employee_id,
+                    "username": user_data["username"],
+                    "name": user_data["name"],
+                    "team": user_data["team"],
+                    "lane_or_section": user_data["lane_or_section"],
+                    "is_tech": user_data["is_tech"],
+                    "is_writer": user_data["is_writer"],
+                }
+            )
+
+        return employee_id
 
     def set_login_status(self, status):
         """Sets the login status of the database."""
@@ -279,46 +773,25 @@ class AppDatabase:
             ),
         )
 
-        self.connection.commit()
+        self.commit()
+
+        # old password must not pass confirmations anymore
+        self.reauth_grace.clear()
 
     def update_user_name(self, user_id, name):
         """Updates a user's name in the database."""
 
-        self.cursor.execute(
-            """UPDATE employees SET name = (?) WHERE employee_id = (?);""",
-            (
-                name,
-                user_id,
-            ),
-        )
-
-        self.connection.commit()
+        self.update_fields("employees", user_id, {"name": name})
 
     def update_user_team(self, user_id, team):
         """Update a user's team in the database."""
 
-        self.cursor.execute(
-            """UPDATE employees SET team = (?) WHERE employee_id = (?);""",
-            (
-                team,
-                user_id,
-            ),
-        )
-
-        self.connection.commit()
+        self.update_fields("employees", user_id, {"team": team})
 
     def update_user_lane_or_section(self, user_id, lane_or_section):
         """Update a user's lane or section in the database."""
 
-        self.cursor.execute(
-            """UPDATE employees SET lane_or_section = (?) WHERE employee_id = (?);""",
-            (
-                lane_or_section,
-                user_id,
-            ),
-        )
-
-        self.connection.commit()
+        self.update_fields("employees", user_id, {"lane_or_section": lane_or_section})
 
     def search_for_user(self, user_id):
         """Searchs the database for the requested id and return that users
@@ -342,6 +815,22 @@ class AppDatabase:
             """SELECT employee_id, name, lane_or_section FROM employees;"""
         ).fetchall()
 
+    def get_users_page(
+        self, after_key=None, limit=PAGE_SIZE, sort_column=None, descending=False
+    ):
+        """Returns the next page of users id's, names, and lane/section after the
+        passed page key, see get_table_page."""
+
+        return self.get_table_page(
+            "employees", after_key, limit, sort_column, descending
+        )
+
+    def iter_users(self, batch_size=STREAM_BATCH_SIZE):
+        """Generator yielding all users id's, names, and lane/section, see
+        iter_table."""
+
+        return self.iter_table("employees", batch_size)
+
     def get_user_id_for_username(self, username):
         """Searches the database for a username and returns that users employee_id."""
 
@@ -349,14 +838,34 @@ class AppDatabase:
             """SELECT employee_id FROM employees WHERE username = (?)""", (username,)
         ).fetchone()
 
+    def load_employee_directory(self):
+        """Loads every employee's id, username, name, team, lane/section and roles
+        into the in memory employee directory."""
+
+        self.employee_directory.load(
+            self.cursor.execute(
+                """SELECT employee_id, username, name, team, lane_or_section,
+                is_tech, is_writer FROM employees;"""
+            ).fetchall()
+        )
+
+    def get_employee(self, employee_id):
+        """Returns the employee directory entry of the passed employee id, or None
+        if there is no such employee. Does not query once the directory is loaded."""
+
+        if not self.employee_directory.is_loaded:
+            self.load_employee_directory()
+
+        return self.employee_directory.get(employee_id)
+
     def is_tech_or_writer(self, user_id, role):
         """Returns true if the passed role matches the employee id in the database"""
 
-        # Get roles for id
-        roles = self.cursor.execute(
-            """SELECT is_tech, is_writer FROM employees WHERE employee_id = (?)""",
-            (user_id,),
-        ).fetchone()
+        # Get roles for id from the employee directory
+        roles = self.get_employee(user_id)
+
+        if roles is None:
+            return False  # no such employee --> has no role
 
         # If the GUI is claiming tech and database has 1 for tech, it is a tech
         if role == "tech" and roles["is_tech"] == 1:
@@ -371,7 +880,8 @@ class AppDatabase:
 
     def insert_repair(self, repair_data):
         """Inserts a new repair into the database and call the functions
-        need to add the repair to the valid employee's repair list."""
+        need to add the repair to the valid employee's repair list, returns the
+        new repair id."""
 
         self.cursor.execute(
             """INSERT INTO repairs 
@@ -398,7 +908,9 @@ class AppDatabase:
             ),
         )
 
-        self.connection.commit()
+        self.commit()
+
+        return repair_data["repair_id"]
 
     def remove_repair(self, repair, password):
         """Removes the passed repair id if passed password is correct."""
@@ -410,15 +922,15 @@ class AppDatabase:
                 """SELECT vehicle FROM repairs WHERE repair_id = (?)""", (repair,)
             ).fetchone()
 
-            self.cursor.execute(
-                """DELETE FROM repairs WHERE repair_id = (?)""", (repair,)
-            )
-
-            self.connection.commit()
+            # delete and clear active repair as one commit
+            with self.transaction():
+                self.cursor.execute(
+                    """DELETE FROM repairs WHERE repair_id = (?)""", (repair,)
+                )
 
-            self.update_vehicle_active_repair(
-                vin["vehicle"]
-            )  # None for repair id is default
+                self.update_vehicle_active_repair(
+                    vin["vehicle"]
+                )  # None for repair id is default
 
             return True
 
@@ -439,12 +951,64 @@ class AppDatabase:
             """SELECT * FROM repairs WHERE repair_completed_date IS NULL;"""
         ).fetchall()
 
+    def get_active_repairs_page(
+        self, after_key=None, limit=PAGE_SIZE, sort_column=None, descending=False
+    ):
+        """Returns the next page of active repairs after the passed page key, see
+        get_table_page."""
+
+        return self.get_table_page(
+            "repairs",
+            after_key,
+            limit,
+            sort_column,
+            descending,
+            "repair_completed_date IS NULL",
+        )
+
+    def iter_active_repairs(self, batch_size=STREAM_BATCH_SIZE):
+        """Generator yielding all active repairs (no completion date), see
+        iter_table."""
+
+        return self.iter_table("repairs", batch_size, "repair_completed_date IS NULL")
+
+    def search_repairs_text(self, query, limit=SEARCH_LIMIT):
+        """Returns up to limit repairs whose problem or repair description contain every
+        word of the passed search text, best matches first. Each result holds the repair
+        id, its dates and [highlighted] snippets of both descriptions."""
+
+        search_query = build_search_query(query)
+
+        if search_query is None:
+            return []
+
+        return self.cursor.execute(
+            """SELECT repairs.repair_id,
+                repairs.drop_off_date,
+                COALESCE(repairs.repair_completed_date, 'Active')
+                    AS repair_completed_date,
+                COALESCE(snippet(repairs_fts, 0, '[', ']', '...', 16), '')
+                    AS problem_snippet,
+                COALESCE(snippet(repairs_fts, 1, '[', ']', '...', 16), '')
+                    AS repair_snippet
+            FROM repairs_fts
+            JOIN repairs_search_ids ON repairs_search_ids.search_id = repairs_fts.rowid
+            JOIN repairs ON repairs.repair_id = repairs_search_ids.repair_id
+            WHERE repairs_fts MATCH (?)
+            ORDER BY rank
+            LIMIT (?);""",
+            (search_query, limit),
+        ).fetchall()
+
     def get_repairs_assigned(self, employee_id):
         """Returns all repair_ids assosiated with the passed employee id (No
         completion data)."""
 
-        # get user data
-        user = self.search_for_user(employee_id)
+        # get user data from the employee directory
+        user = self.get_employee(employee_id)
+
+        if user is None:
+            return None  # no such employee
 
         # get repair id where tech id matches passed id if user is tech
         if user["is_tech"] == 1:
@@ -468,143 +1032,78 @@ class AppDatabase:
     def update_repair_service_writer(self, repair_id, service_writer_id):
         """Updates the targted repair with a new service writer."""
 
-        self.cursor.execute(
-            """UPDATE repairs SET service_writer = (?) WHERE repair_id = (?);""",
-            (
-                service_writer_id,
-                repair_id,
-            ),
-        )
-
-        self.connection.commit()
+        self.update_fields("repairs", repair_id, {"service_writer": service_writer_id})
 
     def update_repair_tech(self, repair_id, tech_id):
         """Updates the targeted repair with a new technician."""
 
-        self.cursor.execute(
-            """UPDATE repairs SET technician = (?) WHERE repair_id = (?);""",
-            (
-                tech_id,
-                repair_id,
-            ),
-        )
-
-        self.connection.commit()
-
-    def update_total_repair_cost(self, repair_id, total_cost):
-        """Updates the total repair cost of the targeted repair."""
-
-        self.cursor.execute(
-            """UPDATE repairs SET total_cost = (?) WHERE repair_id = (?);""",
-            (
-                total_cost,
-                repair_id,
-            ),
-        )
-
-        self.connection.commit()
+        self.update_fields("repairs", repair_id, {"technician": tech_id})
 
     def update_labor_cost(self, repair_id, labor_repair_cost):
         """Updates the labor cost of the targeted repair."""
 
         labor_repair_cost = float(labor_repair_cost)
 
-        self.cursor.execute(
-            """UPDATE repairs SET labor = (?) WHERE repair_id = (?);""",
-            (
-                labor_repair_cost,
-                repair_id,
-            ),
-        )
-
-        self.connection.commit()
-
-    def update_repair_parts_cost(self, repair_id, parts_cost):
-        """Updates the part cost of the targeted repair."""
-
-        self.cursor.execute(
-            """UPDATE repairs SET parts_cost = (?) WHERE repair_id = (?);""",
-            (
-                parts_cost,
-                repair_id,
-            ),
-        )
-
-        self.connection.commit()
+        self.update_fields("repairs", repair_id, {"labor": labor_repair_cost})
 
     def update_repair_complete_date(self, repair_id, completion_date):
         """Updates the completion date of the targeted repair."""
 
-        self.cursor.execute(
-            """UPDATE repairs SET repair_completed_date = (?) WHERE repair_id = (?);""",
-            (
-                completion_date,
-                repair_id,
-            ),
+        self.update_fields(
+            "repairs", repair_id, {"repair_completed_date": completion_date}
         )
 
-        self.connection.commit()
-
     def update_repair_problem(self, repair_id, problem_description):
         """Updates the problem description of the targted repair."""
 
-        self.cursor.execute(
-            """UPDATE repairs SET problem_description = (?) WHERE repair_id = (?);""",
-            (
-                problem_description,
-                repair_id,
-            ),
+        self.update_fields(
+            "repairs", repair_id, {"problem_description": problem_description}
         )
 
-        self.connection.commit()
-
     def update_repair_description(self, repair_id, repair_description):
         """Updates the repair description of the targeted repair."""
 
-        self.cursor.execute(
-            """UPDATE repairs SET repair_description = (?) WHERE repair_id = (?);""",
-            (
-                repair_description,
-                repair_id,
-            ),
+        self.update_fields(
+            "repairs", repair_id, {"repair_description": repair_description}
         )
 
-        self.connection.commit()
-
-    def insert_part_listing(self, repair_id, part_id):
-        """Updates the list of required parts for the repair."""
+    def insert_part_listing(self, repair_id, part_id, quantity=1):
+        """Updates the list of required parts for the repair, adds the passed quantity
+        to the listing if the repair already lists that part."""
 
         self.cursor.execute(
-            """INSERT INTO part_listings (part_id, repair_id) VALUES (?, ?);""",
-            (part_id, repair_id),
+            """INSERT INTO part_listings (repair_id, part_id, quantity) VALUES (?, ?, ?)
+                ON CONFLICT (repair_id, part_id)
+                DO UPDATE SET quantity = quantity + excluded.quantity;""",
+            (repair_id, part_id, quantity),
         )
 
-        self.connection.commit()
+        self.commit()
 
-    def drop_part_listing(self, repair_id, part_id):
-        """Removes one part listing from the part listings table, does so by
-        referening both a repair id and part id then fetching one listing
-        for a listing id."""
+    def drop_part_listing(self, repair_id, part_id, quantity=1):
+        """Removes the passed quantity of a part from the repair's part listing, removes
+        the whole listing if no more than that quantity is listed. Returns false if the
+        repair does not list that part."""
 
-        # produce a listing id from passed repair and part ids
-        listing_id = self.cursor.execute(
-            """SELECT listing_id FROM part_listings 
-                WHERE part_id = (?) AND repair_id = (?)""",
-            (part_id, repair_id),
-        ).fetchone()
-
-        if listing_id is None:
-            return False  # no such listing --> return false
-
-        # delete produced listing --> return true for success
+        # listing has more than the quantity to drop --> lower quantity
         self.cursor.execute(
-            """DELETE FROM part_listings WHERE listing_id = (?)""",
-            (listing_id["listing_id"],),
+            """UPDATE part_listings SET quantity = quantity - (?)
+                WHERE repair_id = (?) AND part_id = (?) AND quantity > (?);""",
+            (quantity, repair_id, part_id, quantity),
         )
 
-        self.connection.commit()
+        # otherwise drop the listing, rowcount is 0 if there was no such listing
+        if self.cursor.rowcount == 0:
+            self.cursor.execute(
+                """DELETE FROM part_listings WHERE repair_id = (?) AND part_id = (?);""",
+                (repair_id, part_id),
+            )
 
-        return True
+        dropped = self.cursor.rowcount > 0
+
+        self.commit()
+
+        return dropped
 
     def get_repair_part_listings(self, repair_id):
         """Returns all part listings for the assosiated repair_id."""
@@ -613,8 +1112,34 @@ class AppDatabase:
             """SELECT * FROM part_listings WHERE repair_id = (?)""", (repair_id,)
         ).fetchall()
 
+    def get_repair_parts(self, repair_id):
+        """Returns the part data and listed quantity of every part listed for the passed
+        repair_id in one joined query."""
+
+        return self.cursor.execute(
+            """SELECT parts.part_id, parts.part_cost, parts.part_description,
+                part_listings.quantity
+                FROM part_listings
+                JOIN parts ON parts.part_id = part_listings.part_id
+                WHERE part_listings.repair_id = (?)
+                ORDER BY part_listings.part_id;""",
+            (repair_id,),
+        ).fetchall()
+
+    def get_repair_parts_cost(self, repair_id):
+        """Returns the summed cost of every part listed for the passed repair_id."""
+
+        return self.cursor.execute(
+            """SELECT COALESCE(SUM(parts.part_cost * part_listings.quantity), 0.0)
+                AS parts_cost
+                FROM part_listings
+                JOIN parts ON parts.part_id = part_listings.part_id
+                WHERE part_listings.repair_id = (?);""",
+            (repair_id,),
+        ).fetchone()["parts_cost"]
+
     def insert_part(self, part_data):
-        """Inserts a new part into the database."""
+        """Inserts a new part into the database, returns the new part id."""
 
         self.cursor.execute(
             """INSERT INTO parts VALUES(?, ?, ?);""",
@@ -625,7 +1150,11 @@ class AppDatabase:
             ),
         )
 
-        self.connection.commit()
+        self.commit()
+
+        self.part_cache.invalidate(part_data["part_id"])
+
+        return part_data["part_id"]
 
     def remove_part(self, part, password):
         """Removes the passed part id if the passed password is the current
@@ -635,7 +1164,9 @@ class AppDatabase:
         if self.is_current_users_password(password):
             self.cursor.execute("""DELETE FROM parts WHERE part_id = (?)""", (part,))
 
-            self.connection.commit()
+            self.commit()
+
+            self.part_cache.invalidate(part)
 
             return True
 
@@ -647,14 +1178,43 @@ class AppDatabase:
 
         return self.cursor.execute("""SELECT * FROM parts;""").fetchall()
 
+    def get_parts_page(
+        self, after_key=None, limit=PAGE_SIZE, sort_column=None, descending=False
+    ):
+        """Returns the next page of parts after the passed page key, see
+        get_table_page."""
+
+        return self.get_table_page("parts", after_key, limit, sort_column, descending)
+
+    def iter_parts(self, batch_size=STREAM_BATCH_SIZE):
+        """Generator yielding all parts in the database, see iter_table."""
+
+        return self.iter_table("parts", batch_size)
+
     def get_part_data(self, part_id):
-        """Returns data for the passed part id."""
+        """Returns data for the passed part id, read through the part cache."""
 
-        return self.cursor.execute(
+        part_data = self.part_cache.get(part_id)
+
+        if part_data is not None:
+            return part_data  # cache hit --> no query
+
+        part_data = self.cursor.execute(
             """SELECT * FROM parts WHERE part_id = (?);""",
             (part_id,),
         ).fetchone()
 
+        # only cache found parts, missing ids are cheap to look up again
+        if part_data is not None:
+            self.part_cache.put(part_id, part_data)
+
+        return part_data
+
+    def get_part_cache_stats(self):
+        """Returns the part cache's hit/miss counters and size."""
+
+        return self.part_cache.get_stats()
+
     def update_part_cost(self, part_id, new_cost):
         """Updates the part cost in the database for the passed part id."""
 
@@ -666,7 +1226,9 @@ class AppDatabase:
             ),
         )
 
-        self.connection.commit()
+        self.commit()
+
+        self.part_cache.invalidate(part_id)
 
     def update_part_description(self, part_id, new_description):
         """Updates the part description in the databse for the passed part id."""
@@ -679,11 +1241,13 @@ class AppDatabase:
             ),
         )
 
-        self.connection.commit()
+        self.commit()
+
+        self.part_cache.invalidate(part_id)
 
     def insert_customer(self, customer_data):
         """Takes the passed customer data and enters a new customer into the database,
-        returns the new customer id based on name, address and phone."""
+        returns the new customer id generated by the database."""
 
         self.cursor.execute(
             """INSERT INTO customers (name, address, phone_number) VALUES (?, ?, ?);""",
@@ -694,19 +1258,10 @@ class AppDatabase:
             ),
         )
 
-        self.connection.commit()
-
-        customer_id = self.cursor.execute(
-            """SELECT customer_id FROM customers WHERE
-              name = (?) AND address = (?) AND phone_number = (?)""",
-            (
-                customer_data["name"],
-                customer_data["address"],
-                customer_data["phone"],
-            ),
-        ).fetchone()
+        self.commit()
 
-        return customer_id["customer_id"]
+        # id of the inserted row, no need to search for it
+        return self.cursor.lastrowid
 
     def remove_customer(self, customer, password):
         """Removes the passed customer id if the passed password is the current
@@ -718,7 +1273,7 @@ class AppDatabase:
                 """DELETE FROM customers WHERE customer_id = (?)""", (customer,)
             )
 
-            self.connection.commit()
+            self.commit()
 
             return True
 
@@ -738,47 +1293,39 @@ class AppDatabase:
 
         return self.cursor.execute("""SELECT * FROM customers;""").fetchall()
 
-    def update_customer_name(self, customer_id, new_name):
-        """Updates the passed customer id to show the new name in the database."""
+    def get_customers_page(
+        self, after_key=None, limit=PAGE_SIZE, sort_column=None, descending=False
+    ):
+        """Returns the next page of customers after the passed page key, see
+        get_table_page."""
 
-        self.cursor.execute(
-            """UPDATE customers SET name = (?) WHERE customer_id = (?);""",
-            (
-                new_name,
-                customer_id,
-            ),
+        return self.get_table_page(
+            "customers", after_key, limit, sort_column, descending
         )
 
-        self.connection.commit()
+    def iter_customers(self, batch_size=STREAM_BATCH_SIZE):
+        """Generator yielding all customers in the database, see iter_table."""
+
+        return self.iter_table("customers", batch_size)
+
+    def update_customer_name(self, customer_id, new_name):
+        """Updates the passed customer id to show the new name in the database."""
+
+        self.update_fields("customers", customer_id, {"name": new_name})
 
     def update_customer_address(self, customer_id, new_address):
         """Updates the passed customer id to show the new address in the database."""
 
-        self.cursor.execute(
-            """UPDATE customers SET address = (?) WHERE customer_id = (?);""",
-            (
-                new_address,
-                customer_id,
-            ),
-        )
-
-        self.connection.commit()
+        self.update_fields("customers", customer_id, {"address": new_address})
 
     def update_customer_phone(self, customer_id, new_phone):
         """Updates the passed customer id to show the new phone number in the database."""
 
-        self.cursor.execute(
-            """UPDATE customers SET phone_number = (?) WHERE customer_id = (?);""",
-            (
-                new_phone,
-                customer_id,
-            ),
-        )
-
-        self.connection.commit()
+        self.update_fields("customers", customer_id, {"phone_number": new_phone})
 
     def insert_vehicle(self, vehicle_data):
-        """Inserts new vehicle into the database from passed vehicle data."""
+        """Inserts new vehicle into the database from passed vehicle data, returns the
+        new vehicle's vin."""
 
         self.cursor.execute(
             """INSERT INTO vehicles VALUES(?, ?, ?, ?, ?, ?, ?, ?);""",
@@ -794,7 +1341,9 @@ class AppDatabase:
             ),
         )
 
-        self.connection.commit()
+        self.commit()
+
+        return vehicle_data["vin"]
 
     def remove_vehicle(self, vin, password):
         """Removes passed vehicle if the passed password is the current users
@@ -804,7 +1353,7 @@ class AppDatabase:
         if self.is_current_users_password(password):
             self.cursor.execute("""DELETE FROM vehicles WHERE vin = (?)""", (vin,))
 
-            self.connection.commit()
+            self.commit()
 
             return True
 
@@ -824,6 +1373,21 @@ class AppDatabase:
 
         return self.cursor.execute("""SELECT * FROM vehicles;""").fetchall()
 
+    def get_vehicles_page(
+        self, after_key=None, limit=PAGE_SIZE, sort_column=None, descending=False
+    ):
+        """Returns the next page of vehicles after the passed page key, see
+        get_table_page."""
+
+        return self.get_table_page(
+            "vehicles", after_key, limit, sort_column, descending
+        )
+
+    def iter_vehicles(self, batch_size=STREAM_BATCH_SIZE):
+        """Generator yielding all vehicles in the database, see iter_table."""
+
+        return self.iter_table("vehicles", batch_size)
+
     def vehicle_is_owned(self, vin):
         """Checks if a vin has a owner listed."""
 
@@ -855,7 +1419,7 @@ class AppDatabase:
             (customer_id, vin),
         )
 
-        self.connection.commit()
+        self.commit()
 
     def remove_vehicle_owner(self, vin, customer_id):
         """Removes owner from passed vin."""
@@ -879,7 +1443,7 @@ class AppDatabase:
                 (None, vin),
             )
 
-            self.connection.commit()
+            self.commit()
 
             return True
 
@@ -889,78 +1453,33 @@ class AppDatabase:
     def update_vehicle_make(self, vin, new_make):
         """Updates the passed vin to have the passed new make in the database."""
 
-        self.cursor.execute(
-            """UPDATE vehicles SET make = (?) WHERE vin = (?);""",
-            (
-                new_make,
-                vin,
-            ),
-        )
-
-        self.connection.commit()
+        self.update_fields("vehicles", vin, {"make": new_make})
 
     def update_vehicle_model(self, vin, new_model):
         """Updates the passed vin to have the passed new model in the database."""
 
-        self.cursor.execute(
-            """UPDATE vehicles SET model = (?) WHERE vin = (?);""",
-            (
-                new_model,
-                vin,
-            ),
-        )
-
-        self.connection.commit()
+        self.update_fields("vehicles", vin, {"model": new_model})
 
     def update_vehicle_year(self, vin, new_year):
         """Updates the passed vin to have the passed new year in the database."""
 
-        self.cursor.execute(
-            """UPDATE vehicles SET year = (?) WHERE vin = (?);""",
-            (
-                new_year,
-                vin,
-            ),
-        )
-
-        self.connection.commit()
+        self.update_fields("vehicles", vin, {"year": new_year})
 
     def update_vehicle_color(self, vin, new_color):
         """Updates the passed vin to have the passed new color in the database."""
 
-        self.cursor.execute(
-            """UPDATE vehicles SET color = (?) WHERE vin = (?);""",
-            (
-                new_color,
-                vin,
-            ),
-        )
-
-        self.connection.commit()
+        self.update_fields("vehicles", vin, {"color": new_color})
 
     def update_vehicle_engine(self, vin, new_engine):
         """Updates the passed vin to have the new passed engine in the database."""
 
-        self.cursor.execute(
-            """UPDATE vehicles SET engine = (?) WHERE vin = (?);""",
-            (
-                new_engine,
-                vin,
-            ),
-        )
-
-        self.connection.commit()
+        self.update_fields("vehicles", vin, {"engine": new_engine})
 
     def update_vehicle_active_repair(self, vin, repair_id=None):
         """Updates the active repair id of a passed vehicle to the passed repair id,
         defaults to none for if repair was completed."""
 
-        self.cursor.execute(
-            """UPDATE vehicles SET repair_request = (?) WHERE vin = (?);""",
-            (repair_id, vin),
-        )
-
-        self.connection.commit()
+        self.update_fields("vehicles", vin, {"repair_request": repair_id})
 
     def has_active_repair(self, vin):
         """Searches if a passed vin has an active repair."""
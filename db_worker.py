@@ -0,0 +1,226 @@
+"""This module defines the database worker thread that owns the database connection and
+the asynchronous facade the handler modules use in place of the database object, so
+queries run off the GUI thread."""
+
+import asyncio
+import contextlib
+import itertools
+import queue
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from PyQt6 import QtCore
+from data_interface import AppDatabase, STREAM_BATCH_SIZE
+
+# disable linter message due to using C extention
+# pylint: disable=c-extension-no-member
+
+# Calls that finish within this many seconds are waited on without spinning an event loop
+FAST_PATH_SECONDS = 0.01
+
+
+class DatabaseWorker(QtCore.QThread):
+    """This class defines the thread that creates the database, and so owns its
+    connection, then runs queued calls against it one at a time in order."""
+
+    # (callback, result) emitted on the worker thread, delivered on the GUI thread
+    result_ready = QtCore.pyqtSignal(object, object)
+
+    def __init__(self, database_factory=AppDatabase):
+        super().__init__()
+        self.database_factory = database_factory
+        self.database = None
+        self.database_ready = Future()  # result is the database once it is created
+        self.calls = queue.Queue()
+
+        # this object lives on the GUI thread --> connected slot runs there
+        self.result_ready.connect(self.deliver_result)
+
+    def run(self):
+        """Creates the database on this thread, then runs queued calls until stopped."""
+
+        try:
+            self.database = self.database_factory()
+
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            self.database_ready.set_exception(error)
+
+            return
+
+        self.database_ready.set_result(self.database)
+
+        while True:
+            call = self.calls.get()
+
+            if call is None:
+                break  # stop requested
+
+            future, function, args, kwargs = call
+
+            # skip calls cancelled while they waited in the queue
+            if not future.set_running_or_notify_cancel():
+                continue
+
+            try:
+                future.set_result(function(self.database, *args, **kwargs))
+
+            except BaseException as error:  # pylint: disable=broad-exception-caught
+                future.set_exception(error)
+
+        self.database.close()
+
+    def submit(self, function, *args, **kwargs):
+        """Queues function(database, *args, **kwargs) to run on the worker thread,
+        returns a future of its result."""
+
+        future = Future()
+
+        self.calls.put((future, function, args, kwargs))
+
+        return future
+
+    def submit_method(self, name, *args, **kwargs):
+        """Queues a call of the named database method, returns a future of its result."""
+
+        return self.submit(lambda database: getattr(database, name)(*args, **kwargs))
+
+    def call_async(self, name, *args, callback=None, **kwargs):
+        """Queues a call of the named database method, the passed callback is called
+        with its result on the GUI thread. Returns the future of the result."""
+
+        future = self.submit_method(name, *args, **kwargs)
+
+        if callback is not None:
+            future.add_done_callback(
+                lambda done: self.result_ready.emit(callback, done)
+            )
+
+        return future
+
+    def deliver_result(self, callback, future):
+        """Calls the callback with the result of a finished call, on the GUI thread.
+        Cancelled calls are dropped."""
+
+        if not future.cancelled():
+            callback(future.result())
+
+    def stop(self):
+        """Lets queued calls finish, closes the database and ends the thread."""
+
+        self.calls.put(None)
+        self.wait()
+
+
+class AsyncDatabase:
+    """This class defines a facade with the database's interface whose method calls run
+    on the database worker thread. Calls made from the GUI wait through the waiter, which
+    keeps the window painting, so the handler modules can use it as the database."""
+
+    # these show GUI dialogs so they run on the calling thread, their database calls go
+    # back through this facade
+    remove_row = AppDatabase.remove_row
+    get_remove_id_loop = AppDatabase.get_remove_id_loop
+
+    def __init__(self, worker, waiter=None):
+        self.worker = worker
+        self.waiter = waiter
+
+        # wait for the worker to create the database, raises if that failed
+        self.database = worker.database_ready.result()
+
+        self.remove_row_distpatcher = AppDatabase.create_remove_row_dispatcher(self)
+
+    def __getattr__(self, name):
+        """Returns a function that runs the named database method on the worker thread
+        and waits for its result, other attributes are read from the database."""
+
+        if not callable(getattr(AppDatabase, name, None)):
+            return getattr(self.database, name)
+
+        # generator methods --> stream their rows back from the worker
+        if name.startswith("iter_"):
+            return lambda *args, **kwargs: self.iterate(name, *args, **kwargs)
+
+        def call_on_worker(*args, **kwargs):
+            return self.wait(self.worker.submit_method(name, *args, **kwargs))
+
+        return call_on_worker
+
+    def wait(self, future):
+        """Returns the result of the passed future, quick calls are waited on directly,
+        slower ones through the waiter."""
+
+        try:
+            return future.result(timeout=FAST_PATH_SECONDS)
+
+        except FutureTimeoutError:
+            pass
+
+        if self.waiter is None:
+            return future.result()
+
+        return self.waiter(future)
+
+    def iterate(self, name, *args, **kwargs):
+        """Generator yielding the items of the named database generator method, which
+        runs on the worker thread. Items are passed back a batch at a time."""
+
+        batch_size = kwargs.get("batch_size", STREAM_BATCH_SIZE)
+
+        # creating the generator runs none of it, every next() on it runs on the worker
+        items = self.wait(self.worker.submit_method(name, *args, **kwargs))
+
+        try:
+            while True:
+                batch = self.wait(
+                    self.worker.submit(
+                        lambda _database: list(itertools.islice(items, batch_size))
+                    )
+                )
+
+                if not batch:
+                    return  # generator finished
+
+                yield from batch
+
+        finally:
+            # dropped part way through --> close it on the worker, its cursor lives there
+            self.worker.submit(lambda _database: items.close())
+
+    def submit(self, name, *args, **kwargs):
+        """Queues a call of the named database method, returns a future of its result
+        without waiting."""
+
+        return self.worker.submit_method(name, *args, **kwargs)
+
+    def call_async(self, name, *args, callback=None, **kwargs):
+        """Queues a call of the named database method, the callback is called with its
+        result on the GUI thread."""
+
+        return self.worker.call_async(name, *args, callback=callback, **kwargs)
+
+    async def run(self, name, *args, **kwargs):
+        """Coroutine that awaits a call of the named database method, for use from an
+        asyncio event loop."""
+
+        return await asyncio.wrap_future(self.submit(name, *args, **kwargs))
+
+    @contextlib.contextmanager
+    def transaction(self):
+        """Context manager grouping every call made inside it into one atomic commit
+        on the worker's connection, see AppDatabase.transaction."""
+
+        self.begin_transaction()
+
+        try:
+            yield self
+
+        except BaseException:
+            self.end_transaction(False)
+
+            raise
+
+        self.end_transaction(True)
+
+    def close(self):
+        """Stops the worker thread, which closes the database."""
+
+        self.worker.stop()
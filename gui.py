@@ -6,17 +6,82 @@
 
 # -*- coding: utf-8 -*-
 
-# Form implementation generated from reading ui file 'gui.ui'
+# First generated from a Qt Designer file by PyQt5 UI code generator 5.15.9 --->
+# Migrated to PyQt6, then spaced and linted.
 #
-# Created by: PyQt5 UI code generator 5.15.9 ---> Migrated to PyQt6
+# This file is maintained by hand. The Designer file was removed once the list pages
+# moved to table views it did not have, edit the widgets here directly.
 #
-# WARNING: Any manual changes made to this file will be lost when pyuic5 is
-# run again.  Do not edit this file unless you know what you are doing.
-
-# After UI code production by PyQt5 UI code generator the code was spaced and linted.
-# Only minor changes following that.
+# Only the login page is built up front, each other page is built on first use by its
+# setup_<page> and retranslate_<page> methods. A new page is appended to PAGES, whose
+# order is the stack index app.py matches on, and its widget name prefix is added to
+# WIDGET_PAGES.
 
 from PyQt6 import QtCore, QtGui, QtWidgets
+from table_models import KeysetTableModel
+
+# Milliseconds typing has to pause for before the lookup page searches
+LOOKUP_DELAY_MS = 60
+
+# Pages of the widget stack in index order, new pages go last as app.py matches indexes
+PAGES = (
+    "login_page",
+    "new_user_page",
+    "update_password_page",
+    "update_user_page",
+    "new_repair_page",
+    "edit_repair_page",
+    "active_repairs_page",
+    "display_old_repair",
+    "new_part_page",
+    "edit_part_page",
+    "list_of_parts_page",
+    "new_customer_page",
+    "edit_customer_page",
+    "list_of_customers_page",
+    "new_vehicle_page",
+    "edit_vehicle_page",
+    "list_of_vehicles_page",
+    "search_repairs_page",
+    "lookup_page",
+)
+
+# Widget name prefix --> page the widget is on
+WIDGET_PAGES = {
+    "username_login_": "login_page",
+    "password_login_": "login_page",
+    "login_page_": "login_page",
+    "username_new_user_": "new_user_page",
+    "password_new_user_": "new_user_page",
+    "confirm_password_new_user_": "new_user_page",
+    "new_user_": "new_user_page",
+    "update_password_": "update_password_page",
+    "new_password_": "update_password_page",
+    "old_password_": "update_password_page",
+    "confirm_new_password_": "update_password_page",
+    "update_user_": "update_user_page",
+    "need_password_": "update_user_page",
+    "new_repair_": "new_repair_page",
+    "edit_repair_": "edit_repair_page",
+    "edit_total_repair_": "edit_repair_page",
+    "change_writer_": "edit_repair_page",
+    "change_tech_": "edit_repair_page",
+    "change_labor_": "edit_repair_page",
+    "active_repairs_": "active_repairs_page",
+    "old_repair_": "display_old_repair",
+    "old_total_repair_": "display_old_repair",
+    "new_part_": "new_part_page",
+    "edit_part_": "edit_part_page",
+    "list_of_parts_": "list_of_parts_page",
+    "new_customer_": "new_customer_page",
+    "edit_customer_": "edit_customer_page",
+    "list_of_customers_": "list_of_customers_page",
+    "new_vehicle_": "new_vehicle_page",
+    "edit_vehicle_": "edit_vehicle_page",
+    "list_of_vehicles_": "list_of_vehicles_page",
+    "search_repairs_": "search_repairs_page",
+    "lookup_": "lookup_page",
+}
 
 # disable linter message due to using C extention
 # pylint: disable=c-extension-no-member
@@ -24,8 +89,21 @@ from PyQt6 import QtCore, QtGui, QtWidgets
 # pylint: disable=attribute-defined-outside-init
 
 
+def get_widget_page(name):
+    """Returns the page the named widget is on, None if it is not on a page."""
+
+    for prefix, page in WIDGET_PAGES.items():
+        if name.startswith(prefix):
+            return page
+
+    return None
+
+
 class UiGarageTrackerMainWindow(QtWidgets.QMainWindow):
-    """Defines the contents of the apps GUI."""
+    """Defines the contents of the apps GUI. Only the login page is built up front,
+    the other pages build their widgets the first time they are used."""
+
+    page_built = QtCore.pyqtSignal(str)  # name of the page whose widgets were built
 
     def setup_ui(self, app_main_window):
         """Sets up the GUI window and contents."""
@@ -38,6 +116,14 @@ class UiGarageTrackerMainWindow(QtWidgets.QMainWindow):
 
         self.edit_repair_problem_has_changed = False
         self.edit_repair_repair_has_changed = False
+        self.text_streams = {}  # text browser name --> chunks still being displayed
+
+        # lookup page search as you type, runs once typing pauses for the interval
+        self.lookup_timer = QtCore.QTimer(app_main_window)
+        self.lookup_timer.setSingleShot(True)
+        self.lookup_timer.setInterval(LOOKUP_DELAY_MS)
+        self.lookup_pending = None  # future of the lookup query still running
+        self.lookup_generation = 0  # counts lookups, results of older ones are dropped
 
         self.centralwidget = QtWidgets.QWidget(app_main_window)
         self.centralwidget.setObjectName("centralwidget")
@@ -45,2351 +131,2533 @@ class UiGarageTrackerMainWindow(QtWidgets.QMainWindow):
         self.widget_stack.setGeometry(QtCore.QRect(0, 0, 951, 931))
         self.widget_stack.setObjectName("widget_stack")
 
-        self.login_page = QtWidgets.QWidget()
-        self.login_page.setObjectName("login_page")
+        # pages are empty until first used, build_page adds their widgets
+        self.built_pages = set()
 
-        self.username_login_input_box = QtWidgets.QLineEdit(self.login_page)
-        self.username_login_input_box.setGeometry(QtCore.QRect(370, 300, 171, 31))
-        self.username_login_input_box.setObjectName("username_login_input_box")
+        for page in PAGES:
+            page_widget = QtWidgets.QWidget()
+            page_widget.setObjectName(page)
+            setattr(self, page, page_widget)
+            self.widget_stack.addWidget(page_widget)
 
-        self.password_login_input_box = QtWidgets.QLineEdit(self.login_page)
-        self.password_login_input_box.setEchoMode(QtWidgets.QLineEdit.EchoMode.Password)
-        self.password_login_input_box.setGeometry(QtCore.QRect(370, 390, 171, 31))
-        self.password_login_input_box.setObjectName("password_login_input_box")
+        app_main_window.setCentralWidget(self.centralwidget)
 
-        self.username_login_label = QtWidgets.QLabel(self.login_page)
-        self.username_login_label.setGeometry(QtCore.QRect(370, 270, 101, 21))
-        font = QtGui.QFont()
-        font.setPointSize(16)
-        self.username_login_label.setFont(font)
-        self.username_login_label.setObjectName("username_login_label")
+        self.menu_bar = QtWidgets.QMenuBar(app_main_window)
+        self.menu_bar.setGeometry(QtCore.QRect(0, 0, 950, 21))
+        self.menu_bar.setObjectName("menu_bar")
 
-        self.password_login_label = QtWidgets.QLabel(self.login_page)
-        self.password_login_label.setGeometry(QtCore.QRect(370, 360, 101, 21))
-        font = QtGui.QFont()
-        font.setPointSize(16)
-        self.password_login_label.setFont(font)
-        self.password_login_label.setObjectName("password_login_label")
+        self.menu_users = QtWidgets.QMenu(self.menu_bar)
+        self.menu_users.setObjectName("menu_users")
 
-        self.login_page_submit_button = QtWidgets.QPushButton(self.login_page)
-        self.login_page_submit_button.setGeometry(QtCore.QRect(410, 450, 81, 31))
-        font = QtGui.QFont()
-        font.setPointSize(12)
-        self.login_page_submit_button.setFont(font)
-        self.login_page_submit_button.setObjectName("login_page_submit_button")
+        self.menu_repairs = QtWidgets.QMenu(self.menu_bar)
+        self.menu_repairs.setObjectName("menu_repairs")
 
-        self.widget_stack.addWidget(self.login_page)
+        self.menu_parts = QtWidgets.QMenu(self.menu_bar)
+        self.menu_parts.setObjectName("menu_parts")
 
-        self.new_user_page = QtWidgets.QWidget()
-        self.new_user_page.setObjectName("new_user_page")
+        self.menu_customers = QtWidgets.QMenu(self.menu_bar)
+        self.menu_customers.setObjectName("menu_customers")
 
-        self.username_new_user_input_box = QtWidgets.QLineEdit(self.new_user_page)
-        self.username_new_user_input_box.setGeometry(QtCore.QRect(610, 220, 171, 31))
-        self.username_new_user_input_box.setObjectName("username_new_user_input_box")
+        self.menu_vehicles = QtWidgets.QMenu(self.menu_bar)
+        self.menu_vehicles.setObjectName("menu_vehicles")
 
-        self.username_new_user_label = QtWidgets.QLabel(self.new_user_page)
-        self.username_new_user_label.setGeometry(QtCore.QRect(610, 190, 101, 21))
-        font = QtGui.QFont()
-        font.setPointSize(16)
-        self.username_new_user_label.setFont(font)
-        self.username_new_user_label.setObjectName("username_new_user_label")
+        app_main_window.setMenuBar(self.menu_bar)
 
-        self.password_new_user_input_box = QtWidgets.QLineEdit(self.new_user_page)
-        self.password_new_user_input_box.setGeometry(QtCore.QRect(610, 310, 171, 31))
-        self.password_new_user_input_box.setEchoMode(
-            QtWidgets.QLineEdit.EchoMode.Password
-        )
-        self.password_new_user_input_box.setObjectName("password_new_user_input_box")
+        self.status_bar = QtWidgets.QStatusBar(app_main_window)
+        self.status_bar.setObjectName("status_bar")
 
-        self.password_new_user_label = QtWidgets.QLabel(self.new_user_page)
-        self.password_new_user_label.setGeometry(QtCore.QRect(610, 280, 101, 21))
-        font = QtGui.QFont()
-        font.setPointSize(16)
-        self.password_new_user_label.setFont(font)
-        self.password_new_user_label.setObjectName("password_new_user_label")
+        app_main_window.setStatusBar(self.status_bar)
 
-        self.confirm_password_new_user_input_box = QtWidgets.QLineEdit(
-            self.new_user_page
-        )
-        self.confirm_password_new_user_input_box.setGeometry(
-            QtCore.QRect(610, 400, 171, 31)
-        )
-        self.confirm_password_new_user_input_box.setEchoMode(
-            QtWidgets.QLineEdit.EchoMode.Password
-        )
-        self.confirm_password_new_user_input_box.setObjectName(
-            "confirm_password_new_user_input_box"
-        )
+        self.action_login = QtGui.QAction(app_main_window)
+        self.action_login.setObjectName("action_login")
 
-        self.confirm_password_new_user_label = QtWidgets.QLabel(self.new_user_page)
-        self.confirm_password_new_user_label.setGeometry(
-            QtCore.QRect(610, 370, 171, 21)
-        )
-        font = QtGui.QFont()
-        font.setPointSize(16)
-        self.confirm_password_new_user_label.setFont(font)
-        self.confirm_password_new_user_label.setObjectName(
-            "confirm_password_new_user_label"
-        )
+        self.action_logout = QtGui.QAction(app_main_window)
+        self.action_logout.setObjectName("action_logout")
 
-        self.new_user_note_label = QtWidgets.QLabel(self.new_user_page)
-        self.new_user_note_label.setGeometry(QtCore.QRect(640, 500, 111, 61))
-        self.new_user_note_label.setWordWrap(True)
-        self.new_user_note_label.setObjectName("new_user_note_label")
-        self.new_user_note2_label = QtWidgets.QLabel(self.new_user_page)
-        self.new_user_note2_label.setGeometry(QtCore.QRect(640, 570, 111, 80))
-        self.new_user_note2_label.setWordWrap(True)
-        self.new_user_note2_label.setObjectName("new_user_note2_label")
+        self.action_new_user = QtGui.QAction(app_main_window)
+        self.action_new_user.setObjectName("action_new_user")
 
-        self.new_user_page_submit_button = QtWidgets.QPushButton(self.new_user_page)
-        self.new_user_page_submit_button.setGeometry(QtCore.QRect(650, 450, 81, 31))
-        font = QtGui.QFont()
-        font.setPointSize(12)
-        self.new_user_page_submit_button.setFont(font)
-        self.new_user_page_submit_button.setObjectName("new_user_page_submit_button")
+        self.action_new_repair = QtGui.QAction(app_main_window)
+        self.action_new_repair.setObjectName("action_new_repair")
 
-        self.new_user_writer_or_tech_label = QtWidgets.QLabel(self.new_user_page)
-        self.new_user_writer_or_tech_label.setGeometry(QtCore.QRect(120, 360, 261, 21))
-        font = QtGui.QFont()
-        font.setPointSize(16)
-        self.new_user_writer_or_tech_label.setFont(font)
-        self.new_user_writer_or_tech_label.setObjectName(
-            "new_user_writer_or_tech_label"
-        )
+        self.action_edit_repair = QtGui.QAction(app_main_window)
+        self.action_edit_repair.setObjectName("action_edit_repair")
 
-        self.new_user_service_writer_radio_button = QtWidgets.QRadioButton(
-            self.new_user_page
-        )
-        self.new_user_service_writer_radio_button.setGeometry(
-            QtCore.QRect(80, 400, 101, 31)
-        )
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.new_user_service_writer_radio_button.setFont(font)
-        self.new_user_service_writer_radio_button.setObjectName(
-            "new_user_service_writer_radio_button"
-        )
+        self.action_new_part = QtGui.QAction(app_main_window)
+        self.action_new_part.setObjectName("action_new_part")
 
-        self.new_user_tech_radio_button = QtWidgets.QRadioButton(self.new_user_page)
-        self.new_user_tech_radio_button.setGeometry(QtCore.QRect(330, 400, 101, 31))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.new_user_tech_radio_button.setFont(font)
-        self.new_user_tech_radio_button.setObjectName("new_user_tech_radio_button")
+        self.action_edit_part = QtGui.QAction(app_main_window)
+        self.action_edit_part.setObjectName("action_edit_part")
 
-        self.new_user_name_label = QtWidgets.QLabel(self.new_user_page)
-        self.new_user_name_label.setGeometry(QtCore.QRect(170, 180, 101, 21))
-        font = QtGui.QFont()
-        font.setPointSize(16)
-        self.new_user_name_label.setFont(font)
-        self.new_user_name_label.setObjectName("new_user_name_label")
+        self.action_new_customer = QtGui.QAction(app_main_window)
+        self.action_new_customer.setObjectName("action_new_customer")
 
-        self.new_user_name_input_box = QtWidgets.QLineEdit(self.new_user_page)
-        self.new_user_name_input_box.setGeometry(QtCore.QRect(170, 210, 171, 31))
-        self.new_user_name_input_box.setObjectName("new_user_name_input_box")
+        self.action_edit_customer = QtGui.QAction(app_main_window)
+        self.action_edit_customer.setObjectName("action_edit_customer")
 
-        self.new_user_team_label = QtWidgets.QLabel(self.new_user_page)
-        self.new_user_team_label.setGeometry(QtCore.QRect(170, 270, 101, 21))
-        font = QtGui.QFont()
-        font.setPointSize(16)
-        self.new_user_team_label.setFont(font)
-        self.new_user_team_label.setObjectName("new_user_team_label")
+        self.action_new_vehicle = QtGui.QAction(app_main_window)
+        self.action_new_vehicle.setObjectName("action_new_vehicle")
 
-        self.new_user_team_input_box = QtWidgets.QLineEdit(self.new_user_page)
-        self.new_user_team_input_box.setGeometry(QtCore.QRect(170, 300, 171, 31))
-        self.new_user_team_input_box.setObjectName("new_user_team_input_box")
+        self.action_edit_vehicle = QtGui.QAction(app_main_window)
+        self.action_edit_vehicle.setObjectName("action_edit_vehicle")
 
-        self.new_user_lane_label = QtWidgets.QLabel(self.new_user_page)
-        self.new_user_lane_label.setGeometry(QtCore.QRect(80, 440, 101, 21))
-        font = QtGui.QFont()
-        font.setPointSize(16)
-        self.new_user_lane_label.setFont(font)
-        self.new_user_lane_label.setObjectName("new_user_lane_label")
+        self.action_update_password = QtGui.QAction(app_main_window)
+        self.action_update_password.setObjectName("action_update_password")
 
-        self.new_user_section_label = QtWidgets.QLabel(self.new_user_page)
-        self.new_user_section_label.setGeometry(QtCore.QRect(320, 440, 101, 21))
-        font = QtGui.QFont()
-        font.setPointSize(16)
-        self.new_user_section_label.setFont(font)
-        self.new_user_section_label.setObjectName("new_user_section_label")
+        self.action_active_repairs = QtGui.QAction(app_main_window)
+        self.action_active_repairs.setObjectName("action_active_repairs")
 
-        self.new_user_lane_input_box = QtWidgets.QLineEdit(self.new_user_page)
-        self.new_user_lane_input_box.setGeometry(QtCore.QRect(80, 470, 171, 31))
-        self.new_user_lane_input_box.setObjectName("new_user_lane_input_box")
+        self.action_list_of_parts = QtGui.QAction(app_main_window)
+        self.action_list_of_parts.setObjectName("action_list_of_parts")
 
-        self.new_user_section_input_box = QtWidgets.QLineEdit(self.new_user_page)
-        self.new_user_section_input_box.setGeometry(QtCore.QRect(320, 470, 171, 31))
-        self.new_user_section_input_box.setObjectName("new_user_section_input_box")
+        self.action_get_repair_history = QtGui.QAction(app_main_window)
+        self.action_get_repair_history.setObjectName("action_get_repair_history")
 
-        self.widget_stack.addWidget(self.new_user_page)
+        self.action_list_of_customers = QtGui.QAction(app_main_window)
+        self.action_list_of_customers.setObjectName("action_list_of_customers")
 
-        self.update_password_page = QtWidgets.QWidget()
-        self.update_password_page.setObjectName("update_password_page")
+        self.action_list_of_vehicles = QtGui.QAction(app_main_window)
+        self.action_list_of_vehicles.setObjectName("action_list_of_vehicles")
 
-        self.new_password_input_box = QtWidgets.QLineEdit(self.update_password_page)
-        self.new_password_input_box.setGeometry(QtCore.QRect(370, 480, 171, 31))
-        self.new_password_input_box.setEchoMode(QtWidgets.QLineEdit.EchoMode.Password)
-        self.new_password_input_box.setObjectName("new_password_input_box")
+        self.action_display_old_repair = QtGui.QAction(app_main_window)
+        self.action_display_old_repair.setObjectName("action_display_old_repair")
 
-        self.update_password_username_label = QtWidgets.QLabel(
-            self.update_password_page
-        )
-        self.update_password_username_label.setGeometry(QtCore.QRect(370, 270, 101, 21))
-        font = QtGui.QFont()
-        font.setPointSize(16)
-        self.update_password_username_label.setFont(font)
-        self.update_password_username_label.setObjectName(
-            "update_password_username_label"
-        )
+        self.action_search_repairs = QtGui.QAction(app_main_window)
+        self.action_search_repairs.setObjectName("action_search_repairs")
 
-        self.update_password_note2_label = QtWidgets.QLabel(self.update_password_page)
-        self.update_password_note2_label.setGeometry(QtCore.QRect(390, 740, 111, 80))
-        self.update_password_note2_label.setWordWrap(True)
-        self.update_password_note2_label.setObjectName("update_password_note2_label")
+        self.action_lookup_part = QtGui.QAction(app_main_window)
+        self.action_lookup_part.setObjectName("action_lookup_part")
 
-        self.new_password_label = QtWidgets.QLabel(self.update_password_page)
-        self.new_password_label.setGeometry(QtCore.QRect(370, 450, 171, 21))
-        font = QtGui.QFont()
-        font.setPointSize(16)
-        self.new_password_label.setFont(font)
-        self.new_password_label.setObjectName("new_password_label")
+        self.action_lookup_customer = QtGui.QAction(app_main_window)
+        self.action_lookup_customer.setObjectName("action_lookup_customer")
 
-        self.update_password_username_input_box = QtWidgets.QLineEdit(
-            self.update_password_page
-        )
-        self.update_password_username_input_box.setGeometry(
-            QtCore.QRect(370, 300, 171, 31)
-        )
-        self.update_password_username_input_box.setObjectName(
-            "update_password_username_input_box"
-        )
+        self.action_lookup_vehicle = QtGui.QAction(app_main_window)
+        self.action_lookup_vehicle.setObjectName("action_lookup_vehicle")
 
-        self.update_password_note_label = QtWidgets.QLabel(self.update_password_page)
-        self.update_password_note_label.setGeometry(QtCore.QRect(390, 670, 111, 61))
-        self.update_password_note_label.setWordWrap(True)
-        self.update_password_note_label.setObjectName("update_password_note_label")
+        self.action_search_user = QtGui.QAction(app_main_window)
+        self.action_search_user.setObjectName("action_search_user")
 
-        self.old_password_input_box = QtWidgets.QLineEdit(self.update_password_page)
-        self.old_password_input_box.setGeometry(QtCore.QRect(370, 390, 171, 31))
-        self.old_password_input_box.setEchoMode(QtWidgets.QLineEdit.EchoMode.Password)
-        self.old_password_input_box.setObjectName("old_password_input_box")
+        self.action_update_user = QtGui.QAction(app_main_window)
+        self.action_update_user.setObjectName("action_update_user")
 
-        self.old_password_label = QtWidgets.QLabel(self.update_password_page)
-        self.old_password_label.setGeometry(QtCore.QRect(370, 360, 101, 21))
-        font = QtGui.QFont()
-        font.setPointSize(16)
-        self.old_password_label.setFont(font)
-        self.old_password_label.setObjectName("old_password_label")
+        self.action_show_users = QtGui.QAction(app_main_window)
+        self.action_show_users.setObjectName("action_show_users")
 
-        self.confirm_new_password_label = QtWidgets.QLabel(self.update_password_page)
-        self.confirm_new_password_label.setGeometry(QtCore.QRect(370, 540, 171, 21))
-        font = QtGui.QFont()
-        font.setPointSize(16)
-        self.confirm_new_password_label.setFont(font)
-        self.confirm_new_password_label.setObjectName("confirm_new_password_label")
+        self.action_remove_user = QtGui.QAction(app_main_window)
+        self.action_remove_user.setObjectName("action_remove_user")
 
-        self.confirm_new_password_input_box = QtWidgets.QLineEdit(
-            self.update_password_page
-        )
-        self.confirm_new_password_input_box.setGeometry(QtCore.QRect(370, 570, 171, 31))
-        self.confirm_new_password_input_box.setText("")
-        self.confirm_new_password_input_box.setEchoMode(
-            QtWidgets.QLineEdit.EchoMode.Password
-        )
-        self.confirm_new_password_input_box.setObjectName(
-            "confirm_new_password_input_box"
-        )
+        self.action_remove_repair = QtGui.QAction(app_main_window)
+        self.action_remove_repair.setObjectName("action_remove_repair")
 
-        self.update_password_submit_button = QtWidgets.QPushButton(
-            self.update_password_page
-        )
-        self.update_password_submit_button.setGeometry(QtCore.QRect(410, 630, 81, 31))
-        font = QtGui.QFont()
-        font.setPointSize(12)
-        self.update_password_submit_button.setFont(font)
-        self.update_password_submit_button.setObjectName(
-            "update_password_submit_button"
-        )
+        self.action_remove_part = QtGui.QAction(app_main_window)
+        self.action_remove_part.setObjectName("action_remove_part")
 
-        self.widget_stack.addWidget(self.update_password_page)
+        self.action_remove_customer = QtGui.QAction(app_main_window)
+        self.action_remove_customer.setObjectName("action_remove_customer")
 
-        self.update_user_page = QtWidgets.QWidget()
-        self.update_user_page.setObjectName("update_user_page")
+        self.action_remove_vehicle = QtGui.QAction(app_main_window)
+        self.action_remove_vehicle.setObjectName("action_remove_vehicle")
 
-        self.update_user_password_input_box = QtWidgets.QLineEdit(self.update_user_page)
-        self.update_user_password_input_box.setGeometry(QtCore.QRect(390, 650, 171, 31))
-        self.update_user_password_input_box.setEchoMode(
-            QtWidgets.QLineEdit.EchoMode.Password
-        )
-        self.update_user_password_input_box.setObjectName(
-            "update_user_password_input_box"
-        )
+        self.menu_users.addAction(self.action_login)
+        self.menu_users.addAction(self.action_logout)
+        self.menu_users.addAction(self.action_new_user)
+        self.menu_users.addAction(self.action_update_password)
+        self.menu_users.addAction(self.action_search_user)
+        self.menu_users.addAction(self.action_update_user)
+        self.menu_users.addAction(self.action_show_users)
+        self.menu_users.addAction(self.action_remove_user)
+        self.menu_repairs.addAction(self.action_new_repair)
+        self.menu_repairs.addAction(self.action_edit_repair)
+        self.menu_repairs.addAction(self.action_active_repairs)
+        self.menu_repairs.addAction(self.action_display_old_repair)
+        self.menu_repairs.addAction(self.action_search_repairs)
+        self.menu_repairs.addAction(self.action_remove_repair)
+        self.menu_parts.addAction(self.action_new_part)
+        self.menu_parts.addAction(self.action_edit_part)
+        self.menu_parts.addAction(self.action_list_of_parts)
+        self.menu_parts.addAction(self.action_lookup_part)
+        self.menu_parts.addAction(self.action_remove_part)
+        self.menu_customers.addAction(self.action_new_customer)
+        self.menu_customers.addAction(self.action_edit_customer)
+        self.menu_customers.addAction(self.action_list_of_customers)
+        self.menu_customers.addAction(self.action_lookup_customer)
+        self.menu_customers.addAction(self.action_remove_customer)
+        self.menu_vehicles.addAction(self.action_new_vehicle)
+        self.menu_vehicles.addAction(self.action_edit_vehicle)
+        self.menu_vehicles.addAction(self.action_get_repair_history)
+        self.menu_vehicles.addAction(self.action_list_of_vehicles)
+        self.menu_vehicles.addAction(self.action_lookup_vehicle)
+        self.menu_vehicles.addAction(self.action_remove_vehicle)
+        self.menu_bar.addAction(self.menu_users.menuAction())
+        self.menu_bar.addAction(self.menu_repairs.menuAction())
+        self.menu_bar.addAction(self.menu_parts.menuAction())
+        self.menu_bar.addAction(self.menu_customers.menuAction())
+        self.menu_bar.addAction(self.menu_vehicles.menuAction())
 
-        self.update_user_service_writer_radio_button = QtWidgets.QRadioButton(
-            self.update_user_page
-        )
-        self.update_user_service_writer_radio_button.setGeometry(
-            QtCore.QRect(470, 290, 101, 31)
-        )
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.update_user_service_writer_radio_button.setFont(font)
-        self.update_user_service_writer_radio_button.setObjectName(
-            "update_user_service_writer_radio_button"
-        )
+        self.retranslate_ui(app_main_window)
+        self.widget_stack.currentChanged.connect(self.build_current_page)
+        self.build_page(PAGES[0])
+        self.widget_stack.setCurrentIndex(0)
+        QtCore.QMetaObject.connectSlotsByName(app_main_window)
 
-        self.update_user_section_label = QtWidgets.QLabel(self.update_user_page)
-        self.update_user_section_label.setGeometry(QtCore.QRect(710, 330, 101, 21))
-        font = QtGui.QFont()
-        font.setPointSize(16)
-        self.update_user_section_label.setFont(font)
-        self.update_user_section_label.setObjectName("update_user_section_label")
+    def retranslate_ui(self, app_main_window):
+        """Retranslates the ui, created by Qt Designer. Contains all the Strings for
+        the labels and buttons."""
 
-        self.update_user_page_submit_button = QtWidgets.QPushButton(
-            self.update_user_page
-        )
-        self.update_user_page_submit_button.setGeometry(QtCore.QRect(430, 710, 81, 31))
-        font = QtGui.QFont()
-        font.setPointSize(12)
-        self.update_user_page_submit_button.setFont(font)
-        self.update_user_page_submit_button.setObjectName(
-            "update_user_page_submit_button"
+        _translate = QtCore.QCoreApplication.translate
+        app_main_window.setWindowTitle(
+            _translate("app_main_window", "Garage Service Tracker")
         )
 
-        self.update_user_lane_label = QtWidgets.QLabel(self.update_user_page)
-        self.update_user_lane_label.setGeometry(QtCore.QRect(470, 330, 101, 21))
-        font = QtGui.QFont()
-        font.setPointSize(16)
-        self.update_user_lane_label.setFont(font)
-        self.update_user_lane_label.setObjectName("update_user_lane_label")
+        self.menu_users.setTitle(_translate("app_main_window", "Users"))
 
-        self.update_user_name_label = QtWidgets.QLabel(self.update_user_page)
-        self.update_user_name_label.setGeometry(QtCore.QRect(140, 220, 101, 21))
-        font = QtGui.QFont()
-        font.setPointSize(16)
-        self.update_user_name_label.setFont(font)
-        self.update_user_name_label.setObjectName("update_user_name_label")
+        self.menu_repairs.setTitle(_translate("app_main_window", "Repairs"))
 
-        self.update_user_team_input_box = QtWidgets.QLineEdit(self.update_user_page)
-        self.update_user_team_input_box.setGeometry(QtCore.QRect(140, 460, 171, 31))
-        self.update_user_team_input_box.setObjectName("update_user_team_input_box")
+        self.menu_parts.setTitle(_translate("app_main_window", "Parts"))
 
-        self.update_user_writer_or_tech_label = QtWidgets.QLabel(self.update_user_page)
-        self.update_user_writer_or_tech_label.setGeometry(
-            QtCore.QRect(510, 250, 261, 21)
-        )
-        font = QtGui.QFont()
-        font.setPointSize(16)
-        self.update_user_writer_or_tech_label.setFont(font)
-        self.update_user_writer_or_tech_label.setObjectName(
-            "update_user_writer_or_tech_label"
-        )
+        self.menu_customers.setTitle(_translate("app_main_window", "Customers"))
 
-        self.update_user_team_label = QtWidgets.QLabel(self.update_user_page)
-        self.update_user_team_label.setGeometry(QtCore.QRect(140, 380, 101, 21))
-        font = QtGui.QFont()
-        font.setPointSize(16)
-        self.update_user_team_label.setFont(font)
-        self.update_user_team_label.setObjectName("update_user_team_label")
+        self.menu_vehicles.setTitle(_translate("app_main_window", "Vehicles"))
 
-        self.update_user_password_label = QtWidgets.QLabel(self.update_user_page)
-        self.update_user_password_label.setGeometry(QtCore.QRect(390, 620, 101, 21))
-        font = QtGui.QFont()
-        font.setPointSize(16)
-        self.update_user_password_label.setFont(font)
-        self.update_user_password_label.setObjectName("update_user_password_label")
+        self.action_login.setText(_translate("app_main_window", "Login"))
 
-        self.update_user_name_input_box = QtWidgets.QLineEdit(self.update_user_page)
-        self.update_user_name_input_box.setGeometry(QtCore.QRect(140, 300, 171, 31))
-        self.update_user_name_input_box.setObjectName("update_user_name_input_box")
+        self.action_logout.setText(_translate("app_main_window", "Logout"))
 
-        self.update_user_section_input_box = QtWidgets.QLineEdit(self.update_user_page)
-        self.update_user_section_input_box.setGeometry(QtCore.QRect(710, 410, 171, 31))
-        self.update_user_section_input_box.setObjectName(
-            "update_user_section_input_box"
+        self.action_new_user.setText(_translate("app_main_window", "New User"))
+
+        self.action_show_users.setText(_translate("app_main_window", "Show Users"))
+
+        self.action_remove_user.setText(_translate("app_main_window", "Remove User"))
+
+        self.action_remove_repair.setText(
+            _translate("app_main_window", "Remove Repair")
         )
 
-        self.update_user_lane_input_box = QtWidgets.QLineEdit(self.update_user_page)
-        self.update_user_lane_input_box.setGeometry(QtCore.QRect(470, 410, 171, 31))
-        self.update_user_lane_input_box.setObjectName("update_user_lane_input_box")
+        self.action_remove_part.setText(_translate("app_main_window", "Remove Part"))
 
-        self.update_user_tech_radio_button = QtWidgets.QRadioButton(
-            self.update_user_page
+        self.action_remove_customer.setText(
+            _translate("app_main_window", "Remove Customer")
         )
-        self.update_user_tech_radio_button.setGeometry(QtCore.QRect(720, 290, 101, 31))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.update_user_tech_radio_button.setFont(font)
-        self.update_user_tech_radio_button.setObjectName(
-            "update_user_tech_radio_button"
+
+        self.action_remove_vehicle.setText(
+            _translate("app_main_window", "Remove Vehicle")
         )
 
-        self.need_password_label = QtWidgets.QLabel(self.update_user_page)
-        self.need_password_label.setGeometry(QtCore.QRect(390, 590, 180, 16))
-        self.need_password_label.setObjectName("need_password_label")
+        self.action_new_repair.setText(_translate("app_main_window", "New Repair"))
 
-        self.update_user_user_id_label = QtWidgets.QLabel(self.update_user_page)
-        self.update_user_user_id_label.setGeometry(QtCore.QRect(320, 70, 261, 21))
-        font = QtGui.QFont()
-        font.setPointSize(16)
-        self.update_user_user_id_label.setFont(font)
-        self.update_user_user_id_label.setObjectName("update_user_user_id_label")
+        self.action_edit_repair.setText(_translate("app_main_window", "Edit Repair"))
 
-        self.update_user_user_id_display_label = QtWidgets.QLabel(self.update_user_page)
-        self.update_user_user_id_display_label.setGeometry(
-            QtCore.QRect(320, 100, 261, 21)
-        )
-        font = QtGui.QFont()
-        font.setPointSize(14)
-        self.update_user_user_id_display_label.setFont(font)
-        self.update_user_user_id_display_label.setObjectName(
-            "update_user_user_id_display_label"
-        )
+        self.action_new_part.setText(_translate("app_main_window", "New Part"))
 
-        self.update_user_name_display_label = QtWidgets.QLabel(self.update_user_page)
-        self.update_user_name_display_label.setGeometry(QtCore.QRect(140, 250, 261, 21))
-        font = QtGui.QFont()
-        font.setPointSize(14)
-        self.update_user_name_display_label.setFont(font)
-        self.update_user_name_display_label.setObjectName(
-            "update_user_name_display_label"
-        )
+        self.action_edit_part.setText(_translate("app_main_window", "Edit Part"))
 
-        self.update_user_team_display_label = QtWidgets.QLabel(self.update_user_page)
-        self.update_user_team_display_label.setGeometry(QtCore.QRect(140, 410, 261, 21))
-        font = QtGui.QFont()
-        font.setPointSize(14)
-        self.update_user_team_display_label.setFont(font)
-        self.update_user_team_display_label.setObjectName(
-            "update_user_team_display_label"
-        )
+        self.action_new_customer.setText(_translate("app_main_window", "New Customer"))
 
-        self.update_user_lane_display_label = QtWidgets.QLabel(self.update_user_page)
-        self.update_user_lane_display_label.setGeometry(QtCore.QRect(470, 360, 121, 21))
-        font = QtGui.QFont()
-        font.setPointSize(14)
-        self.update_user_lane_display_label.setFont(font)
-        self.update_user_lane_display_label.setObjectName(
-            "update_user_lane_display_label"
+        self.action_edit_customer.setText(
+            _translate("app_main_window", "Edit Customer")
         )
 
-        self.update_user_section_display_label = QtWidgets.QLabel(self.update_user_page)
-        self.update_user_section_display_label.setGeometry(
-            QtCore.QRect(710, 360, 230, 21)
-        )
-        font = QtGui.QFont()
-        font.setPointSize(14)
-        self.update_user_section_display_label.setFont(font)
-        self.update_user_section_display_label.setObjectName(
-            "update_user_section_display_label"
-        )
+        self.action_new_vehicle.setText(_translate("app_main_window", "New Vehicle"))
 
-        self.update_user_change_name_check_box = QtWidgets.QCheckBox(
-            self.update_user_page
-        )
-        self.update_user_change_name_check_box.setGeometry(
-            QtCore.QRect(140, 280, 111, 17)
-        )
-        self.update_user_change_name_check_box.setObjectName(
-            "update_user_change_name_check_box"
+        self.action_edit_vehicle.setText(_translate("app_main_window", "Edit Vehicle"))
+
+        self.action_update_password.setText(
+            _translate("app_main_window", "Update Password")
         )
 
-        self.update_user_change_team_check_box = QtWidgets.QCheckBox(
-            self.update_user_page
+        self.action_active_repairs.setText(
+            _translate("app_main_window", "Active Repairs")
         )
-        self.update_user_change_team_check_box.setGeometry(
-            QtCore.QRect(140, 440, 111, 17)
+
+        self.action_list_of_parts.setText(
+            _translate("app_main_window", "List of Parts")
         )
-        self.update_user_change_team_check_box.setObjectName(
-            "update_user_change_team_check_box"
+
+        self.action_get_repair_history.setText(
+            _translate("app_main_window", "Get Repair History")
         )
 
-        self.update_user_change_lane_check_box = QtWidgets.QCheckBox(
-            self.update_user_page
+        self.action_list_of_customers.setText(
+            _translate("app_main_window", "List of Customers")
         )
-        self.update_user_change_lane_check_box.setGeometry(
-            QtCore.QRect(470, 390, 91, 17)
+
+        self.action_list_of_vehicles.setText(
+            _translate("app_main_window", "List of Vehicles")
         )
-        self.update_user_change_lane_check_box.setObjectName(
-            "update_user_change_lane_check_box"
+
+        self.action_display_old_repair.setText(
+            _translate("app_main_window", "Display Old Repair")
         )
 
-        self.update_user_change_section_check_box = QtWidgets.QCheckBox(
-            self.update_user_page
+        self.action_search_repairs.setText(
+            _translate("app_main_window", "Search Repairs")
         )
-        self.update_user_change_section_check_box.setGeometry(
-            QtCore.QRect(710, 390, 101, 17)
+
+        self.action_lookup_part.setText(_translate("app_main_window", "Lookup Part"))
+
+        self.action_lookup_customer.setText(
+            _translate("app_main_window", "Lookup Customer")
         )
-        self.update_user_change_section_check_box.setObjectName(
-            "update_user_change_section_check_box"
+
+        self.action_lookup_vehicle.setText(
+            _translate("app_main_window", "Lookup Vehicle")
         )
 
-        self.widget_stack.addWidget(self.update_user_page)
+        self.action_search_user.setText(_translate("app_main_window", "Search User"))
 
-        self.new_repair_page = QtWidgets.QWidget()
-        self.new_repair_page.setObjectName("new_repair_page")
+        self.action_update_user.setText(_translate("app_main_window", "Update User"))
 
-        self.new_repair_tech_id_label = QtWidgets.QLabel(self.new_repair_page)
-        self.new_repair_tech_id_label.setGeometry(QtCore.QRect(20, 100, 101, 21))
-        font = QtGui.QFont()
-        font.setPointSize(16)
-        self.new_repair_tech_id_label.setFont(font)
-        self.new_repair_tech_id_label.setObjectName("new_repair_tech_id_label")
+        for page in self.built_pages:
+            getattr(self, f"retranslate_{page}")()
 
-        self.new_repair_current_date_display = QtWidgets.QLabel(self.new_repair_page)
-        self.new_repair_current_date_display.setGeometry(QtCore.QRect(20, 310, 171, 31))
-        self.new_repair_current_date_display.setText("")
-        self.new_repair_current_date_display.setObjectName(
-            "new_repair_current_date_display"
-        )
+    def __getattr__(self, name):
+        """Builds the page of the widget being looked up if it is not built yet, so
+        handlers can fill a page in before switching to it."""
 
-        self.new_repair_service_id_label = QtWidgets.QLabel(self.new_repair_page)
-        self.new_repair_service_id_label.setGeometry(QtCore.QRect(20, 10, 171, 21))
-        font = QtGui.QFont()
-        font.setPointSize(16)
-        self.new_repair_service_id_label.setFont(font)
-        self.new_repair_service_id_label.setObjectName("new_repair_service_id_label")
+        page = get_widget_page(name)
+        built_pages = self.__dict__.get("built_pages")  # missing until setup_ui runs
 
-        self.new_repair_vin_label = QtWidgets.QLabel(self.new_repair_page)
-        self.new_repair_vin_label.setGeometry(QtCore.QRect(20, 190, 171, 21))
-        font = QtGui.QFont()
-        font.setPointSize(16)
-        self.new_repair_vin_label.setFont(font)
-        self.new_repair_vin_label.setObjectName("new_repair_vin_label")
+        # not a page widget, or its page is built and the widget does not exist
+        if page is None or built_pages is None or page in built_pages:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            )
 
-        self.new_repair_drop_off_date_label = QtWidgets.QLabel(self.new_repair_page)
-        self.new_repair_drop_off_date_label.setGeometry(QtCore.QRect(20, 280, 171, 21))
-        font = QtGui.QFont()
-        font.setPointSize(16)
-        self.new_repair_drop_off_date_label.setFont(font)
-        self.new_repair_drop_off_date_label.setObjectName(
-            "new_repair_drop_off_date_label"
-        )
+        self.build_page(page)
 
-        self.new_repair_vin_input_box = QtWidgets.QLineEdit(self.new_repair_page)
-        self.new_repair_vin_input_box.setGeometry(QtCore.QRect(20, 220, 171, 31))
-        self.new_repair_vin_input_box.setObjectName("new_repair_vin_input_box")
+        return getattr(self, name)
 
-        self.new_repair_service_id_input_box = QtWidgets.QLineEdit(self.new_repair_page)
-        self.new_repair_service_id_input_box.setGeometry(QtCore.QRect(20, 40, 171, 31))
-        self.new_repair_service_id_input_box.setObjectName(
-            "new_repair_service_id_input_box"
-        )
+    def build_page(self, page):
+        """Builds the widgets of the passed stack page the first time it is used,
+        then emits page_built so its handlers get connected."""
 
-        self.new_repair_tech_id_input_box = QtWidgets.QLineEdit(self.new_repair_page)
-        self.new_repair_tech_id_input_box.setGeometry(QtCore.QRect(20, 130, 171, 31))
-        self.new_repair_tech_id_input_box.setObjectName("new_repair_tech_id_input_box")
+        if page in self.built_pages:
+            return
 
-        self.new_repair_description_label = QtWidgets.QLabel(self.new_repair_page)
-        self.new_repair_description_label.setGeometry(QtCore.QRect(490, 10, 201, 25))
+        self.built_pages.add(page)
+        getattr(self, f"setup_{page}")()
+        getattr(self, f"retranslate_{page}")()
+
+        # widgets added to a page already showing stay hidden until shown
+        page_widget = getattr(self, page)
+
+        if page_widget.isVisible():
+            for child in page_widget.findChildren(
+                QtWidgets.QWidget,
+                options=QtCore.Qt.FindChildOption.FindDirectChildrenOnly,
+            ):
+                child.show()
+
+        self.page_built.emit(page)
+
+    def build_current_page(self, index):
+        """Builds the page the widget stack switched to."""
+
+        self.build_page(PAGES[index])
+
+    def setup_login_page(self):
+        """Builds the widgets of the login page."""
+
+        self.username_login_input_box = QtWidgets.QLineEdit(self.login_page)
+        self.username_login_input_box.setGeometry(QtCore.QRect(370, 300, 171, 31))
+        self.username_login_input_box.setObjectName("username_login_input_box")
+
+        self.password_login_input_box = QtWidgets.QLineEdit(self.login_page)
+        self.password_login_input_box.setEchoMode(QtWidgets.QLineEdit.EchoMode.Password)
+        self.password_login_input_box.setGeometry(QtCore.QRect(370, 390, 171, 31))
+        self.password_login_input_box.setObjectName("password_login_input_box")
+
+        self.username_login_label = QtWidgets.QLabel(self.login_page)
+        self.username_login_label.setGeometry(QtCore.QRect(370, 270, 101, 21))
         font = QtGui.QFont()
         font.setPointSize(16)
-        self.new_repair_description_label.setFont(font)
-        self.new_repair_description_label.setObjectName("new_repair_description_label")
+        self.username_login_label.setFont(font)
+        self.username_login_label.setObjectName("username_login_label")
 
-        self.new_repair_description_input_box = QtWidgets.QTextEdit(
-            self.new_repair_page
-        )
-        self.new_repair_description_input_box.setGeometry(
-            QtCore.QRect(230, 40, 691, 841)
-        )
-        self.new_repair_description_input_box.setObjectName(
-            "new_repair_description_input_box"
-        )
+        self.password_login_label = QtWidgets.QLabel(self.login_page)
+        self.password_login_label.setGeometry(QtCore.QRect(370, 360, 101, 21))
+        font = QtGui.QFont()
+        font.setPointSize(16)
+        self.password_login_label.setFont(font)
+        self.password_login_label.setObjectName("password_login_label")
+
+        self.login_page_submit_button = QtWidgets.QPushButton(self.login_page)
+        self.login_page_submit_button.setGeometry(QtCore.QRect(410, 450, 81, 31))
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        self.login_page_submit_button.setFont(font)
+        self.login_page_submit_button.setObjectName("login_page_submit_button")
+
+    def retranslate_login_page(self):
+        """Sets the strings of the labels and buttons of the login page."""
+
+        _translate = QtCore.QCoreApplication.translate
+        self.username_login_label.setText(_translate("app_main_window", "Username"))
 
-        self.new_repair_page_submit_button = QtWidgets.QPushButton(self.new_repair_page)
-        self.new_repair_page_submit_button.setGeometry(QtCore.QRect(60, 850, 81, 31))
-        font = QtGui.QFont()
-        font.setPointSize(12)
-        self.new_repair_page_submit_button.setFont(font)
-        self.new_repair_page_submit_button.setObjectName(
-            "new_repair_page_submit_button"
-        )
+        self.password_login_label.setText(_translate("app_main_window", "Password"))
 
-        self.widget_stack.addWidget(self.new_repair_page)
+        self.login_page_submit_button.setText(_translate("app_main_window", "Submit"))
 
-        self.edit_repair_page = QtWidgets.QWidget()
-        self.edit_repair_page.setObjectName("edit_repair_page")
+    def setup_new_user_page(self):
+        """Builds the widgets of the new user page."""
 
-        self.edit_repair_tech_id_input_box = QtWidgets.QLineEdit(self.edit_repair_page)
-        self.edit_repair_tech_id_input_box.setGeometry(QtCore.QRect(20, 220, 171, 31))
-        self.edit_repair_tech_id_input_box.setObjectName(
-            "edit_repair_tech_id_input_box"
+        self.username_new_user_input_box = QtWidgets.QLineEdit(self.new_user_page)
+        self.username_new_user_input_box.setGeometry(QtCore.QRect(610, 220, 171, 31))
+        self.username_new_user_input_box.setObjectName("username_new_user_input_box")
+
+        self.username_new_user_label = QtWidgets.QLabel(self.new_user_page)
+        self.username_new_user_label.setGeometry(QtCore.QRect(610, 190, 101, 21))
+        font = QtGui.QFont()
+        font.setPointSize(16)
+        self.username_new_user_label.setFont(font)
+        self.username_new_user_label.setObjectName("username_new_user_label")
+
+        self.password_new_user_input_box = QtWidgets.QLineEdit(self.new_user_page)
+        self.password_new_user_input_box.setGeometry(QtCore.QRect(610, 310, 171, 31))
+        self.password_new_user_input_box.setEchoMode(
+            QtWidgets.QLineEdit.EchoMode.Password
         )
+        self.password_new_user_input_box.setObjectName("password_new_user_input_box")
 
-        self.edit_repair_tech_id_label = QtWidgets.QLabel(self.edit_repair_page)
-        self.edit_repair_tech_id_label.setGeometry(QtCore.QRect(20, 140, 101, 21))
+        self.password_new_user_label = QtWidgets.QLabel(self.new_user_page)
+        self.password_new_user_label.setGeometry(QtCore.QRect(610, 280, 101, 21))
         font = QtGui.QFont()
         font.setPointSize(16)
-        self.edit_repair_tech_id_label.setFont(font)
-        self.edit_repair_tech_id_label.setObjectName("edit_repair_tech_id_label")
+        self.password_new_user_label.setFont(font)
+        self.password_new_user_label.setObjectName("password_new_user_label")
 
-        self.edit_repair_problem_description_input_box = QtWidgets.QTextEdit(
-            self.edit_repair_page
+        self.confirm_password_new_user_input_box = QtWidgets.QLineEdit(
+            self.new_user_page
         )
-        self.edit_repair_problem_description_input_box.setGeometry(
-            QtCore.QRect(230, 130, 691, 241)
+        self.confirm_password_new_user_input_box.setGeometry(
+            QtCore.QRect(610, 400, 171, 31)
         )
-        self.edit_repair_problem_description_input_box.setObjectName(
-            "edit_repair_problem_description_input_box"
+        self.confirm_password_new_user_input_box.setEchoMode(
+            QtWidgets.QLineEdit.EchoMode.Password
+        )
+        self.confirm_password_new_user_input_box.setObjectName(
+            "confirm_password_new_user_input_box"
         )
 
-        self.edit_repair_description_label = QtWidgets.QLabel(self.edit_repair_page)
-        self.edit_repair_description_label.setGeometry(QtCore.QRect(480, 100, 221, 25))
+        self.confirm_password_new_user_label = QtWidgets.QLabel(self.new_user_page)
+        self.confirm_password_new_user_label.setGeometry(
+            QtCore.QRect(610, 370, 171, 21)
+        )
         font = QtGui.QFont()
         font.setPointSize(16)
-        self.edit_repair_description_label.setFont(font)
-        self.edit_repair_description_label.setObjectName(
-            "edit_repair_description_label"
+        self.confirm_password_new_user_label.setFont(font)
+        self.confirm_password_new_user_label.setObjectName(
+            "confirm_password_new_user_label"
         )
 
-        self.edit_repair_service_id_input_box = QtWidgets.QLineEdit(
-            self.edit_repair_page
-        )
-        self.edit_repair_service_id_input_box.setGeometry(QtCore.QRect(20, 90, 171, 31))
-        self.edit_repair_service_id_input_box.setObjectName(
-            "edit_repair_service_id_input_box"
-        )
+        self.new_user_note_label = QtWidgets.QLabel(self.new_user_page)
+        self.new_user_note_label.setGeometry(QtCore.QRect(640, 500, 111, 61))
+        self.new_user_note_label.setWordWrap(True)
+        self.new_user_note_label.setObjectName("new_user_note_label")
+        self.new_user_note2_label = QtWidgets.QLabel(self.new_user_page)
+        self.new_user_note2_label.setGeometry(QtCore.QRect(640, 570, 111, 80))
+        self.new_user_note2_label.setWordWrap(True)
+        self.new_user_note2_label.setObjectName("new_user_note2_label")
 
-        self.edit_repair_service_id_label = QtWidgets.QLabel(self.edit_repair_page)
-        self.edit_repair_service_id_label.setGeometry(QtCore.QRect(20, 10, 171, 21))
+        self.new_user_page_submit_button = QtWidgets.QPushButton(self.new_user_page)
+        self.new_user_page_submit_button.setGeometry(QtCore.QRect(650, 450, 81, 31))
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        self.new_user_page_submit_button.setFont(font)
+        self.new_user_page_submit_button.setObjectName("new_user_page_submit_button")
+
+        self.new_user_writer_or_tech_label = QtWidgets.QLabel(self.new_user_page)
+        self.new_user_writer_or_tech_label.setGeometry(QtCore.QRect(120, 360, 261, 21))
         font = QtGui.QFont()
         font.setPointSize(16)
-        self.edit_repair_service_id_label.setFont(font)
-        self.edit_repair_service_id_label.setObjectName("edit_repair_service_id_label")
+        self.new_user_writer_or_tech_label.setFont(font)
+        self.new_user_writer_or_tech_label.setObjectName(
+            "new_user_writer_or_tech_label"
+        )
 
-        self.edit_repair_service_id_display_label = QtWidgets.QLabel(
-            self.edit_repair_page
+        self.new_user_service_writer_radio_button = QtWidgets.QRadioButton(
+            self.new_user_page
         )
-        self.edit_repair_service_id_display_label.setGeometry(
-            QtCore.QRect(20, 40, 171, 21)
+        self.new_user_service_writer_radio_button.setGeometry(
+            QtCore.QRect(80, 400, 101, 31)
         )
         font = QtGui.QFont()
-        font.setPointSize(14)
-        self.edit_repair_service_id_display_label.setFont(font)
-        self.edit_repair_service_id_display_label.setObjectName(
-            "edit_repair_service_id_display_label"
+        font.setPointSize(10)
+        self.new_user_service_writer_radio_button.setFont(font)
+        self.new_user_service_writer_radio_button.setObjectName(
+            "new_user_service_writer_radio_button"
         )
 
-        self.change_writer_check_box = QtWidgets.QCheckBox(self.edit_repair_page)
-        self.change_writer_check_box.setGeometry(QtCore.QRect(20, 70, 101, 17))
-        self.change_writer_check_box.setObjectName("change_writer_check_box")
+        self.new_user_tech_radio_button = QtWidgets.QRadioButton(self.new_user_page)
+        self.new_user_tech_radio_button.setGeometry(QtCore.QRect(330, 400, 101, 31))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.new_user_tech_radio_button.setFont(font)
+        self.new_user_tech_radio_button.setObjectName("new_user_tech_radio_button")
 
-        self.change_tech_check_box = QtWidgets.QCheckBox(self.edit_repair_page)
-        self.change_tech_check_box.setGeometry(QtCore.QRect(20, 200, 121, 17))
-        self.change_tech_check_box.setObjectName("change_tech_check_box")
+        self.new_user_name_label = QtWidgets.QLabel(self.new_user_page)
+        self.new_user_name_label.setGeometry(QtCore.QRect(170, 180, 101, 21))
+        font = QtGui.QFont()
+        font.setPointSize(16)
+        self.new_user_name_label.setFont(font)
+        self.new_user_name_label.setObjectName("new_user_name_label")
 
-        self.edit_repair_tech_id_display_label = QtWidgets.QLabel(self.edit_repair_page)
-        self.edit_repair_tech_id_display_label.setGeometry(
-            QtCore.QRect(20, 170, 171, 21)
-        )
+        self.new_user_name_input_box = QtWidgets.QLineEdit(self.new_user_page)
+        self.new_user_name_input_box.setGeometry(QtCore.QRect(170, 210, 171, 31))
+        self.new_user_name_input_box.setObjectName("new_user_name_input_box")
+
+        self.new_user_team_label = QtWidgets.QLabel(self.new_user_page)
+        self.new_user_team_label.setGeometry(QtCore.QRect(170, 270, 101, 21))
         font = QtGui.QFont()
-        font.setPointSize(14)
-        self.edit_repair_tech_id_display_label.setFont(font)
-        self.edit_repair_tech_id_display_label.setObjectName(
-            "edit_repair_tech_id_display_label"
-        )
+        font.setPointSize(16)
+        self.new_user_team_label.setFont(font)
+        self.new_user_team_label.setObjectName("new_user_team_label")
 
-        self.edit_repair_page_submit_update_button = QtWidgets.QPushButton(
-            self.edit_repair_page
-        )
-        self.edit_repair_page_submit_update_button.setGeometry(
-            QtCore.QRect(40, 810, 141, 31)
-        )
+        self.new_user_team_input_box = QtWidgets.QLineEdit(self.new_user_page)
+        self.new_user_team_input_box.setGeometry(QtCore.QRect(170, 300, 171, 31))
+        self.new_user_team_input_box.setObjectName("new_user_team_input_box")
+
+        self.new_user_lane_label = QtWidgets.QLabel(self.new_user_page)
+        self.new_user_lane_label.setGeometry(QtCore.QRect(80, 440, 101, 21))
         font = QtGui.QFont()
-        font.setPointSize(12)
-        self.edit_repair_page_submit_update_button.setFont(font)
-        self.edit_repair_page_submit_update_button.setObjectName(
-            "edit_repair_page_submit_update_button"
-        )
+        font.setPointSize(16)
+        self.new_user_lane_label.setFont(font)
+        self.new_user_lane_label.setObjectName("new_user_lane_label")
 
-        self.edit_repair_list_of_parts_label = QtWidgets.QLabel(self.edit_repair_page)
-        self.edit_repair_list_of_parts_label.setGeometry(
-            QtCore.QRect(500, 650, 171, 21)
-        )
+        self.new_user_section_label = QtWidgets.QLabel(self.new_user_page)
+        self.new_user_section_label.setGeometry(QtCore.QRect(320, 440, 101, 21))
         font = QtGui.QFont()
         font.setPointSize(16)
-        self.edit_repair_list_of_parts_label.setFont(font)
-        self.edit_repair_list_of_parts_label.setObjectName(
-            "edit_repair_list_of_parts_label"
-        )
+        self.new_user_section_label.setFont(font)
+        self.new_user_section_label.setObjectName("new_user_section_label")
 
-        self.edit_repair_list_of_parts_text_browser = QtWidgets.QTextBrowser(
-            self.edit_repair_page
+        self.new_user_lane_input_box = QtWidgets.QLineEdit(self.new_user_page)
+        self.new_user_lane_input_box.setGeometry(QtCore.QRect(80, 470, 171, 31))
+        self.new_user_lane_input_box.setObjectName("new_user_lane_input_box")
+
+        self.new_user_section_input_box = QtWidgets.QLineEdit(self.new_user_page)
+        self.new_user_section_input_box.setGeometry(QtCore.QRect(320, 470, 171, 31))
+        self.new_user_section_input_box.setObjectName("new_user_section_input_box")
+
+    def retranslate_new_user_page(self):
+        """Sets the strings of the labels and buttons of the new user page."""
+
+        _translate = QtCore.QCoreApplication.translate
+        self.username_new_user_label.setText(_translate("app_main_window", "Username"))
+
+        self.password_new_user_label.setText(_translate("app_main_window", "Password"))
+
+        self.confirm_password_new_user_label.setText(
+            _translate("app_main_window", "Confirm Password")
         )
-        self.edit_repair_list_of_parts_text_browser.setGeometry(
-            QtCore.QRect(230, 680, 691, 201)
+
+        self.new_user_note_label.setText(
+            _translate(
+                "app_main_window",
+                "Note: Passwords must be between 4 and 20 characters. ",
+            )
         )
-        self.edit_repair_list_of_parts_text_browser.setObjectName(
-            "edit_repair_list_of_parts_text_browser"
+
+        self.new_user_note2_label.setText(
+            _translate(
+                "app_main_window",
+                "Note 2: Usernames must be "
+                "between 4 and 20 characters and only contain letters and numbers.",
+            )
         )
 
-        self.edit_repair_drop_off_date_label = QtWidgets.QLabel(self.edit_repair_page)
-        self.edit_repair_drop_off_date_label.setGeometry(QtCore.QRect(20, 270, 171, 25))
-        font = QtGui.QFont()
-        font.setPointSize(16)
-        self.edit_repair_drop_off_date_label.setFont(font)
-        self.edit_repair_drop_off_date_label.setObjectName(
-            "edit_repair_drop_off_date_label"
+        self.new_user_page_submit_button.setText(
+            _translate("app_main_window", "Submit")
         )
 
-        self.edit_repair_drop_off_date_display_label = QtWidgets.QLabel(
-            self.edit_repair_page
+        self.new_user_writer_or_tech_label.setText(
+            _translate("app_main_window", "Service Writer / Technician")
         )
-        self.edit_repair_drop_off_date_display_label.setGeometry(
-            QtCore.QRect(20, 300, 171, 21)
+
+        self.new_user_service_writer_radio_button.setText(
+            _translate("app_main_window", "Service Writer")
         )
-        font = QtGui.QFont()
-        font.setPointSize(14)
-        self.edit_repair_drop_off_date_display_label.setFont(font)
-        self.edit_repair_drop_off_date_display_label.setObjectName(
-            "edit_repair_drop_off_date_display_label"
+
+        self.new_user_tech_radio_button.setText(
+            _translate("app_main_window", "Technician")
         )
 
-        self.edit_repair_page_submit_complete_button = QtWidgets.QPushButton(
-            self.edit_repair_page
-        )
-        self.edit_repair_page_submit_complete_button.setGeometry(
-            QtCore.QRect(40, 850, 141, 31)
+        self.new_user_name_label.setText(_translate("app_main_window", "Name"))
+
+        self.new_user_team_label.setText(_translate("app_main_window", "Team"))
+
+        self.new_user_lane_label.setText(_translate("app_main_window", "Lane"))
+
+        self.new_user_section_label.setText(_translate("app_main_window", "Section"))
+
+    def setup_update_password_page(self):
+        """Builds the widgets of the update password page."""
+
+        self.new_password_input_box = QtWidgets.QLineEdit(self.update_password_page)
+        self.new_password_input_box.setGeometry(QtCore.QRect(370, 480, 171, 31))
+        self.new_password_input_box.setEchoMode(QtWidgets.QLineEdit.EchoMode.Password)
+        self.new_password_input_box.setObjectName("new_password_input_box")
+
+        self.update_password_username_label = QtWidgets.QLabel(
+            self.update_password_page
         )
+        self.update_password_username_label.setGeometry(QtCore.QRect(370, 270, 101, 21))
         font = QtGui.QFont()
-        font.setPointSize(12)
-        self.edit_repair_page_submit_complete_button.setFont(font)
-        self.edit_repair_page_submit_complete_button.setObjectName(
-            "edit_repair_page_submit_complete_button"
+        font.setPointSize(16)
+        self.update_password_username_label.setFont(font)
+        self.update_password_username_label.setObjectName(
+            "update_password_username_label"
         )
 
-        self.edit_total_repair_cost_label = QtWidgets.QLabel(self.edit_repair_page)
-        self.edit_total_repair_cost_label.setGeometry(QtCore.QRect(20, 340, 171, 25))
+        self.update_password_note2_label = QtWidgets.QLabel(self.update_password_page)
+        self.update_password_note2_label.setGeometry(QtCore.QRect(390, 740, 111, 80))
+        self.update_password_note2_label.setWordWrap(True)
+        self.update_password_note2_label.setObjectName("update_password_note2_label")
+
+        self.new_password_label = QtWidgets.QLabel(self.update_password_page)
+        self.new_password_label.setGeometry(QtCore.QRect(370, 450, 171, 21))
         font = QtGui.QFont()
         font.setPointSize(16)
-        self.edit_total_repair_cost_label.setFont(font)
-        self.edit_total_repair_cost_label.setObjectName("edit_total_repair_cost_label")
+        self.new_password_label.setFont(font)
+        self.new_password_label.setObjectName("new_password_label")
 
-        self.edit_repair_total_repair_cost_display_label = QtWidgets.QLabel(
-            self.edit_repair_page
+        self.update_password_username_input_box = QtWidgets.QLineEdit(
+            self.update_password_page
         )
-        self.edit_repair_total_repair_cost_display_label.setGeometry(
-            QtCore.QRect(20, 370, 171, 21)
+        self.update_password_username_input_box.setGeometry(
+            QtCore.QRect(370, 300, 171, 31)
         )
-        font = QtGui.QFont()
-        font.setPointSize(14)
-        self.edit_repair_total_repair_cost_display_label.setFont(font)
-        self.edit_repair_total_repair_cost_display_label.setObjectName(
-            "edit_repair_total_repair_cost_display_label"
+        self.update_password_username_input_box.setObjectName(
+            "update_password_username_input_box"
         )
 
-        self.edit_repair_labor_cost_display_label = QtWidgets.QLabel(
-            self.edit_repair_page
-        )
-        self.edit_repair_labor_cost_display_label.setGeometry(
-            QtCore.QRect(20, 440, 171, 21)
-        )
-        font = QtGui.QFont()
-        font.setPointSize(14)
-        self.edit_repair_labor_cost_display_label.setFont(font)
-        self.edit_repair_labor_cost_display_label.setObjectName(
-            "edit_repair_labor_cost_display_label"
-        )
+        self.update_password_note_label = QtWidgets.QLabel(self.update_password_page)
+        self.update_password_note_label.setGeometry(QtCore.QRect(390, 670, 111, 61))
+        self.update_password_note_label.setWordWrap(True)
+        self.update_password_note_label.setObjectName("update_password_note_label")
 
-        self.edit_repair_labor_cost_label = QtWidgets.QLabel(self.edit_repair_page)
-        self.edit_repair_labor_cost_label.setGeometry(QtCore.QRect(20, 410, 171, 21))
+        self.old_password_input_box = QtWidgets.QLineEdit(self.update_password_page)
+        self.old_password_input_box.setGeometry(QtCore.QRect(370, 390, 171, 31))
+        self.old_password_input_box.setEchoMode(QtWidgets.QLineEdit.EchoMode.Password)
+        self.old_password_input_box.setObjectName("old_password_input_box")
+
+        self.old_password_label = QtWidgets.QLabel(self.update_password_page)
+        self.old_password_label.setGeometry(QtCore.QRect(370, 360, 101, 21))
         font = QtGui.QFont()
         font.setPointSize(16)
-        self.edit_repair_labor_cost_label.setFont(font)
-        self.edit_repair_labor_cost_label.setObjectName("edit_repair_labor_cost_label")
+        self.old_password_label.setFont(font)
+        self.old_password_label.setObjectName("old_password_label")
 
-        self.edit_repair_part_cost_label = QtWidgets.QLabel(self.edit_repair_page)
-        self.edit_repair_part_cost_label.setGeometry(QtCore.QRect(20, 540, 171, 21))
+        self.confirm_new_password_label = QtWidgets.QLabel(self.update_password_page)
+        self.confirm_new_password_label.setGeometry(QtCore.QRect(370, 540, 171, 21))
         font = QtGui.QFont()
         font.setPointSize(16)
-        self.edit_repair_part_cost_label.setFont(font)
-        self.edit_repair_part_cost_label.setObjectName("edit_repair_part_cost_label")
+        self.confirm_new_password_label.setFont(font)
+        self.confirm_new_password_label.setObjectName("confirm_new_password_label")
 
-        self.edit_repair_part_cost_display_label = QtWidgets.QLabel(
-            self.edit_repair_page
+        self.confirm_new_password_input_box = QtWidgets.QLineEdit(
+            self.update_password_page
         )
-        self.edit_repair_part_cost_display_label.setGeometry(
-            QtCore.QRect(20, 570, 171, 21)
+        self.confirm_new_password_input_box.setGeometry(QtCore.QRect(370, 570, 171, 31))
+        self.confirm_new_password_input_box.setText("")
+        self.confirm_new_password_input_box.setEchoMode(
+            QtWidgets.QLineEdit.EchoMode.Password
         )
-        font = QtGui.QFont()
-        font.setPointSize(14)
-        self.edit_repair_part_cost_display_label.setFont(font)
-        self.edit_repair_part_cost_display_label.setObjectName(
-            "edit_repair_part_cost_display_label"
+        self.confirm_new_password_input_box.setObjectName(
+            "confirm_new_password_input_box"
         )
 
-        self.edit_repair_repair_id_label = QtWidgets.QLabel(self.edit_repair_page)
-        self.edit_repair_repair_id_label.setGeometry(QtCore.QRect(450, 10, 171, 25))
-        font = QtGui.QFont()
-        font.setPointSize(16)
-        self.edit_repair_repair_id_label.setFont(font)
-        self.edit_repair_repair_id_label.setObjectName("edit_repair_repair_id_label")
-
-        self.edit_repair_repair_id_display_label = QtWidgets.QLabel(
-            self.edit_repair_page
-        )
-        self.edit_repair_repair_id_display_label.setGeometry(
-            QtCore.QRect(365, 40, 301, 21)
+        self.update_password_submit_button = QtWidgets.QPushButton(
+            self.update_password_page
         )
+        self.update_password_submit_button.setGeometry(QtCore.QRect(410, 630, 81, 31))
         font = QtGui.QFont()
-        font.setPointSize(14)
-        self.edit_repair_repair_id_display_label.setFont(font)
-        self.edit_repair_repair_id_display_label.setObjectName(
-            "edit_repair_repair_id_display_label"
+        font.setPointSize(12)
+        self.update_password_submit_button.setFont(font)
+        self.update_password_submit_button.setObjectName(
+            "update_password_submit_button"
         )
 
-        self.edit_repair_repair_description_input_box = QtWidgets.QTextEdit(
-            self.edit_repair_page
-        )
-        self.edit_repair_repair_description_input_box.setGeometry(
-            QtCore.QRect(230, 410, 691, 231)
-        )
-        self.edit_repair_repair_description_input_box.setObjectName(
-            "edit_repair_repair_description_input_box"
-        )
+    def retranslate_update_password_page(self):
+        """Sets the strings of the labels and buttons of the update password page."""
 
-        self.edit_repair_repair_description_label = QtWidgets.QLabel(
-            self.edit_repair_page
-        )
-        self.edit_repair_repair_description_label.setGeometry(
-            QtCore.QRect(480, 380, 221, 25)
+        _translate = QtCore.QCoreApplication.translate
+        self.update_password_username_label.setText(
+            _translate("app_main_window", "Username")
         )
-        font = QtGui.QFont()
-        font.setPointSize(16)
-        self.edit_repair_repair_description_label.setFont(font)
-        self.edit_repair_repair_description_label.setObjectName(
-            "edit_repair_repair_description_label"
+
+        self.update_password_note2_label.setText(
+            _translate(
+                "app_main_window",
+                "Note 2: Usernames "
+                "must be between 4 and 20 characters and only contain letters and numbers.",
+            )
         )
 
-        self.edit_repair_labor_input_box = QtWidgets.QLineEdit(self.edit_repair_page)
-        self.edit_repair_labor_input_box.setGeometry(QtCore.QRect(20, 490, 91, 31))
-        self.edit_repair_labor_input_box.setObjectName("edit_repair_labor_input_box")
+        self.new_password_label.setText(_translate("app_main_window", "New Password"))
 
-        self.change_labor_check_box = QtWidgets.QCheckBox(self.edit_repair_page)
-        self.change_labor_check_box.setGeometry(QtCore.QRect(20, 470, 141, 17))
-        self.change_labor_check_box.setObjectName("change_labor_check_box")
+        self.update_password_note_label.setText(
+            _translate(
+                "app_main_window",
+                "Note: Passwords must be between 4 and 20 characters. ",
+            )
+        )
 
-        self.edit_repair_add_part_button = QtWidgets.QPushButton(self.edit_repair_page)
-        self.edit_repair_add_part_button.setGeometry(QtCore.QRect(40, 610, 141, 31))
-        font = QtGui.QFont()
-        font.setPointSize(12)
-        self.edit_repair_add_part_button.setFont(font)
-        self.edit_repair_add_part_button.setObjectName("edit_repair_add_part_button")
+        self.old_password_label.setText(_translate("app_main_window", "Password"))
 
-        self.edit_repair_remove_part_button = QtWidgets.QPushButton(
-            self.edit_repair_page
-        )
-        self.edit_repair_remove_part_button.setGeometry(QtCore.QRect(40, 650, 141, 31))
-        font = QtGui.QFont()
-        font.setPointSize(12)
-        self.edit_repair_remove_part_button.setFont(font)
-        self.edit_repair_remove_part_button.setObjectName(
-            "edit_repair_remove_part_button"
+        self.confirm_new_password_label.setText(
+            _translate("app_main_window", "Confirm Password")
         )
 
-        self.widget_stack.addWidget(self.edit_repair_page)
+        self.update_password_submit_button.setText(
+            _translate("app_main_window", "Submit")
+        )
 
-        self.active_repairs_page = QtWidgets.QWidget()
-        self.active_repairs_page.setObjectName("active_repairs_page")
+    def setup_update_user_page(self):
+        """Builds the widgets of the update user page."""
 
-        self.active_repairs_list_of_repairs_label = QtWidgets.QLabel(
-            self.active_repairs_page
-        )
-        self.active_repairs_list_of_repairs_label.setGeometry(
-            QtCore.QRect(370, 20, 201, 25)
+        self.update_user_password_input_box = QtWidgets.QLineEdit(self.update_user_page)
+        self.update_user_password_input_box.setGeometry(QtCore.QRect(390, 650, 171, 31))
+        self.update_user_password_input_box.setEchoMode(
+            QtWidgets.QLineEdit.EchoMode.Password
         )
-        font = QtGui.QFont()
-        font.setPointSize(16)
-        self.active_repairs_list_of_repairs_label.setFont(font)
-        self.active_repairs_list_of_repairs_label.setObjectName(
-            "active_repairs_list_of_repairs_label"
+        self.update_user_password_input_box.setObjectName(
+            "update_user_password_input_box"
         )
 
-        self.active_repairs_list_text_browser = QtWidgets.QTextBrowser(
-            self.active_repairs_page
+        self.update_user_service_writer_radio_button = QtWidgets.QRadioButton(
+            self.update_user_page
         )
-        self.active_repairs_list_text_browser.setGeometry(
-            QtCore.QRect(40, 50, 861, 821)
+        self.update_user_service_writer_radio_button.setGeometry(
+            QtCore.QRect(470, 290, 101, 31)
         )
-        self.active_repairs_list_text_browser.setObjectName(
-            "active_repairs_list_text_browser"
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.update_user_service_writer_radio_button.setFont(font)
+        self.update_user_service_writer_radio_button.setObjectName(
+            "update_user_service_writer_radio_button"
         )
 
-        self.widget_stack.addWidget(self.active_repairs_page)
-
-        self.display_old_repair = QtWidgets.QWidget()
-        self.display_old_repair.setObjectName("display_old_repair")
-
-        self.old_repair_description_label = QtWidgets.QLabel(self.display_old_repair)
-        self.old_repair_description_label.setGeometry(QtCore.QRect(480, 100, 221, 25))
+        self.update_user_section_label = QtWidgets.QLabel(self.update_user_page)
+        self.update_user_section_label.setGeometry(QtCore.QRect(710, 330, 101, 21))
         font = QtGui.QFont()
         font.setPointSize(16)
-        self.old_repair_description_label.setFont(font)
-        self.old_repair_description_label.setObjectName("old_repair_description_label")
+        self.update_user_section_label.setFont(font)
+        self.update_user_section_label.setObjectName("update_user_section_label")
 
-        self.old_repair_part_cost_label = QtWidgets.QLabel(self.display_old_repair)
-        self.old_repair_part_cost_label.setGeometry(QtCore.QRect(20, 510, 171, 21))
+        self.update_user_page_submit_button = QtWidgets.QPushButton(
+            self.update_user_page
+        )
+        self.update_user_page_submit_button.setGeometry(QtCore.QRect(430, 710, 81, 31))
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        self.update_user_page_submit_button.setFont(font)
+        self.update_user_page_submit_button.setObjectName(
+            "update_user_page_submit_button"
+        )
+
+        self.update_user_lane_label = QtWidgets.QLabel(self.update_user_page)
+        self.update_user_lane_label.setGeometry(QtCore.QRect(470, 330, 101, 21))
         font = QtGui.QFont()
         font.setPointSize(16)
-        self.old_repair_part_cost_label.setFont(font)
-        self.old_repair_part_cost_label.setObjectName("old_repair_part_cost_label")
+        self.update_user_lane_label.setFont(font)
+        self.update_user_lane_label.setObjectName("update_user_lane_label")
 
-        self.old_repair_drop_off_date_label = QtWidgets.QLabel(self.display_old_repair)
-        self.old_repair_drop_off_date_label.setGeometry(QtCore.QRect(20, 170, 171, 25))
+        self.update_user_name_label = QtWidgets.QLabel(self.update_user_page)
+        self.update_user_name_label.setGeometry(QtCore.QRect(140, 220, 101, 21))
         font = QtGui.QFont()
         font.setPointSize(16)
-        self.old_repair_drop_off_date_label.setFont(font)
-        self.old_repair_drop_off_date_label.setObjectName(
-            "old_repair_drop_off_date_label"
-        )
+        self.update_user_name_label.setFont(font)
+        self.update_user_name_label.setObjectName("update_user_name_label")
 
-        self.old_repair_tech_id_display_label = QtWidgets.QLabel(
-            self.display_old_repair
-        )
-        self.old_repair_tech_id_display_label.setGeometry(
-            QtCore.QRect(20, 120, 171, 21)
+        self.update_user_team_input_box = QtWidgets.QLineEdit(self.update_user_page)
+        self.update_user_team_input_box.setGeometry(QtCore.QRect(140, 460, 171, 31))
+        self.update_user_team_input_box.setObjectName("update_user_team_input_box")
+
+        self.update_user_writer_or_tech_label = QtWidgets.QLabel(self.update_user_page)
+        self.update_user_writer_or_tech_label.setGeometry(
+            QtCore.QRect(510, 250, 261, 21)
         )
         font = QtGui.QFont()
-        font.setPointSize(14)
-        self.old_repair_tech_id_display_label.setFont(font)
-        self.old_repair_tech_id_display_label.setObjectName(
-            "old_repair_tech_id_display_label"
+        font.setPointSize(16)
+        self.update_user_writer_or_tech_label.setFont(font)
+        self.update_user_writer_or_tech_label.setObjectName(
+            "update_user_writer_or_tech_label"
         )
 
-        self.old_repair_labor_cost_display_label = QtWidgets.QLabel(
-            self.display_old_repair
-        )
-        self.old_repair_labor_cost_display_label.setGeometry(
-            QtCore.QRect(20, 450, 171, 21)
-        )
+        self.update_user_team_label = QtWidgets.QLabel(self.update_user_page)
+        self.update_user_team_label.setGeometry(QtCore.QRect(140, 380, 101, 21))
         font = QtGui.QFont()
-        font.setPointSize(14)
-        self.old_repair_labor_cost_display_label.setFont(font)
-        self.old_repair_labor_cost_display_label.setObjectName(
-            "old_repair_labor_cost_display_label"
-        )
+        font.setPointSize(16)
+        self.update_user_team_label.setFont(font)
+        self.update_user_team_label.setObjectName("update_user_team_label")
 
-        self.old_total_repair_cost_label = QtWidgets.QLabel(self.display_old_repair)
-        self.old_total_repair_cost_label.setGeometry(QtCore.QRect(20, 330, 171, 25))
+        self.update_user_password_label = QtWidgets.QLabel(self.update_user_page)
+        self.update_user_password_label.setGeometry(QtCore.QRect(390, 620, 101, 21))
         font = QtGui.QFont()
         font.setPointSize(16)
-        self.old_total_repair_cost_label.setFont(font)
-        self.old_total_repair_cost_label.setObjectName("old_total_repair_cost_label")
+        self.update_user_password_label.setFont(font)
+        self.update_user_password_label.setObjectName("update_user_password_label")
 
-        self.old_repair_list_of_parts_text_browser = QtWidgets.QTextBrowser(
-            self.display_old_repair
+        self.update_user_name_input_box = QtWidgets.QLineEdit(self.update_user_page)
+        self.update_user_name_input_box.setGeometry(QtCore.QRect(140, 300, 171, 31))
+        self.update_user_name_input_box.setObjectName("update_user_name_input_box")
+
+        self.update_user_section_input_box = QtWidgets.QLineEdit(self.update_user_page)
+        self.update_user_section_input_box.setGeometry(QtCore.QRect(710, 410, 171, 31))
+        self.update_user_section_input_box.setObjectName(
+            "update_user_section_input_box"
         )
-        self.old_repair_list_of_parts_text_browser.setGeometry(
-            QtCore.QRect(230, 680, 691, 201)
+
+        self.update_user_lane_input_box = QtWidgets.QLineEdit(self.update_user_page)
+        self.update_user_lane_input_box.setGeometry(QtCore.QRect(470, 410, 171, 31))
+        self.update_user_lane_input_box.setObjectName("update_user_lane_input_box")
+
+        self.update_user_tech_radio_button = QtWidgets.QRadioButton(
+            self.update_user_page
         )
-        self.old_repair_list_of_parts_text_browser.setObjectName(
-            "old_repair_list_of_parts_text_browser"
+        self.update_user_tech_radio_button.setGeometry(QtCore.QRect(720, 290, 101, 31))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.update_user_tech_radio_button.setFont(font)
+        self.update_user_tech_radio_button.setObjectName(
+            "update_user_tech_radio_button"
         )
 
-        self.old_repair_tech_id_label = QtWidgets.QLabel(self.display_old_repair)
-        self.old_repair_tech_id_label.setGeometry(QtCore.QRect(20, 90, 101, 21))
+        self.need_password_label = QtWidgets.QLabel(self.update_user_page)
+        self.need_password_label.setGeometry(QtCore.QRect(390, 590, 180, 16))
+        self.need_password_label.setObjectName("need_password_label")
+
+        self.update_user_user_id_label = QtWidgets.QLabel(self.update_user_page)
+        self.update_user_user_id_label.setGeometry(QtCore.QRect(320, 70, 261, 21))
         font = QtGui.QFont()
         font.setPointSize(16)
-        self.old_repair_tech_id_label.setFont(font)
-        self.old_repair_tech_id_label.setObjectName("old_repair_tech_id_label")
+        self.update_user_user_id_label.setFont(font)
+        self.update_user_user_id_label.setObjectName("update_user_user_id_label")
 
-        self.old_repair_repair_id_display_label = QtWidgets.QLabel(
-            self.display_old_repair
-        )
-        self.old_repair_repair_id_display_label.setGeometry(
-            QtCore.QRect(350, 40, 301, 21)
+        self.update_user_user_id_display_label = QtWidgets.QLabel(self.update_user_page)
+        self.update_user_user_id_display_label.setGeometry(
+            QtCore.QRect(320, 100, 261, 21)
         )
         font = QtGui.QFont()
         font.setPointSize(14)
-        self.old_repair_repair_id_display_label.setFont(font)
-        self.old_repair_repair_id_display_label.setObjectName(
-            "old_repair_repair_id_display_label"
+        self.update_user_user_id_display_label.setFont(font)
+        self.update_user_user_id_display_label.setObjectName(
+            "update_user_user_id_display_label"
         )
 
-        self.old_repair_service_id_label = QtWidgets.QLabel(self.display_old_repair)
-        self.old_repair_service_id_label.setGeometry(QtCore.QRect(20, 10, 171, 21))
+        self.update_user_name_display_label = QtWidgets.QLabel(self.update_user_page)
+        self.update_user_name_display_label.setGeometry(QtCore.QRect(140, 250, 261, 21))
         font = QtGui.QFont()
-        font.setPointSize(16)
-        self.old_repair_service_id_label.setFont(font)
-        self.old_repair_service_id_label.setObjectName("old_repair_service_id_label")
-
-        self.old_repair_drop_off_date_display_label = QtWidgets.QLabel(
-            self.display_old_repair
-        )
-        self.old_repair_drop_off_date_display_label.setGeometry(
-            QtCore.QRect(20, 200, 171, 21)
+        font.setPointSize(14)
+        self.update_user_name_display_label.setFont(font)
+        self.update_user_name_display_label.setObjectName(
+            "update_user_name_display_label"
         )
+
+        self.update_user_team_display_label = QtWidgets.QLabel(self.update_user_page)
+        self.update_user_team_display_label.setGeometry(QtCore.QRect(140, 410, 261, 21))
         font = QtGui.QFont()
         font.setPointSize(14)
-        self.old_repair_drop_off_date_display_label.setFont(font)
-        self.old_repair_drop_off_date_display_label.setObjectName(
-            "old_repair_drop_off_date_display_label"
+        self.update_user_team_display_label.setFont(font)
+        self.update_user_team_display_label.setObjectName(
+            "update_user_team_display_label"
         )
 
-        self.old_repair_repair_id_label = QtWidgets.QLabel(self.display_old_repair)
-        self.old_repair_repair_id_label.setGeometry(QtCore.QRect(450, 10, 171, 25))
+        self.update_user_lane_display_label = QtWidgets.QLabel(self.update_user_page)
+        self.update_user_lane_display_label.setGeometry(QtCore.QRect(470, 360, 121, 21))
         font = QtGui.QFont()
-        font.setPointSize(16)
-        self.old_repair_repair_id_label.setFont(font)
-        self.old_repair_repair_id_label.setObjectName("old_repair_repair_id_label")
-
-        self.old_repair_service_id_display_label = QtWidgets.QLabel(
-            self.display_old_repair
+        font.setPointSize(14)
+        self.update_user_lane_display_label.setFont(font)
+        self.update_user_lane_display_label.setObjectName(
+            "update_user_lane_display_label"
         )
-        self.old_repair_service_id_display_label.setGeometry(
-            QtCore.QRect(20, 40, 171, 21)
+
+        self.update_user_section_display_label = QtWidgets.QLabel(self.update_user_page)
+        self.update_user_section_display_label.setGeometry(
+            QtCore.QRect(710, 360, 230, 21)
         )
         font = QtGui.QFont()
         font.setPointSize(14)
-        self.old_repair_service_id_display_label.setFont(font)
-        self.old_repair_service_id_display_label.setObjectName(
-            "old_repair_service_id_display_label"
+        self.update_user_section_display_label.setFont(font)
+        self.update_user_section_display_label.setObjectName(
+            "update_user_section_display_label"
         )
 
-        self.old_repair_part_cost_display_label = QtWidgets.QLabel(
-            self.display_old_repair
+        self.update_user_change_name_check_box = QtWidgets.QCheckBox(
+            self.update_user_page
         )
-        self.old_repair_part_cost_display_label.setGeometry(
-            QtCore.QRect(20, 540, 171, 21)
+        self.update_user_change_name_check_box.setGeometry(
+            QtCore.QRect(140, 280, 111, 17)
         )
-        font = QtGui.QFont()
-        font.setPointSize(14)
-        self.old_repair_part_cost_display_label.setFont(font)
-        self.old_repair_part_cost_display_label.setObjectName(
-            "old_repair_part_cost_display_label"
+        self.update_user_change_name_check_box.setObjectName(
+            "update_user_change_name_check_box"
         )
 
-        self.old_repair_list_of_parts_label = QtWidgets.QLabel(self.display_old_repair)
-        self.old_repair_list_of_parts_label.setGeometry(QtCore.QRect(500, 650, 171, 21))
-        font = QtGui.QFont()
-        font.setPointSize(16)
-        self.old_repair_list_of_parts_label.setFont(font)
-        self.old_repair_list_of_parts_label.setObjectName(
-            "old_repair_list_of_parts_label"
+        self.update_user_change_team_check_box = QtWidgets.QCheckBox(
+            self.update_user_page
+        )
+        self.update_user_change_team_check_box.setGeometry(
+            QtCore.QRect(140, 440, 111, 17)
+        )
+        self.update_user_change_team_check_box.setObjectName(
+            "update_user_change_team_check_box"
         )
 
-        self.old_repair_repair_description_label = QtWidgets.QLabel(
-            self.display_old_repair
+        self.update_user_change_lane_check_box = QtWidgets.QCheckBox(
+            self.update_user_page
         )
-        self.old_repair_repair_description_label.setGeometry(
-            QtCore.QRect(480, 380, 221, 25)
+        self.update_user_change_lane_check_box.setGeometry(
+            QtCore.QRect(470, 390, 91, 17)
         )
-        font = QtGui.QFont()
-        font.setPointSize(16)
-        self.old_repair_repair_description_label.setFont(font)
-        self.old_repair_repair_description_label.setObjectName(
-            "old_repair_repair_description_label"
+        self.update_user_change_lane_check_box.setObjectName(
+            "update_user_change_lane_check_box"
         )
 
-        self.old_repair_labor_cost_label = QtWidgets.QLabel(self.display_old_repair)
-        self.old_repair_labor_cost_label.setGeometry(QtCore.QRect(20, 420, 171, 21))
-        font = QtGui.QFont()
-        font.setPointSize(16)
-        self.old_repair_labor_cost_label.setFont(font)
-        self.old_repair_labor_cost_label.setObjectName("old_repair_labor_cost_label")
-
-        self.old_repair_problem_text_browser = QtWidgets.QTextBrowser(
-            self.display_old_repair
+        self.update_user_change_section_check_box = QtWidgets.QCheckBox(
+            self.update_user_page
         )
-        self.old_repair_problem_text_browser.setGeometry(
-            QtCore.QRect(235, 131, 691, 231)
+        self.update_user_change_section_check_box.setGeometry(
+            QtCore.QRect(710, 390, 101, 17)
         )
-        self.old_repair_problem_text_browser.setObjectName(
-            "old_repair_problem_text_browser"
+        self.update_user_change_section_check_box.setObjectName(
+            "update_user_change_section_check_box"
         )
 
-        self.old_repair_repair_text_browser = QtWidgets.QTextBrowser(
-            self.display_old_repair
+    def retranslate_update_user_page(self):
+        """Sets the strings of the labels and buttons of the update user page."""
+
+        _translate = QtCore.QCoreApplication.translate
+        self.update_user_service_writer_radio_button.setText(
+            _translate("app_main_window", "Service Writer")
         )
-        self.old_repair_repair_text_browser.setGeometry(
-            QtCore.QRect(235, 411, 691, 211)
+
+        self.update_user_section_label.setText(_translate("app_main_window", "Section"))
+
+        self.update_user_page_submit_button.setText(
+            _translate("app_main_window", "Submit")
         )
-        self.old_repair_repair_text_browser.setObjectName(
-            "old_repair_repair_text_browser"
+
+        self.update_user_lane_label.setText(_translate("app_main_window", "Lane"))
+
+        self.update_user_name_label.setText(_translate("app_main_window", "Name"))
+
+        self.update_user_writer_or_tech_label.setText(
+            _translate("app_main_window", "Service Writer / Technician")
         )
 
-        self.old_repair_complete_date_label = QtWidgets.QLabel(self.display_old_repair)
-        self.old_repair_complete_date_label.setGeometry(QtCore.QRect(20, 250, 211, 25))
-        font = QtGui.QFont()
-        font.setPointSize(16)
-        self.old_repair_complete_date_label.setFont(font)
-        self.old_repair_complete_date_label.setObjectName(
-            "old_repair_complete_date_label"
+        self.update_user_team_label.setText(_translate("app_main_window", "Team"))
+
+        self.update_user_password_label.setText(
+            _translate("app_main_window", "Password")
         )
 
-        self.old_repair_complete_date_display_label = QtWidgets.QLabel(
-            self.display_old_repair
+        self.update_user_tech_radio_button.setText(
+            _translate("app_main_window", "Technician")
         )
-        self.old_repair_complete_date_display_label.setGeometry(
-            QtCore.QRect(20, 280, 171, 21)
+
+        self.need_password_label.setText(
+            _translate("app_main_window", "Enter password to apply changes")
         )
-        font = QtGui.QFont()
-        font.setPointSize(14)
-        self.old_repair_complete_date_display_label.setFont(font)
-        self.old_repair_complete_date_display_label.setObjectName(
-            "old_repair_complete_date_display_label"
+
+        self.update_user_user_id_label.setText(_translate("app_main_window", "User ID"))
+
+        self.update_user_user_id_display_label.setText(
+            _translate("app_main_window", "N/A")
         )
 
-        self.old_repair_total_cost_display_label = QtWidgets.QLabel(
-            self.display_old_repair
+        self.update_user_name_display_label.setText(
+            _translate("app_main_window", "N/A")
         )
-        self.old_repair_total_cost_display_label.setGeometry(
-            QtCore.QRect(20, 360, 171, 21)
+
+        self.update_user_team_display_label.setText(
+            _translate("app_main_window", "N/A")
         )
-        font = QtGui.QFont()
-        font.setPointSize(14)
-        self.old_repair_total_cost_display_label.setFont(font)
-        self.old_repair_total_cost_display_label.setObjectName(
-            "old_repair_total_cost_display_label"
+
+        self.update_user_lane_display_label.setText(
+            _translate("app_main_window", "N/A")
         )
 
-        self.widget_stack.addWidget(self.display_old_repair)
+        self.update_user_section_display_label.setText(
+            _translate("app_main_window", "N/A")
+        )
 
-        self.new_part_page = QtWidgets.QWidget()
-        self.new_part_page.setObjectName("new_part_page")
+        self.update_user_change_name_check_box.setText(
+            _translate("app_main_window", "Change Name")
+        )
 
-        self.new_part_part_id_input_box = QtWidgets.QLineEdit(self.new_part_page)
-        self.new_part_part_id_input_box.setGeometry(QtCore.QRect(370, 300, 171, 31))
-        self.new_part_part_id_input_box.setObjectName("new_part_part_id_input_box")
+        self.update_user_change_team_check_box.setText(
+            _translate("app_main_window", "Change Team")
+        )
 
-        self.new_part_id_label = QtWidgets.QLabel(self.new_part_page)
-        self.new_part_id_label.setGeometry(QtCore.QRect(370, 270, 121, 21))
-        font = QtGui.QFont()
-        font.setPointSize(16)
-        self.new_part_id_label.setFont(font)
-        self.new_part_id_label.setObjectName("new_part_id_label")
+        self.update_user_change_lane_check_box.setText(
+            _translate("app_main_window", "Change Lane")
+        )
 
-        self.new_part_part_cost_input_box = QtWidgets.QLineEdit(self.new_part_page)
-        self.new_part_part_cost_input_box.setGeometry(QtCore.QRect(370, 390, 171, 31))
-        self.new_part_part_cost_input_box.setObjectName("new_part_part_cost_input_box")
+        self.update_user_change_section_check_box.setText(
+            _translate("app_main_window", "Change Section")
+        )
 
-        self.new_part_cost_label = QtWidgets.QLabel(self.new_part_page)
-        self.new_part_cost_label.setGeometry(QtCore.QRect(370, 360, 141, 21))
+    def setup_new_repair_page(self):
+        """Builds the widgets of the new repair page."""
+
+        self.new_repair_tech_id_label = QtWidgets.QLabel(self.new_repair_page)
+        self.new_repair_tech_id_label.setGeometry(QtCore.QRect(20, 100, 101, 21))
         font = QtGui.QFont()
         font.setPointSize(16)
-        self.new_part_cost_label.setFont(font)
-        self.new_part_cost_label.setObjectName("new_part_cost_label")
+        self.new_repair_tech_id_label.setFont(font)
+        self.new_repair_tech_id_label.setObjectName("new_repair_tech_id_label")
 
-        self.new_part_description_input_box = QtWidgets.QLineEdit(self.new_part_page)
-        self.new_part_description_input_box.setGeometry(QtCore.QRect(370, 480, 171, 31))
-        self.new_part_description_input_box.setObjectName(
-            "new_part_description_input_box"
+        self.new_repair_current_date_display = QtWidgets.QLabel(self.new_repair_page)
+        self.new_repair_current_date_display.setGeometry(QtCore.QRect(20, 310, 171, 31))
+        self.new_repair_current_date_display.setText("")
+        self.new_repair_current_date_display.setObjectName(
+            "new_repair_current_date_display"
         )
 
-        self.new_part_description_label = QtWidgets.QLabel(self.new_part_page)
-        self.new_part_description_label.setGeometry(QtCore.QRect(370, 450, 201, 25))
+        self.new_repair_service_id_label = QtWidgets.QLabel(self.new_repair_page)
+        self.new_repair_service_id_label.setGeometry(QtCore.QRect(20, 10, 171, 21))
         font = QtGui.QFont()
         font.setPointSize(16)
-        self.new_part_description_label.setFont(font)
-        self.new_part_description_label.setObjectName("new_part_description_label")
+        self.new_repair_service_id_label.setFont(font)
+        self.new_repair_service_id_label.setObjectName("new_repair_service_id_label")
 
-        self.new_part_submit_button = QtWidgets.QPushButton(self.new_part_page)
-        self.new_part_submit_button.setGeometry(QtCore.QRect(410, 540, 81, 31))
+        self.new_repair_vin_label = QtWidgets.QLabel(self.new_repair_page)
+        self.new_repair_vin_label.setGeometry(QtCore.QRect(20, 190, 171, 21))
         font = QtGui.QFont()
-        font.setPointSize(12)
-        self.new_part_submit_button.setFont(font)
-        self.new_part_submit_button.setObjectName("new_part_submit_button")
+        font.setPointSize(16)
+        self.new_repair_vin_label.setFont(font)
+        self.new_repair_vin_label.setObjectName("new_repair_vin_label")
 
-        self.widget_stack.addWidget(self.new_part_page)
+        self.new_repair_drop_off_date_label = QtWidgets.QLabel(self.new_repair_page)
+        self.new_repair_drop_off_date_label.setGeometry(QtCore.QRect(20, 280, 171, 21))
+        font = QtGui.QFont()
+        font.setPointSize(16)
+        self.new_repair_drop_off_date_label.setFont(font)
+        self.new_repair_drop_off_date_label.setObjectName(
+            "new_repair_drop_off_date_label"
+        )
 
-        self.edit_part_page = QtWidgets.QWidget()
-        self.edit_part_page.setObjectName("edit_part_page")
+        self.new_repair_vin_input_box = QtWidgets.QLineEdit(self.new_repair_page)
+        self.new_repair_vin_input_box.setGeometry(QtCore.QRect(20, 220, 171, 31))
+        self.new_repair_vin_input_box.setObjectName("new_repair_vin_input_box")
 
-        self.edit_part_part_cost_input_box = QtWidgets.QLineEdit(self.edit_part_page)
-        self.edit_part_part_cost_input_box.setGeometry(QtCore.QRect(370, 390, 171, 31))
-        self.edit_part_part_cost_input_box.setText("")
-        self.edit_part_part_cost_input_box.setObjectName(
-            "edit_part_part_cost_input_box"
+        self.new_repair_service_id_input_box = QtWidgets.QLineEdit(self.new_repair_page)
+        self.new_repair_service_id_input_box.setGeometry(QtCore.QRect(20, 40, 171, 31))
+        self.new_repair_service_id_input_box.setObjectName(
+            "new_repair_service_id_input_box"
         )
 
-        self.edit_part_cost_label = QtWidgets.QLabel(self.edit_part_page)
-        self.edit_part_cost_label.setGeometry(QtCore.QRect(370, 340, 141, 25))
-        font = QtGui.QFont()
-        font.setPointSize(16)
-        self.edit_part_cost_label.setFont(font)
-        self.edit_part_cost_label.setObjectName("edit_part_cost_label")
+        self.new_repair_tech_id_input_box = QtWidgets.QLineEdit(self.new_repair_page)
+        self.new_repair_tech_id_input_box.setGeometry(QtCore.QRect(20, 130, 171, 31))
+        self.new_repair_tech_id_input_box.setObjectName("new_repair_tech_id_input_box")
 
-        self.edit_part_description_label = QtWidgets.QLabel(self.edit_part_page)
-        self.edit_part_description_label.setGeometry(QtCore.QRect(370, 450, 201, 25))
+        self.new_repair_description_label = QtWidgets.QLabel(self.new_repair_page)
+        self.new_repair_description_label.setGeometry(QtCore.QRect(490, 10, 201, 25))
         font = QtGui.QFont()
         font.setPointSize(16)
-        self.edit_part_description_label.setFont(font)
-        self.edit_part_description_label.setObjectName("edit_part_description_label")
+        self.new_repair_description_label.setFont(font)
+        self.new_repair_description_label.setObjectName("new_repair_description_label")
 
-        self.edit_part_description_input_box = QtWidgets.QLineEdit(self.edit_part_page)
-        self.edit_part_description_input_box.setGeometry(
-            QtCore.QRect(370, 500, 171, 31)
+        self.new_repair_description_input_box = QtWidgets.QTextEdit(
+            self.new_repair_page
         )
-        self.edit_part_description_input_box.setText("")
-        self.edit_part_description_input_box.setObjectName(
-            "edit_part_description_input_box"
+        self.new_repair_description_input_box.setGeometry(
+            QtCore.QRect(230, 40, 691, 841)
+        )
+        self.new_repair_description_input_box.setObjectName(
+            "new_repair_description_input_box"
         )
 
-        self.edit_part_submit_button = QtWidgets.QPushButton(self.edit_part_page)
-        self.edit_part_submit_button.setGeometry(QtCore.QRect(410, 560, 81, 31))
+        self.new_repair_page_submit_button = QtWidgets.QPushButton(self.new_repair_page)
+        self.new_repair_page_submit_button.setGeometry(QtCore.QRect(60, 850, 81, 31))
         font = QtGui.QFont()
         font.setPointSize(12)
-        self.edit_part_submit_button.setFont(font)
-        self.edit_part_submit_button.setObjectName("edit_part_submit_button")
+        self.new_repair_page_submit_button.setFont(font)
+        self.new_repair_page_submit_button.setObjectName(
+            "new_repair_page_submit_button"
+        )
 
-        self.edit_part_id_label = QtWidgets.QLabel(self.edit_part_page)
-        self.edit_part_id_label.setGeometry(QtCore.QRect(370, 240, 141, 21))
-        font = QtGui.QFont()
-        font.setPointSize(16)
-        self.edit_part_id_label.setFont(font)
-        self.edit_part_id_label.setObjectName("edit_part_id_label")
+    def retranslate_new_repair_page(self):
+        """Sets the strings of the labels and buttons of the new repair page."""
 
-        self.edit_part_id_display_label = QtWidgets.QLabel(self.edit_part_page)
-        self.edit_part_id_display_label.setGeometry(QtCore.QRect(370, 270, 141, 21))
-        font = QtGui.QFont()
-        font.setPointSize(14)
-        self.edit_part_id_display_label.setFont(font)
-        self.edit_part_id_display_label.setObjectName("edit_part_id_display_label")
+        _translate = QtCore.QCoreApplication.translate
+        self.new_repair_tech_id_label.setText(_translate("app_main_window", "Tech ID"))
 
-        self.edit_part_change_cost_check_box = QtWidgets.QCheckBox(self.edit_part_page)
-        self.edit_part_change_cost_check_box.setGeometry(QtCore.QRect(370, 370, 91, 17))
-        self.edit_part_change_cost_check_box.setObjectName(
-            "edit_part_change_cost_check_box"
+        self.new_repair_service_id_label.setText(
+            _translate("app_main_window", "Service Writer ID")
         )
 
-        self.edit_part_change_description_check_box = QtWidgets.QCheckBox(
-            self.edit_part_page
+        self.new_repair_vin_label.setText(_translate("app_main_window", "VIN"))
+
+        self.new_repair_drop_off_date_label.setText(
+            _translate("app_main_window", "Drop Off Date")
         )
-        self.edit_part_change_description_check_box.setGeometry(
-            QtCore.QRect(370, 480, 125, 17)
+
+        self.new_repair_description_label.setText(
+            _translate("app_main_window", "Problem Description")
         )
-        self.edit_part_change_description_check_box.setObjectName(
-            "edit_part_change_description_check_box"
+
+        self.new_repair_page_submit_button.setText(
+            _translate("app_main_window", "Submit")
+        )
+
+    def setup_edit_repair_page(self):
+        """Builds the widgets of the edit repair page."""
+
+        self.edit_repair_tech_id_input_box = QtWidgets.QLineEdit(self.edit_repair_page)
+        self.edit_repair_tech_id_input_box.setGeometry(QtCore.QRect(20, 220, 171, 31))
+        self.edit_repair_tech_id_input_box.setObjectName(
+            "edit_repair_tech_id_input_box"
         )
 
-        self.widget_stack.addWidget(self.edit_part_page)
+        self.edit_repair_tech_id_label = QtWidgets.QLabel(self.edit_repair_page)
+        self.edit_repair_tech_id_label.setGeometry(QtCore.QRect(20, 140, 101, 21))
+        font = QtGui.QFont()
+        font.setPointSize(16)
+        self.edit_repair_tech_id_label.setFont(font)
+        self.edit_repair_tech_id_label.setObjectName("edit_repair_tech_id_label")
+
+        self.edit_repair_problem_description_input_box = QtWidgets.QTextEdit(
+            self.edit_repair_page
+        )
+        self.edit_repair_problem_description_input_box.setGeometry(
+            QtCore.QRect(230, 130, 691, 241)
+        )
+        self.edit_repair_problem_description_input_box.setObjectName(
+            "edit_repair_problem_description_input_box"
+        )
 
-        self.list_of_parts_page = QtWidgets.QWidget()
-        self.list_of_parts_page.setObjectName("list_of_parts_page")
+        self.edit_repair_description_label = QtWidgets.QLabel(self.edit_repair_page)
+        self.edit_repair_description_label.setGeometry(QtCore.QRect(480, 100, 221, 25))
+        font = QtGui.QFont()
+        font.setPointSize(16)
+        self.edit_repair_description_label.setFont(font)
+        self.edit_repair_description_label.setObjectName(
+            "edit_repair_description_label"
+        )
 
-        self.list_of_parts_text_browser = QtWidgets.QTextBrowser(
-            self.list_of_parts_page
+        self.edit_repair_service_id_input_box = QtWidgets.QLineEdit(
+            self.edit_repair_page
+        )
+        self.edit_repair_service_id_input_box.setGeometry(QtCore.QRect(20, 90, 171, 31))
+        self.edit_repair_service_id_input_box.setObjectName(
+            "edit_repair_service_id_input_box"
         )
-        self.list_of_parts_text_browser.setGeometry(QtCore.QRect(40, 50, 861, 821))
-        self.list_of_parts_text_browser.setObjectName("list_of_parts_text_browser")
 
-        self.list_of_parts_label = QtWidgets.QLabel(self.list_of_parts_page)
-        self.list_of_parts_label.setGeometry(QtCore.QRect(420, 20, 201, 21))
+        self.edit_repair_service_id_label = QtWidgets.QLabel(self.edit_repair_page)
+        self.edit_repair_service_id_label.setGeometry(QtCore.QRect(20, 10, 171, 21))
         font = QtGui.QFont()
         font.setPointSize(16)
-        self.list_of_parts_label.setFont(font)
-        self.list_of_parts_label.setObjectName("list_of_parts_label")
+        self.edit_repair_service_id_label.setFont(font)
+        self.edit_repair_service_id_label.setObjectName("edit_repair_service_id_label")
 
-        self.widget_stack.addWidget(self.list_of_parts_page)
+        self.edit_repair_service_id_display_label = QtWidgets.QLabel(
+            self.edit_repair_page
+        )
+        self.edit_repair_service_id_display_label.setGeometry(
+            QtCore.QRect(20, 40, 171, 21)
+        )
+        font = QtGui.QFont()
+        font.setPointSize(14)
+        self.edit_repair_service_id_display_label.setFont(font)
+        self.edit_repair_service_id_display_label.setObjectName(
+            "edit_repair_service_id_display_label"
+        )
 
-        self.new_customer_page = QtWidgets.QWidget()
-        self.new_customer_page.setObjectName("new_customer_page")
+        self.change_writer_check_box = QtWidgets.QCheckBox(self.edit_repair_page)
+        self.change_writer_check_box.setGeometry(QtCore.QRect(20, 70, 101, 17))
+        self.change_writer_check_box.setObjectName("change_writer_check_box")
 
-        self.new_customer_name_input_box = QtWidgets.QLineEdit(self.new_customer_page)
-        self.new_customer_name_input_box.setGeometry(QtCore.QRect(370, 300, 171, 31))
-        self.new_customer_name_input_box.setObjectName("new_customer_name_input_box")
+        self.change_tech_check_box = QtWidgets.QCheckBox(self.edit_repair_page)
+        self.change_tech_check_box.setGeometry(QtCore.QRect(20, 200, 121, 17))
+        self.change_tech_check_box.setObjectName("change_tech_check_box")
 
-        self.new_customer_address_input_box = QtWidgets.QTextEdit(
-            self.new_customer_page
+        self.edit_repair_tech_id_display_label = QtWidgets.QLabel(self.edit_repair_page)
+        self.edit_repair_tech_id_display_label.setGeometry(
+            QtCore.QRect(20, 170, 171, 21)
+        )
+        font = QtGui.QFont()
+        font.setPointSize(14)
+        self.edit_repair_tech_id_display_label.setFont(font)
+        self.edit_repair_tech_id_display_label.setObjectName(
+            "edit_repair_tech_id_display_label"
+        )
+
+        self.edit_repair_page_submit_update_button = QtWidgets.QPushButton(
+            self.edit_repair_page
         )
-        self.new_customer_address_input_box.setGeometry(
-            QtCore.QRect(370, 390, 171, 111)
+        self.edit_repair_page_submit_update_button.setGeometry(
+            QtCore.QRect(40, 810, 141, 31)
         )
-        self.new_customer_address_input_box.setObjectName(
-            "new_customer_address_input_box"
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        self.edit_repair_page_submit_update_button.setFont(font)
+        self.edit_repair_page_submit_update_button.setObjectName(
+            "edit_repair_page_submit_update_button"
         )
 
-        self.new_customer_phone_label = QtWidgets.QLabel(self.new_customer_page)
-        self.new_customer_phone_label.setGeometry(QtCore.QRect(370, 530, 171, 21))
+        self.edit_repair_list_of_parts_label = QtWidgets.QLabel(self.edit_repair_page)
+        self.edit_repair_list_of_parts_label.setGeometry(
+            QtCore.QRect(500, 650, 171, 21)
+        )
         font = QtGui.QFont()
         font.setPointSize(16)
-        self.new_customer_phone_label.setFont(font)
-        self.new_customer_phone_label.setObjectName("new_customer_phone_label")
+        self.edit_repair_list_of_parts_label.setFont(font)
+        self.edit_repair_list_of_parts_label.setObjectName(
+            "edit_repair_list_of_parts_label"
+        )
 
-        self.new_customer_phone_input_box = QtWidgets.QLineEdit(self.new_customer_page)
-        self.new_customer_phone_input_box.setGeometry(QtCore.QRect(370, 560, 171, 31))
-        self.new_customer_phone_input_box.setObjectName("new_customer_phone_input_box")
+        self.edit_repair_list_of_parts_text_browser = QtWidgets.QTextBrowser(
+            self.edit_repair_page
+        )
+        self.edit_repair_list_of_parts_text_browser.setGeometry(
+            QtCore.QRect(230, 680, 691, 201)
+        )
+        self.edit_repair_list_of_parts_text_browser.setObjectName(
+            "edit_repair_list_of_parts_text_browser"
+        )
 
-        self.new_customer_name_label = QtWidgets.QLabel(self.new_customer_page)
-        self.new_customer_name_label.setGeometry(QtCore.QRect(370, 270, 101, 21))
+        self.edit_repair_drop_off_date_label = QtWidgets.QLabel(self.edit_repair_page)
+        self.edit_repair_drop_off_date_label.setGeometry(QtCore.QRect(20, 270, 171, 25))
         font = QtGui.QFont()
         font.setPointSize(16)
-        self.new_customer_name_label.setFont(font)
-        self.new_customer_name_label.setObjectName("new_customer_name_label")
+        self.edit_repair_drop_off_date_label.setFont(font)
+        self.edit_repair_drop_off_date_label.setObjectName(
+            "edit_repair_drop_off_date_label"
+        )
 
-        self.new_customer_address_label = QtWidgets.QLabel(self.new_customer_page)
-        self.new_customer_address_label.setGeometry(QtCore.QRect(370, 360, 101, 21))
+        self.edit_repair_drop_off_date_display_label = QtWidgets.QLabel(
+            self.edit_repair_page
+        )
+        self.edit_repair_drop_off_date_display_label.setGeometry(
+            QtCore.QRect(20, 300, 171, 21)
+        )
         font = QtGui.QFont()
-        font.setPointSize(16)
-        self.new_customer_address_label.setFont(font)
-        self.new_customer_address_label.setObjectName("new_customer_address_label")
+        font.setPointSize(14)
+        self.edit_repair_drop_off_date_display_label.setFont(font)
+        self.edit_repair_drop_off_date_display_label.setObjectName(
+            "edit_repair_drop_off_date_display_label"
+        )
 
-        self.new_customer_submit_button = QtWidgets.QPushButton(self.new_customer_page)
-        self.new_customer_submit_button.setGeometry(QtCore.QRect(410, 620, 81, 31))
+        self.edit_repair_page_submit_complete_button = QtWidgets.QPushButton(
+            self.edit_repair_page
+        )
+        self.edit_repair_page_submit_complete_button.setGeometry(
+            QtCore.QRect(40, 850, 141, 31)
+        )
         font = QtGui.QFont()
         font.setPointSize(12)
-        self.new_customer_submit_button.setFont(font)
-        self.new_customer_submit_button.setObjectName("new_customer_submit_button")
-
-        self.widget_stack.addWidget(self.new_customer_page)
+        self.edit_repair_page_submit_complete_button.setFont(font)
+        self.edit_repair_page_submit_complete_button.setObjectName(
+            "edit_repair_page_submit_complete_button"
+        )
 
-        self.edit_customer_page = QtWidgets.QWidget()
-        self.edit_customer_page.setObjectName("edit_customer_page")
+        self.edit_total_repair_cost_label = QtWidgets.QLabel(self.edit_repair_page)
+        self.edit_total_repair_cost_label.setGeometry(QtCore.QRect(20, 340, 171, 25))
+        font = QtGui.QFont()
+        font.setPointSize(16)
+        self.edit_total_repair_cost_label.setFont(font)
+        self.edit_total_repair_cost_label.setObjectName("edit_total_repair_cost_label")
 
-        self.edit_customer_address_input_box = QtWidgets.QTextEdit(
-            self.edit_customer_page
+        self.edit_repair_total_repair_cost_display_label = QtWidgets.QLabel(
+            self.edit_repair_page
         )
-        self.edit_customer_address_input_box.setGeometry(
-            QtCore.QRect(100, 460, 171, 91)
+        self.edit_repair_total_repair_cost_display_label.setGeometry(
+            QtCore.QRect(20, 370, 171, 21)
         )
-        self.edit_customer_address_input_box.setObjectName(
-            "edit_customer_address_input_box"
+        font = QtGui.QFont()
+        font.setPointSize(14)
+        self.edit_repair_total_repair_cost_display_label.setFont(font)
+        self.edit_repair_total_repair_cost_display_label.setObjectName(
+            "edit_repair_total_repair_cost_display_label"
         )
 
-        self.edit_customer_submit_button = QtWidgets.QPushButton(
-            self.edit_customer_page
+        self.edit_repair_labor_cost_display_label = QtWidgets.QLabel(
+            self.edit_repair_page
+        )
+        self.edit_repair_labor_cost_display_label.setGeometry(
+            QtCore.QRect(20, 440, 171, 21)
         )
-        self.edit_customer_submit_button.setGeometry(QtCore.QRect(140, 730, 81, 31))
         font = QtGui.QFont()
-        font.setPointSize(12)
-        self.edit_customer_submit_button.setFont(font)
-        self.edit_customer_submit_button.setObjectName("edit_customer_submit_button")
+        font.setPointSize(14)
+        self.edit_repair_labor_cost_display_label.setFont(font)
+        self.edit_repair_labor_cost_display_label.setObjectName(
+            "edit_repair_labor_cost_display_label"
+        )
 
-        self.edit_customer_phone_label = QtWidgets.QLabel(self.edit_customer_page)
-        self.edit_customer_phone_label.setGeometry(QtCore.QRect(100, 580, 171, 21))
+        self.edit_repair_labor_cost_label = QtWidgets.QLabel(self.edit_repair_page)
+        self.edit_repair_labor_cost_label.setGeometry(QtCore.QRect(20, 410, 171, 21))
         font = QtGui.QFont()
         font.setPointSize(16)
-        self.edit_customer_phone_label.setFont(font)
-        self.edit_customer_phone_label.setObjectName("edit_customer_phone_label")
+        self.edit_repair_labor_cost_label.setFont(font)
+        self.edit_repair_labor_cost_label.setObjectName("edit_repair_labor_cost_label")
 
-        self.edit_customer_name_label = QtWidgets.QLabel(self.edit_customer_page)
-        self.edit_customer_name_label.setGeometry(QtCore.QRect(100, 150, 101, 21))
+        self.edit_repair_part_cost_label = QtWidgets.QLabel(self.edit_repair_page)
+        self.edit_repair_part_cost_label.setGeometry(QtCore.QRect(20, 540, 171, 21))
         font = QtGui.QFont()
         font.setPointSize(16)
-        self.edit_customer_name_label.setFont(font)
-        self.edit_customer_name_label.setObjectName("edit_customer_name_label")
-
-        self.edit_customer_name_input_box = QtWidgets.QLineEdit(self.edit_customer_page)
-        self.edit_customer_name_input_box.setGeometry(QtCore.QRect(100, 240, 171, 31))
-        self.edit_customer_name_input_box.setObjectName("edit_customer_name_input_box")
+        self.edit_repair_part_cost_label.setFont(font)
+        self.edit_repair_part_cost_label.setObjectName("edit_repair_part_cost_label")
 
-        self.edit_customer_phone_input_box = QtWidgets.QLineEdit(
-            self.edit_customer_page
+        self.edit_repair_part_cost_display_label = QtWidgets.QLabel(
+            self.edit_repair_page
         )
-        self.edit_customer_phone_input_box.setGeometry(QtCore.QRect(100, 670, 171, 31))
-        self.edit_customer_phone_input_box.setObjectName(
-            "edit_customer_phone_input_box"
+        self.edit_repair_part_cost_display_label.setGeometry(
+            QtCore.QRect(20, 570, 171, 21)
         )
-
-        self.edit_customer_address_label = QtWidgets.QLabel(self.edit_customer_page)
-        self.edit_customer_address_label.setGeometry(QtCore.QRect(100, 300, 101, 21))
         font = QtGui.QFont()
-        font.setPointSize(16)
-        self.edit_customer_address_label.setFont(font)
-        self.edit_customer_address_label.setObjectName("edit_customer_address_label")
+        font.setPointSize(14)
+        self.edit_repair_part_cost_display_label.setFont(font)
+        self.edit_repair_part_cost_display_label.setObjectName(
+            "edit_repair_part_cost_display_label"
+        )
 
-        self.edit_customer_id_label = QtWidgets.QLabel(self.edit_customer_page)
-        self.edit_customer_id_label.setGeometry(QtCore.QRect(100, 80, 131, 21))
+        self.edit_repair_repair_id_label = QtWidgets.QLabel(self.edit_repair_page)
+        self.edit_repair_repair_id_label.setGeometry(QtCore.QRect(450, 10, 171, 25))
         font = QtGui.QFont()
         font.setPointSize(16)
-        self.edit_customer_id_label.setFont(font)
-        self.edit_customer_id_label.setObjectName("edit_customer_id_label")
+        self.edit_repair_repair_id_label.setFont(font)
+        self.edit_repair_repair_id_label.setObjectName("edit_repair_repair_id_label")
 
-        self.edit_customer_id_display_label = QtWidgets.QLabel(self.edit_customer_page)
-        self.edit_customer_id_display_label.setGeometry(QtCore.QRect(100, 110, 131, 21))
+        self.edit_repair_repair_id_display_label = QtWidgets.QLabel(
+            self.edit_repair_page
+        )
+        self.edit_repair_repair_id_display_label.setGeometry(
+            QtCore.QRect(365, 40, 301, 21)
+        )
         font = QtGui.QFont()
         font.setPointSize(14)
-        self.edit_customer_id_display_label.setFont(font)
-        self.edit_customer_id_display_label.setObjectName(
-            "edit_customer_id_display_label"
+        self.edit_repair_repair_id_display_label.setFont(font)
+        self.edit_repair_repair_id_display_label.setObjectName(
+            "edit_repair_repair_id_display_label"
         )
 
-        self.edit_customer_change_name_check_box = QtWidgets.QCheckBox(
-            self.edit_customer_page
+        self.edit_repair_repair_description_input_box = QtWidgets.QTextEdit(
+            self.edit_repair_page
         )
-        self.edit_customer_change_name_check_box.setGeometry(
-            QtCore.QRect(100, 210, 100, 17)
+        self.edit_repair_repair_description_input_box.setGeometry(
+            QtCore.QRect(230, 410, 691, 231)
         )
-        self.edit_customer_change_name_check_box.setObjectName(
-            "edit_customer_change_name_check_box"
+        self.edit_repair_repair_description_input_box.setObjectName(
+            "edit_repair_repair_description_input_box"
         )
 
-        self.edit_customer_change_address_check_box = QtWidgets.QCheckBox(
-            self.edit_customer_page
+        self.edit_repair_repair_description_label = QtWidgets.QLabel(
+            self.edit_repair_page
         )
-        self.edit_customer_change_address_check_box.setGeometry(
-            QtCore.QRect(100, 430, 111, 17)
+        self.edit_repair_repair_description_label.setGeometry(
+            QtCore.QRect(480, 380, 221, 25)
         )
-        self.edit_customer_change_address_check_box.setObjectName(
-            "edit_customer_change_address_check_box"
+        font = QtGui.QFont()
+        font.setPointSize(16)
+        self.edit_repair_repair_description_label.setFont(font)
+        self.edit_repair_repair_description_label.setObjectName(
+            "edit_repair_repair_description_label"
         )
 
-        self.edit_customer_change_phone_check_box = QtWidgets.QCheckBox(
-            self.edit_customer_page
+        self.edit_repair_labor_input_box = QtWidgets.QLineEdit(self.edit_repair_page)
+        self.edit_repair_labor_input_box.setGeometry(QtCore.QRect(20, 490, 91, 31))
+        self.edit_repair_labor_input_box.setObjectName("edit_repair_labor_input_box")
+
+        self.change_labor_check_box = QtWidgets.QCheckBox(self.edit_repair_page)
+        self.change_labor_check_box.setGeometry(QtCore.QRect(20, 470, 141, 17))
+        self.change_labor_check_box.setObjectName("change_labor_check_box")
+
+        self.edit_repair_add_part_button = QtWidgets.QPushButton(self.edit_repair_page)
+        self.edit_repair_add_part_button.setGeometry(QtCore.QRect(40, 610, 141, 31))
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        self.edit_repair_add_part_button.setFont(font)
+        self.edit_repair_add_part_button.setObjectName("edit_repair_add_part_button")
+
+        self.edit_repair_remove_part_button = QtWidgets.QPushButton(
+            self.edit_repair_page
         )
-        self.edit_customer_change_phone_check_box.setGeometry(
-            QtCore.QRect(100, 640, 145, 17)
+        self.edit_repair_remove_part_button.setGeometry(QtCore.QRect(40, 650, 141, 31))
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        self.edit_repair_remove_part_button.setFont(font)
+        self.edit_repair_remove_part_button.setObjectName(
+            "edit_repair_remove_part_button"
         )
-        self.edit_customer_change_phone_check_box.setObjectName(
-            "edit_customer_change_phone_check_box"
+
+    def retranslate_edit_repair_page(self):
+        """Sets the strings of the labels and buttons of the edit repair page."""
+
+        _translate = QtCore.QCoreApplication.translate
+        self.edit_repair_tech_id_label.setText(_translate("app_main_window", "Tech ID"))
+
+        self.edit_repair_description_label.setText(
+            _translate("app_main_window", "Problem Description")
         )
 
-        self.edit_customer_add_vehicle_button = QtWidgets.QPushButton(
-            self.edit_customer_page
+        self.edit_repair_service_id_label.setText(
+            _translate("app_main_window", "Service Writer ID")
         )
-        self.edit_customer_add_vehicle_button.setGeometry(
-            QtCore.QRect(580, 550, 111, 31)
+
+        self.edit_repair_service_id_display_label.setText(
+            _translate("app_main_window", "N/A")
         )
-        font = QtGui.QFont()
-        font.setPointSize(12)
-        self.edit_customer_add_vehicle_button.setFont(font)
-        self.edit_customer_add_vehicle_button.setObjectName(
-            "edit_customer_add_vehicle_button"
+
+        self.change_writer_check_box.setText(
+            _translate("app_main_window", "Change Writer")
         )
 
-        self.edit_customer_remove_vehicle_button = QtWidgets.QPushButton(
-            self.edit_customer_page
+        self.change_tech_check_box.setText(
+            _translate("app_main_window", "Change Technician")
         )
-        self.edit_customer_remove_vehicle_button.setGeometry(
-            QtCore.QRect(570, 610, 131, 31)
+
+        self.edit_repair_tech_id_display_label.setText(
+            _translate("app_main_window", "N/A")
         )
-        font = QtGui.QFont()
-        font.setPointSize(12)
-        self.edit_customer_remove_vehicle_button.setFont(font)
-        self.edit_customer_remove_vehicle_button.setObjectName(
-            "edit_customer_remove_vehicle_button"
+
+        self.edit_repair_page_submit_update_button.setText(
+            _translate("app_main_window", "Submit Update")
         )
 
-        self.edit_customer_vehicle_list_label = QtWidgets.QLabel(
-            self.edit_customer_page
+        self.edit_repair_list_of_parts_label.setText(
+            _translate("app_main_window", "List of Parts")
         )
-        self.edit_customer_vehicle_list_label.setGeometry(
-            QtCore.QRect(560, 150, 151, 21)
+
+        self.edit_repair_drop_off_date_label.setText(
+            _translate("app_main_window", "Drop Off Date")
         )
-        font = QtGui.QFont()
-        font.setPointSize(16)
-        self.edit_customer_vehicle_list_label.setFont(font)
-        self.edit_customer_vehicle_list_label.setObjectName(
-            "edit_customer_vehicle_list_label"
+
+        self.edit_repair_drop_off_date_display_label.setText(
+            _translate("app_main_window", "N/A")
         )
 
-        self.edit_customer_vechile_list_text_browser = QtWidgets.QTextBrowser(
-            self.edit_customer_page
+        self.edit_repair_page_submit_complete_button.setText(
+            _translate("app_main_window", "Submit Complete")
         )
-        self.edit_customer_vechile_list_text_browser.setGeometry(
-            QtCore.QRect(370, 190, 531, 321)
+
+        self.edit_total_repair_cost_label.setText(
+            _translate("app_main_window", "Total Repair Cost")
         )
-        self.edit_customer_vechile_list_text_browser.setObjectName(
-            "edit_customer_vechile_list_text_browser"
+
+        self.edit_repair_total_repair_cost_display_label.setText(
+            _translate("app_main_window", "N/A")
         )
 
-        self.edit_customer_phone_display_label = QtWidgets.QLabel(
-            self.edit_customer_page
+        self.edit_repair_labor_cost_display_label.setText(
+            _translate("app_main_window", "N/A")
         )
-        self.edit_customer_phone_display_label.setGeometry(
-            QtCore.QRect(100, 610, 131, 21)
+
+        self.edit_repair_labor_cost_label.setText(
+            _translate("app_main_window", "Labor Cost")
         )
-        font = QtGui.QFont()
-        font.setPointSize(14)
-        self.edit_customer_phone_display_label.setFont(font)
-        self.edit_customer_phone_display_label.setObjectName(
-            "edit_customer_phone_display_label"
+
+        self.edit_repair_part_cost_label.setText(
+            _translate("app_main_window", "Part Cost")
         )
 
-        self.edit_customer_address_text_browser = QtWidgets.QTextBrowser(
-            self.edit_customer_page
+        self.edit_repair_part_cost_display_label.setText(
+            _translate("app_main_window", "N/A")
         )
-        self.edit_customer_address_text_browser.setGeometry(
-            QtCore.QRect(100, 330, 171, 91)
+
+        self.edit_repair_repair_id_label.setText(
+            _translate("app_main_window", "Repair ID")
         )
-        self.edit_customer_address_text_browser.setObjectName(
-            "edit_customer_address_text_browser"
+
+        self.edit_repair_repair_id_display_label.setText(
+            _translate("app_main_window", "N/A")
         )
 
-        self.edit_customer_name_display_label = QtWidgets.QLabel(
-            self.edit_customer_page
+        self.edit_repair_repair_description_label.setText(
+            _translate("app_main_window", "Repair Description")
         )
-        self.edit_customer_name_display_label.setGeometry(
-            QtCore.QRect(100, 180, 200, 21)
+
+        self.change_labor_check_box.setText(
+            _translate("app_main_window", "Update Labor")
         )
-        font = QtGui.QFont()
-        font.setPointSize(14)
-        self.edit_customer_name_display_label.setFont(font)
-        self.edit_customer_name_display_label.setObjectName(
-            "edit_customer_name_display_label"
+
+        self.edit_repair_add_part_button.setText(
+            _translate("app_main_window", "Add Part")
         )
 
-        self.widget_stack.addWidget(self.edit_customer_page)
+        self.edit_repair_remove_part_button.setText(
+            _translate("app_main_window", "Remove Part")
+        )
 
-        self.list_of_customers_page = QtWidgets.QWidget()
-        self.list_of_customers_page.setObjectName("list_of_customers_page")
+    def setup_active_repairs_page(self):
+        """Builds the widgets of the active repairs page."""
 
-        self.list_of_customers_text_browser = QtWidgets.QTextBrowser(
-            self.list_of_customers_page
+        self.active_repairs_list_of_repairs_label = QtWidgets.QLabel(
+            self.active_repairs_page
         )
-        self.list_of_customers_text_browser.setGeometry(QtCore.QRect(40, 50, 861, 821))
-        self.list_of_customers_text_browser.setObjectName(
-            "list_of_customers_text_browser"
+        self.active_repairs_list_of_repairs_label.setGeometry(
+            QtCore.QRect(370, 20, 201, 25)
         )
-
-        self.list_of_customers_label = QtWidgets.QLabel(self.list_of_customers_page)
-        self.list_of_customers_label.setGeometry(QtCore.QRect(370, 20, 201, 25))
         font = QtGui.QFont()
         font.setPointSize(16)
-        self.list_of_customers_label.setFont(font)
-        self.list_of_customers_label.setObjectName("list_of_customers_label")
-
-        self.widget_stack.addWidget(self.list_of_customers_page)
+        self.active_repairs_list_of_repairs_label.setFont(font)
+        self.active_repairs_list_of_repairs_label.setObjectName(
+            "active_repairs_list_of_repairs_label"
+        )
 
-        self.new_vehicle_page = QtWidgets.QWidget()
-        self.new_vehicle_page.setObjectName("new_vehicle_page")
+        self.active_repairs_list_table_view = QtWidgets.QTableView(
+            self.active_repairs_page
+        )
+        self.active_repairs_list_table_view.setGeometry(QtCore.QRect(40, 50, 861, 821))
+        self.active_repairs_list_table_view.setSortingEnabled(True)
+        self.active_repairs_list_table_view.setObjectName(
+            "active_repairs_list_table_view"
+        )
 
-        self.new_vehicle_vin_label = QtWidgets.QLabel(self.new_vehicle_page)
-        self.new_vehicle_vin_label.setGeometry(QtCore.QRect(380, 180, 101, 21))
-        font = QtGui.QFont()
-        font.setPointSize(16)
-        self.new_vehicle_vin_label.setFont(font)
-        self.new_vehicle_vin_label.setObjectName("new_vehicle_vin_label")
+    def retranslate_active_repairs_page(self):
+        """Sets the strings of the labels and buttons of the active repairs page."""
 
-        self.new_vehicle_vin_input_box = QtWidgets.QLineEdit(self.new_vehicle_page)
-        self.new_vehicle_vin_input_box.setGeometry(QtCore.QRect(380, 210, 171, 31))
-        self.new_vehicle_vin_input_box.setObjectName("new_vehicle_vin_input_box")
+        _translate = QtCore.QCoreApplication.translate
+        self.active_repairs_list_of_repairs_label.setText(
+            _translate("app_main_window", "List of Active Repairs")
+        )
 
-        self.new_vehicle_make_input_box = QtWidgets.QLineEdit(self.new_vehicle_page)
-        self.new_vehicle_make_input_box.setGeometry(QtCore.QRect(380, 300, 171, 31))
-        self.new_vehicle_make_input_box.setObjectName("new_vehicle_make_input_box")
+    def setup_display_old_repair(self):
+        """Builds the widgets of the display old repair page."""
 
-        self.new_vehicle_make_label = QtWidgets.QLabel(self.new_vehicle_page)
-        self.new_vehicle_make_label.setGeometry(QtCore.QRect(380, 270, 101, 21))
+        self.old_repair_description_label = QtWidgets.QLabel(self.display_old_repair)
+        self.old_repair_description_label.setGeometry(QtCore.QRect(480, 100, 221, 25))
         font = QtGui.QFont()
         font.setPointSize(16)
-        self.new_vehicle_make_label.setFont(font)
-        self.new_vehicle_make_label.setObjectName("new_vehicle_make_label")
-
-        self.new_vehicle_model_input_box = QtWidgets.QLineEdit(self.new_vehicle_page)
-        self.new_vehicle_model_input_box.setGeometry(QtCore.QRect(380, 390, 171, 31))
-        self.new_vehicle_model_input_box.setObjectName("new_vehicle_model_input_box")
+        self.old_repair_description_label.setFont(font)
+        self.old_repair_description_label.setObjectName("old_repair_description_label")
 
-        self.new_vehicle_model_label = QtWidgets.QLabel(self.new_vehicle_page)
-        self.new_vehicle_model_label.setGeometry(QtCore.QRect(380, 360, 101, 21))
+        self.old_repair_part_cost_label = QtWidgets.QLabel(self.display_old_repair)
+        self.old_repair_part_cost_label.setGeometry(QtCore.QRect(20, 510, 171, 21))
         font = QtGui.QFont()
         font.setPointSize(16)
-        self.new_vehicle_model_label.setFont(font)
-        self.new_vehicle_model_label.setObjectName("new_vehicle_model_label")
-
-        self.new_vehicle_year_input_box = QtWidgets.QLineEdit(self.new_vehicle_page)
-        self.new_vehicle_year_input_box.setGeometry(QtCore.QRect(380, 480, 171, 31))
-        self.new_vehicle_year_input_box.setObjectName("new_vehicle_year_input_box")
+        self.old_repair_part_cost_label.setFont(font)
+        self.old_repair_part_cost_label.setObjectName("old_repair_part_cost_label")
 
-        self.new_vehicle_year_label = QtWidgets.QLabel(self.new_vehicle_page)
-        self.new_vehicle_year_label.setGeometry(QtCore.QRect(380, 450, 101, 21))
+        self.old_repair_drop_off_date_label = QtWidgets.QLabel(self.display_old_repair)
+        self.old_repair_drop_off_date_label.setGeometry(QtCore.QRect(20, 170, 171, 25))
         font = QtGui.QFont()
         font.setPointSize(16)
-        self.new_vehicle_year_label.setFont(font)
-        self.new_vehicle_year_label.setObjectName("new_vehicle_year_label")
+        self.old_repair_drop_off_date_label.setFont(font)
+        self.old_repair_drop_off_date_label.setObjectName(
+            "old_repair_drop_off_date_label"
+        )
 
-        self.new_vehicle_color_input_box = QtWidgets.QLineEdit(self.new_vehicle_page)
-        self.new_vehicle_color_input_box.setGeometry(QtCore.QRect(380, 570, 171, 31))
-        self.new_vehicle_color_input_box.setObjectName("new_vehicle_color_input_box")
+        self.old_repair_tech_id_display_label = QtWidgets.QLabel(
+            self.display_old_repair
+        )
+        self.old_repair_tech_id_display_label.setGeometry(
+            QtCore.QRect(20, 120, 171, 21)
+        )
+        font = QtGui.QFont()
+        font.setPointSize(14)
+        self.old_repair_tech_id_display_label.setFont(font)
+        self.old_repair_tech_id_display_label.setObjectName(
+            "old_repair_tech_id_display_label"
+        )
 
-        self.new_vehicle_color_label = QtWidgets.QLabel(self.new_vehicle_page)
-        self.new_vehicle_color_label.setGeometry(QtCore.QRect(380, 540, 101, 21))
+        self.old_repair_labor_cost_display_label = QtWidgets.QLabel(
+            self.display_old_repair
+        )
+        self.old_repair_labor_cost_display_label.setGeometry(
+            QtCore.QRect(20, 450, 171, 21)
+        )
+        font = QtGui.QFont()
+        font.setPointSize(14)
+        self.old_repair_labor_cost_display_label.setFont(font)
+        self.old_repair_labor_cost_display_label.setObjectName(
+            "old_repair_labor_cost_display_label"
+        )
+
+        self.old_total_repair_cost_label = QtWidgets.QLabel(self.display_old_repair)
+        self.old_total_repair_cost_label.setGeometry(QtCore.QRect(20, 330, 171, 25))
         font = QtGui.QFont()
         font.setPointSize(16)
-        self.new_vehicle_color_label.setFont(font)
-        self.new_vehicle_color_label.setObjectName("new_vehicle_color_label")
+        self.old_total_repair_cost_label.setFont(font)
+        self.old_total_repair_cost_label.setObjectName("old_total_repair_cost_label")
 
-        self.new_vehicle_engine_input_box = QtWidgets.QLineEdit(self.new_vehicle_page)
-        self.new_vehicle_engine_input_box.setGeometry(QtCore.QRect(380, 660, 171, 31))
-        self.new_vehicle_engine_input_box.setText("")
-        self.new_vehicle_engine_input_box.setObjectName("new_vehicle_engine_input_box")
+        self.old_repair_list_of_parts_text_browser = QtWidgets.QTextBrowser(
+            self.display_old_repair
+        )
+        self.old_repair_list_of_parts_text_browser.setGeometry(
+            QtCore.QRect(230, 680, 691, 201)
+        )
+        self.old_repair_list_of_parts_text_browser.setObjectName(
+            "old_repair_list_of_parts_text_browser"
+        )
 
-        self.new_vehicle_engine_label = QtWidgets.QLabel(self.new_vehicle_page)
-        self.new_vehicle_engine_label.setGeometry(QtCore.QRect(380, 620, 101, 31))
+        self.old_repair_tech_id_label = QtWidgets.QLabel(self.display_old_repair)
+        self.old_repair_tech_id_label.setGeometry(QtCore.QRect(20, 90, 101, 21))
         font = QtGui.QFont()
         font.setPointSize(16)
-        self.new_vehicle_engine_label.setFont(font)
-        self.new_vehicle_engine_label.setObjectName("new_vehicle_engine_label")
+        self.old_repair_tech_id_label.setFont(font)
+        self.old_repair_tech_id_label.setObjectName("old_repair_tech_id_label")
 
-        self.new_vehicle_submit_button = QtWidgets.QPushButton(self.new_vehicle_page)
-        self.new_vehicle_submit_button.setGeometry(QtCore.QRect(420, 750, 81, 31))
+        self.old_repair_repair_id_display_label = QtWidgets.QLabel(
+            self.display_old_repair
+        )
+        self.old_repair_repair_id_display_label.setGeometry(
+            QtCore.QRect(350, 40, 301, 21)
+        )
         font = QtGui.QFont()
-        font.setPointSize(12)
-        self.new_vehicle_submit_button.setFont(font)
-        self.new_vehicle_submit_button.setObjectName("new_vehicle_submit_button")
-
-        self.widget_stack.addWidget(self.new_vehicle_page)
-
-        self.edit_vehicle_page = QtWidgets.QWidget()
-        self.edit_vehicle_page.setObjectName("edit_vehicle_page")
+        font.setPointSize(14)
+        self.old_repair_repair_id_display_label.setFont(font)
+        self.old_repair_repair_id_display_label.setObjectName(
+            "old_repair_repair_id_display_label"
+        )
 
-        self.edit_vehicle_year_input_box = QtWidgets.QLineEdit(self.edit_vehicle_page)
-        self.edit_vehicle_year_input_box.setGeometry(QtCore.QRect(380, 480, 171, 31))
-        self.edit_vehicle_year_input_box.setObjectName("edit_vehicle_year_input_box")
+        self.old_repair_service_id_label = QtWidgets.QLabel(self.display_old_repair)
+        self.old_repair_service_id_label.setGeometry(QtCore.QRect(20, 10, 171, 21))
+        font = QtGui.QFont()
+        font.setPointSize(16)
+        self.old_repair_service_id_label.setFont(font)
+        self.old_repair_service_id_label.setObjectName("old_repair_service_id_label")
 
-        self.edit_vehicle_model_input_box = QtWidgets.QLineEdit(self.edit_vehicle_page)
-        self.edit_vehicle_model_input_box.setGeometry(QtCore.QRect(380, 370, 171, 31))
-        self.edit_vehicle_model_input_box.setObjectName("edit_vehicle_model_input_box")
+        self.old_repair_drop_off_date_display_label = QtWidgets.QLabel(
+            self.display_old_repair
+        )
+        self.old_repair_drop_off_date_display_label.setGeometry(
+            QtCore.QRect(20, 200, 171, 21)
+        )
+        font = QtGui.QFont()
+        font.setPointSize(14)
+        self.old_repair_drop_off_date_display_label.setFont(font)
+        self.old_repair_drop_off_date_display_label.setObjectName(
+            "old_repair_drop_off_date_display_label"
+        )
 
-        self.edit_vehicle_year_label = QtWidgets.QLabel(self.edit_vehicle_page)
-        self.edit_vehicle_year_label.setGeometry(QtCore.QRect(380, 430, 101, 21))
+        self.old_repair_repair_id_label = QtWidgets.QLabel(self.display_old_repair)
+        self.old_repair_repair_id_label.setGeometry(QtCore.QRect(450, 10, 171, 25))
         font = QtGui.QFont()
         font.setPointSize(16)
-        self.edit_vehicle_year_label.setFont(font)
-        self.edit_vehicle_year_label.setObjectName("edit_vehicle_year_label")
+        self.old_repair_repair_id_label.setFont(font)
+        self.old_repair_repair_id_label.setObjectName("old_repair_repair_id_label")
 
-        self.edit_vehicle_engine_input_box = QtWidgets.QLineEdit(self.edit_vehicle_page)
-        self.edit_vehicle_engine_input_box.setGeometry(QtCore.QRect(380, 710, 171, 31))
-        self.edit_vehicle_engine_input_box.setText("")
-        self.edit_vehicle_engine_input_box.setObjectName(
-            "edit_vehicle_engine_input_box"
+        self.old_repair_service_id_display_label = QtWidgets.QLabel(
+            self.display_old_repair
+        )
+        self.old_repair_service_id_display_label.setGeometry(
+            QtCore.QRect(20, 40, 171, 21)
+        )
+        font = QtGui.QFont()
+        font.setPointSize(14)
+        self.old_repair_service_id_display_label.setFont(font)
+        self.old_repair_service_id_display_label.setObjectName(
+            "old_repair_service_id_display_label"
         )
 
-        self.edit_vehicle_color_input_box = QtWidgets.QLineEdit(self.edit_vehicle_page)
-        self.edit_vehicle_color_input_box.setGeometry(QtCore.QRect(380, 590, 171, 31))
-        self.edit_vehicle_color_input_box.setObjectName("edit_vehicle_color_input_box")
+        self.old_repair_part_cost_display_label = QtWidgets.QLabel(
+            self.display_old_repair
+        )
+        self.old_repair_part_cost_display_label.setGeometry(
+            QtCore.QRect(20, 540, 171, 21)
+        )
+        font = QtGui.QFont()
+        font.setPointSize(14)
+        self.old_repair_part_cost_display_label.setFont(font)
+        self.old_repair_part_cost_display_label.setObjectName(
+            "old_repair_part_cost_display_label"
+        )
 
-        self.edit_vehicle_make_label = QtWidgets.QLabel(self.edit_vehicle_page)
-        self.edit_vehicle_make_label.setGeometry(QtCore.QRect(380, 210, 101, 21))
+        self.old_repair_list_of_parts_label = QtWidgets.QLabel(self.display_old_repair)
+        self.old_repair_list_of_parts_label.setGeometry(QtCore.QRect(500, 650, 171, 21))
         font = QtGui.QFont()
         font.setPointSize(16)
-        self.edit_vehicle_make_label.setFont(font)
-        self.edit_vehicle_make_label.setObjectName("edit_vehicle_make_label")
+        self.old_repair_list_of_parts_label.setFont(font)
+        self.old_repair_list_of_parts_label.setObjectName(
+            "old_repair_list_of_parts_label"
+        )
 
-        self.edit_vehicle_model_label = QtWidgets.QLabel(self.edit_vehicle_page)
-        self.edit_vehicle_model_label.setGeometry(QtCore.QRect(380, 320, 101, 21))
+        self.old_repair_repair_description_label = QtWidgets.QLabel(
+            self.display_old_repair
+        )
+        self.old_repair_repair_description_label.setGeometry(
+            QtCore.QRect(480, 380, 221, 25)
+        )
         font = QtGui.QFont()
         font.setPointSize(16)
-        self.edit_vehicle_model_label.setFont(font)
-        self.edit_vehicle_model_label.setObjectName("edit_vehicle_model_label")
-
-        self.edit_vehicle_make_input_box = QtWidgets.QLineEdit(self.edit_vehicle_page)
-        self.edit_vehicle_make_input_box.setGeometry(QtCore.QRect(380, 260, 171, 31))
-        self.edit_vehicle_make_input_box.setObjectName("edit_vehicle_make_input_box")
+        self.old_repair_repair_description_label.setFont(font)
+        self.old_repair_repair_description_label.setObjectName(
+            "old_repair_repair_description_label"
+        )
 
-        self.edit_vehicle_vin_label = QtWidgets.QLabel(self.edit_vehicle_page)
-        self.edit_vehicle_vin_label.setGeometry(QtCore.QRect(380, 140, 101, 21))
+        self.old_repair_labor_cost_label = QtWidgets.QLabel(self.display_old_repair)
+        self.old_repair_labor_cost_label.setGeometry(QtCore.QRect(20, 420, 171, 21))
         font = QtGui.QFont()
         font.setPointSize(16)
-        self.edit_vehicle_vin_label.setFont(font)
-        self.edit_vehicle_vin_label.setObjectName("edit_vehicle_vin_label")
+        self.old_repair_labor_cost_label.setFont(font)
+        self.old_repair_labor_cost_label.setObjectName("old_repair_labor_cost_label")
 
-        self.edit_vehicle_engine_label = QtWidgets.QLabel(self.edit_vehicle_page)
-        self.edit_vehicle_engine_label.setGeometry(QtCore.QRect(380, 650, 101, 31))
+        self.old_repair_problem_text_browser = QtWidgets.QTextBrowser(
+            self.display_old_repair
+        )
+        self.old_repair_problem_text_browser.setGeometry(
+            QtCore.QRect(235, 131, 691, 231)
+        )
+        self.old_repair_problem_text_browser.setObjectName(
+            "old_repair_problem_text_browser"
+        )
+
+        self.old_repair_repair_text_browser = QtWidgets.QTextBrowser(
+            self.display_old_repair
+        )
+        self.old_repair_repair_text_browser.setGeometry(
+            QtCore.QRect(235, 411, 691, 211)
+        )
+        self.old_repair_repair_text_browser.setObjectName(
+            "old_repair_repair_text_browser"
+        )
+
+        self.old_repair_complete_date_label = QtWidgets.QLabel(self.display_old_repair)
+        self.old_repair_complete_date_label.setGeometry(QtCore.QRect(20, 250, 211, 25))
         font = QtGui.QFont()
         font.setPointSize(16)
-        self.edit_vehicle_engine_label.setFont(font)
-        self.edit_vehicle_engine_label.setObjectName("edit_vehicle_engine_label")
+        self.old_repair_complete_date_label.setFont(font)
+        self.old_repair_complete_date_label.setObjectName(
+            "old_repair_complete_date_label"
+        )
 
-        self.edit_vehicle_color_label = QtWidgets.QLabel(self.edit_vehicle_page)
-        self.edit_vehicle_color_label.setGeometry(QtCore.QRect(380, 540, 101, 21))
+        self.old_repair_complete_date_display_label = QtWidgets.QLabel(
+            self.display_old_repair
+        )
+        self.old_repair_complete_date_display_label.setGeometry(
+            QtCore.QRect(20, 280, 171, 21)
+        )
         font = QtGui.QFont()
-        font.setPointSize(16)
-        self.edit_vehicle_color_label.setFont(font)
-        self.edit_vehicle_color_label.setObjectName("edit_vehicle_color_label")
+        font.setPointSize(14)
+        self.old_repair_complete_date_display_label.setFont(font)
+        self.old_repair_complete_date_display_label.setObjectName(
+            "old_repair_complete_date_display_label"
+        )
 
-        self.edit_vehicle_vin_display_label = QtWidgets.QLabel(self.edit_vehicle_page)
-        self.edit_vehicle_vin_display_label.setGeometry(QtCore.QRect(380, 170, 180, 21))
+        self.old_repair_total_cost_display_label = QtWidgets.QLabel(
+            self.display_old_repair
+        )
+        self.old_repair_total_cost_display_label.setGeometry(
+            QtCore.QRect(20, 360, 171, 21)
+        )
         font = QtGui.QFont()
         font.setPointSize(14)
-        self.edit_vehicle_vin_display_label.setFont(font)
-        self.edit_vehicle_vin_display_label.setObjectName(
-            "edit_vehicle_vin_display_label"
+        self.old_repair_total_cost_display_label.setFont(font)
+        self.old_repair_total_cost_display_label.setObjectName(
+            "old_repair_total_cost_display_label"
         )
 
-        self.edit_vehicle_change_make_check_box = QtWidgets.QCheckBox(
-            self.edit_vehicle_page
+    def retranslate_display_old_repair(self):
+        """Sets the strings of the labels and buttons of the display old repair page."""
+
+        _translate = QtCore.QCoreApplication.translate
+        self.old_repair_description_label.setText(
+            _translate("app_main_window", "Problem Description")
         )
-        self.edit_vehicle_change_make_check_box.setGeometry(
-            QtCore.QRect(380, 240, 100, 17)
+
+        self.old_repair_part_cost_label.setText(
+            _translate("app_main_window", "Part Cost")
         )
-        self.edit_vehicle_change_make_check_box.setObjectName(
-            "edit_vehicle_change_make_check_box"
+
+        self.old_repair_drop_off_date_label.setText(
+            _translate("app_main_window", "Drop Off Date")
         )
 
-        self.edit_vehicle_change_model_check_box = QtWidgets.QCheckBox(
-            self.edit_vehicle_page
+        self.old_repair_tech_id_display_label.setText(
+            _translate("app_main_window", "N/A")
         )
-        self.edit_vehicle_change_model_check_box.setGeometry(
-            QtCore.QRect(380, 350, 100, 17)
+
+        self.old_repair_labor_cost_display_label.setText(
+            _translate("app_main_window", "N/A")
         )
-        self.edit_vehicle_change_model_check_box.setObjectName(
-            "edit_vehicle_change_model_check_box"
+
+        self.old_total_repair_cost_label.setText(
+            _translate("app_main_window", "Total Repair Cost")
         )
 
-        self.edit_vehicle_change_year_check_box = QtWidgets.QCheckBox(
-            self.edit_vehicle_page
+        self.old_repair_tech_id_label.setText(_translate("app_main_window", "Tech ID"))
+
+        self.old_repair_repair_id_display_label.setText(
+            _translate("app_main_window", "N/A")
         )
-        self.edit_vehicle_change_year_check_box.setGeometry(
-            QtCore.QRect(380, 460, 95, 17)
+
+        self.old_repair_service_id_label.setText(
+            _translate("app_main_window", "Service Writer ID")
         )
-        self.edit_vehicle_change_year_check_box.setObjectName(
-            "edit_vehicle_change_year_check_box"
+
+        self.old_repair_drop_off_date_display_label.setText(
+            _translate("app_main_window", "N/A")
         )
 
-        self.edit_vehicle_change_color_check_box = QtWidgets.QCheckBox(
-            self.edit_vehicle_page
+        self.old_repair_repair_id_label.setText(
+            _translate("app_main_window", "Repair ID")
         )
-        self.edit_vehicle_change_color_check_box.setGeometry(
-            QtCore.QRect(380, 570, 100, 17)
+
+        self.old_repair_service_id_display_label.setText(
+            _translate("app_main_window", "N/A")
         )
-        self.edit_vehicle_change_color_check_box.setObjectName(
-            "edit_vehicle_change_color_check_box"
+
+        self.old_repair_part_cost_display_label.setText(
+            _translate("app_main_window", "N/A")
         )
 
-        self.edit_vehicle_change_engine_check_box = QtWidgets.QCheckBox(
-            self.edit_vehicle_page
+        self.old_repair_list_of_parts_label.setText(
+            _translate("app_main_window", "List of Parts")
         )
-        self.edit_vehicle_change_engine_check_box.setGeometry(
-            QtCore.QRect(380, 690, 101, 17)
+
+        self.old_repair_repair_description_label.setText(
+            _translate("app_main_window", "Repair Description")
         )
-        self.edit_vehicle_change_engine_check_box.setObjectName(
-            "edit_vehicle_change_engine_check_box"
+
+        self.old_repair_labor_cost_label.setText(
+            _translate("app_main_window", "Labor Cost")
         )
 
-        self.edit_vehicle_submit_button = QtWidgets.QPushButton(self.edit_vehicle_page)
-        self.edit_vehicle_submit_button.setGeometry(QtCore.QRect(420, 790, 81, 31))
+        self.old_repair_complete_date_label.setText(
+            _translate("app_main_window", "Repair Complete Date")
+        )
+
+        self.old_repair_complete_date_display_label.setText(
+            _translate("app_main_window", "N/A")
+        )
+
+        self.old_repair_total_cost_display_label.setText(
+            _translate("app_main_window", "N/A")
+        )
+
+    def setup_new_part_page(self):
+        """Builds the widgets of the new part page."""
+
+        self.new_part_part_id_input_box = QtWidgets.QLineEdit(self.new_part_page)
+        self.new_part_part_id_input_box.setGeometry(QtCore.QRect(370, 300, 171, 31))
+        self.new_part_part_id_input_box.setObjectName("new_part_part_id_input_box")
+
+        self.new_part_id_label = QtWidgets.QLabel(self.new_part_page)
+        self.new_part_id_label.setGeometry(QtCore.QRect(370, 270, 121, 21))
         font = QtGui.QFont()
-        font.setPointSize(12)
-        self.edit_vehicle_submit_button.setFont(font)
-        self.edit_vehicle_submit_button.setObjectName("edit_vehicle_submit_button")
+        font.setPointSize(16)
+        self.new_part_id_label.setFont(font)
+        self.new_part_id_label.setObjectName("new_part_id_label")
 
-        self.widget_stack.addWidget(self.edit_vehicle_page)
+        self.new_part_part_cost_input_box = QtWidgets.QLineEdit(self.new_part_page)
+        self.new_part_part_cost_input_box.setGeometry(QtCore.QRect(370, 390, 171, 31))
+        self.new_part_part_cost_input_box.setObjectName("new_part_part_cost_input_box")
 
-        self.list_of_vehicles_page = QtWidgets.QWidget()
-        self.list_of_vehicles_page.setObjectName("list_of_vehicles_page")
+        self.new_part_cost_label = QtWidgets.QLabel(self.new_part_page)
+        self.new_part_cost_label.setGeometry(QtCore.QRect(370, 360, 141, 21))
+        font = QtGui.QFont()
+        font.setPointSize(16)
+        self.new_part_cost_label.setFont(font)
+        self.new_part_cost_label.setObjectName("new_part_cost_label")
 
-        self.list_of_vehicles_text_browser = QtWidgets.QTextBrowser(
-            self.list_of_vehicles_page
-        )
-        self.list_of_vehicles_text_browser.setGeometry(QtCore.QRect(40, 50, 861, 821))
-        self.list_of_vehicles_text_browser.setObjectName(
-            "list_of_vehicles_text_browser"
+        self.new_part_description_input_box = QtWidgets.QLineEdit(self.new_part_page)
+        self.new_part_description_input_box.setGeometry(QtCore.QRect(370, 480, 171, 31))
+        self.new_part_description_input_box.setObjectName(
+            "new_part_description_input_box"
         )
 
-        self.list_of_vehicles_label = QtWidgets.QLabel(self.list_of_vehicles_page)
-        self.list_of_vehicles_label.setGeometry(QtCore.QRect(370, 20, 201, 25))
+        self.new_part_description_label = QtWidgets.QLabel(self.new_part_page)
+        self.new_part_description_label.setGeometry(QtCore.QRect(370, 450, 201, 25))
         font = QtGui.QFont()
         font.setPointSize(16)
-        self.list_of_vehicles_label.setFont(font)
-        self.list_of_vehicles_label.setObjectName("list_of_vehicles_label")
-
-        self.widget_stack.addWidget(self.list_of_vehicles_page)
-
-        app_main_window.setCentralWidget(self.centralwidget)
+        self.new_part_description_label.setFont(font)
+        self.new_part_description_label.setObjectName("new_part_description_label")
 
-        self.menu_bar = QtWidgets.QMenuBar(app_main_window)
-        self.menu_bar.setGeometry(QtCore.QRect(0, 0, 950, 21))
-        self.menu_bar.setObjectName("menu_bar")
+        self.new_part_submit_button = QtWidgets.QPushButton(self.new_part_page)
+        self.new_part_submit_button.setGeometry(QtCore.QRect(410, 540, 81, 31))
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        self.new_part_submit_button.setFont(font)
+        self.new_part_submit_button.setObjectName("new_part_submit_button")
 
-        self.menu_users = QtWidgets.QMenu(self.menu_bar)
-        self.menu_users.setObjectName("menu_users")
+    def retranslate_new_part_page(self):
+        """Sets the strings of the labels and buttons of the new part page."""
 
-        self.menu_repairs = QtWidgets.QMenu(self.menu_bar)
-        self.menu_repairs.setObjectName("menu_repairs")
+        _translate = QtCore.QCoreApplication.translate
+        self.new_part_id_label.setText(_translate("app_main_window", "New Part ID"))
 
-        self.menu_parts = QtWidgets.QMenu(self.menu_bar)
-        self.menu_parts.setObjectName("menu_parts")
+        self.new_part_cost_label.setText(_translate("app_main_window", "New Part Cost"))
 
-        self.menu_customers = QtWidgets.QMenu(self.menu_bar)
-        self.menu_customers.setObjectName("menu_customers")
+        self.new_part_description_label.setText(
+            _translate("app_main_window", "New Part Description")
+        )
 
-        self.menu_vehicles = QtWidgets.QMenu(self.menu_bar)
-        self.menu_vehicles.setObjectName("menu_vehicles")
+        self.new_part_submit_button.setText(_translate("app_main_window", "Submit"))
 
-        app_main_window.setMenuBar(self.menu_bar)
+    def setup_edit_part_page(self):
+        """Builds the widgets of the edit part page."""
 
-        self.status_bar = QtWidgets.QStatusBar(app_main_window)
-        self.status_bar.setObjectName("status_bar")
+        self.edit_part_part_cost_input_box = QtWidgets.QLineEdit(self.edit_part_page)
+        self.edit_part_part_cost_input_box.setGeometry(QtCore.QRect(370, 390, 171, 31))
+        self.edit_part_part_cost_input_box.setText("")
+        self.edit_part_part_cost_input_box.setObjectName(
+            "edit_part_part_cost_input_box"
+        )
 
-        app_main_window.setStatusBar(self.status_bar)
+        self.edit_part_cost_label = QtWidgets.QLabel(self.edit_part_page)
+        self.edit_part_cost_label.setGeometry(QtCore.QRect(370, 340, 141, 25))
+        font = QtGui.QFont()
+        font.setPointSize(16)
+        self.edit_part_cost_label.setFont(font)
+        self.edit_part_cost_label.setObjectName("edit_part_cost_label")
 
-        self.action_login = QtGui.QAction(app_main_window)
-        self.action_login.setObjectName("action_login")
+        self.edit_part_description_label = QtWidgets.QLabel(self.edit_part_page)
+        self.edit_part_description_label.setGeometry(QtCore.QRect(370, 450, 201, 25))
+        font = QtGui.QFont()
+        font.setPointSize(16)
+        self.edit_part_description_label.setFont(font)
+        self.edit_part_description_label.setObjectName("edit_part_description_label")
 
-        self.action_logout = QtGui.QAction(app_main_window)
-        self.action_logout.setObjectName("action_logout")
+        self.edit_part_description_input_box = QtWidgets.QLineEdit(self.edit_part_page)
+        self.edit_part_description_input_box.setGeometry(
+            QtCore.QRect(370, 500, 171, 31)
+        )
+        self.edit_part_description_input_box.setText("")
+        self.edit_part_description_input_box.setObjectName(
+            "edit_part_description_input_box"
+        )
 
-        self.action_new_user = QtGui.QAction(app_main_window)
-        self.action_new_user.setObjectName("action_new_user")
+        self.edit_part_submit_button = QtWidgets.QPushButton(self.edit_part_page)
+        self.edit_part_submit_button.setGeometry(QtCore.QRect(410, 560, 81, 31))
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        self.edit_part_submit_button.setFont(font)
+        self.edit_part_submit_button.setObjectName("edit_part_submit_button")
 
-        self.action_new_repair = QtGui.QAction(app_main_window)
-        self.action_new_repair.setObjectName("action_new_repair")
+        self.edit_part_id_label = QtWidgets.QLabel(self.edit_part_page)
+        self.edit_part_id_label.setGeometry(QtCore.QRect(370, 240, 141, 21))
+        font = QtGui.QFont()
+        font.setPointSize(16)
+        self.edit_part_id_label.setFont(font)
+        self.edit_part_id_label.setObjectName("edit_part_id_label")
 
-        self.action_edit_repair = QtGui.QAction(app_main_window)
-        self.action_edit_repair.setObjectName("action_edit_repair")
+        self.edit_part_id_display_label = QtWidgets.QLabel(self.edit_part_page)
+        self.edit_part_id_display_label.setGeometry(QtCore.QRect(370, 270, 141, 21))
+        font = QtGui.QFont()
+        font.setPointSize(14)
+        self.edit_part_id_display_label.setFont(font)
+        self.edit_part_id_display_label.setObjectName("edit_part_id_display_label")
 
-        self.action_new_part = QtGui.QAction(app_main_window)
-        self.action_new_part.setObjectName("action_new_part")
+        self.edit_part_change_cost_check_box = QtWidgets.QCheckBox(self.edit_part_page)
+        self.edit_part_change_cost_check_box.setGeometry(QtCore.QRect(370, 370, 91, 17))
+        self.edit_part_change_cost_check_box.setObjectName(
+            "edit_part_change_cost_check_box"
+        )
 
-        self.action_edit_part = QtGui.QAction(app_main_window)
-        self.action_edit_part.setObjectName("action_edit_part")
+        self.edit_part_change_description_check_box = QtWidgets.QCheckBox(
+            self.edit_part_page
+        )
+        self.edit_part_change_description_check_box.setGeometry(
+            QtCore.QRect(370, 480, 125, 17)
+        )
+        self.edit_part_change_description_check_box.setObjectName(
+            "edit_part_change_description_check_box"
+        )
 
-        self.action_new_customer = QtGui.QAction(app_main_window)
-        self.action_new_customer.setObjectName("action_new_customer")
+    def retranslate_edit_part_page(self):
+        """Sets the strings of the labels and buttons of the edit part page."""
 
-        self.action_edit_customer = QtGui.QAction(app_main_window)
-        self.action_edit_customer.setObjectName("action_edit_customer")
+        _translate = QtCore.QCoreApplication.translate
+        self.edit_part_cost_label.setText(_translate("app_main_window", "Updated Cost"))
 
-        self.action_new_vehicle = QtGui.QAction(app_main_window)
-        self.action_new_vehicle.setObjectName("action_new_vehicle")
+        self.edit_part_description_label.setText(
+            _translate("app_main_window", "Updated Description")
+        )
 
-        self.action_edit_vehicle = QtGui.QAction(app_main_window)
-        self.action_edit_vehicle.setObjectName("action_edit_vehicle")
+        self.edit_part_submit_button.setText(_translate("app_main_window", "Submit"))
 
-        self.action_update_password = QtGui.QAction(app_main_window)
-        self.action_update_password.setObjectName("action_update_password")
+        self.edit_part_id_label.setText(_translate("app_main_window", "Part ID"))
 
-        self.action_active_repairs = QtGui.QAction(app_main_window)
-        self.action_active_repairs.setObjectName("action_active_repairs")
+        self.edit_part_id_display_label.setText(_translate("app_main_window", "N/A"))
 
-        self.action_list_of_parts = QtGui.QAction(app_main_window)
-        self.action_list_of_parts.setObjectName("action_list_of_parts")
+        self.edit_part_change_cost_check_box.setText(
+            _translate("app_main_window", "Change cost")
+        )
 
-        self.action_get_repair_history = QtGui.QAction(app_main_window)
-        self.action_get_repair_history.setObjectName("action_get_repair_history")
+        self.edit_part_change_description_check_box.setText(
+            _translate("app_main_window", "Change Description")
+        )
 
-        self.action_list_of_customers = QtGui.QAction(app_main_window)
-        self.action_list_of_customers.setObjectName("action_list_of_customers")
+    def setup_list_of_parts_page(self):
+        """Builds the widgets of the list of parts page."""
 
-        self.action_list_of_vehicles = QtGui.QAction(app_main_window)
-        self.action_list_of_vehicles.setObjectName("action_list_of_vehicles")
+        self.list_of_parts_table_view = QtWidgets.QTableView(self.list_of_parts_page)
+        self.list_of_parts_table_view.setGeometry(QtCore.QRect(40, 50, 861, 821))
+        self.list_of_parts_table_view.setSortingEnabled(True)
+        self.list_of_parts_table_view.setObjectName("list_of_parts_table_view")
 
-        self.action_display_old_repair = QtGui.QAction(app_main_window)
-        self.action_display_old_repair.setObjectName("action_display_old_repair")
+        self.list_of_parts_label = QtWidgets.QLabel(self.list_of_parts_page)
+        self.list_of_parts_label.setGeometry(QtCore.QRect(420, 20, 201, 21))
+        font = QtGui.QFont()
+        font.setPointSize(16)
+        self.list_of_parts_label.setFont(font)
+        self.list_of_parts_label.setObjectName("list_of_parts_label")
 
-        self.action_search_user = QtGui.QAction(app_main_window)
-        self.action_search_user.setObjectName("action_search_user")
+    def retranslate_list_of_parts_page(self):
+        """Sets the strings of the labels and buttons of the list of parts page."""
 
-        self.action_update_user = QtGui.QAction(app_main_window)
-        self.action_update_user.setObjectName("action_update_user")
+        _translate = QtCore.QCoreApplication.translate
+        self.list_of_parts_label.setText(_translate("app_main_window", "List of Parts"))
 
-        self.action_show_users = QtGui.QAction(app_main_window)
-        self.action_show_users.setObjectName("action_show_users")
+    def setup_new_customer_page(self):
+        """Builds the widgets of the new customer page."""
 
-        self.action_remove_user = QtGui.QAction(app_main_window)
-        self.action_remove_user.setObjectName("action_remove_user")
+        self.new_customer_name_input_box = QtWidgets.QLineEdit(self.new_customer_page)
+        self.new_customer_name_input_box.setGeometry(QtCore.QRect(370, 300, 171, 31))
+        self.new_customer_name_input_box.setObjectName("new_customer_name_input_box")
 
-        self.action_remove_repair = QtGui.QAction(app_main_window)
-        self.action_remove_repair.setObjectName("action_remove_repair")
+        self.new_customer_address_input_box = QtWidgets.QTextEdit(
+            self.new_customer_page
+        )
+        self.new_customer_address_input_box.setGeometry(
+            QtCore.QRect(370, 390, 171, 111)
+        )
+        self.new_customer_address_input_box.setObjectName(
+            "new_customer_address_input_box"
+        )
 
-        self.action_remove_part = QtGui.QAction(app_main_window)
-        self.action_remove_part.setObjectName("action_remove_part")
+        self.new_customer_phone_label = QtWidgets.QLabel(self.new_customer_page)
+        self.new_customer_phone_label.setGeometry(QtCore.QRect(370, 530, 171, 21))
+        font = QtGui.QFont()
+        font.setPointSize(16)
+        self.new_customer_phone_label.setFont(font)
+        self.new_customer_phone_label.setObjectName("new_customer_phone_label")
 
-        self.action_remove_customer = QtGui.QAction(app_main_window)
-        self.action_remove_customer.setObjectName("action_remove_customer")
+        self.new_customer_phone_input_box = QtWidgets.QLineEdit(self.new_customer_page)
+        self.new_customer_phone_input_box.setGeometry(QtCore.QRect(370, 560, 171, 31))
+        self.new_customer_phone_input_box.setObjectName("new_customer_phone_input_box")
 
-        self.action_remove_vehicle = QtGui.QAction(app_main_window)
-        self.action_remove_vehicle.setObjectName("action_remove_vehicle")
+        self.new_customer_name_label = QtWidgets.QLabel(self.new_customer_page)
+        self.new_customer_name_label.setGeometry(QtCore.QRect(370, 270, 101, 21))
+        font = QtGui.QFont()
+        font.setPointSize(16)
+        self.new_customer_name_label.setFont(font)
+        self.new_customer_name_label.setObjectName("new_customer_name_label")
 
-        self.menu_users.addAction(self.action_login)
-        self.menu_users.addAction(self.action_logout)
-        self.menu_users.addAction(self.action_new_user)
-        self.menu_users.addAction(self.action_update_password)
-        self.menu_users.addAction(self.action_search_user)
-        self.menu_users.addAction(self.action_update_user)
-        self.menu_users.addAction(self.action_show_users)
-        self.menu_users.addAction(self.action_remove_user)
-        self.menu_repairs.addAction(self.action_new_repair)
-        self.menu_repairs.addAction(self.action_edit_repair)
-        self.menu_repairs.addAction(self.action_active_repairs)
-        self.menu_repairs.addAction(self.action_display_old_repair)
-        self.menu_repairs.addAction(self.action_remove_repair)
-        self.menu_parts.addAction(self.action_new_part)
-        self.menu_parts.addAction(self.action_edit_part)
-        self.menu_parts.addAction(self.action_list_of_parts)
-        self.menu_parts.addAction(self.action_remove_part)
-        self.menu_customers.addAction(self.action_new_customer)
-        self.menu_customers.addAction(self.action_edit_customer)
-        self.menu_customers.addAction(self.action_list_of_customers)
-        self.menu_customers.addAction(self.action_remove_customer)
-        self.menu_vehicles.addAction(self.action_new_vehicle)
-        self.menu_vehicles.addAction(self.action_edit_vehicle)
-        self.menu_vehicles.addAction(self.action_get_repair_history)
-        self.menu_vehicles.addAction(self.action_list_of_vehicles)
-        self.menu_vehicles.addAction(self.action_remove_vehicle)
-        self.menu_bar.addAction(self.menu_users.menuAction())
-        self.menu_bar.addAction(self.menu_repairs.menuAction())
-        self.menu_bar.addAction(self.menu_parts.menuAction())
-        self.menu_bar.addAction(self.menu_customers.menuAction())
-        self.menu_bar.addAction(self.menu_vehicles.menuAction())
+        self.new_customer_address_label = QtWidgets.QLabel(self.new_customer_page)
+        self.new_customer_address_label.setGeometry(QtCore.QRect(370, 360, 101, 21))
+        font = QtGui.QFont()
+        font.setPointSize(16)
+        self.new_customer_address_label.setFont(font)
+        self.new_customer_address_label.setObjectName("new_customer_address_label")
 
-        self.retranslate_ui(app_main_window)
-        self.widget_stack.setCurrentIndex(0)
-        QtCore.QMetaObject.connectSlotsByName(app_main_window)
+        self.new_customer_submit_button = QtWidgets.QPushButton(self.new_customer_page)
+        self.new_customer_submit_button.setGeometry(QtCore.QRect(410, 620, 81, 31))
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        self.new_customer_submit_button.setFont(font)
+        self.new_customer_submit_button.setObjectName("new_customer_submit_button")
 
-    def retranslate_ui(self, app_main_window):
-        """Retranslates the ui, created by Qt Designer. Contains all the Strings for
-        the labels and buttons."""
+    def retranslate_new_customer_page(self):
+        """Sets the strings of the labels and buttons of the new customer page."""
 
         _translate = QtCore.QCoreApplication.translate
-        app_main_window.setWindowTitle(
-            _translate("app_main_window", "Garage Service Tracker")
+        self.new_customer_phone_label.setText(
+            _translate("app_main_window", "Phone Number")
         )
 
-        self.username_login_label.setText(_translate("app_main_window", "Username"))
-
-        self.password_login_label.setText(_translate("app_main_window", "Password"))
-
-        self.login_page_submit_button.setText(_translate("app_main_window", "Submit"))
-
-        self.username_new_user_label.setText(_translate("app_main_window", "Username"))
-
-        self.password_new_user_label.setText(_translate("app_main_window", "Password"))
+        self.new_customer_name_label.setText(_translate("app_main_window", "Name"))
 
-        self.confirm_password_new_user_label.setText(
-            _translate("app_main_window", "Confirm Password")
+        self.new_customer_address_label.setText(
+            _translate("app_main_window", "Address")
         )
 
-        self.new_user_note_label.setText(
-            _translate(
-                "app_main_window",
-                "Note: Passwords must be between 4 and 20 characters. ",
-            )
-        )
+        self.new_customer_submit_button.setText(_translate("app_main_window", "Submit"))
 
-        self.new_user_note2_label.setText(
-            _translate(
-                "app_main_window",
-                "Note 2: Usernames must be "
-                "between 4 and 20 characters and only contain letters and numbers.",
-            )
-        )
+    def setup_edit_customer_page(self):
+        """Builds the widgets of the edit customer page."""
 
-        self.new_user_page_submit_button.setText(
-            _translate("app_main_window", "Submit")
+        self.edit_customer_address_input_box = QtWidgets.QTextEdit(
+            self.edit_customer_page
         )
-
-        self.new_user_writer_or_tech_label.setText(
-            _translate("app_main_window", "Service Writer / Technician")
+        self.edit_customer_address_input_box.setGeometry(
+            QtCore.QRect(100, 460, 171, 91)
         )
-
-        self.new_user_service_writer_radio_button.setText(
-            _translate("app_main_window", "Service Writer")
+        self.edit_customer_address_input_box.setObjectName(
+            "edit_customer_address_input_box"
         )
 
-        self.new_user_tech_radio_button.setText(
-            _translate("app_main_window", "Technician")
+        self.edit_customer_submit_button = QtWidgets.QPushButton(
+            self.edit_customer_page
         )
+        self.edit_customer_submit_button.setGeometry(QtCore.QRect(140, 730, 81, 31))
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        self.edit_customer_submit_button.setFont(font)
+        self.edit_customer_submit_button.setObjectName("edit_customer_submit_button")
 
-        self.new_user_name_label.setText(_translate("app_main_window", "Name"))
-
-        self.new_user_team_label.setText(_translate("app_main_window", "Team"))
+        self.edit_customer_phone_label = QtWidgets.QLabel(self.edit_customer_page)
+        self.edit_customer_phone_label.setGeometry(QtCore.QRect(100, 580, 171, 21))
+        font = QtGui.QFont()
+        font.setPointSize(16)
+        self.edit_customer_phone_label.setFont(font)
+        self.edit_customer_phone_label.setObjectName("edit_customer_phone_label")
 
-        self.new_user_lane_label.setText(_translate("app_main_window", "Lane"))
+        self.edit_customer_name_label = QtWidgets.QLabel(self.edit_customer_page)
+        self.edit_customer_name_label.setGeometry(QtCore.QRect(100, 150, 101, 21))
+        font = QtGui.QFont()
+        font.setPointSize(16)
+        self.edit_customer_name_label.setFont(font)
+        self.edit_customer_name_label.setObjectName("edit_customer_name_label")
 
-        self.new_user_section_label.setText(_translate("app_main_window", "Section"))
+        self.edit_customer_name_input_box = QtWidgets.QLineEdit(self.edit_customer_page)
+        self.edit_customer_name_input_box.setGeometry(QtCore.QRect(100, 240, 171, 31))
+        self.edit_customer_name_input_box.setObjectName("edit_customer_name_input_box")
 
-        self.update_password_username_label.setText(
-            _translate("app_main_window", "Username")
+        self.edit_customer_phone_input_box = QtWidgets.QLineEdit(
+            self.edit_customer_page
         )
-
-        self.update_password_note2_label.setText(
-            _translate(
-                "app_main_window",
-                "Note 2: Usernames "
-                "must be between 4 and 20 characters and only contain letters and numbers.",
-            )
+        self.edit_customer_phone_input_box.setGeometry(QtCore.QRect(100, 670, 171, 31))
+        self.edit_customer_phone_input_box.setObjectName(
+            "edit_customer_phone_input_box"
         )
 
-        self.new_password_label.setText(_translate("app_main_window", "New Password"))
-
-        self.update_password_note_label.setText(
-            _translate(
-                "app_main_window",
-                "Note: Passwords must be between 4 and 20 characters. ",
-            )
-        )
+        self.edit_customer_address_label = QtWidgets.QLabel(self.edit_customer_page)
+        self.edit_customer_address_label.setGeometry(QtCore.QRect(100, 300, 101, 21))
+        font = QtGui.QFont()
+        font.setPointSize(16)
+        self.edit_customer_address_label.setFont(font)
+        self.edit_customer_address_label.setObjectName("edit_customer_address_label")
 
-        self.old_password_label.setText(_translate("app_main_window", "Password"))
+        self.edit_customer_id_label = QtWidgets.QLabel(self.edit_customer_page)
+        self.edit_customer_id_label.setGeometry(QtCore.QRect(100, 80, 131, 21))
+        font = QtGui.QFont()
+        font.setPointSize(16)
+        self.edit_customer_id_label.setFont(font)
+        self.edit_customer_id_label.setObjectName("edit_customer_id_label")
 
-        self.confirm_new_password_label.setText(
-            _translate("app_main_window", "Confirm Password")
+        self.edit_customer_id_display_label = QtWidgets.QLabel(self.edit_customer_page)
+        self.edit_customer_id_display_label.setGeometry(QtCore.QRect(100, 110, 131, 21))
+        font = QtGui.QFont()
+        font.setPointSize(14)
+        self.edit_customer_id_display_label.setFont(font)
+        self.edit_customer_id_display_label.setObjectName(
+            "edit_customer_id_display_label"
         )
 
-        self.update_password_submit_button.setText(
-            _translate("app_main_window", "Submit")
+        self.edit_customer_change_name_check_box = QtWidgets.QCheckBox(
+            self.edit_customer_page
         )
-
-        self.update_user_service_writer_radio_button.setText(
-            _translate("app_main_window", "Service Writer")
+        self.edit_customer_change_name_check_box.setGeometry(
+            QtCore.QRect(100, 210, 100, 17)
         )
-
-        self.update_user_section_label.setText(_translate("app_main_window", "Section"))
-
-        self.update_user_page_submit_button.setText(
-            _translate("app_main_window", "Submit")
+        self.edit_customer_change_name_check_box.setObjectName(
+            "edit_customer_change_name_check_box"
         )
 
-        self.update_user_lane_label.setText(_translate("app_main_window", "Lane"))
-
-        self.update_user_name_label.setText(_translate("app_main_window", "Name"))
-
-        self.update_user_writer_or_tech_label.setText(
-            _translate("app_main_window", "Service Writer / Technician")
+        self.edit_customer_change_address_check_box = QtWidgets.QCheckBox(
+            self.edit_customer_page
         )
-
-        self.update_user_team_label.setText(_translate("app_main_window", "Team"))
-
-        self.update_user_password_label.setText(
-            _translate("app_main_window", "Password")
+        self.edit_customer_change_address_check_box.setGeometry(
+            QtCore.QRect(100, 430, 111, 17)
         )
-
-        self.update_user_tech_radio_button.setText(
-            _translate("app_main_window", "Technician")
+        self.edit_customer_change_address_check_box.setObjectName(
+            "edit_customer_change_address_check_box"
         )
 
-        self.need_password_label.setText(
-            _translate("app_main_window", "Enter password to apply changes")
+        self.edit_customer_change_phone_check_box = QtWidgets.QCheckBox(
+            self.edit_customer_page
         )
-
-        self.update_user_user_id_label.setText(_translate("app_main_window", "User ID"))
-
-        self.update_user_user_id_display_label.setText(
-            _translate("app_main_window", "N/A")
+        self.edit_customer_change_phone_check_box.setGeometry(
+            QtCore.QRect(100, 640, 145, 17)
         )
-
-        self.update_user_name_display_label.setText(
-            _translate("app_main_window", "N/A")
+        self.edit_customer_change_phone_check_box.setObjectName(
+            "edit_customer_change_phone_check_box"
         )
 
-        self.update_user_team_display_label.setText(
-            _translate("app_main_window", "N/A")
+        self.edit_customer_add_vehicle_button = QtWidgets.QPushButton(
+            self.edit_customer_page
         )
-
-        self.update_user_lane_display_label.setText(
-            _translate("app_main_window", "N/A")
+        self.edit_customer_add_vehicle_button.setGeometry(
+            QtCore.QRect(580, 550, 111, 31)
         )
-
-        self.update_user_section_display_label.setText(
-            _translate("app_main_window", "N/A")
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        self.edit_customer_add_vehicle_button.setFont(font)
+        self.edit_customer_add_vehicle_button.setObjectName(
+            "edit_customer_add_vehicle_button"
         )
 
-        self.update_user_change_name_check_box.setText(
-            _translate("app_main_window", "Change Name")
+        self.edit_customer_remove_vehicle_button = QtWidgets.QPushButton(
+            self.edit_customer_page
         )
-
-        self.update_user_change_team_check_box.setText(
-            _translate("app_main_window", "Change Team")
+        self.edit_customer_remove_vehicle_button.setGeometry(
+            QtCore.QRect(570, 610, 131, 31)
         )
-
-        self.update_user_change_lane_check_box.setText(
-            _translate("app_main_window", "Change Lane")
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        self.edit_customer_remove_vehicle_button.setFont(font)
+        self.edit_customer_remove_vehicle_button.setObjectName(
+            "edit_customer_remove_vehicle_button"
         )
 
-        self.update_user_change_section_check_box.setText(
-            _translate("app_main_window", "Change Section")
+        self.edit_customer_vehicle_list_label = QtWidgets.QLabel(
+            self.edit_customer_page
         )
-
-        self.new_repair_tech_id_label.setText(_translate("app_main_window", "Tech ID"))
-
-        self.new_repair_service_id_label.setText(
-            _translate("app_main_window", "Service Writer ID")
+        self.edit_customer_vehicle_list_label.setGeometry(
+            QtCore.QRect(560, 150, 151, 21)
+        )
+        font = QtGui.QFont()
+        font.setPointSize(16)
+        self.edit_customer_vehicle_list_label.setFont(font)
+        self.edit_customer_vehicle_list_label.setObjectName(
+            "edit_customer_vehicle_list_label"
         )
 
-        self.new_repair_vin_label.setText(_translate("app_main_window", "VIN"))
-
-        self.new_repair_drop_off_date_label.setText(
-            _translate("app_main_window", "Drop Off Date")
+        self.edit_customer_vechile_list_text_browser = QtWidgets.QTextBrowser(
+            self.edit_customer_page
+        )
+        self.edit_customer_vechile_list_text_browser.setGeometry(
+            QtCore.QRect(370, 190, 531, 321)
+        )
+        self.edit_customer_vechile_list_text_browser.setObjectName(
+            "edit_customer_vechile_list_text_browser"
         )
 
-        self.new_repair_description_label.setText(
-            _translate("app_main_window", "Problem Description")
+        self.edit_customer_phone_display_label = QtWidgets.QLabel(
+            self.edit_customer_page
+        )
+        self.edit_customer_phone_display_label.setGeometry(
+            QtCore.QRect(100, 610, 131, 21)
+        )
+        font = QtGui.QFont()
+        font.setPointSize(14)
+        self.edit_customer_phone_display_label.setFont(font)
+        self.edit_customer_phone_display_label.setObjectName(
+            "edit_customer_phone_display_label"
         )
 
-        self.new_repair_page_submit_button.setText(
-            _translate("app_main_window", "Submit")
+        self.edit_customer_address_text_browser = QtWidgets.QTextBrowser(
+            self.edit_customer_page
+        )
+        self.edit_customer_address_text_browser.setGeometry(
+            QtCore.QRect(100, 330, 171, 91)
+        )
+        self.edit_customer_address_text_browser.setObjectName(
+            "edit_customer_address_text_browser"
         )
 
-        self.edit_repair_tech_id_label.setText(_translate("app_main_window", "Tech ID"))
-
-        self.edit_repair_description_label.setText(
-            _translate("app_main_window", "Problem Description")
+        self.edit_customer_name_display_label = QtWidgets.QLabel(
+            self.edit_customer_page
         )
-
-        self.edit_repair_service_id_label.setText(
-            _translate("app_main_window", "Service Writer ID")
+        self.edit_customer_name_display_label.setGeometry(
+            QtCore.QRect(100, 180, 200, 21)
         )
-
-        self.edit_repair_service_id_display_label.setText(
-            _translate("app_main_window", "N/A")
+        font = QtGui.QFont()
+        font.setPointSize(14)
+        self.edit_customer_name_display_label.setFont(font)
+        self.edit_customer_name_display_label.setObjectName(
+            "edit_customer_name_display_label"
         )
 
-        self.change_writer_check_box.setText(
-            _translate("app_main_window", "Change Writer")
-        )
+    def retranslate_edit_customer_page(self):
+        """Sets the strings of the labels and buttons of the edit customer page."""
 
-        self.change_tech_check_box.setText(
-            _translate("app_main_window", "Change Technician")
+        _translate = QtCore.QCoreApplication.translate
+        self.edit_customer_submit_button.setText(
+            _translate("app_main_window", "Submit")
         )
 
-        self.edit_repair_tech_id_display_label.setText(
-            _translate("app_main_window", "N/A")
+        self.edit_customer_phone_label.setText(
+            _translate("app_main_window", "Phone Number")
         )
 
-        self.edit_repair_page_submit_update_button.setText(
-            _translate("app_main_window", "Submit Update")
-        )
+        self.edit_customer_name_label.setText(_translate("app_main_window", "Name"))
 
-        self.edit_repair_list_of_parts_label.setText(
-            _translate("app_main_window", "List of Parts")
+        self.edit_customer_address_label.setText(
+            _translate("app_main_window", "Address")
         )
 
-        self.edit_repair_drop_off_date_label.setText(
-            _translate("app_main_window", "Drop Off Date")
+        self.edit_customer_id_label.setText(
+            _translate("app_main_window", "Customer ID")
         )
 
-        self.edit_repair_drop_off_date_display_label.setText(
+        self.edit_customer_id_display_label.setText(
             _translate("app_main_window", "N/A")
         )
 
-        self.edit_repair_page_submit_complete_button.setText(
-            _translate("app_main_window", "Submit Complete")
+        self.edit_customer_change_name_check_box.setText(
+            _translate("app_main_window", "Change Name")
         )
 
-        self.edit_total_repair_cost_label.setText(
-            _translate("app_main_window", "Total Repair Cost")
+        self.edit_customer_change_address_check_box.setText(
+            _translate("app_main_window", "Change Address")
         )
 
-        self.edit_repair_total_repair_cost_display_label.setText(
-            _translate("app_main_window", "N/A")
+        self.edit_customer_change_phone_check_box.setText(
+            _translate("app_main_window", "Change Phone Number")
         )
 
-        self.edit_repair_labor_cost_display_label.setText(
-            _translate("app_main_window", "N/A")
+        self.edit_customer_add_vehicle_button.setText(
+            _translate("app_main_window", "Add Vehicle")
         )
 
-        self.edit_repair_labor_cost_label.setText(
-            _translate("app_main_window", "Labor Cost")
+        self.edit_customer_remove_vehicle_button.setText(
+            _translate("app_main_window", "Remove Vehicle")
         )
 
-        self.edit_repair_part_cost_label.setText(
-            _translate("app_main_window", "Part Cost")
+        self.edit_customer_vehicle_list_label.setText(
+            _translate("app_main_window", "List of Vehicles")
         )
 
-        self.edit_repair_part_cost_display_label.setText(
+        self.edit_customer_phone_display_label.setText(
             _translate("app_main_window", "N/A")
         )
 
-        self.edit_repair_repair_id_label.setText(
-            _translate("app_main_window", "Repair ID")
-        )
-
-        self.edit_repair_repair_id_display_label.setText(
+        self.edit_customer_name_display_label.setText(
             _translate("app_main_window", "N/A")
         )
 
-        self.edit_repair_repair_description_label.setText(
-            _translate("app_main_window", "Repair Description")
-        )
+    def setup_list_of_customers_page(self):
+        """Builds the widgets of the list of customers page."""
 
-        self.change_labor_check_box.setText(
-            _translate("app_main_window", "Update Labor")
+        self.list_of_customers_table_view = QtWidgets.QTableView(
+            self.list_of_customers_page
         )
+        self.list_of_customers_table_view.setGeometry(QtCore.QRect(40, 50, 861, 821))
+        self.list_of_customers_table_view.setSortingEnabled(True)
+        self.list_of_customers_table_view.setObjectName("list_of_customers_table_view")
 
-        self.edit_repair_add_part_button.setText(
-            _translate("app_main_window", "Add Part")
-        )
+        self.list_of_customers_label = QtWidgets.QLabel(self.list_of_customers_page)
+        self.list_of_customers_label.setGeometry(QtCore.QRect(370, 20, 201, 25))
+        font = QtGui.QFont()
+        font.setPointSize(16)
+        self.list_of_customers_label.setFont(font)
+        self.list_of_customers_label.setObjectName("list_of_customers_label")
 
-        self.edit_repair_remove_part_button.setText(
-            _translate("app_main_window", "Remove Part")
-        )
+    def retranslate_list_of_customers_page(self):
+        """Sets the strings of the labels and buttons of the list of customers page."""
 
-        self.active_repairs_list_of_repairs_label.setText(
-            _translate("app_main_window", "List of Active Repairs")
+        _translate = QtCore.QCoreApplication.translate
+        self.list_of_customers_label.setText(
+            _translate("app_main_window", "List of Customers")
         )
 
-        self.old_repair_description_label.setText(
-            _translate("app_main_window", "Problem Description")
-        )
+    def setup_new_vehicle_page(self):
+        """Builds the widgets of the new vehicle page."""
 
-        self.old_repair_part_cost_label.setText(
-            _translate("app_main_window", "Part Cost")
-        )
+        self.new_vehicle_vin_label = QtWidgets.QLabel(self.new_vehicle_page)
+        self.new_vehicle_vin_label.setGeometry(QtCore.QRect(380, 180, 101, 21))
+        font = QtGui.QFont()
+        font.setPointSize(16)
+        self.new_vehicle_vin_label.setFont(font)
+        self.new_vehicle_vin_label.setObjectName("new_vehicle_vin_label")
 
-        self.old_repair_drop_off_date_label.setText(
-            _translate("app_main_window", "Drop Off Date")
-        )
+        self.new_vehicle_vin_input_box = QtWidgets.QLineEdit(self.new_vehicle_page)
+        self.new_vehicle_vin_input_box.setGeometry(QtCore.QRect(380, 210, 171, 31))
+        self.new_vehicle_vin_input_box.setObjectName("new_vehicle_vin_input_box")
 
-        self.old_repair_tech_id_display_label.setText(
-            _translate("app_main_window", "N/A")
-        )
+        self.new_vehicle_make_input_box = QtWidgets.QLineEdit(self.new_vehicle_page)
+        self.new_vehicle_make_input_box.setGeometry(QtCore.QRect(380, 300, 171, 31))
+        self.new_vehicle_make_input_box.setObjectName("new_vehicle_make_input_box")
 
-        self.old_repair_labor_cost_display_label.setText(
-            _translate("app_main_window", "N/A")
-        )
+        self.new_vehicle_make_label = QtWidgets.QLabel(self.new_vehicle_page)
+        self.new_vehicle_make_label.setGeometry(QtCore.QRect(380, 270, 101, 21))
+        font = QtGui.QFont()
+        font.setPointSize(16)
+        self.new_vehicle_make_label.setFont(font)
+        self.new_vehicle_make_label.setObjectName("new_vehicle_make_label")
 
-        self.old_total_repair_cost_label.setText(
-            _translate("app_main_window", "Total Repair Cost")
-        )
+        self.new_vehicle_model_input_box = QtWidgets.QLineEdit(self.new_vehicle_page)
+        self.new_vehicle_model_input_box.setGeometry(QtCore.QRect(380, 390, 171, 31))
+        self.new_vehicle_model_input_box.setObjectName("new_vehicle_model_input_box")
 
-        self.old_repair_tech_id_label.setText(_translate("app_main_window", "Tech ID"))
+        self.new_vehicle_model_label = QtWidgets.QLabel(self.new_vehicle_page)
+        self.new_vehicle_model_label.setGeometry(QtCore.QRect(380, 360, 101, 21))
+        font = QtGui.QFont()
+        font.setPointSize(16)
+        self.new_vehicle_model_label.setFont(font)
+        self.new_vehicle_model_label.setObjectName("new_vehicle_model_label")
 
-        self.old_repair_repair_id_display_label.setText(
-            _translate("app_main_window", "N/A")
-        )
+        self.new_vehicle_year_input_box = QtWidgets.QLineEdit(self.new_vehicle_page)
+        self.new_vehicle_year_input_box.setGeometry(QtCore.QRect(380, 480, 171, 31))
+        self.new_vehicle_year_input_box.setObjectName("new_vehicle_year_input_box")
 
-        self.old_repair_service_id_label.setText(
-            _translate("app_main_window", "Service Writer ID")
-        )
+        self.new_vehicle_year_label = QtWidgets.QLabel(self.new_vehicle_page)
+        self.new_vehicle_year_label.setGeometry(QtCore.QRect(380, 450, 101, 21))
+        font = QtGui.QFont()
+        font.setPointSize(16)
+        self.new_vehicle_year_label.setFont(font)
+        self.new_vehicle_year_label.setObjectName("new_vehicle_year_label")
 
-        self.old_repair_drop_off_date_display_label.setText(
-            _translate("app_main_window", "N/A")
-        )
+        self.new_vehicle_color_input_box = QtWidgets.QLineEdit(self.new_vehicle_page)
+        self.new_vehicle_color_input_box.setGeometry(QtCore.QRect(380, 570, 171, 31))
+        self.new_vehicle_color_input_box.setObjectName("new_vehicle_color_input_box")
 
-        self.old_repair_repair_id_label.setText(
-            _translate("app_main_window", "Repair ID")
-        )
+        self.new_vehicle_color_label = QtWidgets.QLabel(self.new_vehicle_page)
+        self.new_vehicle_color_label.setGeometry(QtCore.QRect(380, 540, 101, 21))
+        font = QtGui.QFont()
+        font.setPointSize(16)
+        self.new_vehicle_color_label.setFont(font)
+        self.new_vehicle_color_label.setObjectName("new_vehicle_color_label")
 
-        self.old_repair_service_id_display_label.setText(
-            _translate("app_main_window", "N/A")
-        )
+        self.new_vehicle_engine_input_box = QtWidgets.QLineEdit(self.new_vehicle_page)
+        self.new_vehicle_engine_input_box.setGeometry(QtCore.QRect(380, 660, 171, 31))
+        self.new_vehicle_engine_input_box.setText("")
+        self.new_vehicle_engine_input_box.setObjectName("new_vehicle_engine_input_box")
 
-        self.old_repair_part_cost_display_label.setText(
-            _translate("app_main_window", "N/A")
-        )
+        self.new_vehicle_engine_label = QtWidgets.QLabel(self.new_vehicle_page)
+        self.new_vehicle_engine_label.setGeometry(QtCore.QRect(380, 620, 101, 31))
+        font = QtGui.QFont()
+        font.setPointSize(16)
+        self.new_vehicle_engine_label.setFont(font)
+        self.new_vehicle_engine_label.setObjectName("new_vehicle_engine_label")
 
-        self.old_repair_list_of_parts_label.setText(
-            _translate("app_main_window", "List of Parts")
-        )
+        self.new_vehicle_submit_button = QtWidgets.QPushButton(self.new_vehicle_page)
+        self.new_vehicle_submit_button.setGeometry(QtCore.QRect(420, 750, 81, 31))
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        self.new_vehicle_submit_button.setFont(font)
+        self.new_vehicle_submit_button.setObjectName("new_vehicle_submit_button")
 
-        self.old_repair_repair_description_label.setText(
-            _translate("app_main_window", "Repair Description")
-        )
+    def retranslate_new_vehicle_page(self):
+        """Sets the strings of the labels and buttons of the new vehicle page."""
 
-        self.old_repair_labor_cost_label.setText(
-            _translate("app_main_window", "Labor Cost")
-        )
+        _translate = QtCore.QCoreApplication.translate
+        self.new_vehicle_vin_label.setText(_translate("app_main_window", "VIN"))
 
-        self.old_repair_complete_date_label.setText(
-            _translate("app_main_window", "Repair Complete Date")
-        )
+        self.new_vehicle_make_label.setText(_translate("app_main_window", "Make"))
 
-        self.old_repair_complete_date_display_label.setText(
-            _translate("app_main_window", "N/A")
-        )
+        self.new_vehicle_model_label.setText(_translate("app_main_window", "Model"))
 
-        self.old_repair_total_cost_display_label.setText(
-            _translate("app_main_window", "N/A")
-        )
+        self.new_vehicle_year_label.setText(_translate("app_main_window", "Year"))
 
-        self.new_part_id_label.setText(_translate("app_main_window", "New Part ID"))
+        self.new_vehicle_color_label.setText(_translate("app_main_window", "Color"))
 
-        self.new_part_cost_label.setText(_translate("app_main_window", "New Part Cost"))
+        self.new_vehicle_engine_label.setText(_translate("app_main_window", "Engine"))
 
-        self.new_part_description_label.setText(
-            _translate("app_main_window", "New Part Description")
-        )
+        self.new_vehicle_submit_button.setText(_translate("app_main_window", "Submit"))
 
-        self.new_part_submit_button.setText(_translate("app_main_window", "Submit"))
+    def setup_edit_vehicle_page(self):
+        """Builds the widgets of the edit vehicle page."""
 
-        self.edit_part_cost_label.setText(_translate("app_main_window", "Updated Cost"))
+        self.edit_vehicle_year_input_box = QtWidgets.QLineEdit(self.edit_vehicle_page)
+        self.edit_vehicle_year_input_box.setGeometry(QtCore.QRect(380, 480, 171, 31))
+        self.edit_vehicle_year_input_box.setObjectName("edit_vehicle_year_input_box")
 
-        self.edit_part_description_label.setText(
-            _translate("app_main_window", "Updated Description")
+        self.edit_vehicle_model_input_box = QtWidgets.QLineEdit(self.edit_vehicle_page)
+        self.edit_vehicle_model_input_box.setGeometry(QtCore.QRect(380, 370, 171, 31))
+        self.edit_vehicle_model_input_box.setObjectName("edit_vehicle_model_input_box")
+
+        self.edit_vehicle_year_label = QtWidgets.QLabel(self.edit_vehicle_page)
+        self.edit_vehicle_year_label.setGeometry(QtCore.QRect(380, 430, 101, 21))
+        font = QtGui.QFont()
+        font.setPointSize(16)
+        self.edit_vehicle_year_label.setFont(font)
+        self.edit_vehicle_year_label.setObjectName("edit_vehicle_year_label")
+
+        self.edit_vehicle_engine_input_box = QtWidgets.QLineEdit(self.edit_vehicle_page)
+        self.edit_vehicle_engine_input_box.setGeometry(QtCore.QRect(380, 710, 171, 31))
+        self.edit_vehicle_engine_input_box.setText("")
+        self.edit_vehicle_engine_input_box.setObjectName(
+            "edit_vehicle_engine_input_box"
         )
 
-        self.edit_part_submit_button.setText(_translate("app_main_window", "Submit"))
+        self.edit_vehicle_color_input_box = QtWidgets.QLineEdit(self.edit_vehicle_page)
+        self.edit_vehicle_color_input_box.setGeometry(QtCore.QRect(380, 590, 171, 31))
+        self.edit_vehicle_color_input_box.setObjectName("edit_vehicle_color_input_box")
+
+        self.edit_vehicle_make_label = QtWidgets.QLabel(self.edit_vehicle_page)
+        self.edit_vehicle_make_label.setGeometry(QtCore.QRect(380, 210, 101, 21))
+        font = QtGui.QFont()
+        font.setPointSize(16)
+        self.edit_vehicle_make_label.setFont(font)
+        self.edit_vehicle_make_label.setObjectName("edit_vehicle_make_label")
 
-        self.edit_part_id_label.setText(_translate("app_main_window", "Part ID"))
+        self.edit_vehicle_model_label = QtWidgets.QLabel(self.edit_vehicle_page)
+        self.edit_vehicle_model_label.setGeometry(QtCore.QRect(380, 320, 101, 21))
+        font = QtGui.QFont()
+        font.setPointSize(16)
+        self.edit_vehicle_model_label.setFont(font)
+        self.edit_vehicle_model_label.setObjectName("edit_vehicle_model_label")
 
-        self.edit_part_id_display_label.setText(_translate("app_main_window", "N/A"))
+        self.edit_vehicle_make_input_box = QtWidgets.QLineEdit(self.edit_vehicle_page)
+        self.edit_vehicle_make_input_box.setGeometry(QtCore.QRect(380, 260, 171, 31))
+        self.edit_vehicle_make_input_box.setObjectName("edit_vehicle_make_input_box")
 
-        self.edit_part_change_cost_check_box.setText(
-            _translate("app_main_window", "Change cost")
-        )
+        self.edit_vehicle_vin_label = QtWidgets.QLabel(self.edit_vehicle_page)
+        self.edit_vehicle_vin_label.setGeometry(QtCore.QRect(380, 140, 101, 21))
+        font = QtGui.QFont()
+        font.setPointSize(16)
+        self.edit_vehicle_vin_label.setFont(font)
+        self.edit_vehicle_vin_label.setObjectName("edit_vehicle_vin_label")
 
-        self.edit_part_change_description_check_box.setText(
-            _translate("app_main_window", "Change Description")
-        )
+        self.edit_vehicle_engine_label = QtWidgets.QLabel(self.edit_vehicle_page)
+        self.edit_vehicle_engine_label.setGeometry(QtCore.QRect(380, 650, 101, 31))
+        font = QtGui.QFont()
+        font.setPointSize(16)
+        self.edit_vehicle_engine_label.setFont(font)
+        self.edit_vehicle_engine_label.setObjectName("edit_vehicle_engine_label")
 
-        self.list_of_parts_label.setText(_translate("app_main_window", "List of Parts"))
+        self.edit_vehicle_color_label = QtWidgets.QLabel(self.edit_vehicle_page)
+        self.edit_vehicle_color_label.setGeometry(QtCore.QRect(380, 540, 101, 21))
+        font = QtGui.QFont()
+        font.setPointSize(16)
+        self.edit_vehicle_color_label.setFont(font)
+        self.edit_vehicle_color_label.setObjectName("edit_vehicle_color_label")
 
-        self.new_customer_phone_label.setText(
-            _translate("app_main_window", "Phone Number")
+        self.edit_vehicle_vin_display_label = QtWidgets.QLabel(self.edit_vehicle_page)
+        self.edit_vehicle_vin_display_label.setGeometry(QtCore.QRect(380, 170, 180, 21))
+        font = QtGui.QFont()
+        font.setPointSize(14)
+        self.edit_vehicle_vin_display_label.setFont(font)
+        self.edit_vehicle_vin_display_label.setObjectName(
+            "edit_vehicle_vin_display_label"
         )
 
-        self.new_customer_name_label.setText(_translate("app_main_window", "Name"))
-
-        self.new_customer_address_label.setText(
-            _translate("app_main_window", "Address")
+        self.edit_vehicle_change_make_check_box = QtWidgets.QCheckBox(
+            self.edit_vehicle_page
         )
-
-        self.new_customer_submit_button.setText(_translate("app_main_window", "Submit"))
-
-        self.edit_customer_submit_button.setText(
-            _translate("app_main_window", "Submit")
+        self.edit_vehicle_change_make_check_box.setGeometry(
+            QtCore.QRect(380, 240, 100, 17)
         )
-
-        self.edit_customer_phone_label.setText(
-            _translate("app_main_window", "Phone Number")
+        self.edit_vehicle_change_make_check_box.setObjectName(
+            "edit_vehicle_change_make_check_box"
         )
 
-        self.edit_customer_name_label.setText(_translate("app_main_window", "Name"))
-
-        self.edit_customer_address_label.setText(
-            _translate("app_main_window", "Address")
+        self.edit_vehicle_change_model_check_box = QtWidgets.QCheckBox(
+            self.edit_vehicle_page
         )
-
-        self.edit_customer_id_label.setText(
-            _translate("app_main_window", "Customer ID")
+        self.edit_vehicle_change_model_check_box.setGeometry(
+            QtCore.QRect(380, 350, 100, 17)
         )
-
-        self.edit_customer_id_display_label.setText(
-            _translate("app_main_window", "N/A")
+        self.edit_vehicle_change_model_check_box.setObjectName(
+            "edit_vehicle_change_model_check_box"
         )
 
-        self.edit_customer_change_name_check_box.setText(
-            _translate("app_main_window", "Change Name")
+        self.edit_vehicle_change_year_check_box = QtWidgets.QCheckBox(
+            self.edit_vehicle_page
         )
-
-        self.edit_customer_change_address_check_box.setText(
-            _translate("app_main_window", "Change Address")
+        self.edit_vehicle_change_year_check_box.setGeometry(
+            QtCore.QRect(380, 460, 95, 17)
         )
-
-        self.edit_customer_change_phone_check_box.setText(
-            _translate("app_main_window", "Change Phone Number")
+        self.edit_vehicle_change_year_check_box.setObjectName(
+            "edit_vehicle_change_year_check_box"
         )
 
-        self.edit_customer_add_vehicle_button.setText(
-            _translate("app_main_window", "Add Vehicle")
+        self.edit_vehicle_change_color_check_box = QtWidgets.QCheckBox(
+            self.edit_vehicle_page
         )
-
-        self.edit_customer_remove_vehicle_button.setText(
-            _translate("app_main_window", "Remove Vehicle")
+        self.edit_vehicle_change_color_check_box.setGeometry(
+            QtCore.QRect(380, 570, 100, 17)
         )
-
-        self.edit_customer_vehicle_list_label.setText(
-            _translate("app_main_window", "List of Vehicles")
+        self.edit_vehicle_change_color_check_box.setObjectName(
+            "edit_vehicle_change_color_check_box"
         )
 
-        self.edit_customer_phone_display_label.setText(
-            _translate("app_main_window", "N/A")
+        self.edit_vehicle_change_engine_check_box = QtWidgets.QCheckBox(
+            self.edit_vehicle_page
         )
-
-        self.edit_customer_name_display_label.setText(
-            _translate("app_main_window", "N/A")
+        self.edit_vehicle_change_engine_check_box.setGeometry(
+            QtCore.QRect(380, 690, 101, 17)
         )
-
-        self.list_of_customers_label.setText(
-            _translate("app_main_window", "List of Customers")
+        self.edit_vehicle_change_engine_check_box.setObjectName(
+            "edit_vehicle_change_engine_check_box"
         )
 
-        self.new_vehicle_vin_label.setText(_translate("app_main_window", "VIN"))
-
-        self.new_vehicle_make_label.setText(_translate("app_main_window", "Make"))
-
-        self.new_vehicle_model_label.setText(_translate("app_main_window", "Model"))
-
-        self.new_vehicle_year_label.setText(_translate("app_main_window", "Year"))
-
-        self.new_vehicle_color_label.setText(_translate("app_main_window", "Color"))
-
-        self.new_vehicle_engine_label.setText(_translate("app_main_window", "Engine"))
+        self.edit_vehicle_submit_button = QtWidgets.QPushButton(self.edit_vehicle_page)
+        self.edit_vehicle_submit_button.setGeometry(QtCore.QRect(420, 790, 81, 31))
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        self.edit_vehicle_submit_button.setFont(font)
+        self.edit_vehicle_submit_button.setObjectName("edit_vehicle_submit_button")
 
-        self.new_vehicle_submit_button.setText(_translate("app_main_window", "Submit"))
+    def retranslate_edit_vehicle_page(self):
+        """Sets the strings of the labels and buttons of the edit vehicle page."""
 
+        _translate = QtCore.QCoreApplication.translate
         self.edit_vehicle_year_label.setText(_translate("app_main_window", "Year"))
 
         self.edit_vehicle_make_label.setText(_translate("app_main_window", "Make"))
@@ -2428,93 +2696,168 @@ class UiGarageTrackerMainWindow(QtWidgets.QMainWindow):
 
         self.edit_vehicle_submit_button.setText(_translate("app_main_window", "Submit"))
 
+    def setup_list_of_vehicles_page(self):
+        """Builds the widgets of the list of vehicles page."""
+
+        self.list_of_vehicles_table_view = QtWidgets.QTableView(
+            self.list_of_vehicles_page
+        )
+        self.list_of_vehicles_table_view.setGeometry(QtCore.QRect(40, 50, 861, 821))
+        self.list_of_vehicles_table_view.setSortingEnabled(True)
+        self.list_of_vehicles_table_view.setObjectName("list_of_vehicles_table_view")
+
+        self.list_of_vehicles_label = QtWidgets.QLabel(self.list_of_vehicles_page)
+        self.list_of_vehicles_label.setGeometry(QtCore.QRect(370, 20, 201, 25))
+        font = QtGui.QFont()
+        font.setPointSize(16)
+        self.list_of_vehicles_label.setFont(font)
+        self.list_of_vehicles_label.setObjectName("list_of_vehicles_label")
+
+    def retranslate_list_of_vehicles_page(self):
+        """Sets the strings of the labels and buttons of the list of vehicles page."""
+
+        _translate = QtCore.QCoreApplication.translate
         self.list_of_vehicles_label.setText(
             _translate("app_main_window", "List of Vehicles")
         )
 
-        self.menu_users.setTitle(_translate("app_main_window", "Users"))
+    def setup_search_repairs_page(self):
+        """Builds the widgets of the search repairs page."""
 
-        self.menu_repairs.setTitle(_translate("app_main_window", "Repairs"))
+        self.search_repairs_label = QtWidgets.QLabel(self.search_repairs_page)
+        self.search_repairs_label.setGeometry(QtCore.QRect(370, 20, 201, 25))
+        font = QtGui.QFont()
+        font.setPointSize(16)
+        self.search_repairs_label.setFont(font)
+        self.search_repairs_label.setObjectName("search_repairs_label")
 
-        self.menu_parts.setTitle(_translate("app_main_window", "Parts"))
+        self.search_repairs_input_box = QtWidgets.QLineEdit(self.search_repairs_page)
+        self.search_repairs_input_box.setGeometry(QtCore.QRect(40, 60, 721, 31))
+        self.search_repairs_input_box.setObjectName("search_repairs_input_box")
 
-        self.menu_customers.setTitle(_translate("app_main_window", "Customers"))
+        self.search_repairs_submit_button = QtWidgets.QPushButton(
+            self.search_repairs_page
+        )
+        self.search_repairs_submit_button.setGeometry(QtCore.QRect(780, 60, 121, 31))
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        self.search_repairs_submit_button.setFont(font)
+        self.search_repairs_submit_button.setObjectName("search_repairs_submit_button")
 
-        self.menu_vehicles.setTitle(_translate("app_main_window", "Vehicles"))
+        self.search_repairs_results_text_browser = QtWidgets.QTextBrowser(
+            self.search_repairs_page
+        )
+        self.search_repairs_results_text_browser.setGeometry(
+            QtCore.QRect(40, 110, 861, 761)
+        )
+        self.search_repairs_results_text_browser.setObjectName(
+            "search_repairs_results_text_browser"
+        )
 
-        self.action_login.setText(_translate("app_main_window", "Login"))
+    def retranslate_search_repairs_page(self):
+        """Sets the strings of the labels and buttons of the search repairs page."""
 
-        self.action_logout.setText(_translate("app_main_window", "Logout"))
+        _translate = QtCore.QCoreApplication.translate
+        self.search_repairs_label.setText(
+            _translate("app_main_window", "Search Repairs")
+        )
 
-        self.action_new_user.setText(_translate("app_main_window", "New User"))
+        self.search_repairs_submit_button.setText(
+            _translate("app_main_window", "Search")
+        )
 
-        self.action_show_users.setText(_translate("app_main_window", "Show Users"))
+    def setup_lookup_page(self):
+        """Builds the widgets of the lookup page."""
 
-        self.action_remove_user.setText(_translate("app_main_window", "Remove User"))
+        self.lookup_label = QtWidgets.QLabel(self.lookup_page)
+        self.lookup_label.setGeometry(QtCore.QRect(370, 20, 201, 25))
+        font = QtGui.QFont()
+        font.setPointSize(16)
+        self.lookup_label.setFont(font)
+        self.lookup_label.setObjectName("lookup_label")
 
-        self.action_remove_repair.setText(
-            _translate("app_main_window", "Remove Repair")
-        )
+        self.lookup_kind_combo_box = QtWidgets.QComboBox(self.lookup_page)
+        self.lookup_kind_combo_box.setGeometry(QtCore.QRect(40, 60, 141, 31))
+        self.lookup_kind_combo_box.setObjectName("lookup_kind_combo_box")
+        self.lookup_kind_combo_box.addItems(["", "", ""])
 
-        self.action_remove_part.setText(_translate("app_main_window", "Remove Part"))
+        self.lookup_input_box = QtWidgets.QLineEdit(self.lookup_page)
+        self.lookup_input_box.setGeometry(QtCore.QRect(200, 60, 701, 31))
+        self.lookup_input_box.setObjectName("lookup_input_box")
 
-        self.action_remove_customer.setText(
-            _translate("app_main_window", "Remove Customer")
-        )
+        self.lookup_results_list_widget = QtWidgets.QListWidget(self.lookup_page)
+        self.lookup_results_list_widget.setGeometry(QtCore.QRect(40, 110, 861, 761))
+        self.lookup_results_list_widget.setObjectName("lookup_results_list_widget")
 
-        self.action_remove_vehicle.setText(
-            _translate("app_main_window", "Remove Vehicle")
+    def retranslate_lookup_page(self):
+        """Sets the strings of the labels and buttons of the lookup page."""
+
+        _translate = QtCore.QCoreApplication.translate
+        self.lookup_label.setText(_translate("app_main_window", "Lookup"))
+
+        self.lookup_kind_combo_box.setItemText(
+            0, _translate("app_main_window", "Customers")
+        )
+        self.lookup_kind_combo_box.setItemText(
+            1, _translate("app_main_window", "Vehicles")
+        )
+        self.lookup_kind_combo_box.setItemText(
+            2, _translate("app_main_window", "Parts")
         )
 
-        self.action_new_repair.setText(_translate("app_main_window", "New Repair"))
+    def wait_for_future(self, future):
+        """Runs a local event loop until the passed future is done so the window keeps
+        painting while work runs on another thread, returns the future's result. User
+        input is held until the work is done."""
 
-        self.action_edit_repair.setText(_translate("app_main_window", "Edit Repair"))
+        if not future.done():
+            wait_loop = QtCore.QEventLoop()
 
-        self.action_new_part.setText(_translate("app_main_window", "New Part"))
+            # done callback runs on the worker thread --> queue the quit to this thread
+            future.add_done_callback(
+                lambda _: QtCore.QMetaObject.invokeMethod(
+                    wait_loop, "quit", QtCore.Qt.ConnectionType.QueuedConnection
+                )
+            )
 
-        self.action_edit_part.setText(_translate("app_main_window", "Edit Part"))
+            QtWidgets.QApplication.setOverrideCursor(QtCore.Qt.CursorShape.BusyCursor)
 
-        self.action_new_customer.setText(_translate("app_main_window", "New Customer"))
+            wait_loop.exec(QtCore.QEventLoop.ProcessEventsFlag.ExcludeUserInputEvents)
 
-        self.action_edit_customer.setText(
-            _translate("app_main_window", "Edit Customer")
-        )
+            QtWidgets.QApplication.restoreOverrideCursor()
 
-        self.action_new_vehicle.setText(_translate("app_main_window", "New Vehicle"))
+        return future.result()
 
-        self.action_edit_vehicle.setText(_translate("app_main_window", "Edit Vehicle"))
+    def stream_text(self, text_browser, chunks):
+        """Replaces the text of the passed text browser with the passed chunks of text.
+        The first chunk is shown at once, the rest one per pass of the event loop so
+        long lists do not hold up the window. A new stream to the same text browser
+        stops the one before it."""
 
-        self.action_update_password.setText(
-            _translate("app_main_window", "Update Password")
-        )
+        text_browser.clear()
 
-        self.action_active_repairs.setText(
-            _translate("app_main_window", "Active Repairs")
-        )
+        chunks = iter(chunks)
+        self.text_streams[text_browser.objectName()] = chunks
 
-        self.action_list_of_parts.setText(
-            _translate("app_main_window", "List of Parts")
-        )
+        def show_next_chunk():
+            # a newer stream replaced this one --> stop
+            if self.text_streams.get(text_browser.objectName()) is not chunks:
+                return
 
-        self.action_get_repair_history.setText(
-            _translate("app_main_window", "Get Repair History")
-        )
+            chunk = next(chunks, None)
 
-        self.action_list_of_customers.setText(
-            _translate("app_main_window", "List of Customers")
-        )
+            if chunk is None:
+                del self.text_streams[text_browser.objectName()]
 
-        self.action_list_of_vehicles.setText(
-            _translate("app_main_window", "List of Vehicles")
-        )
+                return
 
-        self.action_display_old_repair.setText(
-            _translate("app_main_window", "Display Old Repair")
-        )
+            cursor = text_browser.textCursor()
+            cursor.movePosition(QtGui.QTextCursor.MoveOperation.End)
+            cursor.insertText(chunk)
 
-        self.action_search_user.setText(_translate("app_main_window", "Search User"))
+            QtCore.QTimer.singleShot(0, show_next_chunk)
 
-        self.action_update_user.setText(_translate("app_main_window", "Update User"))
+        show_next_chunk()
 
     def show_error(self, error):
         """Displays the passed error message to the user in a separate window."""
@@ -2551,6 +2894,21 @@ class UiGarageTrackerMainWindow(QtWidgets.QMainWindow):
         # otherwise user hit cancel or escaped
         return False
 
+    def show_quantity_request(self, title, msg):
+        """Displays a input dialog to user for a quantity, is passed a title and
+        message to tell user what the quantity is for."""
+
+        quantity, ok_button = QtWidgets.QInputDialog.getInt(
+            self, title, msg, 1, 1, 999  # default, min, max
+        )
+
+        # if user hits ok --> return quantity
+        if ok_button:
+            return quantity
+
+        # otherwise user hit cancel or escaped
+        return False
+
     def show_user_search(self, information_to_display):
         """Displays the passed user data to the user."""
 
@@ -2569,10 +2927,42 @@ class UiGarageTrackerMainWindow(QtWidgets.QMainWindow):
         result_window.setWindowTitle("Repair History")
         result_window.exec()
 
-    def update_active_repair_list(self, list_of_repairs):
+    def update_lookup_results(self, results):
+        """Replaces the lookup page results with the passed (text, key) results, the key
+        is kept with each result to open it with."""
+
+        self.lookup_results_list_widget.clear()
+
+        for text, key in results:
+            item = QtWidgets.QListWidgetItem(text)
+            item.setData(QtCore.Qt.ItemDataRole.UserRole, key)
+            self.lookup_results_list_widget.addItem(item)
+
+    def get_lookup_result_key(self, item):
+        """Returns the key kept with the passed lookup result."""
+
+        return item.data(QtCore.Qt.ItemDataRole.UserRole)
+
+    def update_list_table(self, table_view, fetch_page, table, columns):
+        """Displays a table's rows in the passed table view, fetched a page at a time
+        with the passed database get_*_page method as the user scrolls. The columns are
+        (column name, header, format string or None) tuples."""
+
+        # first visit --> give the view a model, the view owns it from then on
+        if table_view.model() is None:
+            table_view.setModel(
+                KeysetTableModel(fetch_page, table, columns, parent=table_view)
+            )
+
+        # drop rows from the last visit, they may have changed since
+        table_view.model().refresh()
+
+    def update_active_repair_list(self, fetch_page, columns):
         """Displays the active repairs repair data to the user."""
 
-        self.active_repairs_list_text_browser.setText(list_of_repairs)
+        self.update_list_table(
+            self.active_repairs_list_table_view, fetch_page, "repairs", columns
+        )
 
     def update_user_update_displays(self, user_data):
         """Takes the information retrived from the database and update
@@ -2621,7 +3011,8 @@ class UiGarageTrackerMainWindow(QtWidgets.QMainWindow):
         )
 
     def update_old_repair_displays(self, repair_data, parts_list):
-        """Updates the old repair page with the repair data passed to it."""
+        """Updates the old repair page with the repair data and chunks of parts list
+        text passed to it."""
 
         self.old_repair_repair_id_display_label.setText(repair_data["repair_id"])
         self.old_repair_total_cost_display_label.setText(
@@ -2641,7 +3032,7 @@ class UiGarageTrackerMainWindow(QtWidgets.QMainWindow):
         )
         self.old_repair_problem_text_browser.setText(repair_data["problem_description"])
         self.old_repair_repair_text_browser.setText(repair_data["repair_description"])
-        self.old_repair_list_of_parts_text_browser.setText(parts_list)
+        self.stream_text(self.old_repair_list_of_parts_text_browser, parts_list)
         self.old_repair_tech_id_display_label.setText(str(repair_data["technician"]))
         self.old_repair_service_id_display_label.setText(
             str(repair_data["service_writer"])
@@ -2655,13 +3046,14 @@ class UiGarageTrackerMainWindow(QtWidgets.QMainWindow):
         self.edit_part_description_input_box.setText(part_data["part_description"])
 
     def update_edit_customer_page(self, customer_data, vehicle_list):
-        """Updates the edit customer page with the passed data."""
+        """Updates the edit customer page with the passed data and chunks of vehicle
+        list text."""
 
         self.edit_customer_id_display_label.setText(str(customer_data["customer_id"]))
         self.edit_customer_name_display_label.setText(customer_data["name"])
         self.edit_customer_address_text_browser.setText(customer_data["address"])
         self.edit_customer_phone_display_label.setText(customer_data["phone_number"])
-        self.edit_customer_vechile_list_text_browser.setText(vehicle_list)
+        self.stream_text(self.edit_customer_vechile_list_text_browser, vehicle_list)
 
     def update_edit_vehicle_page(self, vehicle_data):
         """Updates the edit vehicle page with the passed vehicle data."""
@@ -2796,7 +3188,29 @@ class UiGarageTrackerMainWindow(QtWidgets.QMainWindow):
 
         self.edit_repair_problem_description_input_box.clear()
         self.edit_repair_repair_description_input_box.clear()
-        self.edit_repair_list_of_parts_text_browser.clear()
+        self.stream_text(
+            self.edit_repair_list_of_parts_text_browser, ()
+        )  # stops stream
+
+    def reset_search_repairs_page(self):
+        """Clears the search box and results on the search repairs page."""
+
+        self.search_repairs_input_box.clear()
+        self.stream_text(self.search_repairs_results_text_browser, ())  # stops stream
+
+    def reset_lookup_page(self):
+        """Clears the search box and results on the lookup page, dropping any lookup
+        still running."""
+
+        self.lookup_timer.stop()
+        self.lookup_generation += 1  # results of running lookups --> dropped
+
+        if self.lookup_pending is not None:
+            self.lookup_pending.cancel()
+            self.lookup_pending = None
+
+        self.lookup_input_box.clear()
+        self.lookup_results_list_widget.clear()
 
     def reset_new_part_page(self):
         """Clears all text boxes on the new part page."""
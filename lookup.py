@@ -0,0 +1,122 @@
+"""This module handles the search as you type lookup of customers, vehicles and parts."""
+
+import render
+import customers
+import vehicles
+import parts
+
+NO_LOGIN_MSG = "You must be logged in to access this page."
+
+# Lookup kinds in lookup kind combo box order
+CUSTOMER_LOOKUP = 0
+VEHICLE_LOOKUP = 1
+PART_LOOKUP = 2
+
+# Lookup kind --> (database lookup method, result template, key column, edit page function)
+LOOKUP_KINDS = {
+    CUSTOMER_LOOKUP: (
+        "lookup_customers",
+        render.CUSTOMER_LOOKUP_ROW,
+        "customer_id",
+        customers.go_to_edit_customer_page,
+    ),
+    VEHICLE_LOOKUP: (
+        "lookup_vehicles",
+        render.VEHICLE_LOOKUP_ROW,
+        "vin",
+        vehicles.go_to_edit_vehicle_page,
+    ),
+    PART_LOOKUP: (
+        "lookup_parts",
+        render.PART_LOOKUP_ROW,
+        "part_id",
+        parts.go_to_edit_part_page,
+    ),
+}
+
+# Longest search text passed to the database
+MAX_LOOKUP_LENGTH = 100
+
+
+def go_to_lookup_page(database, gui, kind):
+    """Takes the user to the lookup page set to look up the passed kind."""
+
+    if not database.get_login_status():
+        return gui.show_error(NO_LOGIN_MSG)
+
+    gui.reset_lookup_page()
+
+    gui.lookup_kind_combo_box.setCurrentIndex(kind)
+
+    gui.widget_stack.setCurrentIndex(18)
+
+    return gui.lookup_input_box.setFocus()
+
+
+def lookup_text_changed(gui):
+    """Restarts the lookup delay, the lookup runs once the user stops typing."""
+
+    gui.lookup_timer.start()
+
+
+def run_lookup(database, gui):
+    """Queues a lookup of the search box text on the database thread, replacing the
+    lookup before it. Its results are shown when it finishes unless a newer lookup has
+    been started by then."""
+
+    # newer lookup --> cancel the older one if it has not started, drop its results
+    if gui.lookup_pending is not None:
+        gui.lookup_pending.cancel()
+
+    gui.lookup_generation += 1
+    generation = gui.lookup_generation
+
+    kind = gui.lookup_kind_combo_box.currentIndex()
+    text = gui.lookup_input_box.text()[:MAX_LOOKUP_LENGTH]
+
+    if not text.strip():
+        gui.lookup_pending = None
+
+        return gui.update_lookup_results([])
+
+    gui.lookup_pending = database.call_async(
+        LOOKUP_KINDS[kind][0],
+        text,
+        callback=lambda rows: show_lookup_results(gui, kind, generation, rows),
+    )
+
+    return gui.lookup_pending
+
+
+def show_lookup_results(gui, kind, generation, rows):
+    """Displays the rows found by a lookup, if it is still the latest lookup."""
+
+    if generation != gui.lookup_generation:
+        return None  # superseded by a newer lookup
+
+    gui.lookup_pending = None
+
+    _method, template, key_column, _edit_page = LOOKUP_KINDS[kind]
+    format_row = render.get_row_formatter(template)
+
+    return gui.update_lookup_results(
+        [(format_row(row), row[key_column]) for row in rows]
+    )
+
+
+def open_lookup_result(database, gui, item=None):
+    """Takes the user to the edit page of the passed lookup result, or of the
+    selected/first result if none is passed."""
+
+    if item is None:
+        item = gui.lookup_results_list_widget.currentItem()
+
+    if item is None:
+        item = gui.lookup_results_list_widget.item(0)
+
+    if item is None:
+        return None  # no results
+
+    edit_page = LOOKUP_KINDS[gui.lookup_kind_combo_box.currentIndex()][3]
+
+    return edit_page(database, gui, gui.get_lookup_result_key(item))
@@ -0,0 +1,296 @@
+"""This module defines the schema migrations for the database and the function used to
+apply them to an existing database file."""
+
+
+# Each migration is a tuple of SQL statements, its schema version is its position in the
+# list + 1. Migrations are only ever appended, never edited once released.
+MIGRATIONS = [
+    # 1 --> indexes for the assigned repair, active repair, repair history, owned vehicle
+    # and part listing lookups. The active and assigned repair ones are partial so they
+    # only hold the open repairs, queries must filter on repair_completed_date IS NULL.
+    (
+        """CREATE INDEX IF NOT EXISTS repairs_active_index
+            ON repairs (repair_id) WHERE repair_completed_date IS NULL;""",
+        """CREATE INDEX IF NOT EXISTS repairs_active_technician_index
+            ON repairs (technician, repair_id) WHERE repair_completed_date IS NULL;""",
+        """CREATE INDEX IF NOT EXISTS repairs_active_service_writer_index
+            ON repairs (service_writer, repair_id)
+            WHERE repair_completed_date IS NULL;""",
+        """CREATE INDEX IF NOT EXISTS repairs_vehicle_index
+            ON repairs (vehicle, repair_completed_date);""",
+        """CREATE INDEX IF NOT EXISTS part_listings_repair_index
+            ON part_listings (repair_id);""",
+        """CREATE INDEX IF NOT EXISTS vehicles_owner_index
+            ON vehicles (owner);""",
+    ),
+    # 2 --> triggers keeping repairs parts_cost and total_cost up to date, then a one time
+    # rebuild of both for existing repairs
+    (
+        """CREATE TRIGGER IF NOT EXISTS part_listings_insert_cost
+            AFTER INSERT ON part_listings
+            BEGIN
+                UPDATE repairs SET parts_cost = (
+                    SELECT COALESCE(SUM(parts.part_cost), 0.0) FROM part_listings
+                    JOIN parts ON parts.part_id = part_listings.part_id
+                    WHERE part_listings.repair_id = new.repair_id)
+                WHERE repair_id = new.repair_id;
+            END;""",
+        """CREATE TRIGGER IF NOT EXISTS part_listings_delete_cost
+            AFTER DELETE ON part_listings
+            BEGIN
+                UPDATE repairs SET parts_cost = (
+                    SELECT COALESCE(SUM(parts.part_cost), 0.0) FROM part_listings
+                    JOIN parts ON parts.part_id = part_listings.part_id
+                    WHERE part_listings.repair_id = old.repair_id)
+                WHERE repair_id = old.repair_id;
+            END;""",
+        """CREATE TRIGGER IF NOT EXISTS repairs_total_cost
+            AFTER UPDATE OF labor, parts_cost ON repairs
+            BEGIN
+                UPDATE repairs
+                SET total_cost = COALESCE(new.labor, 0.0) + COALESCE(new.parts_cost, 0.0)
+                WHERE repair_id = new.repair_id;
+            END;""",
+        """UPDATE repairs SET parts_cost = (
+            SELECT COALESCE(SUM(parts.part_cost), 0.0) FROM part_listings
+            JOIN parts ON parts.part_id = part_listings.part_id
+            WHERE part_listings.repair_id = repairs.repair_id);""",
+    ),
+    # 3 --> one part listing per repair and part with a quantity instead of one row per
+    # part unit, dropping the old table also drops its index and triggers
+    (
+        """CREATE TABLE part_listings_with_quantity
+            (repair_id TEXT NOT NULL,
+            part_id TEXT NOT NULL,
+            quantity INTEGER NOT NULL CHECK (quantity > 0),
+            PRIMARY KEY (repair_id, part_id),
+            FOREIGN KEY (part_id) REFERENCES parts (part_id),
+            FOREIGN KEY (repair_id) REFERENCES repairs (repair_id))
+            WITHOUT ROWID;""",
+        """INSERT INTO part_listings_with_quantity (repair_id, part_id, quantity)
+            SELECT repair_id, part_id, COUNT(*) FROM part_listings
+            GROUP BY repair_id, part_id;""",
+        """DROP TABLE part_listings;""",
+        """ALTER TABLE part_listings_with_quantity RENAME TO part_listings;""",
+        """CREATE TRIGGER part_listings_insert_cost
+            AFTER INSERT ON part_listings
+            BEGIN
+                UPDATE repairs SET parts_cost = (
+                    SELECT COALESCE(SUM(parts.part_cost * part_listings.quantity), 0.0)
+                    FROM part_listings
+                    JOIN parts ON parts.part_id = part_listings.part_id
+                    WHERE part_listings.repair_id = new.repair_id)
+                WHERE repair_id = new.repair_id;
+            END;""",
+        """CREATE TRIGGER part_listings_update_cost
+            AFTER UPDATE OF quantity ON part_listings
+            BEGIN
+                UPDATE repairs SET parts_cost = (
+                    SELECT COALESCE(SUM(parts.part_cost * part_listings.quantity), 0.0)
+                    FROM part_listings
+                    JOIN parts ON parts.part_id = part_listings.part_id
+                    WHERE part_listings.repair_id = new.repair_id)
+                WHERE repair_id = new.repair_id;
+            END;""",
+        """CREATE TRIGGER part_listings_delete_cost
+            AFTER DELETE ON part_listings
+            BEGIN
+                UPDATE repairs SET parts_cost = (
+                    SELECT COALESCE(SUM(parts.part_cost * part_listings.quantity), 0.0)
+                    FROM part_listings
+                    JOIN parts ON parts.part_id = part_listings.part_id
+                    WHERE part_listings.repair_id = old.repair_id)
+                WHERE repair_id = old.repair_id;
+            END;""",
+    ),
+    # 4 --> full text index of repair problem and repair descriptions, kept in step with
+    # repairs by triggers. The rowid of repairs (no INTEGER PRIMARY KEY) may change on
+    # VACUUM, so each repair gets a search id of its own and the index reads its rows
+    # from a view keyed on it (external content)
+    (
+        """CREATE TABLE repairs_search_ids
+            (search_id INTEGER PRIMARY KEY,
+            repair_id TEXT NOT NULL UNIQUE);""",
+        """CREATE VIEW repairs_search AS
+            SELECT repairs_search_ids.search_id,
+                repairs.problem_description,
+                repairs.repair_description
+            FROM repairs_search_ids
+            JOIN repairs ON repairs.repair_id = repairs_search_ids.repair_id;""",
+        """CREATE VIRTUAL TABLE repairs_fts USING fts5
+            (problem_description,
+            repair_description,
+            content = 'repairs_search',
+            content_rowid = 'search_id',
+            tokenize = 'porter unicode61');""",
+        """CREATE TRIGGER repairs_fts_insert
+            AFTER INSERT ON repairs
+            BEGIN
+                INSERT INTO repairs_search_ids (repair_id) VALUES (new.repair_id);
+                INSERT INTO repairs_fts (rowid, problem_description, repair_description)
+                VALUES (
+                    (SELECT search_id FROM repairs_search_ids
+                    WHERE repair_id = new.repair_id),
+                    new.problem_description,
+                    new.repair_description);
+            END;""",
+        """CREATE TRIGGER repairs_fts_delete
+            AFTER DELETE ON repairs
+            BEGIN
+                INSERT INTO repairs_fts
+                    (repairs_fts, rowid, problem_description, repair_description)
+                VALUES (
+                    'delete',
+                    (SELECT search_id FROM repairs_search_ids
+                    WHERE repair_id = old.repair_id),
+                    old.problem_description,
+                    old.repair_description);
+                DELETE FROM repairs_search_ids WHERE repair_id = old.repair_id;
+            END;""",
+        """CREATE TRIGGER repairs_fts_update
+            AFTER UPDATE OF problem_description, repair_description ON repairs
+            BEGIN
+                INSERT INTO repairs_fts
+                    (repairs_fts, rowid, problem_description, repair_description)
+                VALUES (
+                    'delete',
+                    (SELECT search_id FROM repairs_search_ids
+                    WHERE repair_id = old.repair_id),
+                    old.problem_description,
+                    old.repair_description);
+                INSERT INTO repairs_fts (rowid, problem_description, repair_description)
+                VALUES (
+                    (SELECT search_id FROM repairs_search_ids
+                    WHERE repair_id = new.repair_id),
+                    new.problem_description,
+                    new.repair_description);
+            END;""",
+        """INSERT INTO repairs_search_ids (repair_id)
+            SELECT repair_id FROM repairs ORDER BY rowid;""",
+        """INSERT INTO repairs_fts (repairs_fts) VALUES ('rebuild');""",
+    ),
+    # 5 --> indexes for the search as you type prefix lookups, each lookup query must use
+    # the exact same expression as its index, see LOOKUP_EXPRESSIONS in data_interface
+    (
+        """CREATE INDEX customers_name_lookup_index
+            ON customers (name COLLATE NOCASE);""",
+        """CREATE INDEX customers_phone_lookup_index
+            ON customers (replace(phone_number, '-', ''));""",
+        """CREATE INDEX vehicles_vin_lookup_index
+            ON vehicles (vin COLLATE NOCASE);""",
+        """CREATE INDEX vehicles_vin_last_six_lookup_index
+            ON vehicles (substr(vin, -6) COLLATE NOCASE);""",
+        """CREATE INDEX parts_id_lookup_index
+            ON parts (part_id COLLATE NOCASE);""",
+        """CREATE INDEX parts_description_lookup_index
+            ON parts (part_description COLLATE NOCASE);""",
+    ),
+    # 6 --> customer phone numbers as digits only and names in lower case as generated
+    # columns with indexes, these replace the customer lookup indexes of migration 5
+    (
+        """ALTER TABLE customers ADD COLUMN phone_digits TEXT
+            GENERATED ALWAYS AS (
+                replace(replace(replace(replace(replace(
+                    phone_number, '-', ''), ' ', ''), '(', ''), ')', ''), '.', '')
+            ) VIRTUAL;""",
+        """ALTER TABLE customers ADD COLUMN name_folded TEXT
+            GENERATED ALWAYS AS (lower(name)) VIRTUAL;""",
+        """CREATE INDEX customers_phone_digits_index ON customers (phone_digits);""",
+        """CREATE INDEX customers_name_folded_index ON customers (name_folded);""",
+        """DROP INDEX customers_name_lookup_index;""",
+        """DROP INDEX customers_phone_lookup_index;""",
+    ),
+    # 7 --> indexes for the sorted list pages, one per sortable column on (column, key
+    # column) so each page is a seek, see PAGE_SORT_COLUMNS in data_interface. Integer
+    # keys are the rowid which every index already ends with. The repairs ones only hold
+    # the active repairs and the NULL cost columns are indexed on the COALESCE they are
+    # sorted by, technician and service writer are by the assigned repair indexes of
+    # migration 1. The planner needs the statistics to pick the partial indexes.
+    (
+        """CREATE INDEX customers_name_index ON customers (name);""",
+        """CREATE INDEX customers_phone_number_index ON customers (phone_number);""",
+        """CREATE INDEX employees_name_index ON employees (name);""",
+        """CREATE INDEX employees_lane_or_section_index
+            ON employees (lane_or_section);""",
+        """CREATE INDEX parts_cost_index ON parts (part_cost, part_id);""",
+        """CREATE INDEX parts_description_index ON parts (part_description, part_id);""",
+        """CREATE INDEX vehicles_make_index ON vehicles (make, vin);""",
+        """CREATE INDEX vehicles_model_index ON vehicles (model, vin);""",
+        """CREATE INDEX vehicles_year_index ON vehicles (year, vin);""",
+        """CREATE INDEX repairs_active_total_cost_index
+            ON repairs (COALESCE(total_cost, 0.0), repair_id)
+            WHERE repair_completed_date IS NULL;""",
+        """CREATE INDEX repairs_active_labor_index
+            ON repairs (COALESCE(labor, 0.0), repair_id)
+            WHERE repair_completed_date IS NULL;""",
+        """CREATE INDEX repairs_active_parts_cost_index
+            ON repairs (COALESCE(parts_cost, 0.0), repair_id)
+            WHERE repair_completed_date IS NULL;""",
+        """CREATE INDEX repairs_active_drop_off_date_index
+            ON repairs (drop_off_date, repair_id) WHERE repair_completed_date IS NULL;""",
+        """ANALYZE;""",
+    ),
+]
+
+# Recalculates every repair's costs against the current schema. Kept apart from the
+# migrations above as those must keep working against the schema of their own version.
+REBUILD_REPAIR_COSTS = (
+    """UPDATE repairs SET parts_cost = (
+        SELECT COALESCE(SUM(parts.part_cost * part_listings.quantity), 0.0)
+        FROM part_listings
+        JOIN parts ON parts.part_id = part_listings.part_id
+        WHERE part_listings.repair_id = repairs.repair_id);""",
+    """UPDATE repairs
+        SET total_cost = COALESCE(labor, 0.0) + COALESCE(parts_cost, 0.0);""",
+)
+
+
+# Rebuilds the repair search index from the repairs table, first giving a search id to
+# repairs written without the triggers and dropping those of repairs since deleted
+REBUILD_REPAIR_SEARCH = (
+    """DELETE FROM repairs_search_ids
+        WHERE repair_id NOT IN (SELECT repair_id FROM repairs);""",
+    """INSERT INTO repairs_search_ids (repair_id)
+        SELECT repair_id FROM repairs
+        WHERE repair_id NOT IN (SELECT repair_id FROM repairs_search_ids)
+        ORDER BY rowid;""",
+    """INSERT INTO repairs_fts (repairs_fts) VALUES ('rebuild');""",
+)
+
+
+def get_schema_version(connection):
+    """Returns the schema version stored in the passed database connection."""
+
+    return connection.execute("""PRAGMA user_version;""").fetchone()[0]
+
+
+def migrate(connection):
+    """Applies every migration newer than the database's schema version, each one in its
+    own transaction, and returns the resulting schema version."""
+
+    version = get_schema_version(connection)
+
+    for target_version, statements in enumerate(MIGRATIONS, start=1):
+        if target_version <= version:
+            continue  # already applied --> skip
+
+        connection.execute("""BEGIN;""")
+
+        try:
+            for statement in statements:
+                connection.execute(statement)
+
+            # pragma can not take parameters, version is always an int from enumerate
+            connection.execute(f"""PRAGMA user_version = {target_version};""")
+
+        except Exception:
+            # leave the database at the last good version
+            connection.rollback()
+
+            raise
+
+        connection.commit()
+
+        version = target_version
+
+    return version
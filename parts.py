@@ -4,6 +4,13 @@ import validate
 
 NO_LOGIN_MSG = "You must be logged in to access this page."
 
+# Columns of the list of parts page --> (column name, header, format string)
+PARTS_LIST_COLUMNS = (
+    ("part_id", "Part ID", None),
+    ("part_cost", "Cost", "${:,.2f}"),
+    ("part_description", "Description", None),
+)
+
 
 def create_part_submit(database, gui):
     """Creates new part from inputs and passed to database for storage."""
@@ -67,12 +74,13 @@ def edit_part_submit(database, gui):
     if errors != "":
         return gui.show_error(errors)
 
-    # If checkbox is checked update database with related input
-    if gui.edit_part_change_cost_check_box.isChecked():
-        database.update_part_cost(part_id, new_part_cost)
+    # If checkbox is checked update database with related input, commit all at once
+    with database.transaction():
+        if gui.edit_part_change_cost_check_box.isChecked():
+            database.update_part_cost(part_id, new_part_cost)
 
-    if gui.edit_part_change_description_check_box.isChecked():
-        database.update_part_description(part_id, new_part_description)
+        if gui.edit_part_change_description_check_box.isChecked():
+            database.update_part_description(part_id, new_part_description)
 
     # Reset page, show success
     gui.reset_edit_part_page()
@@ -138,23 +146,17 @@ def go_to_edit_part_page(database, gui, part_id=None):
 
 
 def go_to_list_of_parts_page(database, gui):
-    """Takes the user to the list of parts page and pulls all
-    part data from the database to pass the data to the GUI."""
+    """Takes the user to the list of parts page, the GUI pulls part data from the
+    database a page at a time as the user scrolls through the list."""
 
     if not database.get_login_status():
         return gui.show_error(NO_LOGIN_MSG)
 
-    parts_data = database.get_all_parts_in_database()
-
-    parts_list = ""
-
-    for part in parts_data:
-        parts_list = (
-            parts_list
-            + f"Part ID : {part['part_id']}, Cost : ${part['part_cost']:,.2f}, "
-            f"Description : {part['part_description']}\n\n"
-        )
-
-    gui.list_of_parts_text_browser.setText(parts_list)
+    gui.update_list_table(
+        gui.list_of_parts_table_view,
+        database.get_parts_page,
+        "parts",
+        PARTS_LIST_COLUMNS,
+    )
 
     return gui.widget_stack.setCurrentIndex(10)
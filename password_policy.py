@@ -0,0 +1,107 @@
+"""This module defines the password hashing policy of the application, the hash rounds are
+calibrated to a target verification time on the machine the app runs on.
+
+passlib is imported when the policy is first calibrated, not with this module, so
+importing the database or handler modules does not pay for it."""
+
+import statistics
+import threading
+import time
+
+# disable linter message for the passlib imports, they are deferred on purpose
+# pylint: disable=import-outside-toplevel
+
+# Time one password verification should take on this machine
+TARGET_VERIFY_SECONDS = 0.15
+
+# Security floor, rounds never drop below this no matter how slow or busy the machine is
+MIN_ROUNDS = 100000
+
+# Rounds timed to measure the speed of this machine, and how many times they are timed.
+# The median run is used so a machine busy at startup does not calibrate too low.
+CALIBRATION_ROUNDS = 20000
+CALIBRATION_RUNS = 5
+
+# Stored hashes with fewer than the calibrated rounds divided by this are rehashed on the
+# next successful login, stored hashes with more rounds are always kept
+ROUNDS_TOLERANCE = 2
+
+
+def calibrate_rounds(target_seconds=TARGET_VERIFY_SECONDS):
+    """Times sha512_crypt hashes on this machine and returns the rounds needed for one
+    verification to take the target time, from the median of the timing runs."""
+
+    from passlib.hash import sha512_crypt
+
+    hasher = sha512_crypt.using(rounds=CALIBRATION_ROUNDS)
+    timings = []
+
+    for _ in range(CALIBRATION_RUNS):
+        start = time.perf_counter()
+        hasher.hash("calibration password")
+        timings.append(time.perf_counter() - start)
+
+    elapsed = statistics.median(timings)
+    rounds = int(CALIBRATION_ROUNDS * target_seconds / max(elapsed, 1e-6))
+
+    return max(MIN_ROUNDS, min(rounds, sha512_crypt.max_rounds))
+
+
+def build_context(rounds):
+    """Returns a passlib CryptContext that hashes with the passed rounds and flags stored
+    hashes with too few rounds (or of another scheme) as needing an update. Hashes with
+    more rounds than the policy are never rehashed down."""
+
+    from passlib.context import CryptContext
+    from passlib.hash import sha512_crypt
+
+    return CryptContext(
+        schemes=["sha512_crypt"],
+        deprecated="auto",
+        sha512_crypt__default_rounds=rounds,
+        sha512_crypt__min_rounds=max(MIN_ROUNDS, rounds // ROUNDS_TOLERANCE),
+        sha512_crypt__max_rounds=sha512_crypt.max_rounds,
+    )
+
+
+class PasswordPolicy:
+    """This class defines the password policy, calibrating its rounds on first use."""
+
+    def __init__(self, target_seconds=TARGET_VERIFY_SECONDS):
+        self.target_seconds = target_seconds
+        self.rounds = None
+        self.context = None
+        self.lock = threading.Lock()  # hashes may run on several worker threads
+
+    def get_context(self):
+        """Returns the policy's CryptContext, calibrating the rounds the first time."""
+
+        with self.lock:
+            if self.context is None:
+                self.rounds = calibrate_rounds(self.target_seconds)
+                self.context = build_context(self.rounds)
+
+            return self.context
+
+    def hash(self, password):
+        """Returns a hash of the passed password under the current policy, the hash
+        records its scheme and rounds."""
+
+        return self.get_context().hash(password)
+
+    def verify(self, password, stored_hash):
+        """Returns true if the passed password matches the stored hash."""
+
+        return self.get_context().verify(password, stored_hash)
+
+    def verify_and_update(self, password, stored_hash):
+        """Verifies the passed password against the stored hash, returns a tuple of the
+        result and a new hash if the stored one is outside the policy (otherwise None).
+        """
+
+        return self.get_context().verify_and_update(password, stored_hash)
+
+    def needs_update(self, stored_hash):
+        """Returns true if the stored hash is outside the current policy."""
+
+        return self.get_context().needs_update(stored_hash)
@@ -0,0 +1,385 @@
+"""This module defines the optional query instrumentation of the database: a cursor
+wrapper timing every statement, the statistics it records per statement template and
+per handler, and the slow query log."""
+
+import bisect
+import contextlib
+import functools
+import inspect
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# Statements taking at least this many milliseconds are written to the slow query log
+SLOW_QUERY_MS = 50.0
+
+# Upper bounds of the latency histogram buckets in milliseconds, the last bucket holds
+# everything slower
+HISTOGRAM_BOUNDS_MS = (0.1, 0.5, 1, 5, 10, 50, 100, 500, 1000)
+
+# A template run more than this many times by one handler call is reported as repeated,
+# usually a query run once per row of an earlier query (N+1)
+REPEATED_STATEMENT_LIMIT = 10
+
+# Handler name of statements run outside any tracked handler
+NO_HANDLER = "(no handler)"
+
+
+@functools.lru_cache(maxsize=1024)
+def get_template(statement):
+    """Returns the passed SQL statement with its whitespace collapsed, the key its
+    statistics are recorded under. Values are passed as parameters so the statement
+    text is already a template."""
+
+    return " ".join(statement.split())
+
+
+class StatementStats:
+    """This class defines the statistics of one statement template: runs, time spent,
+    slowest run, rows returned and a histogram of run times."""
+
+    def __init__(self):
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.rows = 0
+        self.histogram = [0] * (len(HISTOGRAM_BOUNDS_MS) + 1)
+
+    def add_run(self, elapsed_ms, rows):
+        """Adds one run of the statement."""
+
+        self.count += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        self.rows += rows
+        self.histogram[bisect.bisect_left(HISTOGRAM_BOUNDS_MS, elapsed_ms)] += 1
+
+    def get_stats(self):
+        """Returns a dictionary of the statistics."""
+
+        labels = [f"<={bound}ms" for bound in HISTOGRAM_BOUNDS_MS]
+        labels.append(f">{HISTOGRAM_BOUNDS_MS[-1]}ms")
+
+        return {
+            "count": self.count,
+            "total_ms": self.total_ms,
+            "mean_ms": self.total_ms / self.count if self.count else 0.0,
+            "max_ms": self.max_ms,
+            "rows": self.rows,
+            "histogram": dict(zip(labels, self.histogram)),
+        }
+
+
+class HandlerStats:
+    """This class defines the statement counts of one handler: calls, statements run
+    by all calls and by the busiest call, and the templates a single call repeated."""
+
+    def __init__(self):
+        self.calls = 0
+        self.statements = 0
+        self.max_statements = 0
+        self.templates = {}  # template --> statements run by all calls
+        self.repeated = {}  # template --> most runs by a single call, over the limit
+
+    def add_call(self, call_templates):
+        """Adds one call of the handler from its template --> runs counts."""
+
+        statements = sum(call_templates.values())
+
+        self.calls += 1
+        self.statements += statements
+        self.max_statements = max(self.max_statements, statements)
+
+        for template, runs in call_templates.items():
+            self.templates[template] = self.templates.get(template, 0) + runs
+
+            if runs > REPEATED_STATEMENT_LIMIT:
+                self.repeated[template] = max(self.repeated.get(template, 0), runs)
+
+    def get_stats(self):
+        """Returns a dictionary of the statement counts."""
+
+        return {
+            "calls": self.calls,
+            "statements": self.statements,
+            "mean_statements": self.statements / self.calls if self.calls else 0.0,
+            "max_statements": self.max_statements,
+            "templates": dict(self.templates),
+            "repeated": dict(self.repeated),
+        }
+
+
+class QueryStats:
+    """This class defines the statistics recorded by the instrumented cursors of a
+    database, per statement template and per handler, and the slow query log.
+
+    Statements run on the database thread while handlers run on the GUI thread, so the
+    current handler is shared between threads and the statistics are locked."""
+
+    def __init__(self, slow_query_ms=SLOW_QUERY_MS):
+        self.slow_query_ms = slow_query_ms
+        self.lock = threading.Lock()
+        self.statements = {}  # template --> StatementStats
+        self.handlers = {}  # handler name --> HandlerStats
+        self.handler_name = None  # outermost handler being run
+        self.handler_depth = 0
+        self.call_templates = {}  # template --> runs by the current handler call
+
+    def start(self, template):
+        """Counts a run of the passed statement template toward the current handler
+        call, returns the handler's name."""
+
+        with self.lock:
+            self.call_templates[template] = self.call_templates.get(template, 0) + 1
+
+            return self.handler_name or NO_HANDLER
+
+    def record(self, template, elapsed_ms, rows, handler_name=NO_HANDLER):
+        """Records a finished run of the passed statement template, logging it if it
+        was slow."""
+
+        with self.lock:
+            if template not in self.statements:
+                self.statements[template] = StatementStats()
+
+            self.statements[template].add_run(elapsed_ms, rows)
+
+        if elapsed_ms >= self.slow_query_ms:
+            logger.warning(
+                "Slow query %.1f ms, %d rows, handler %s : %s",
+                elapsed_ms,
+                rows,
+                handler_name,
+                template,
+            )
+
+    @contextlib.contextmanager
+    def handler(self, name):
+        """Context manager recording the statements run in the block as one call of the
+        named handler. Handlers run by another handler count toward the outermost one.
+        """
+
+        with self.lock:
+            self.handler_depth += 1
+
+            if self.handler_depth == 1:
+                self.handler_name = name
+                self.call_templates = {}
+
+        try:
+            yield
+
+        finally:
+            with self.lock:
+                self.handler_depth -= 1
+
+                if self.handler_depth == 0:
+                    if name not in self.handlers:
+                        self.handlers[name] = HandlerStats()
+
+                    self.handlers[name].add_call(self.call_templates)
+                    self.handler_name = None
+                    self.call_templates = {}
+
+    def track(self, function, name):
+        """Returns the passed function wrapped to run as the named handler."""
+
+        @functools.wraps(function)
+        def tracked(*args, **kwargs):
+            with self.handler(name):
+                return function(*args, **kwargs)
+
+        return tracked
+
+    def track_module(self, module):
+        """Replaces every public function defined in the passed handler module with
+        one tracked as a handler named module.function. Callers look the functions up
+        on the module when they call them, so they get the tracked ones."""
+
+        for name, function in inspect.getmembers(module, inspect.isfunction):
+            if name.startswith("_") or function.__module__ != module.__name__:
+                continue  # private or imported from elsewhere
+
+            setattr(module, name, self.track(function, f"{module.__name__}.{name}"))
+
+    def reset(self):
+        """Drops every recorded statistic."""
+
+        with self.lock:
+            self.statements.clear()
+            self.handlers.clear()
+            self.call_templates = {}
+
+    def get_report(self):
+        """Returns a dictionary of the statistics, statements by total time spent and
+        handlers by statements run, most first."""
+
+        with self.lock:
+            statements = sorted(
+                self.statements.items(), key=lambda item: item[1].total_ms, reverse=True
+            )
+            handlers = sorted(
+                self.handlers.items(),
+                key=lambda item: item[1].statements,
+                reverse=True,
+            )
+
+            return {
+                "slow_query_ms": self.slow_query_ms,
+                "statements": {
+                    template: stats.get_stats() for template, stats in statements
+                },
+                "handlers": {name: stats.get_stats() for name, stats in handlers},
+            }
+
+    def format_report(self, max_statements=20):
+        """Returns the report as text: the statements taking the most time, the
+        statements run per handler and the handlers repeating a statement."""
+
+        report = self.get_report()
+        lines = [
+            f"{'runs':>8}{'total ms':>12}{'mean ms':>10}{'max ms':>10}{'rows':>10}"
+        ]
+
+        for template, stats in list(report["statements"].items())[:max_statements]:
+            lines.append(
+                f"{stats['count']:>8}{stats['total_ms']:>12.1f}{stats['mean_ms']:>10.3f}"
+                f"{stats['max_ms']:>10.1f}{stats['rows']:>10}  {template[:100]}"
+            )
+
+        lines.append(
+            f"\n{'calls':>8}{'statements':>12}{'mean':>10}{'max':>10}  handler"
+        )
+
+        for name, stats in report["handlers"].items():
+            lines.append(
+                f"{stats['calls']:>8}{stats['statements']:>12}"
+                f"{stats['mean_statements']:>10.1f}{stats['max_statements']:>10}  {name}"
+            )
+
+            for template, runs in stats["repeated"].items():
+                lines.append(
+                    f"{'':>8}repeated {runs} times in one call : {template[:80]}"
+                )
+
+        return "\n".join(lines)
+
+
+class InstrumentedCursor:
+    """This class defines a wrapper of a database cursor that records every statement
+    it runs in the query statistics. A run is timed from its execute until the next
+    statement, or until its rows are all fetched, and counts the rows fetched. Anything
+    else is passed through to the cursor."""
+
+    def __init__(self, cursor, stats):
+        self.cursor = cursor
+        self.stats = stats
+        self.template = None  # template of the statement whose rows are being fetched
+        self.handler_name = NO_HANDLER  # handler that ran it
+        self.elapsed_ms = 0.0
+        self.rows = 0
+
+    def __getattr__(self, name):
+        # lastrowid, rowcount, description... --> the wrapped cursor's
+        return getattr(self.cursor, name)
+
+    def __iter__(self):
+        while True:
+            row = self.fetchone()
+
+            if row is None:
+                return
+
+            yield row
+
+    def finish(self):
+        """Records the statement being fetched, if any."""
+
+        if self.template is not None:
+            self.stats.record(
+                self.template, self.elapsed_ms, self.rows, self.handler_name
+            )
+            self.template = None
+
+    def timed(self, template, function, *args):
+        """Finishes the last statement, then runs and times the passed cursor function
+        as a run of the passed template."""
+
+        self.finish()
+
+        handler_name = self.stats.start(template)
+        start = time.perf_counter()
+
+        try:
+            function(*args)
+
+        finally:
+            self.template = template
+            self.handler_name = handler_name
+            self.elapsed_ms = (time.perf_counter() - start) * 1000
+            self.rows = 0
+
+        return self
+
+    def execute(self, statement, parameters=()):
+        """Runs the passed statement, returns this cursor to fetch its rows from."""
+
+        return self.timed(
+            get_template(statement), self.cursor.execute, statement, parameters
+        )
+
+    def executemany(self, statement, parameters):
+        """Runs the passed statement for each set of parameters, recorded as one run."""
+
+        return self.timed(
+            get_template(statement), self.cursor.executemany, statement, parameters
+        )
+
+    def fetched(self, start, rows, is_done):
+        """Adds the time and rows of a fetch to the statement being fetched, finishing
+        it if its rows are all fetched."""
+
+        self.elapsed_ms += (time.perf_counter() - start) * 1000
+        self.rows += rows
+
+        if is_done:
+            self.finish()
+
+    def fetchone(self):
+        """Returns the next row or None."""
+
+        start = time.perf_counter()
+        row = self.cursor.fetchone()
+
+        self.fetched(start, row is not None, row is None)
+
+        return row
+
+    def fetchmany(self, size=None):
+        """Returns up to size of the next rows."""
+
+        size = self.cursor.arraysize if size is None else size
+        start = time.perf_counter()
+        rows = self.cursor.fetchmany(size)
+
+        self.fetched(start, len(rows), len(rows) < size)
+
+        return rows
+
+    def fetchall(self):
+        """Returns the remaining rows."""
+
+        start = time.perf_counter()
+        rows = self.cursor.fetchall()
+
+        self.fetched(start, len(rows), True)
+
+        return rows
+
+    def close(self):
+        """Records the statement being fetched and closes the cursor."""
+
+        self.finish()
+        self.cursor.close()
@@ -0,0 +1,63 @@
+"""This module defines the row templates the application lists rows of data with and the
+functions used to render rows through them into display text."""
+
+import functools
+import itertools
+
+# Number of rows rendered into each chunk of text passed to the GUI at a time
+CHUNK_ROWS = 200
+
+# Row templates, formatted with each row's columns by name
+VEHICLE_ROW = (
+    "VIN : {vin}, Model : {model}, Make : {make}, Year : {year}, Color : {color}, "
+    "Engine : {engine}, Current Active Repair ID : {repair_request}\n\n"
+)
+REPAIR_PART_ROW = (
+    "Part ID : {part_id}, Cost : ${part_cost:,.2f}, Quantity : {quantity}, "
+    "Description : {part_description}\n\n"
+)
+USER_ROW = (
+    "User ID : {employee_id}, Name : {name}, Lane/Section : {lane_or_section}\n\n"
+)
+REPAIR_ID_ROW = "{repair_id}\n\n"
+CUSTOMER_LOOKUP_ROW = (
+    "{name}, Phone Number : {phone_number}, Customer ID : {customer_id}"
+)
+VEHICLE_LOOKUP_ROW = "{vin}, {year} {make} {model}, Color : {color}"
+PART_LOOKUP_ROW = "{part_id}, {part_description}, Cost : ${part_cost:,.2f}"
+REPAIR_SEARCH_ROW = (
+    "Repair ID : {repair_id}, Drop off Date : {drop_off_date}, "
+    "Completed : {repair_completed_date}\nProblem : {problem_snippet}\n"
+    "Repair : {repair_snippet}\n\n"
+)
+
+
+@functools.lru_cache(maxsize=None)
+def get_row_formatter(template):
+    """Returns the function formatting one row through the passed template, created
+    once per template and cached."""
+
+    return template.format_map
+
+
+def render_rows(rows, template):
+    """Returns the passed rows formatted through the passed template as one string,
+    joined once at the end so rendering time grows linearly with the rows."""
+
+    return "".join(map(get_row_formatter(template), rows))
+
+
+def iter_chunks(rows, template, chunk_rows=CHUNK_ROWS):
+    """Generator yielding the passed rows formatted through the passed template, chunk
+    rows rows to a string, so the GUI can display them a chunk at a time."""
+
+    format_row = get_row_formatter(template)
+    rows = iter(rows)
+
+    while True:
+        chunk = "".join(map(format_row, itertools.islice(rows, chunk_rows)))
+
+        if not chunk:
+            return  # all rows rendered
+
+        yield chunk
@@ -2,9 +2,21 @@
 
 import datetime
 import validate
+import render
 
 NO_LOGIN_MSG = "You must be logged in to access this page."
 
+# Columns of the active repairs page --> (column name, header, format string)
+ACTIVE_REPAIRS_COLUMNS = (
+    ("repair_id", "Repair ID", None),
+    ("total_cost", "Total Cost", "${:,.2f}"),
+    ("labor", "Labor", "${:,.2f}"),
+    ("parts_cost", "Parts Cost", "${:,.2f}"),
+    ("drop_off_date", "Drop off Date", None),
+    ("technician", "Technician ID", None),
+    ("service_writer", "Service Writer ID", None),
+)
+
 
 def new_repair_submit(database, gui):
     """Gets information for a new repair and passes it to the database for storage."""
@@ -45,11 +57,11 @@ def new_repair_submit(database, gui):
     repair_id_suffix = repair_id_suffix.join(constructing_suffix)  # combine to string
     repair_id = vin + repair_id_suffix  # 12345678901234vin + YYYYMMDD
 
-    # Ensure data constraints are met or add to errors
-    if (
-        database.search_for_user(tech_id)["is_tech"] != 1
-        or database.search_for_user(writer_id)["is_writer"] != 1
-    ):
+    # Ensure data constraints are met or add to errors, roles come from the directory
+    is_tech = database.is_tech_or_writer(tech_id, "tech")
+    is_writer = database.is_tech_or_writer(writer_id, "writer")
+
+    if not is_tech or not is_writer:
         errors += "Employee ID that does not match their role (tech/writer).\n\n"
 
     if not database.vehicle_is_owned(vin):
@@ -81,10 +93,11 @@ def new_repair_submit(database, gui):
         "vin": vin,
     }
 
-    # Insert repair, updated vehicle active repair, reset page and show success
-    database.insert_repair(repair_data)
+    # Insert repair, updated vehicle active repair as one commit, reset page and show success
+    with database.transaction():
+        database.insert_repair(repair_data)
 
-    database.update_vehicle_active_repair(vin, repair_id)
+        database.update_vehicle_active_repair(vin, repair_id)
 
     gui.reset_new_repair_page()
 
@@ -97,7 +110,7 @@ def new_repair_submit(database, gui):
 def edit_repair_submit(database, gui):
     """Gets new information for a repair and passes it to the database for storage."""
 
-    checkbox_dispatcher = edit_repair_dispatcher(database, gui)
+    checkbox_dispatcher = edit_repair_dispatcher(gui)
     repair_id = gui.edit_repair_repair_id_display_label.text()
     errors = ""
 
@@ -119,24 +132,29 @@ def edit_repair_submit(database, gui):
 
     if (
         change_tech_checkbox["checked"]()
-        and database.search_for_user(tech_input)["is_tech"] != 1
-        or change_tech_checkbox["checked"]()
-        and database.search_for_user(writer_input)["is_writer"] != 1
+        and not database.is_tech_or_writer(tech_input, "tech")
+        or change_writer_checkbox["checked"]()
+        and not database.is_tech_or_writer(writer_input, "writer")
     ):
         return gui.show_error(
             "Employee ID entered that does not match their role (tech/writer).\n\n"
         )
 
-    # If checked update via dispatch
-    for checkbox in checkbox_dispatcher.values():
-        if checkbox["checked"]():
-            checkbox["updater"](repair_id, checkbox["input"]())
+    # Collect checked changes from dispatcher
+    changes = {
+        checkbox["column"]: checkbox["input"]()
+        for checkbox in checkbox_dispatcher.values()
+        if checkbox["checked"]()
+    }
 
-    # Calculate total cost, update database, show success reset/update page
-    total_cost = calculate_total_cost(repair_id, database)
+    # Labor is stored as a number
+    if "labor" in changes:
+        changes["labor"] = float(changes["labor"])
 
-    database.update_total_repair_cost(repair_id, total_cost)
+    # Update all changes in one statement, total cost is kept by the database
+    database.update_fields("repairs", repair_id, changes)
 
+    # Show success reset/update page
     gui.show_success("Repair update successful.")
 
     repair_data = database.search_for_repair(repair_id)
@@ -146,9 +164,9 @@ def edit_repair_submit(database, gui):
     return gui.update_edit_repair_displays(repair_data)
 
 
-def edit_repair_dispatcher(database, gui):
+def edit_repair_dispatcher(gui):
     """Creates a dictionary of dictionaries that contain the checkbox checked and field has changed
-    value in question, related validation fuctions, related update functions, related input fields
+    value in question, related validation fuctions, related database columns, related input fields
     and error messages to use when updating repair data."""
 
     checkbox_dispatcher = {
@@ -157,35 +175,35 @@ def edit_repair_dispatcher(database, gui):
             "validator": validate.is_valid_id,  # Validation function for related value
             "input": gui.edit_repair_service_id_input_box.text,  # Input for related value
             "error": "Invalid service writer ID!\n\n",  # Error for related value
-            "updater": database.update_repair_service_writer,  # Update function for related value
+            "column": "service_writer",  # Database column for related value
         },  # Same as above for those below
         gui.change_tech_check_box: {
             "checked": gui.change_tech_check_box.isChecked,
             "validator": validate.is_valid_id,
             "input": gui.edit_repair_tech_id_input_box.text,
             "error": "Invalid technician ID!\n\n",
-            "updater": database.update_repair_tech,
+            "column": "technician",
         },
         gui.change_labor_check_box: {
             "checked": gui.change_labor_check_box.isChecked,
             "validator": validate.is_valid_dollar_amount,
             "input": gui.edit_repair_labor_input_box.text,
             "error": "Invalid labor value!\n\n",
-            "updater": database.update_labor_cost,
+            "column": "labor",
         },
         gui.edit_repair_problem_description_input_box: {
             "checked": gui.get_repair_problem_has_changed,
             "validator": validate.is_valid_description,
             "input": gui.edit_repair_problem_description_input_box.toPlainText,
             "error": "Invalid description entered!\n\n",
-            "updater": database.update_repair_problem,
+            "column": "problem_description",
         },
         gui.edit_repair_repair_description_input_box: {
             "checked": gui.get_repair_repair_has_changed,
             "validator": validate.is_valid_description,
             "input": gui.edit_repair_repair_description_input_box.toPlainText,
             "error": "Invalid description entered!\n\n",
-            "updater": database.update_repair_description,
+            "column": "repair_description",
         },
     }
 
@@ -223,16 +241,18 @@ def finish_repair_submit(database, gui):
 
         break
 
-    # Set completion date as the current date, updated database, show success, reset/update page
+    # Set completion date as the current date, updated database as one commit
     compelted_date = datetime.datetime.today().strftime("%Y/%m/%d")
 
-    database.update_repair_complete_date(repair_id, compelted_date)
+    with database.transaction():
+        database.update_repair_complete_date(repair_id, compelted_date)
 
-    gui.show_success("Repair completed.")
+        repair_data = database.search_for_repair(repair_id)
 
-    repair_data = database.search_for_repair(repair_id)
+        database.update_vehicle_active_repair(repair_data["vehicle"])
 
-    database.update_vehicle_active_repair(repair_data["vehicle"])
+    # Show success, reset/update page
+    gui.show_success("Repair completed.")
 
     gui.reset_edit_repair_page_finish()
 
@@ -270,23 +290,24 @@ def add_part_to_repair(database, gui):
 
         break
 
-    # Make a new part listing in the database and make updated parts list
-    database.insert_part_listing(repair_id, part_to_add)
-    parts_list = construct_repair_parts_list(repair_id, database)
+    quantity = gui.show_quantity_request("Add Part", "Input quantity to add:")
+
+    # if the user clicked the cancel button
+    if quantity is False:
+        return None
 
-    # Update costs in database
-    parts_cost = calculate_parts_cost(repair_id, database)
-    database.update_repair_parts_cost(repair_id, parts_cost)
+    # Add quantity to the part listing in the database, costs are updated by the database
+    database.insert_part_listing(repair_id, part_to_add, quantity)
 
-    total_cost = calculate_total_cost(repair_id, database)
-    database.update_total_repair_cost(repair_id, total_cost)
+    # Make updated parts list
+    parts_list = construct_repair_parts_list(repair_id, database)
 
     # Get updated repair data, update page with data and parts list, show success
     repair_data = database.search_for_repair(repair_id)
 
     gui.update_edit_repair_displays(repair_data)
 
-    gui.edit_repair_list_of_parts_text_browser.setText(parts_list)
+    gui.stream_text(gui.edit_repair_list_of_parts_text_browser, parts_list)
 
     return gui.show_success("Part added successfuly.")
 
@@ -318,8 +339,15 @@ def remove_part_from_repair(database, gui):
 
             continue
 
-        # remove part listing --> returns false if listing was not found
-        if not database.drop_part_listing(repair_id, part_id_to_remove):
+        quantity = gui.show_quantity_request("Remove Part", "Input quantity to remove:")
+
+        # if the user hit the cancel button
+        if quantity is False:
+            return None
+
+        # remove quantity from part listing, costs are updated by the database
+        # --> returns false if listing was not found
+        if not database.drop_part_listing(repair_id, part_id_to_remove, quantity):
             gui.show_error("Repair does not have that part currently listed.")
 
             continue
@@ -329,19 +357,12 @@ def remove_part_from_repair(database, gui):
     # Make updated parts list
     parts_list = construct_repair_parts_list(repair_id, database)
 
-    # Update costs
-    parts_cost = calculate_parts_cost(repair_id, database)
-    database.update_repair_parts_cost(repair_id, parts_cost)
-
-    total_cost = calculate_total_cost(repair_id, database)
-    database.update_total_repair_cost(repair_id, total_cost)
-
     # Get updated repair data
     repair_data = database.search_for_repair(repair_id)
 
     # update displays
     gui.update_edit_repair_displays(repair_data)
-    gui.edit_repair_list_of_parts_text_browser.setText(parts_list)
+    gui.stream_text(gui.edit_repair_list_of_parts_text_browser, parts_list)
 
     return gui.show_success("Part successfuly removed.")
 
@@ -387,7 +408,7 @@ def go_to_edit_repair_page(database, gui, requested_repair_id=None):
 
     parts_list = construct_repair_parts_list(repair_data["repair_id"], database)
 
-    gui.edit_repair_list_of_parts_text_browser.setText(parts_list)
+    gui.stream_text(gui.edit_repair_list_of_parts_text_browser, parts_list)
 
     gui.reset_edit_repair_page()
 
@@ -428,27 +449,15 @@ def get_repair_data_loop(database, gui):
 
 
 def go_to_active_repairs_page(database, gui):
-    """Takes the user to the active repairs page and gets all active repairs
-    from the database to populate the page.."""
+    """Takes the user to the active repairs page, the GUI pulls active repairs from
+    the database a page at a time as the user scrolls through the list."""
 
     if not database.get_login_status():
         return gui.show_error(NO_LOGIN_MSG)
 
-    repair_data = database.get_all_active_repairs()
-
-    list_of_repairs = ""
-
-    for repair in repair_data:
-        list_of_repairs = (
-            list_of_repairs
-            + f"Repair ID : {repair['repair_id']}, Total Cost : ${repair['total_cost']:,.2f}, "
-            f"Labor : ${repair['labor']:,.2f}, Parts Cost : ${repair['parts_cost']:,.2f}, "
-            f"Drop off Date : {repair['drop_off_date']}, "
-            f"Technician ID : {repair['technician']}, "
-            f"Service Writer ID : {repair['service_writer']}\n\n"
-        )
-
-    gui.update_active_repair_list(list_of_repairs)
+    gui.update_active_repair_list(
+        database.get_active_repairs_page, ACTIVE_REPAIRS_COLUMNS
+    )
 
     return gui.widget_stack.setCurrentIndex(6)
 
@@ -497,50 +506,47 @@ def go_to_old_repair_page(database, gui):
     return gui.widget_stack.setCurrentIndex(7)
 
 
-def construct_repair_parts_list(repair_id, database):
-    """Constructs a string containing the parts needed to complete
-    a repair based of repair id and data from database."""
-
-    parts_list = ""
-
-    part_listings = database.get_repair_part_listings(repair_id)
-
-    for listing in part_listings:
-        part_data = database.get_part_data(listing["part_id"])
-        parts_list = (
-            parts_list
-            + f"Part ID : {part_data['part_id']}, Cost : ${part_data['part_cost']:,.2f}, "
-            f"Description : {part_data['part_description']}\n\n"
-        )
-
-    return parts_list
+def go_to_search_repairs_page(database, gui):
+    """Takes the user to the search repairs page."""
 
+    if not database.get_login_status():
+        return gui.show_error(NO_LOGIN_MSG)
 
-def calculate_total_cost(repair_id, database):
-    """Gets information from database based on passed repair id and then
-    calculates the total cost of a repair with that data."""
+    gui.reset_search_repairs_page()
 
-    repair_data = database.search_for_repair(repair_id)
+    return gui.widget_stack.setCurrentIndex(17)
 
-    parts_cost = repair_data["parts_cost"]
 
-    labor_cost = repair_data["labor"]
+def search_repairs_submit(database, gui):
+    """Searches the problem and repair descriptions of all repairs for the words in the
+    search box and displays the best matches."""
 
-    total_cost = parts_cost + labor_cost
+    if not database.get_login_status():
+        return gui.show_error(NO_LOGIN_MSG)
 
-    return total_cost
+    search_text = gui.search_repairs_input_box.text()
 
+    if not search_text.strip() or not validate.is_valid_description(search_text):
+        return gui.show_error("Invalid search.")
 
-def calculate_parts_cost(repair_id, database):
-    """Gets information from the data base to calculate the total cost of parts."""
+    results = database.search_repairs_text(search_text)
 
-    parts_cost = 0.0
+    if not results:
+        return gui.stream_text(
+            gui.search_repairs_results_text_browser, ("No repairs found.",)
+        )
 
-    part_listings = database.get_repair_part_listings(repair_id)
+    return gui.stream_text(
+        gui.search_repairs_results_text_browser,
+        render.iter_chunks(results, render.REPAIR_SEARCH_ROW),
+    )
 
-    for listing in part_listings:
-        part_data = database.get_part_data(listing["part_id"])
 
-        parts_cost = parts_cost + part_data["part_cost"]
+def construct_repair_parts_list(repair_id, database):
+    """Constructs chunks of text listing the parts needed to complete
+    a repair based of repair id and data from database."""
 
-    return parts_cost
+    # One joined query for all listed parts
+    return render.iter_chunks(
+        database.get_repair_parts(repair_id), render.REPAIR_PART_ROW
+    )
@@ -0,0 +1,164 @@
+"""This module defines the table models the list pages display their rows through, rows
+are fetched from the database a page at a time as the user scrolls to them."""
+
+from PyQt6 import QtCore
+from data_interface import PAGE_SIZE, PAGE_SORT_COLUMNS
+
+# disable linter message due to using C extention
+# pylint: disable=c-extension-no-member
+# disable linter message due to Qt's camelCase method names being overridden
+# pylint: disable=invalid-name
+
+
+class KeysetTableModel(QtCore.QAbstractTableModel):
+    """This class defines a table model over one of the database's paged list queries.
+    Only the pages the view has scrolled to are fetched, each page picks up after the
+    last row of the one before it (keyset paging) so fetching stays as fast deep into the
+    table as at its start. Sorting by a column starts the paging over in that order."""
+
+    def __init__(self, fetch_page, table, columns, page_size=PAGE_SIZE, parent=None):
+        """The fetch page function is a database get_*_page method of the passed table,
+        the columns are (column name, header, format string or None) tuples."""
+
+        super().__init__(parent)
+        self.fetch_page = fetch_page
+        self.key_column, self.sort_columns = PAGE_SORT_COLUMNS[table]
+        self.columns = columns
+        self.page_size = page_size
+        self.sort_column = None  # None --> sorted by key column
+        self.descending = False
+        self.rows = []
+        self.is_exhausted = False
+        # fetch_page waits in a nested event loop, in which the view may ask for more
+        # rows again or the model may be refreshed
+        self.is_fetching = False
+        self.generation = 0  # counts refreshes, pages fetched before one are dropped
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        """Returns the number of rows fetched so far."""
+
+        # table model --> rows have no children
+        if parent.isValid():
+            return 0
+
+        return len(self.rows)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        """Returns the number of displayed columns."""
+
+        if parent.isValid():
+            return 0
+
+        return len(self.columns)
+
+    def data(self, index, role=QtCore.Qt.ItemDataRole.DisplayRole):
+        """Returns the formatted value of the cell at the passed index."""
+
+        if role != QtCore.Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+
+        column, _header, format_string = self.columns[index.column()]
+        value = self.rows[index.row()][column]
+
+        if value is None:
+            return ""
+
+        if format_string is None:
+            return str(value)
+
+        return format_string.format(value)
+
+    def headerData(self, section, orientation, role=QtCore.Qt.ItemDataRole.DisplayRole):
+        """Returns the column headers, row headers are left to the view."""
+
+        if (
+            role == QtCore.Qt.ItemDataRole.DisplayRole
+            and orientation == QtCore.Qt.Orientation.Horizontal
+        ):
+            return self.columns[section][1]
+
+        return super().headerData(section, orientation, role)
+
+    def canFetchMore(self, parent=QtCore.QModelIndex()):
+        """Returns if there may be rows past the ones fetched so far, false while a
+        page is being fetched."""
+
+        return not parent.isValid() and not self.is_exhausted and not self.is_fetching
+
+    def fetchMore(self, parent=QtCore.QModelIndex()):
+        """Fetches the page of rows after the last fetched row, called by the view as
+        the user scrolls to the end of the fetched rows."""
+
+        if parent.isValid() or self.is_exhausted or self.is_fetching:
+            return
+
+        after_key = None
+
+        # page on the last fetched row's (sort value, key value)
+        if self.rows:
+            last_row = self.rows[-1]
+            after_key = (
+                last_row[self.sort_column or self.key_column],
+                last_row[self.key_column],
+            )
+
+        generation = self.generation
+        self.is_fetching = True
+
+        try:
+            page = self.fetch_page(
+                after_key, self.page_size, self.sort_column, self.descending
+            )
+
+        finally:
+            # a refresh while waiting started its own fetch --> leave its flag alone
+            if generation == self.generation:
+                self.is_fetching = False
+
+        # refreshed while waiting --> page is from before the refresh, drop it
+        if generation != self.generation:
+            return
+
+        # short page --> no rows left
+        if len(page) < self.page_size:
+            self.is_exhausted = True
+
+        if not page:
+            return
+
+        self.beginInsertRows(
+            QtCore.QModelIndex(), len(self.rows), len(self.rows) + len(page) - 1
+        )
+        self.rows.extend(page)
+        self.endInsertRows()
+
+    def sort(self, column, order=QtCore.Qt.SortOrder.AscendingOrder):
+        """Starts the paging over ordered by the passed column, columns the database
+        can not sort by are ignored."""
+
+        if not 0 <= column < len(self.columns):
+            return
+
+        sort_column = self.columns[column][0]
+
+        if sort_column not in self.sort_columns:
+            return
+
+        self.sort_column = sort_column
+        self.descending = order == QtCore.Qt.SortOrder.DescendingOrder
+
+        self.refresh()
+
+    def refresh(self):
+        """Drops the fetched rows and fetches the first page again, used when the
+        table's contents or order may have changed."""
+
+        self.generation += 1
+
+        self.beginResetModel()
+        self.rows = []
+        self.is_exhausted = False
+        self.is_fetching = False
+        self.endResetModel()
+
+        self.fetchMore()
@@ -0,0 +1,244 @@
+"""This module defines the latency tracing of GUI actions: how long each click or key
+press took from start to finish and how much of that was spent waiting on the
+database, hashing passwords, rendering results and in dialogs. Traces of the latest
+actions are kept in a rolling buffer that can be dumped to a file."""
+
+import collections
+import datetime
+import functools
+import json
+import statistics
+import threading
+import time
+
+# Number of the latest action traces kept
+TRACE_BUFFER_SIZE = 2000
+
+# Phases of an action, the rest of its time is reported as other
+DATABASE = "database"
+HASHING = "hashing"
+RENDER = "render"
+DIALOG = "dialog"
+PHASES = (DATABASE, HASHING, RENDER, DIALOG)
+
+
+def get_action_name(handler):
+    """Returns the action name of the passed handler function --> module.function"""
+
+    return f"{handler.__module__}.{handler.__qualname__}"
+
+
+class ActionTracer:
+    """This class defines the tracer of GUI actions. Actions and the database, render
+    and dialog phases run on the GUI thread and are timed exclusively, a phase run
+    inside another pauses it. Hashing runs on the password hashing threads, inside a
+    database call, and is taken out of the database time when the action ends."""
+
+    def __init__(self, buffer_size=TRACE_BUFFER_SIZE):
+        self.traces = collections.deque(maxlen=buffer_size)
+        self.lock = threading.Lock()  # hashing times are added from other threads
+        self.action_name = None  # outermost action being run
+        self.is_tracing = False
+        self.phase_times = dict.fromkeys(PHASES, 0.0)
+        self.phase_stack = []  # [phase, time it started or resumed], innermost last
+
+    def run(self, handler, *args, name=None):
+        """Runs the passed handler with the passed arguments as a traced action, named
+        after the handler if no name is passed, returns its result. Actions run by
+        another action count toward the outermost one."""
+
+        if self.is_tracing:
+            return handler(*args)
+
+        self.action_name = name or get_action_name(handler)
+        self.is_tracing = True
+        self.phase_times = dict.fromkeys(PHASES, 0.0)
+        self.phase_stack = []
+        started = time.time()
+        start = time.perf_counter()
+        error = None
+
+        try:
+            return handler(*args)
+
+        except BaseException as caught:
+            error = repr(caught)
+
+            raise
+
+        finally:
+            self.end_action(started, (time.perf_counter() - start) * 1000, error)
+
+    def end_action(self, started, wall_ms, error):
+        """Adds the trace of the action that just ended to the buffer."""
+
+        with self.lock:
+            times = self.phase_times
+            self.is_tracing = False
+
+        # hashing ran inside database calls --> database time is the rest of the wait
+        database_ms = max(0.0, times[DATABASE] - times[HASHING])
+        phase_ms = database_ms + times[HASHING] + times[RENDER] + times[DIALOG]
+
+        self.traces.append(
+            {
+                "action": self.action_name,
+                "started": datetime.datetime.fromtimestamp(started).isoformat(
+                    timespec="milliseconds"
+                ),
+                "wall_ms": wall_ms,
+                "database_ms": database_ms,
+                "hashing_ms": times[HASHING],
+                "render_ms": times[RENDER],
+                "dialog_ms": times[DIALOG],
+                "other_ms": max(0.0, wall_ms - phase_ms),
+                "error": error,
+            }
+        )
+
+    def add_time(self, phase, elapsed_ms):
+        """Adds time spent in the passed phase to the current action, if any."""
+
+        with self.lock:
+            if self.is_tracing:
+                self.phase_times[phase] += elapsed_ms
+
+    def timed(self, phase, function):
+        """Returns the passed function wrapped to count its time toward the passed
+        phase of the current action. Database, render and dialog functions must be
+        called on the GUI thread, hashing functions on any thread."""
+
+        if phase == HASHING:
+
+            @functools.wraps(function)
+            def timed_on_any_thread(*args, **kwargs):
+                start = time.perf_counter()
+
+                try:
+                    return function(*args, **kwargs)
+
+                finally:
+                    self.add_time(phase, (time.perf_counter() - start) * 1000)
+
+            return timed_on_any_thread
+
+        @functools.wraps(function)
+        def timed_on_gui_thread(*args, **kwargs):
+            if not self.is_tracing:
+                return function(*args, **kwargs)  # no action to count toward
+
+            self.enter_phase(phase)
+
+            try:
+                return function(*args, **kwargs)
+
+            finally:
+                self.exit_phase()
+
+        return timed_on_gui_thread
+
+    def time_methods(self, target, phase, names):
+        """Replaces the named methods of the passed object with ones timed toward the
+        passed phase."""
+
+        for name in names:
+            setattr(target, name, self.timed(phase, getattr(target, name)))
+
+    def enter_phase(self, phase):
+        """Starts timing the passed phase, pausing the phase it runs inside."""
+
+        now = time.perf_counter()
+
+        if self.phase_stack:
+            self.pause_phase(now)
+
+        self.phase_stack.append([phase, now])
+
+    def exit_phase(self):
+        """Stops timing the innermost phase, resuming the phase it ran inside."""
+
+        now = time.perf_counter()
+
+        self.pause_phase(now)
+        self.phase_stack.pop()
+
+        if self.phase_stack:
+            self.phase_stack[-1][1] = now
+
+    def pause_phase(self, now):
+        """Adds the time since the innermost phase started or resumed to it."""
+
+        phase, resumed = self.phase_stack[-1]
+
+        self.add_time(phase, (now - resumed) * 1000)
+
+    def get_traces(self):
+        """Returns the buffered traces, oldest first."""
+
+        return list(self.traces)
+
+    def get_summary(self):
+        """Returns a dictionary of action name --> calls, wall time median/p95/max and
+        mean time of each phase, in milliseconds."""
+
+        by_action = collections.defaultdict(list)
+
+        for trace in self.get_traces():
+            by_action[trace["action"]].append(trace)
+
+        summary = {}
+
+        for action, traces in by_action.items():
+            wall = sorted(trace["wall_ms"] for trace in traces)
+
+            summary[action] = {
+                "calls": len(traces),
+                "median_ms": statistics.median(wall),
+                "p95_ms": wall[min(len(wall) - 1, int(len(wall) * 0.95))],
+                "max_ms": wall[-1],
+                **{
+                    f"mean_{phase}_ms": statistics.fmean(
+                        trace[f"{phase}_ms"] for trace in traces
+                    )
+                    for phase in (*PHASES, "other")
+                },
+            }
+
+        return summary
+
+    def format_summary(self):
+        """Returns the summary as text, slowest median first."""
+
+        columns = ("median", "p95", "max", *PHASES, "other")
+        lines = [
+            "".join(f"{column:>10}" for column in ("calls", *columns)) + "  action"
+        ]
+        summary = sorted(
+            self.get_summary().items(),
+            key=lambda item: item[1]["median_ms"],
+            reverse=True,
+        )
+
+        for action, stats in summary:
+            values = [stats[f"{column}_ms"] for column in columns[:3]]
+            values += [stats[f"mean_{phase}_ms"] for phase in columns[3:]]
+
+            lines.append(
+                f"{stats['calls']:>10}"
+                + "".join(f"{value:>10.1f}" for value in values)
+                + f"  {action}"
+            )
+
+        return "\n".join(lines)
+
+    def dump(self, path):
+        """Writes the buffered traces to the passed path as JSON, one trace per line.
+        Returns the number of traces written."""
+
+        traces = self.get_traces()
+
+        with open(path, "w", encoding="utf-8") as trace_file:
+            for trace in traces:
+                trace_file.write(json.dumps(trace) + "\n")
+
+        return len(traces)
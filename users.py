@@ -1,8 +1,8 @@
 """This module contains all the logic to handle user events in the application."""
 
 
-from passlib.hash import sha512_crypt
 import validate
+import render
 
 INVALID_AUTH_MSG = "Invalid username or password!"
 NO_LOGIN_MSG = "You must be logged in to access this page or function."
@@ -62,8 +62,8 @@ def new_user_submit(database, gui):
     if database.is_username_in_use(test_data["username"]):
         return gui.show_error("Username already in use!")
 
-    # Hash password
-    hash_pwrd = sha512_crypt.hash(test_data["pwrd"])
+    # Hash password off the GUI thread
+    hash_pwrd = database.hash_password(test_data["pwrd"])
 
     # Construct a user from validated data
     user_data = {
@@ -76,15 +76,13 @@ def new_user_submit(database, gui):
         "is_writer": test_data["is_writer"],
     }
 
-    # Insert into the database, show success
-    database.insert_user(user_data)
+    # Insert into the database, returns new id generated by the database, show success
+    new_id = database.insert_user(user_data)
 
     gui.show_success("User input successfuly.")
 
-    # Get new id generated by the database to show result to user
-    new_id = database.get_user_id_for_username(test_data["username"])
-
-    user_data = database.search_for_user(new_id["employee_id"])
+    # Get new user's data to show result to user
+    user_data = database.search_for_user(new_id)
 
     information_to_display = user_string(database, user_data)
 
@@ -132,7 +130,7 @@ def update_password_submit(database, gui):
         return gui.show_error(INVALID_AUTH_MSG)
 
     # Pass new password to database, reset page, show success
-    database.update_pass(sha512_crypt.hash(new_pass))
+    database.update_pass(database.hash_password(new_pass))
 
     gui.reset_update_password_page()
 
@@ -170,10 +168,14 @@ def update_user_submit(database, gui):
     if not database.is_current_users_password(input_pass):
         return gui.show_error("Invalid password!")
 
-    # Run through dispatcher for updates
-    for checkbox in checkbox_dispatcher.values():
-        if checkbox["checked"]():
-            checkbox["updater"](target_id, checkbox["input"]())
+    # Run through dispatcher for changes, update all of them in one statement
+    changes = {
+        checkbox["column"]: checkbox["input"]()
+        for checkbox in checkbox_dispatcher.values()
+        if checkbox["checked"]()
+    }
+
+    database.update_fields("employees", target_id, changes)
 
     # Show success
     gui.show_success("Update successful, click ok to see updated data.")
@@ -192,7 +194,7 @@ def update_user_submit(database, gui):
 
 def update_user_dispatcher(database, gui, target_id):
     """Creates the dictionary of dictionaries that contain the checkbox checked value in
-    question, related validate function, related update function, related input variable
+    question, related validate function, related database column, related input variable
     and error message to use when updating user information."""
 
     checkbox_dispatcher = {
@@ -201,14 +203,14 @@ def update_user_dispatcher(database, gui, target_id):
             "validator": validate.is_valid_name,  # Holds validation function for value
             "input": gui.update_user_name_input_box.text,  # Holds input function to get value
             "error": "Invalid name!\n\n",  # Holds error message for related value
-            "updater": database.update_user_name,  # Holds update function for value
+            "column": "name",  # Holds database column for value
         },  # Same below as above (except radio buttons)
         gui.update_user_change_team_check_box: {
             "checked": gui.update_user_change_team_check_box.isChecked,
             "validator": validate.is_valid_team,
             "input": gui.update_user_team_input_box.text,
             "error": "Invalid team!\n\n",
-            "updater": database.update_user_team,
+            "column": "team",
         },
         gui.update_user_change_section_check_box: {
             # Function to check that both the radio and checkboxes are checked
@@ -224,7 +226,7 @@ def update_user_dispatcher(database, gui, target_id):
             "validator": validate.is_valid_name,
             "input": gui.update_user_section_input_box.text,
             "error": "Invalid section!\n\n",
-            "updater": database.update_user_lane_or_section,
+            "column": "lane_or_section",
         },
         gui.update_user_change_lane_check_box: {
             # Function to check that both the radio and checkboxes are checked
@@ -240,7 +242,7 @@ def update_user_dispatcher(database, gui, target_id):
             "validator": validate.is_valid_lane,
             "input": gui.update_user_lane_input_box.text,
             "error": "Invalid lane!\n\n",
-            "updater": database.update_user_lane_or_section,
+            "column": "lane_or_section",
         },
     }
 
@@ -394,7 +396,7 @@ def show_all_users(database, gui):
     if not database.get_login_status():
         return gui.show_error(NO_LOGIN_MSG)
 
-    user_list = list_users(database.get_all_users())
+    user_list = list_users(database.iter_users())
 
     return gui.show_user_search(user_list)
 
@@ -402,15 +404,7 @@ def show_all_users(database, gui):
 def list_users(user_data):
     """Creates a string listing users simple data(id, name, lane/section)"""
 
-    user_list = ""
-
-    for user in user_data:
-        user_list = (
-            user_list + f"User ID : {user['employee_id']}, Name : {user['name']}, "
-            f"Lane/Section : {user['lane_or_section']}\n\n"
-        )
-
-    return user_list
+    return render.render_rows(user_data, render.USER_ROW)
 
 
 def user_string(database, user_data):
@@ -426,7 +420,4 @@ def user_string(database, user_data):
         f"--- Assigned Repairs ---\n\n"
     )
 
-    for repair in repair_data:
-        informaion_to_display = informaion_to_display + f"{repair['repair_id']}\n\n"
-
-    return informaion_to_display
+    return informaion_to_display + render.render_rows(repair_data, render.REPAIR_ID_ROW)
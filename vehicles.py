@@ -1,9 +1,21 @@
 """This module handles all of the vehicle events for the application."""
 
 import validate
+import render
 
 NO_LOGIN_MSG = "You must be logged in to access this page."
 
+# Columns of the list of vehicles page --> (column name, header, format string)
+VEHICLES_LIST_COLUMNS = (
+    ("vin", "VIN", None),
+    ("model", "Model", None),
+    ("make", "Make", None),
+    ("year", "Year", None),
+    ("color", "Color", None),
+    ("engine", "Engine", None),
+    ("repair_request", "Current Active Repair ID", None),
+)
+
 
 def new_vehicle_submit(database, gui):
     """Gets information for a new vehicle and passes it to the database for storage."""
@@ -71,7 +83,7 @@ def edit_vehicle_submit(database, gui):
 
     # Get vin from gui, setup dispatcher
     current_vin = gui.edit_vehicle_vin_display_label.text()
-    checkbox_dispatcher = edit_vehicle_dispatcher(database, gui)
+    checkbox_dispatcher = edit_vehicle_dispatcher(gui)
     errors = ""
 
     # run through dispatcher for errors
@@ -84,10 +96,14 @@ def edit_vehicle_submit(database, gui):
     if errors != "":
         return gui.show_error(errors)
 
-    # run through dispatcher for updates
-    for checkbox in checkbox_dispatcher.values():
-        if checkbox["checked"]():
-            checkbox["updater"](current_vin, checkbox["input"]())
+    # run through dispatcher for changes, update all of them in one statement
+    changes = {
+        checkbox["column"]: checkbox["input"]()
+        for checkbox in checkbox_dispatcher.values()
+        if checkbox["checked"]()
+    }
+
+    database.update_fields("vehicles", current_vin, changes)
 
     # show success, reset checkboxes
     gui.reset_edit_vehicle_page()
@@ -95,9 +111,9 @@ def edit_vehicle_submit(database, gui):
     return gui.show_success("Vehicle update successful.")
 
 
-def edit_vehicle_dispatcher(database, gui):
+def edit_vehicle_dispatcher(gui):
     """Creates the dictionary of dictionaries that contain the checkbox checked value in
-    question, related validate function, related update function, related input variable
+    question, related validate function, related database column, related input variable
     and error message to use when updating user information."""
 
     checkbox_dispatcher = {
@@ -106,35 +122,35 @@ def edit_vehicle_dispatcher(database, gui):
             "validator": validate.is_valid_name,  # Holds function to validate related input
             "input": gui.edit_vehicle_make_input_box.text,  # Holds function to get input
             "error": "Invalid make!\n\n",  # Holds error message if input is invalid
-            "updater": database.update_vehicle_make,  # Holds function to update database with input
+            "column": "make",  # Holds database column to update with input
         },  # All below same as above
         gui.edit_vehicle_change_model_check_box: {
             "checked": gui.edit_vehicle_change_model_check_box.isChecked,
             "validator": validate.is_valid_name,
             "input": gui.edit_vehicle_model_input_box.text,
             "error": "Invalid model!\n\n",
-            "updater": database.update_vehicle_model,
+            "column": "model",
         },
         gui.edit_vehicle_change_year_check_box: {
             "checked": gui.edit_vehicle_change_year_check_box.isChecked,
             "validator": validate.is_valid_year,
             "input": gui.edit_vehicle_year_input_box.text,
             "error": "Invalid year!\n\n",
-            "updater": database.update_vehicle_year,
+            "column": "year",
         },
         gui.edit_vehicle_change_color_check_box: {
             "checked": gui.edit_vehicle_change_color_check_box.isChecked,
             "validator": validate.is_valid_name,
             "input": gui.edit_vehicle_color_input_box.text,
             "error": "Invalid color!\n\n",
-            "updater": database.update_vehicle_color,
+            "column": "color",
         },
         gui.edit_vehicle_change_engine_check_box: {
             "checked": gui.edit_vehicle_change_engine_check_box.isChecked,
             "validator": validate.is_valid_name,
             "input": gui.edit_vehicle_engine_input_box.text,
             "error": "Invalid engine!\n\n",
-            "updater": database.update_vehicle_engine,
+            "column": "engine",
         },
     }
 
@@ -227,41 +243,25 @@ def search_repair_history(database, gui):
     # Search database for input vin and display
     repair_history = database.get_vehicle_repair_history(vin_to_search)
 
-    repair_info = f"VIN : {vin_to_search}\n\n--- Pior Repair IDs ---\n\n"
-
-    for repair in repair_history:
-        repair_info = repair_info + (f"{repair['repair_id']}\n\n")
+    repair_info = f"VIN : {vin_to_search}\n\n--- Pior Repair IDs ---\n\n" + (
+        render.render_rows(repair_history, render.REPAIR_ID_ROW)
+    )
 
     return gui.show_vehicle_repair_history(repair_info)
 
 
 def go_to_list_of_vehicles_page(database, gui):
-    """Takes the user to the list of vehicles page, gets all vehicle data from
-    the database and passes it to the GUI to populate the page."""
+    """Takes the user to the list of vehicles page, the GUI pulls vehicle data from
+    the database a page at a time as the user scrolls through the list."""
 
     if not database.get_login_status():
         return gui.show_error(NO_LOGIN_MSG)
 
-    vehicle_data = database.get_all_vehicles()
-
-    vehicle_list = construct_vehicles_list(vehicle_data)
-
-    gui.list_of_vehicles_text_browser.setText(vehicle_list)
+    gui.update_list_table(
+        gui.list_of_vehicles_table_view,
+        database.get_vehicles_page,
+        "vehicles",
+        VEHICLES_LIST_COLUMNS,
+    )
 
     return gui.widget_stack.setCurrentIndex(16)
-
-
-def construct_vehicles_list(vehicle_data):
-    """Constructs a formated string of passed vehicle data for display."""
-
-    vehicle_list = ""
-
-    for vehicle in vehicle_data:
-        vehicle_list = vehicle_list + (
-            f"VIN : {vehicle['vin']}, Model : {vehicle['model']}, "
-            f"Make : {vehicle['make']}, Year : {vehicle['year']}, "
-            f"Color : {vehicle['color']}, Engine : {vehicle['engine']}, "
-            f"Current Active Repair ID : {vehicle['repair_request']}\n\n"
-        )
-
-    return vehicle_list